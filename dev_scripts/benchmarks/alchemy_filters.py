@@ -0,0 +1,80 @@
+"""Benchmark RemoveExistingFilter and RemoveDuplicatesFilter on substituted prototype structures, compared
+with scanning all the existing structures for every candidate.
+
+Usage: python alchemy_filters.py [n_existing] [n_candidates]
+"""
+
+from __future__ import annotations
+
+import itertools
+import os
+import sys
+import time
+import warnings
+
+import numpy as np
+
+from pymatgen.alchemy.filters import RemoveDuplicatesFilter, RemoveExistingFilter
+from pymatgen.analysis.structure_matcher import ElementComparator, StructureMatcher
+from pymatgen.core import Structure
+
+STRUCTURES_DIR = f"{os.path.dirname(__file__)}/../../src/pymatgen/util/structures"
+PROTOTYPES = ("SrTiO3", "BaNiO3", "TiO2", "VO2", "Li2O", "CsCl", "SiO2")
+ELEMENTS = "Li Na K Rb Mg Ca Sr Ba Sc Ti V Cr Mn Fe Co Ni Cu Zn Al Ga In Si Ge Sn O S Se F Cl Br".split()
+
+
+def substituted_structures(n_structs: int, rng: np.random.Generator) -> list[Structure]:
+    prototypes = [Structure.from_file(f"{STRUCTURES_DIR}/{name}.json") for name in PROTOTYPES]
+    structures = []
+    for idx in itertools.islice(itertools.count(), n_structs):
+        struct = prototypes[idx % len(prototypes)].copy()
+        elements = rng.choice(ELEMENTS, size=len(struct.elements), replace=False)
+        struct.replace_species(dict(zip(map(str, struct.elements), elements, strict=True)))
+        structures.append(struct)
+    return structures
+
+
+def main() -> None:
+    n_existing = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    n_candidates = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+
+    rng = np.random.default_rng(0)
+    existing = substituted_structures(n_existing, rng)
+    # half of the candidates are supercells of existing structures
+    candidates = [
+        existing[idx] * (1, 1, 2) for idx in rng.choice(n_existing, size=n_candidates // 2, replace=False)
+    ] + substituted_structures(n_candidates - n_candidates // 2, rng)
+
+    matcher = StructureMatcher(comparator=ElementComparator())
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        start = time.perf_counter()
+        existing_filter = RemoveExistingFilter(existing, structure_matcher=matcher)
+        kept = [existing_filter.test(struct) for struct in candidates]
+        t_indexed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        kept_scan = [
+            not any(
+                matcher._comparator.get_hash(struct.composition) == matcher._comparator.get_hash(ref.composition)
+                and matcher.fit(ref, struct)
+                for ref in existing
+            )
+            for struct in candidates
+        ]
+        t_scan = time.perf_counter() - start
+
+        start = time.perf_counter()
+        duplicates_filter = RemoveDuplicatesFilter(structure_matcher=matcher, symprec=0.1)
+        n_unique = sum(duplicates_filter.test(struct) for struct in existing + candidates)
+        t_duplicates = time.perf_counter() - start
+
+    print(f"{n_candidates} candidates vs {n_existing} existing structures, {sum(kept)} new")
+    print(f"same result as the scan: {kept == kept_scan}")
+    print(f"RemoveExistingFilter incl. index: {t_indexed:.2f} s")
+    print(f"scan of existing structures:      {t_scan:.2f} s ({t_scan / t_indexed:.1f}x)")
+    print(f"RemoveDuplicatesFilter (symprec): {t_duplicates:.2f} s, {n_unique} unique structures")
+
+
+if __name__ == "__main__":
+    main()
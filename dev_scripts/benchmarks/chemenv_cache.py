@@ -0,0 +1,68 @@
+"""Benchmark the on-disk StructureEnvironmentsCache: computing the StructureEnvironments of a BaNiO3 supercell vs
+reloading them, and applying several strategies on the cached StructureEnvironments.
+
+Usage: python chemenv_cache.py [supercell_size]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import time
+import warnings
+
+from pymatgen.analysis.chemenv.coordination_environments.chemenv_strategies import (
+    MultiWeightsChemenvStrategy,
+    SimplestChemenvStrategy,
+)
+from pymatgen.analysis.chemenv.coordination_environments.coordination_geometry_finder import LocalGeometryFinder
+from pymatgen.analysis.chemenv.coordination_environments.structure_environments_cache import StructureEnvironmentsCache
+from pymatgen.core import Structure
+
+STRUCTURE = f"{os.path.dirname(__file__)}/../../src/pymatgen/util/structures/BaNiO3.json"
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 2
+    structure = Structure.from_file(STRUCTURE) * (1, 1, size)
+    kwargs = {"maximum_distance_factor": 1.41, "only_cations": False}
+    strategies = [
+        SimplestChemenvStrategy(),
+        SimplestChemenvStrategy(distance_cutoff=1.6, angle_cutoff=0.2),
+        MultiWeightsChemenvStrategy.stats_article_weights_parameters(),
+    ]
+
+    lgf = LocalGeometryFinder()
+    with tempfile.TemporaryDirectory() as cache_dir, warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        cache = StructureEnvironmentsCache(cache_dir)
+
+        start = time.perf_counter()
+        cache.get_or_compute(lgf, structure, **kwargs)
+        t_miss = time.perf_counter() - start
+        size_kb = sum(path.stat().st_size for path in cache.entries()) / 1024
+
+        start = time.perf_counter()
+        cache.get_or_compute(lgf, structure, **kwargs)
+        t_hit = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for strategy in strategies:
+            cache.get_or_compute_light(lgf, structure, strategy, valences="undefined", **kwargs)
+        t_new_strategies = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for strategy in strategies:
+            cache.get_or_compute_light(lgf, structure, strategy, valences="undefined", **kwargs)
+        t_lse_hits = time.perf_counter() - start
+
+    print(f"{structure.formula}: {len(structure)} sites, cached StructureEnvironments: {size_kb:.0f} kB")
+    print(f"compute (cache miss):              {t_miss:.2f} s")
+    print(f"reload (cache hit):                {t_hit:.3f} s ({t_miss / t_hit:.0f}x)")
+    print(f"{len(strategies)} new strategies on cached SE:    {t_new_strategies:.3f} s")
+    print(f"{len(strategies)} cached LightStructureEnvironments: {t_lse_hits:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""Benchmark LocalGeometryFinder.compute_structure_environments on a BaNiO3 (hexagonal
+perovskite) supercell, in which every Ba site has 12 neighbors.
+
+Usage: python chemenv_structure_environments.py [supercell_size] [n_jobs]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+import warnings
+
+from pymatgen.analysis.chemenv.coordination_environments.coordination_geometry_finder import LocalGeometryFinder
+from pymatgen.core import Structure
+
+STRUCTURE = f"{os.path.dirname(__file__)}/../../src/pymatgen/util/structures/BaNiO3.json"
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 2
+    n_jobs = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    structure = Structure.from_file(STRUCTURE) * (1, 1, size)
+
+    lgf = LocalGeometryFinder()
+    lgf.setup_structure(structure)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        start = time.perf_counter()
+        se = lgf.compute_structure_environments(maximum_distance_factor=1.41, only_cations=False, n_jobs=n_jobs)
+        elapsed = time.perf_counter() - start
+
+    n_nb_sets = sum(
+        len(nb_sets) for site_nb_sets in se.neighbors_sets if site_nb_sets for nb_sets in site_nb_sets.values()
+    )
+    print(f"{structure.formula}: {len(structure)} sites, {n_nb_sets} neighbors sets, {n_jobs=}")
+    print(f"compute_structure_environments: {elapsed:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Benchmark reducing and weighing many compositions, one Composition at a time
+vs CompositionArray.
+
+Usage: python composition_array.py [n_compositions]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import warnings
+
+import numpy as np
+
+from pymatgen.core import Composition, Element
+from pymatgen.core.composition import CompositionArray
+
+
+def main() -> None:
+    n_comps = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+
+    rng = np.random.default_rng(0)
+    elements = [el.symbol for el in Element if el.Z <= 83]
+    formulas = []
+    for _ in range(n_comps):
+        symbols = rng.choice(elements, size=rng.integers(1, 5), replace=False)
+        amounts = 2 * rng.integers(1, 9, len(symbols))
+        formulas.append("".join(f"{sym}{amt}" for sym, amt in zip(symbols, amounts, strict=True)))
+
+    start = time.perf_counter()
+    comps = [Composition(formula) for formula in formulas]
+    t_parse = time.perf_counter() - start
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")  # electronegativity of noble gases
+        start = time.perf_counter()
+        ref = [(comp.get_reduced_composition_and_factor(), comp.weight) for comp in comps]
+        t_single = time.perf_counter() - start
+
+    start = time.perf_counter()
+    arr = CompositionArray.from_compositions(comps)
+    (reduced, factors), weights = arr.get_reduced_composition_and_factor(), arr.weight
+    t_array = time.perf_counter() - start
+
+    max_diff = max(abs(factor - ref_factor) for factor, ((_, ref_factor), _) in zip(factors, ref, strict=True))
+    print(f"{n_comps} compositions over {len(arr.species)} species, max factor difference {max_diff:.1e}")
+    print(f"parse formulas:                {t_parse:.2f} s")
+    print(f"Composition one by one:        {t_single:.2f} s")
+    print(f"CompositionArray incl. build:  {t_array:.2f} s ({t_single / t_array:.0f}x)")
+    print(f"max weight difference: {np.max(np.abs(weights - [weight for _, weight in ref])):.1e} amu")
+    print(f"first reduced: {reduced[0]}")
+
+
+if __name__ == "__main__":
+    main()
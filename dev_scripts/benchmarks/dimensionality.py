@@ -0,0 +1,72 @@
+"""Benchmark the Larsen dimensionality analysis on a supercell of a molecular crystal (every molecule is a
+component) and the Cheon bonded clusters, and get_dimensionality_larsen_many on a batch of structures.
+
+Usage: python dimensionality.py [supercell_size] [n_jobs]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+import warnings
+
+from pymatgen.analysis.dimensionality import (
+    calculate_dimensionality_of_site,
+    find_clusters,
+    find_connected_atoms,
+    get_dimensionality_larsen,
+    get_dimensionality_larsen_many,
+    get_structure_components,
+)
+from pymatgen.analysis.local_env import CutOffDictNN
+from pymatgen.core import Structure
+
+STRUCTURE = f"{os.path.dirname(__file__)}/../../tests/files/cif/H6PbCI3N_mp-977013_symmetrized.cif"
+STRUCTURES_DIR = f"{os.path.dirname(__file__)}/../../src/pymatgen/util/structures"
+PROTOTYPES = ("LiFePO4", "Graphite", "CsCl", "SrTiO3", "TiO2", "BaNiO3", "Li2O", "SiO2")
+CUT_OFF_DICT = {("C", "H"): 1.2, ("N", "H"): 1.2, ("C", "N"): 1.6}
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    n_jobs = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        structure = Structure.from_file(STRUCTURE) * (size, size, size)
+        bonded_structure = CutOffDictNN(CUT_OFF_DICT).get_bonded_structure(structure)
+
+        start = time.perf_counter()
+        dimensionality = get_dimensionality_larsen(bonded_structure)
+        t_larsen = time.perf_counter() - start
+
+        start = time.perf_counter()
+        components = get_structure_components(bonded_structure, inc_orientation=True, inc_site_ids=True)
+        t_components = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for idx in range(len(bonded_structure)):
+            calculate_dimensionality_of_site(bonded_structure, idx)
+        t_sites = time.perf_counter() - start
+
+        start = time.perf_counter()
+        max_cluster, _, clusters = find_clusters(structure, find_connected_atoms(structure))
+        t_cheon = time.perf_counter() - start
+
+        structures = [Structure.from_file(f"{STRUCTURES_DIR}/{name}.json") for name in PROTOTYPES] * 4
+        start = time.perf_counter()
+        dimensionalities = get_dimensionality_larsen_many(structures, n_jobs=n_jobs)
+        t_many = time.perf_counter() - start
+
+    print(f"{structure.formula}: {len(structure)} sites, {bonded_structure.graph.number_of_edges()} bonds")
+    print(f"get_dimensionality_larsen:        {t_larsen:.3f} s (dimensionality {dimensionality})")
+    print(f"get_structure_components:         {t_components:.3f} s ({len(components)} components)")
+    print(f"calculate_dimensionality_of_site: {t_sites:.3f} s (all sites)")
+    print(f"find_connected_atoms + clusters:  {t_cheon:.3f} s ({len(clusters)} clusters, largest {max_cluster})")
+    print(f"get_dimensionality_larsen_many:   {t_many:.2f} s ({len(structures)} structures with CrystalNN, {n_jobs=})")
+    print(f"dimensionalities: {dimensionalities[: len(PROTOTYPES)]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Benchmark chemical system subsets and ground state selection with the
+columnar EntryTable against EntrySet.
+
+Usage: python entry_table.py [n_entries]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+import numpy as np
+
+from pymatgen.core import Composition, Element
+from pymatgen.entries.computed_entries import ComputedEntry
+from pymatgen.entries.entry_tools import EntrySet, EntryTable
+
+
+def make_entries(n_entries: int) -> list[ComputedEntry]:
+    rng = np.random.default_rng(0)
+    # Noble gases have no electronegativity, which makes EntrySet's reduced formula grouping ambiguous
+    symbols = [el.symbol for el in Element if el.Z <= 83 and not el.is_noble_gas]
+    entries = []
+    for idx in range(n_entries):
+        n_elems = int(rng.integers(1, 5))
+        comp = Composition(
+            dict(zip(rng.choice(symbols, n_elems, replace=False), rng.integers(1, 7, n_elems), strict=True))
+        )
+        entries.append(ComputedEntry(comp, -5 * comp.num_atoms + rng.normal(), entry_id=f"mp-{idx}"))
+    return entries
+
+
+def timed(label: str, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:45} {time.perf_counter() - start:8.3f} s")
+    return result
+
+
+def main(n_entries: int = 200_000) -> None:
+    entries = timed(f"create {n_entries} entries", lambda: make_entries(n_entries))
+    chemsys = ["Li", "Fe", "P", "O"]
+
+    entry_set = timed("EntrySet()", lambda: EntrySet(entries))
+    table = timed("EntryTable()", lambda: EntryTable(entries))
+
+    subset = timed("EntrySet.get_subset_in_chemsys", lambda: entry_set.get_subset_in_chemsys(chemsys))
+    sub_table = timed("EntryTable.get_subset_in_chemsys", lambda: table.get_subset_in_chemsys(chemsys))
+    if len(subset) != len(sub_table):
+        raise RuntimeError("Subsets differ")
+
+    ground_states = timed("EntrySet.ground_states", lambda: entry_set.ground_states)
+    table_ground_states = timed("EntryTable.ground_states", lambda: table.ground_states)
+    if len(ground_states) != len(table_ground_states):
+        raise RuntimeError("Ground states differ")
+
+    timed("EntryTable.get_indices_in_energy_window", lambda: table.get_indices_in_energy_window(0.1))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
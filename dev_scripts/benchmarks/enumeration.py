@@ -0,0 +1,66 @@
+"""Benchmark the ranking of enumerated orderings by Ewald energy in EnumerateStructureTransformation, computing
+one Ewald summation per supercell and chunk of structures vs one per structure (as the former per-structure
+tasks did), and, if enumlib is installed, a repeated enumeration served by the enumeration cache.
+
+Usage: python enumeration.py [n_jobs]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+import warnings
+
+from pymatgen.analysis.ewald import EwaldSummation
+from pymatgen.command_line import enumlib_caller
+from pymatgen.core import Structure
+from pymatgen.transformations.advanced_transformations import EnumerateStructureTransformation
+from pymatgen.transformations.standard_transformations import (
+    OrderDisorderedStructureTransformation,
+    SubstitutionTransformation,
+)
+
+STRUCTURE = f"{os.path.dirname(__file__)}/../../src/pymatgen/util/structures/LiFePO4.json"
+
+
+def main() -> None:
+    n_jobs = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+
+    lifepo4 = Structure.from_file(STRUCTURE)
+    lifepo4.add_oxidation_state_by_element({"Li": 1, "Fe": 2, "P": 5, "O": -2})
+    disordered = SubstitutionTransformation({"Li+": {"Li+": 0.5}}).apply_transformation(lifepo4 * (1, 1, 2))
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        orderings = OrderDisorderedStructureTransformation().apply_transformation(disordered, return_ranked_list=200)
+        structures = [dct["structure"] for dct in orderings]
+        trafo = EnumerateStructureTransformation(n_jobs=n_jobs)
+
+        start = time.perf_counter()
+        energies = trafo._get_ewald_energies(disordered, structures)
+        t_grouped = time.perf_counter() - start
+
+        start = time.perf_counter()
+        energies_per_structure = [EwaldSummation(disordered).compute_sub_structure(struct) for struct in structures]
+        t_per_structure = time.perf_counter() - start
+
+        same = max(abs(e1 - e2) for e1, e2 in zip(energies, energies_per_structure, strict=True)) < 1e-8
+        print(f"{len(structures)} orderings of {disordered.composition.reduced_formula} ({len(disordered)} sites)")
+        print(f"Ewald ranking, grouped by supercell ({n_jobs=}): {t_grouped:.2f} s")
+        print(f"Ewald ranking, one summation per structure: {t_per_structure:.2f} s, same energies: {same}")
+
+        if not (enumlib_caller.ENUM_CMD and enumlib_caller.MAKESTR_CMD):
+            print("enumlib not installed, skipping the enumeration cache benchmark")
+            return
+        disordered = SubstitutionTransformation({"Fe2+": {"Fe2+": 0.5, "Mn2+": 0.5}}).apply_transformation(lifepo4)
+        times = []
+        for _ in range(2):
+            start = time.perf_counter()
+            trafo.apply_transformation(disordered, return_ranked_list=100)
+            times.append(time.perf_counter() - start)
+        print(f"enumeration and ranking: {times[0]:.2f} s, repeated (cached): {times[1]:.4f} s")
+
+
+if __name__ == "__main__":
+    main()
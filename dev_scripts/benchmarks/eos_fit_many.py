@@ -0,0 +1,43 @@
+"""Benchmark fitting many energy-volume curves, one by one vs EOS.fit_many.
+
+Usage: python eos_fit_many.py [n_curves] [eos_name]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+import numpy as np
+
+from pymatgen.analysis.eos import EOS
+
+
+def main() -> None:
+    n_curves = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    eos = EOS(sys.argv[2] if len(sys.argv) > 2 else "birch_murnaghan")
+
+    rng = np.random.default_rng(0)
+    volumes, energies = [], []
+    for _ in range(n_curves):
+        e0, b0, b1, v0 = rng.uniform(-10, -2), rng.uniform(0.2, 1.5), rng.uniform(3, 6), rng.uniform(10, 60)
+        vols = np.linspace(0.9 * v0, 1.1 * v0, rng.integers(6, 12))
+        volumes.append(vols)
+        energies.append(eos.model(vols, vols)._func(vols, (e0, b0, b1, v0)) + rng.normal(0, 1e-4, len(vols)))
+
+    start = time.perf_counter()
+    ref_fits = [eos.fit(vols, ens) for vols, ens in zip(volumes, energies, strict=True)]
+    t_single = time.perf_counter() - start
+
+    start = time.perf_counter()
+    eos_fits = eos.fit_many(volumes, energies)
+    t_many = time.perf_counter() - start
+
+    max_diff = max(abs(fit.v0 - ref.v0) / ref.v0 for fit, ref in zip(eos_fits, ref_fits, strict=True))
+    print(f"{n_curves} {eos.model.__name__} curves")
+    print(f"fit one by one: {t_single:.2f} s")
+    print(f"fit_many: {t_many:.2f} s ({t_single / t_many:.1f}x), max relative v0 difference {max_diff:.1e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""Benchmark generate_all_slabs on a low-symmetry oxide (monoclinic FePO4).
+
+Usage: python generate_all_slabs.py [max_index] [n_jobs]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+import warnings
+
+from pymatgen.core import Structure
+from pymatgen.core.surface import generate_all_slabs
+from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
+
+CIF = f"{os.path.dirname(__file__)}/../../tests/files/cif/FePO4.cif"
+
+
+def main() -> None:
+    max_index = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    n_jobs = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    structure = SpacegroupAnalyzer(Structure.from_file(CIF)).get_conventional_standard_structure()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        start = time.perf_counter()
+        slabs = generate_all_slabs(structure, max_index, 10, 10, n_jobs=n_jobs)
+        elapsed = time.perf_counter() - start
+
+    n_miller = len({slab.miller_index for slab in slabs})
+    print(f"{structure.formula}, {max_index=}, {n_jobs=}: {len(slabs)} slabs on {n_miller} Miller indices")
+    print(f"generate_all_slabs: {elapsed:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Benchmark the CSL sigma enumeration of GrainBoundaryGenerator on all
+low-index rotation axes.
+
+Usage: python grain_boundary_sigmas.py [cutoff] [max_index]
+"""
+
+from __future__ import annotations
+
+import itertools
+import sys
+import time
+
+from pymatgen.core.interface import GrainBoundaryGenerator
+
+# Lattice type -> (enumerator, axial ratio)
+SYSTEMS = {
+    "cubic": (GrainBoundaryGenerator.enum_sigma_cubic, None),
+    "tetragonal": (GrainBoundaryGenerator.enum_sigma_tet, (9, 4)),
+    "orthorhombic": (GrainBoundaryGenerator.enum_sigma_ort, (9, 4, 1)),
+    "hexagonal": (GrainBoundaryGenerator.enum_sigma_hex, (8, 3)),
+    "rhombohedral": (GrainBoundaryGenerator.enum_sigma_rho, (15, -4)),
+}
+
+
+def main() -> None:
+    cutoff = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    max_index = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    axes = [axis for axis in itertools.product(range(max_index + 1), repeat=3) if any(axis)]
+
+    total = 0.0
+    for name, (enum_sigma, ratio) in SYSTEMS.items():
+        n_sigmas = 0
+        start = time.perf_counter()
+        for axis in axes:
+            sigmas = enum_sigma(cutoff, axis) if ratio is None else enum_sigma(cutoff, axis, ratio)
+            n_sigmas += len(sigmas)
+        elapsed = time.perf_counter() - start
+        total += elapsed
+        print(f"{name:>12}: {n_sigmas:6d} sigmas on {len(axes)} axes in {elapsed:.2f} s")
+    print(f"{'total':>12}: {total:.2f} s ({cutoff=}, {max_index=})")
+
+
+if __name__ == "__main__":
+    main()
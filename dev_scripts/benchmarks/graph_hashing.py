@@ -0,0 +1,82 @@
+"""Benchmark the Weisfeiler-Lehman graph hashes and the hash-bucketed isomorphism grouping on the connected
+fragments of the TFSI anion (as enumerated by MoleculeGraph.build_unique_fragments and Fragmenter), compared
+with testing every fragment for isomorphism against all the unique fragments found so far.
+
+Usage: python graph_hashing.py [n_fragments]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+import warnings
+from itertools import combinations
+
+import networkx as nx
+
+from pymatgen.analysis.fragmenter import Fragmenter
+from pymatgen.analysis.graphs import MoleculeGraph, _isomorphic
+from pymatgen.core import Molecule
+from pymatgen.util.graph_hashing import (
+    group_isomorphic_graphs,
+    weisfeiler_lehman_graph_hash,
+    weisfeiler_lehman_graph_hashes,
+)
+
+MOLECULE = f"{os.path.dirname(__file__)}/../../tests/files/analysis/local_env/fragmenter_files/TFSI.xyz"
+EDGES = [(14, 1), (1, 4), (1, 5), (1, 7), (7, 11), (7, 12), (7, 13), (14, 0), (0, 2), (0, 3), (0, 6), (6, 8)]
+EDGES += [(6, 9), (6, 10)]
+
+
+def main() -> None:
+    n_frags = int(sys.argv[1]) if len(sys.argv) > 1 else 4000
+
+    molecule = Molecule.from_file(MOLECULE)
+    mol_graph = MoleculeGraph.from_edges(molecule, dict.fromkeys(EDGES))
+    graph = mol_graph.graph.to_undirected()
+    fragments = []
+    for size in range(len(molecule) // 2, len(molecule)):
+        for combination in combinations(graph.nodes, size):
+            if nx.is_connected(subgraph := nx.subgraph(graph, combination)):
+                fragments.append(subgraph)
+        if len(fragments) >= n_frags:
+            break
+    fragments = fragments[:n_frags]
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        start = time.perf_counter()
+        hashes = [weisfeiler_lehman_graph_hash(frag, node_attr="specie") for frag in fragments]
+        t_hash = time.perf_counter() - start
+
+        start = time.perf_counter()
+        batch_hashes = weisfeiler_lehman_graph_hashes(fragments, node_attr="specie")
+        t_batch = time.perf_counter() - start
+
+        start = time.perf_counter()
+        groups = group_isomorphic_graphs(fragments, _isomorphic, node_attr="specie")
+        t_grouped = time.perf_counter() - start
+
+        start = time.perf_counter()
+        unique = []
+        for frag in fragments:
+            if not any(_isomorphic(frag, other) for other in unique):
+                unique.append(frag)
+        t_pairwise = time.perf_counter() - start
+
+        start = time.perf_counter()
+        fragmenter = Fragmenter(molecule=molecule, edges=EDGES, depth=0)
+        t_fragmenter = time.perf_counter() - start
+
+    print(f"{len(fragments)} connected fragments of {molecule.formula} with {len(molecule) // 2}+ atoms")
+    print(f"weisfeiler_lehman_graph_hash, one by one: {t_hash:.2f} s")
+    print(f"weisfeiler_lehman_graph_hashes (batch):   {t_batch:.2f} s, same hashes: {hashes == batch_hashes}")
+    print(f"group_isomorphic_graphs:                  {t_grouped:.2f} s ({len(groups)} unique)")
+    print(f"pairwise isomorphism tests:               {t_pairwise:.2f} s ({len(unique)} unique)")
+    n_unique = fragmenter.total_unique_fragments
+    print(f"Fragmenter(depth=0), all fragment sizes:  {t_fragmenter:.2f} s ({n_unique} unique)")
+
+
+if __name__ == "__main__":
+    main()
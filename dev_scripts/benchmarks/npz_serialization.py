@@ -0,0 +1,71 @@
+"""Benchmark file size and load time of the columnar npz format (pymatgen.io.npz)
+against monty JSON for a collection of ComputedStructureEntries.
+
+Usage: python npz_serialization.py [n_entries]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+from monty.serialization import dumpfn, loadfn
+
+from pymatgen.core import Lattice, Structure
+from pymatgen.entries.computed_entries import ComputedStructureEntry
+from pymatgen.io.npz import dump_npz, load_npz
+
+
+def make_entries(n_entries: int) -> list[ComputedStructureEntry]:
+    rng = np.random.default_rng(0)
+    species = ["Li", "Fe", "P", "O", "Mn", "Co", "Ni", "S"]
+    entries = []
+    for idx in range(n_entries):
+        n_sites = int(rng.integers(2, 40))
+        struct = Structure(
+            Lattice(rng.normal(scale=0.3, size=(3, 3)) + 5 * np.eye(3)),
+            rng.choice(species, n_sites).tolist(),
+            rng.random((n_sites, 3)),
+            site_properties={"magmom": rng.normal(size=n_sites).tolist()},
+        )
+        entries.append(ComputedStructureEntry(struct, float(rng.normal()) * n_sites, entry_id=f"mp-{idx}"))
+    return entries
+
+
+def main(n_entries: int = 10_000) -> None:
+    entries = make_entries(n_entries)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, dump, load in (
+            ("json", lambda fn: dumpfn(entries, fn), loadfn),
+            ("json.gz", lambda fn: dumpfn(entries, fn), loadfn),
+            ("npz", lambda fn: dump_npz(entries, fn, compress=False), lambda fn: list(load_npz(fn))),
+            ("npz (compressed)", lambda fn: dump_npz(entries, fn), lambda fn: list(load_npz(fn))),
+        ):
+            filename = f"{tmp_dir}/entries.{name.split()[0]}"
+            start = time.perf_counter()
+            dump(filename)
+            dump_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            loaded = load(filename)
+            load_time = time.perf_counter() - start
+            if len(loaded) != n_entries:
+                raise RuntimeError(f"{name}: loaded {len(loaded)} of {n_entries} entries")
+
+            start = time.perf_counter()
+            if name.startswith("npz"):
+                _ = load_npz(filename)[n_entries // 2]
+            lazy_time = time.perf_counter() - start
+
+            size_mb = os.path.getsize(filename) / 1e6
+            print(
+                f"{name:18} {size_mb:8.2f} MB  dump {dump_time:7.2f} s  load {load_time:7.2f} s"
+                + (f"  single item {lazy_time * 1e3:6.1f} ms" if name.startswith("npz") else "")
+            )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
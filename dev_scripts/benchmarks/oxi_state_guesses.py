@@ -0,0 +1,45 @@
+"""Benchmark guessing the oxidation states of many multi-component compositions.
+
+Usage: python oxi_state_guesses.py [n_compositions] [n_jobs]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import warnings
+
+import numpy as np
+
+from pymatgen.core import Composition
+
+ELEMENTS = "Li Na K Mg Ca Sr Ba Ti V Cr Mn Fe Co Ni Cu Zn Al Si P S Mo W Sn Sb Bi".split()
+ANIONS = "O F S N Cl".split()
+
+
+def main() -> None:
+    n_comps = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    n_jobs = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+
+    rng = np.random.default_rng(0)
+    comps = []
+    for _ in range(n_comps):
+        cations = rng.choice(ELEMENTS, size=rng.integers(2, 6), replace=False)
+        amounts = rng.integers(1, 7, len(cations) + 1)
+        formula = "".join(f"{el}{amt}" for el, amt in zip([*cations, rng.choice(ANIONS)], amounts, strict=True))
+        comps.append(Composition(formula))
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        comps[0].oxi_state_guesses()  # load the ICSD statistics
+        start = time.perf_counter()
+        guesses = Composition.oxi_state_guesses_many(comps, n_jobs=n_jobs)
+        elapsed = time.perf_counter() - start
+
+    n_balanced = sum(len(guess) > 0 for guess in guesses)
+    print(f"{n_comps} compositions with 3 to 6 elements, {n_balanced} charge balanced, {n_jobs=}")
+    print(f"oxi_state_guesses_many: {elapsed:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Benchmark PhononBandStructureSymmLine.band_reorder on a synthetic band structure
+with smoothly varying eigenvectors and shuffled band order.
+
+Usage: python phonon_band_reorder.py [n_atoms] [n_qpoints]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+import numpy as np
+
+from pymatgen.core import Lattice, Structure
+from pymatgen.phonon.bandstructure import PhononBandStructureSymmLine
+
+
+def main() -> None:
+    n_atoms = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    n_qpoints = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    n_bands = 3 * n_atoms
+
+    rng = np.random.default_rng(0)
+    lattice = Lattice.cubic(10)
+    structure = Structure(lattice, ["Si"] * n_atoms, rng.random((n_atoms, 3)))
+    h0, h1 = (mat + mat.T for mat in rng.normal(size=(2, n_bands, n_bands)))
+    frequencies = np.empty((n_bands, n_qpoints))
+    eigendisplacements = np.empty((n_bands, n_qpoints, n_atoms, 3), dtype=complex)
+    for iq, q in enumerate(np.linspace(0, 0.5, n_qpoints)):
+        freqs, eigvecs = np.linalg.eigh(h0 + np.sin(q) * h1)
+        perm = rng.permutation(n_bands)
+        frequencies[:, iq] = freqs[perm]
+        eigendisplacements[:, iq] = eigvecs[:, perm].T.reshape(n_bands, n_atoms, 3)
+    eigendisplacements /= np.sqrt(structure[0].specie.atomic_mass)
+
+    qpoints = np.outer(np.linspace(0, 0.5, n_qpoints), [1, 0, 0])
+    band_structure = PhononBandStructureSymmLine(
+        qpoints,
+        frequencies,
+        lattice.reciprocal_lattice,
+        eigendisplacements=eigendisplacements,
+        labels_dict={"Gamma": [0, 0, 0], "X": [0.5, 0, 0]},
+        structure=structure,
+    )
+
+    start = time.perf_counter()
+    band_structure.band_reorder()
+    elapsed = time.perf_counter() - start
+
+    n_crossing = np.count_nonzero(np.diff(np.argsort(band_structure.bands, axis=0), axis=1).any(axis=0))
+    print(f"{n_atoms} atoms, {n_bands} bands, {n_qpoints} q-points")
+    print(f"band_reorder: {elapsed:.2f} s, band order changes at {n_crossing} q-point steps")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Benchmark phonon DOS thermodynamics on a temperature grid for a database of
+DOSes, comparing per-temperature calls with the batched integration.
+
+The database is synthesized from the NaCl test DOS by rescaling its frequencies,
+so all DOSes share the grid size of a typical phonopy DOS.
+
+Usage: python phonon_thermodynamics.py [n_doses] [n_temps]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+
+import numpy as np
+import orjson
+
+from pymatgen.phonon.dos import THERMODYNAMIC_PROPERTIES, PhononDos, get_thermodynamic_properties
+
+DOS_JSON = f"{os.path.dirname(__file__)}/../../tests/files/phonon/dos/NaCl_ph_dos.json"
+
+
+def main() -> None:
+    n_doses = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    n_temps = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    with open(DOS_JSON, "rb") as file:
+        base = PhononDos.from_dict(orjson.loads(file.read()))
+    rng = np.random.default_rng(0)
+    doses = [PhononDos(base.frequencies * scale, base.densities / scale) for scale in rng.uniform(0.5, 2, n_doses)]
+    temps = np.linspace(0, 2000, n_temps)
+
+    # Per-temperature calls are timed on a subset and extrapolated
+    n_loop = max(1, n_doses // 100)
+    start = time.perf_counter()
+    for dos in doses[:n_loop]:
+        for prop in THERMODYNAMIC_PROPERTIES:
+            [getattr(dos, prop)(temp) for temp in temps]
+    loop_time = (time.perf_counter() - start) * n_doses / n_loop
+
+    start = time.perf_counter()
+    for dos in doses:
+        dos.get_thermodynamic_properties(temps)
+    grid_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    get_thermodynamic_properties(doses, temps)
+    batch_time = time.perf_counter() - start
+
+    print(f"{n_doses} DOSes x {n_temps} temperatures, {len(base.frequencies)} frequencies each")
+    print(f"scalar calls (extrapolated): {loop_time:.1f} s")
+    print(f"one call per DOS:            {grid_time:.1f} s")
+    print(f"get_thermodynamic_properties: {batch_time:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Benchmark the labelling of structures with their AFLOW prototypes: setting up AflowPrototypeMatcher,
+matching perturbed prototypes of the library against it, with and without the protostructure label
+prefilter, and computing their spglib protostructure labels in parallel.
+
+Usage: python prototypes.py [n_jobs]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import warnings
+
+from pymatgen.analysis.prototypes import AFLOW_PROTOTYPE_LIBRARY, AflowPrototypeMatcher, get_protostructure_labels
+
+
+def main() -> None:
+    n_jobs = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+
+    structures = []
+    for dct in AFLOW_PROTOTYPE_LIBRARY[::3]:
+        structure = dct["snl"].structure.copy()
+        structure.perturb(0.02)
+        structures.append(structure)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        start = time.perf_counter()
+        matcher = AflowPrototypeMatcher()
+        t_init = time.perf_counter() - start
+
+        start = time.perf_counter()
+        AflowPrototypeMatcher()
+        t_init_again = time.perf_counter() - start
+
+        start = time.perf_counter()
+        prototypes = matcher.get_prototypes_many(structures, n_jobs=n_jobs)
+        t_match = time.perf_counter() - start
+
+        start = time.perf_counter()
+        prefiltered = matcher.get_prototypes_many(structures, prefilter_by_label=True, n_jobs=n_jobs)
+        t_prefiltered = time.perf_counter() - start
+
+        start = time.perf_counter()
+        labels = get_protostructure_labels(structures, method="spglib", n_jobs=n_jobs)
+        t_labels = time.perf_counter() - start
+
+    n_matched = sum(tags is not None for tags in prototypes)
+    same = prototypes == prefiltered
+    print(f"{len(structures)} perturbed prototypes, {n_matched} matched, {len(set(labels))} distinct labels")
+    print(f"AflowPrototypeMatcher(): {t_init:.2f} s, again: {t_init_again:.2f} s")
+    print(f"get_prototypes_many ({n_jobs=}): {t_match:.2f} s")
+    print(f"get_prototypes_many with label prefilter: {t_prefiltered:.2f} s, same prototypes: {same}")
+    print(f"get_protostructure_labels ({n_jobs=}): {t_labels:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Benchmark StructureGraph on a molecular crystal: graph construction from a local environment strategy,
+replication into a supercell, neighbor lookups and extraction of the molecules.
+
+Usage: python structure_graph.py [supercell_size]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+import warnings
+
+from pymatgen.analysis.graphs import StructureGraph
+from pymatgen.analysis.local_env import CutOffDictNN
+from pymatgen.core import Structure
+
+STRUCTURE = f"{os.path.dirname(__file__)}/../../tests/files/cif/H6PbCI3N_mp-977013_symmetrized.cif"
+CUT_OFF_DICT = {("C", "H"): 1.2, ("N", "H"): 1.2, ("C", "N"): 1.6, ("Pb", "I"): 3.5}
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        structure = Structure.from_file(STRUCTURE) * (size, size, size)
+        strategy = CutOffDictNN(CUT_OFF_DICT)
+
+        start = time.perf_counter()
+        struct_graph = StructureGraph.from_local_env_strategy(structure, strategy)
+        t_construction = time.perf_counter() - start
+
+        start = time.perf_counter()
+        supercell_graph = struct_graph * (2, 2, 2)
+        t_mul = time.perf_counter() - start
+
+        start = time.perf_counter()
+        n_neighbors = sum(len(supercell_graph.get_connected_sites(idx)) for idx in range(len(supercell_graph)))
+        t_connected = time.perf_counter() - start
+
+        start = time.perf_counter()
+        molecules = struct_graph.get_subgraphs_as_molecules()
+        t_molecules = time.perf_counter() - start
+
+    print(f"{structure.formula}: {len(structure)} sites, {struct_graph.graph.number_of_edges()} edges")
+    print(f"from_local_env_strategy:          {t_construction:.2f} s")
+    print(f"replication (2, 2, 2):            {t_mul:.2f} s ({len(supercell_graph)} sites)")
+    print(f"get_connected_sites on supercell: {t_connected:.2f} s ({n_neighbors} neighbors)")
+    print(f"get_subgraphs_as_molecules:       {t_molecules:.2f} s ({len(molecules)} unique molecules)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Benchmark SpacegroupAnalyzer on a high-throughput-like workload in which every structure is analyzed by
+several consumers (e.g. XRDCalculator, a duplicate filter and an input set), one structure after the other.
+
+The first pass computes the symmetry datasets, the later ones are served by SYMMETRY_DATASET_CACHE (with the
+former lru_cache of 32 cells, every pass over more than 32 structures recomputed all of them).
+
+Usage: python symmetry_analyze_many.py [n_structures] [n_jobs]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+import warnings
+
+from pymatgen.core import Structure
+from pymatgen.symmetry.analyzer import SYMMETRY_DATASET_CACHE, SpacegroupAnalyzer
+
+STRUCTURES_DIR = f"{os.path.dirname(__file__)}/../../src/pymatgen/util/structures"
+PROTOTYPES = ("LiFePO4", "Li3V2(PO4)3", "BaNiO3", "Li10GeP2S12", "SrTiO3", "TiO2", "La2CoO4F")
+N_PASSES = 3
+
+
+def main() -> None:
+    n_structs = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    n_jobs = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+
+    prototypes = [Structure.from_file(f"{STRUCTURES_DIR}/{name}.json") for name in PROTOTYPES]
+    structures = []
+    for idx in range(n_structs):
+        struct = prototypes[idx % len(prototypes)].copy()
+        struct.scale_lattice(struct.volume * (1 + 1e-3 * idx))
+        structures.append(struct)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        SYMMETRY_DATASET_CACHE.maxsize = 2 * n_structs
+        SYMMETRY_DATASET_CACHE.clear()
+        times = []
+        for _ in range(N_PASSES):
+            start = time.perf_counter()
+            symbols = [SpacegroupAnalyzer(struct, symprec=0.1).get_space_group_symbol() for struct in structures]
+            times.append(time.perf_counter() - start)
+
+        SYMMETRY_DATASET_CACHE.clear()
+        start = time.perf_counter()
+        analyzers = SpacegroupAnalyzer.analyze_many(structures, symprec=0.1, n_jobs=n_jobs)
+        t_many = time.perf_counter() - start
+
+    n_agree = sum(
+        analyzer.get_space_group_symbol() == symbol for analyzer, symbol in zip(analyzers, symbols, strict=True)
+    )
+    print(f"{n_structs} structures, {len({*symbols})} space groups, {n_agree} identical results, {n_jobs=}")
+    print(f"pass 1 (cache misses):     {times[0]:.2f} s")
+    for idx, elapsed in enumerate(times[1:], start=2):
+        print(f"pass {idx} (cache hits):       {elapsed:.2f} s")
+    print(f"analyze_many (cold cache): {t_many:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Benchmark StandardTransmuter on a one-to-many workload: ordering partially substituted LiFePO4
+structures with OrderDisorderedStructureTransformation and removing the duplicates as the ordered
+structures are produced.
+
+Usage: python transmuter.py [n_structures] [ncores]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+import warnings
+
+from pymatgen.alchemy.filters import RemoveDuplicatesFilter
+from pymatgen.alchemy.transmuters import StandardTransmuter
+from pymatgen.core import Structure
+from pymatgen.transformations.standard_transformations import (
+    OrderDisorderedStructureTransformation,
+    SubstitutionTransformation,
+)
+
+STRUCTURE = f"{os.path.dirname(__file__)}/../../src/pymatgen/util/structures/LiFePO4.json"
+DOPANTS = ("Mn2+", "Co2+", "Ni2+", "Mg2+", "Zn2+", "Cu2+", "Ca2+", "Cd2+")
+
+
+def transmute(structures: list[Structure], ncores: int | None) -> StandardTransmuter:
+    transmuter = StandardTransmuter.from_structures(structures)
+    transmuter.ncores = ncores
+    transmuter.append_transformation(
+        OrderDisorderedStructureTransformation(),
+        extend_collection=20,
+        structure_filters=[RemoveDuplicatesFilter(symprec=0.1)],
+    )
+    return transmuter
+
+
+def main() -> None:
+    n_structs = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    ncores = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+
+    lifepo4 = Structure.from_file(STRUCTURE)
+    lifepo4.add_oxidation_state_by_element({"Li": 1, "Fe": 2, "P": 5, "O": -2})
+    structures = []
+    for idx in range(n_structs):
+        dopant = DOPANTS[idx % len(DOPANTS)]
+        fraction = 0.25 * (1 + idx // len(DOPANTS) % 3)
+        trafo = SubstitutionTransformation({"Fe2+": {"Fe2+": 1 - fraction, dopant: fraction}})
+        structures.append(trafo.apply_transformation(lifepo4))
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        start = time.perf_counter()
+        serial = transmute(structures, ncores=None)
+        t_serial = time.perf_counter() - start
+
+        start = time.perf_counter()
+        parallel = transmute(structures, ncores=ncores)
+        t_parallel = time.perf_counter() - start
+
+    same = [ts.final_structure for ts in serial] == [ts.final_structure for ts in parallel]
+    timing = parallel.stage_timings[-1]
+    print(f"{n_structs} disordered structures -> {timing['n_outputs']} ordered, {timing['n_kept']} unique")
+    print(f"serial:   {t_serial:.2f} s")
+    print(f"ncores={ncores}: {t_parallel:.2f} s, same structures as serial: {same}")
+
+
+if __name__ == "__main__":
+    main()
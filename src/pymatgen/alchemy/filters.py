@@ -5,7 +5,7 @@ from __future__ import annotations
 import abc
 import math
 from collections import defaultdict
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 from monty.json import MSONable
 
@@ -23,8 +23,17 @@ if TYPE_CHECKING:
 class AbstractStructureFilter(MSONable, abc.ABC):
     """Structures that return True when passed to the test() method are retained during
     transmutation. Those that return False are removed.
+
+    Attributes:
+        order_dependent (bool): Whether the result of test() can depend on the structures
+            tested before, like RemoveDuplicatesFilter which keeps the first of several
+            matching structures. Filters that are not order-dependent can be applied to
+            the alternatives of one-to-many transformations as soon as they are produced.
+            Defaults to True, which is always safe.
     """
 
+    order_dependent: ClassVar[bool] = True
+
     @abc.abstractmethod
     def test(self, structure: Structure | IStructure):
         """Structures that return true are kept in the Transmuter object during filtering.
@@ -42,6 +51,8 @@ class ContainsSpecieFilter(AbstractStructureFilter):
     By default compares by atomic number.
     """
 
+    order_dependent = False
+
     def __init__(self, species: SpeciesLike, strict_compare: bool = False, AND: bool = True, exclude: bool = False):
         """
         Args:
@@ -117,6 +128,8 @@ class ContainsSpecieFilter(AbstractStructureFilter):
 class SpecieProximityFilter(AbstractStructureFilter):
     """This filter removes structures that have certain species that are too close together."""
 
+    order_dependent = False
+
     def __init__(self, specie_and_min_dist_dict):
         """
         Args:
@@ -163,6 +176,86 @@ class SpecieProximityFilter(AbstractStructureFilter):
         return cls(**dct["init_args"])
 
 
+class StructureIndex:
+    """Index of structures used by RemoveDuplicatesFilter and RemoveExistingFilter to find
+    matching structures without comparing to every indexed structure.
+
+    The structures are bucketed by the comparator hash of their composition, their space group
+    number (if symprec is given) and the number of sites of their reduced structure (when the
+    structure matcher can only match reduced structures with the same number of sites), so that
+    StructureMatcher.fit only runs against the few structures of the same bucket. The index keeps
+    the reduced structures, hence the fits skip the structure reduction.
+    """
+
+    def __init__(
+        self,
+        structure_matcher: StructureMatcher,
+        symprec: float | None = None,
+        by_composition: bool = True,
+    ) -> None:
+        """
+        Args:
+            structure_matcher (StructureMatcher): Structure matcher used for the comparisons.
+            symprec (float | None): The precision in the symmetry finder algorithm. If None,
+                the structures are not bucketed by space group.
+            by_composition (bool): Whether to bucket the structures by the comparator hash
+                of their composition.
+        """
+        self.structure_matcher = structure_matcher
+        self.symprec = symprec
+        self.by_composition = by_composition
+        self._buckets: dict[tuple, list[Structure]] = defaultdict(list)
+
+    def get_key(self, structure: Structure | IStructure) -> tuple[tuple, Structure]:
+        """Get the bucket of a structure and its reduced structure.
+
+        Args:
+            structure (Structure | IStructure): Structure to index or look up.
+
+        Returns:
+            tuple[tuple, Structure]: Bucket key and reduced structure.
+        """
+        matcher = self.structure_matcher
+        spg_num = None
+        if self.symprec is not None:
+            spg_num = SpacegroupAnalyzer(structure, symprec=self.symprec).get_space_group_number()  # type:ignore[arg-type]
+
+        # StructureMatcher.fit compares the compositions without the ignored species
+        processed = matcher._process_species([structure])[0]
+        comp_hash = matcher._comparator.get_hash(processed.composition) if self.by_composition else None
+        reduced = matcher._get_reduced_structure(processed, matcher._primitive_cell, niggli=True)
+        # Without supercells nor subsets, only reduced structures with as many sites can match
+        n_sites = None if matcher._supercell or matcher._subset else len(reduced)
+        return (comp_hash, spg_num, n_sites), reduced
+
+    def add(self, key: tuple, reduced: Structure) -> None:
+        """Add a structure to the index.
+
+        Args:
+            key (tuple): Bucket key, from get_key.
+            reduced (Structure): Reduced structure, from get_key.
+        """
+        self._buckets[key].append(reduced)
+
+    def find(self, key: tuple, reduced: Structure) -> Structure | None:
+        """Find an indexed structure matching a structure.
+
+        Args:
+            key (tuple): Bucket key, from get_key.
+            reduced (Structure): Reduced structure, from get_key.
+
+        Returns:
+            Structure | None: The reduced structure of the first match, None if there is none.
+        """
+        for struct in self._buckets.get(key, ()):
+            if self.structure_matcher.fit(struct, reduced, skip_structure_reduction=True):
+                return struct
+        return None
+
+    def __len__(self) -> int:
+        return sum(map(len, self._buckets.values()))
+
+
 class RemoveDuplicatesFilter(AbstractStructureFilter):
     """This filter removes exact duplicate structures from the transmuter."""
 
@@ -189,6 +282,7 @@ class RemoveDuplicatesFilter(AbstractStructureFilter):
             self.structure_matcher = StructureMatcher.from_dict(structure_matcher)
         else:
             self.structure_matcher = structure_matcher or StructureMatcher(comparator=ElementComparator())
+        self._index = StructureIndex(self.structure_matcher, symprec=symprec, by_composition=True)
 
     def test(self, structure: Structure) -> bool:
         """
@@ -198,28 +292,20 @@ class RemoveDuplicatesFilter(AbstractStructureFilter):
         Returns:
             bool: True if structure is not in list.
         """
-        hash_comp = self.structure_matcher._comparator.get_hash(structure.composition)
-        if not self.structure_list[hash_comp]:
-            self.structure_list[hash_comp].append(structure)
-            return True
-
-        def get_spg_num(struct: Structure) -> int:
-            finder = SpacegroupAnalyzer(struct, symprec=self.symprec)  # type:ignore[arg-type]
-            return finder.get_space_group_number()
-
-        for struct in self.structure_list[hash_comp]:
-            if (self.symprec is None or get_spg_num(struct) == get_spg_num(structure)) and self.structure_matcher.fit(
-                struct, structure
-            ):
-                return False
-
-        self.structure_list[hash_comp].append(structure)
+        key, reduced = self._index.get_key(structure)
+        if self._index.find(key, reduced) is not None:
+            return False
+
+        self._index.add(key, reduced)
+        self.structure_list[self.structure_matcher._comparator.get_hash(structure.composition)].append(structure)
         return True
 
 
 class RemoveExistingFilter(AbstractStructureFilter):
     """This filter removes structures existing in a given list from the transmuter."""
 
+    order_dependent = False
+
     def __init__(
         self,
         existing_structures: list[Structure],
@@ -244,24 +330,23 @@ class RemoveExistingFilter(AbstractStructureFilter):
             self.structure_matcher = StructureMatcher.from_dict(structure_matcher)
         else:
             self.structure_matcher = structure_matcher or StructureMatcher(comparator=ElementComparator())
+        self._index: StructureIndex | None = None
 
     def test(self, structure: Structure):
         """True if structure is not in existing list."""
-
-        def get_sg(s):
-            finder = SpacegroupAnalyzer(s, symprec=self.symprec)
-            return finder.get_space_group_number()
-
-        for struct in self.existing_structures:
-            if (
-                (
-                    self.structure_matcher._comparator.get_hash(structure.composition)
-                    == self.structure_matcher._comparator.get_hash(struct.composition)
-                    and self.symprec is None
-                )
-                or get_sg(struct) == get_sg(structure)
-            ) and self.structure_matcher.fit(struct, structure):
-                return False
+        if self._index is None:
+            # Without a symmetry check, the structures are only compared within the same composition,
+            # which StructureMatcher.fit requires anyway unless it allows subsets
+            self._index = StructureIndex(
+                self.structure_matcher,
+                symprec=self.symprec,
+                by_composition=not self.structure_matcher._subset,
+            )
+            for struct in self.existing_structures:
+                self._index.add(*self._index.get_key(struct))
+
+        if self._index.find(*self._index.get_key(structure)) is not None:
+            return False
 
         self.structure_list.append(structure)
         return True
@@ -282,6 +367,8 @@ class ChargeBalanceFilter(AbstractStructureFilter):
     assumed to have net charge of 0.
     """
 
+    order_dependent = False
+
     def __init__(self):
         """No args required."""
 
@@ -300,6 +387,8 @@ class SpeciesMaxDistFilter(AbstractStructureFilter):
     assumed to have net charge of 0.
     """
 
+    order_dependent = False
+
     def __init__(self, sp1, sp2, max_dist):
         """
         Args:
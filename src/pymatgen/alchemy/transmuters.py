@@ -9,16 +9,20 @@ entire directory of vasp input files for running.
 
 from __future__ import annotations
 
+import logging
 import os
 import re
+import time
 from multiprocessing import Pool
 from typing import TYPE_CHECKING
 
+from tqdm import tqdm
+
 from pymatgen.alchemy.materials import TransformedStructure
 from pymatgen.io.vasp.sets import MPRelaxSet, VaspInputSet
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Sequence
+    from collections.abc import Callable, Iterator, Sequence
 
     from typing_extensions import Self
 
@@ -31,6 +35,8 @@ __maintainer__ = "Shyue Ping Ong"
 __email__ = "shyuep@gmail.com"
 __date__ = "Mar 4, 2012"
 
+logger = logging.getLogger(__name__)
+
 
 class StandardTransmuter:
     """An example of a Transmuter object, which performs a sequence of
@@ -38,6 +44,8 @@ class StandardTransmuter:
 
     Attributes:
         transformed_structures (list[Structure]): All transformed structures.
+        stage_timings (list[dict]): For each transformation applied, its name, the numbers of input,
+            output and kept (after filtering) structures and the time taken in seconds.
     """
 
     def __init__(
@@ -46,6 +54,9 @@ class StandardTransmuter:
         transformations=None,
         extend_collection: int = 0,
         ncores: int | None = None,
+        *,
+        chunksize: int = 1,
+        progress: bool = False,
     ) -> None:
         """Initialize a transmuter from an initial list of
         pymatgen.alchemy.materials.TransformedStructure.
@@ -61,10 +72,21 @@ class StandardTransmuter:
                 transformation.
             ncores (int): Number of cores to use for applying transformations.
                 Uses multiprocessing.Pool. Default is None, which implies
-                serial.
+                serial. Only the transformations whose use_multiprocessing is True
+                run in the pool, on copies of the transformation, so the state they
+                keep from apply_transformation (such as the lowest_energy_structure
+                of OrderDisorderedStructureTransformation) is not updated.
+            chunksize (int): Number of structures sent at once to each process
+                when ncores is set. Larger chunks reduce the communication overhead,
+                smaller ones balance the load better when the cost of a transformation
+                varies a lot between structures.
+            progress (bool): Whether to show a progress bar for each transformation.
         """
         self.transformed_structures = transformed_structures
         self.ncores = ncores
+        self.chunksize = chunksize
+        self.progress = progress
+        self.stage_timings: list[dict] = []
         if transformations is not None:
             for trans in transformations:
                 self.append_transformation(trans, extend_collection=extend_collection)
@@ -102,7 +124,13 @@ class StandardTransmuter:
         for ts in self.transformed_structures:
             ts.redo_next_change()
 
-    def append_transformation(self, transformation, extend_collection=False, clear_redo=True) -> list[bool]:
+    def append_transformation(
+        self,
+        transformation,
+        extend_collection=False,
+        clear_redo=True,
+        structure_filters: Sequence[AbstractStructureFilter] | None = None,
+    ) -> list[bool]:
         """Append a transformation to all TransformedStructures.
 
         Args:
@@ -114,38 +142,101 @@ class StandardTransmuter:
                 this is True, meaning any appends clears the history of
                 undoing. However, when using append_transformation to do a
                 redo, the redo list should not be cleared to allow multiple redos.
+            structure_filters (Sequence[AbstractStructureFilter]): Filters applied to
+                the transformed structures as they are produced, which gives the same
+                result as calling apply_filter with each of them afterwards without
+                keeping the rejected structures around. The alternatives from
+                one-to-many transformations come after all the other structures, so
+                only the leading filters that are not order-dependent (see
+                AbstractStructureFilter.order_dependent) are applied to them as they are
+                produced. The remaining filters, from the first order-dependent one such
+                as RemoveDuplicatesFilter, are applied to the surviving alternatives after
+                all the other structures, following the order of transformed_structures.
 
         Returns:
             list[bool]: Each list item is True if the transformation altered the structure
                 with the corresponding index.
         """
-        if self.ncores and transformation.use_multiprocessing:
+        start = time.perf_counter()
+        n_inputs = len(self.transformed_structures)
+        n_outputs = 0
+        structure_filters = list(structure_filters or [])
+        # Number of leading filters whose results do not depend on the order of the structures
+        n_early = next(
+            (idx for idx, structure_filter in enumerate(structure_filters) if structure_filter.order_dependent),
+            len(structure_filters),
+        )
+        kept: list[TransformedStructure] = []
+        alternatives: list[TransformedStructure] = []
+        for ts, new in tqdm(
+            self._transform(transformation, extend_collection, clear_redo),
+            total=n_inputs,
+            desc=type(transformation).__name__,
+            disable=not self.progress,
+        ):
+            n_outputs += 1 + len(new)
+            if _passes_filters(ts, structure_filters):
+                kept.append(ts)
+            alternatives.extend(
+                alt
+                for alt in new
+                if all(structure_filter.test(alt.final_structure) for structure_filter in structure_filters[:n_early])
+            )
+        kept.extend(alt for alt in alternatives if _passes_filters(alt, structure_filters, n_tested=n_early))
+        self.transformed_structures = kept
+
+        elapsed = time.perf_counter() - start
+        self.stage_timings.append(
+            {
+                "transformation": type(transformation).__name__,
+                "n_inputs": n_inputs,
+                "n_outputs": n_outputs,
+                "n_kept": len(kept),
+                "time": elapsed,
+            }
+        )
+        logger.info(
+            f"{type(transformation).__name__}: {n_inputs} -> {n_outputs} structures, {len(kept)} kept, {elapsed:.2f} s"
+        )
+
+        # len(ts) > 1 checks if the structure has history
+        return [len(ts) > 1 for ts in self.transformed_structures]
+
+    def _transform(
+        self, transformation, extend_collection, clear_redo
+    ) -> Iterator[tuple[TransformedStructure, list[TransformedStructure]]]:
+        """Apply a transformation to all TransformedStructures, yielding them in order
+        together with the new structures from one-to-many transformations.
+        """
+        if self.ncores and transformation.use_multiprocessing and len(self.transformed_structures) > 1:
             with Pool(self.ncores) as pool:
-                # need to condense arguments into single tuple to use map
-                z = ((ts, transformation, extend_collection, clear_redo) for ts in self.transformed_structures)
-                trafo_new_structs = pool.map(_apply_transformation, z, 1)
-                self.transformed_structures = []
-                for ts in trafo_new_structs:
-                    self.transformed_structures.extend(ts)
+                # need to condense arguments into single tuple to use imap
+                args = ((ts, transformation, extend_collection, clear_redo) for ts in self.transformed_structures)
+                for ts, *new in pool.imap(_apply_transformation, args, self.chunksize):
+                    yield ts, new
         else:
-            new_structures = []
             for ts in self.transformed_structures:
                 new = ts.append_transformation(transformation, extend_collection, clear_redo=clear_redo)
-                if new is not None:
-                    new_structures += new
-            self.transformed_structures += new_structures
-
-        # len(ts) > 1 checks if the structure has history
-        return [len(ts) > 1 for ts in self.transformed_structures]
+                yield ts, new or []
 
-    def extend_transformations(self, transformations):
+    def extend_transformations(
+        self,
+        transformations,
+        extend_collection=False,
+        structure_filters: Sequence[AbstractStructureFilter] | None = None,
+    ):
         """Extend a sequence of transformations to the TransformedStructure.
 
         Args:
             transformations: Sequence of Transformations
+            extend_collection: Whether to use more than one output structure
+                from one-to-many transformations, see append_transformation.
+            structure_filters (Sequence[AbstractStructureFilter]): Filters applied to
+                the transformed structures after each transformation, see
+                append_transformation.
         """
         for trafo in transformations:
-            self.append_transformation(trafo)
+            self.append_transformation(trafo, extend_collection, structure_filters=structure_filters)
 
     def apply_filter(self, structure_filter: AbstractStructureFilter):
         """Apply a structure_filter to the list of TransformedStructures
@@ -357,6 +448,22 @@ def batch_write_vasp_input(
             writer.write_file(os.path.join(dirname, f"{formula}.cif"))
 
 
+def _passes_filters(
+    ts: TransformedStructure, structure_filters: Sequence[AbstractStructureFilter] | None, n_tested: int = 0
+) -> bool:
+    """Test a transformed structure against filters, stopping at the first failing one, and
+    record the filters in its history if it passes all of them. The first n_tested filters
+    are those the structure already passed.
+    """
+    if not structure_filters:
+        return True
+    if not all(structure_filter.test(ts.final_structure) for structure_filter in structure_filters[n_tested:]):
+        return False
+    for structure_filter in structure_filters:
+        ts.append_filter(structure_filter)
+    return True
+
+
 def _apply_transformation(inputs):
     """Helper method for multiprocessing of apply_transformation. Must not be
     in the class so that it can be pickled.
@@ -1793,7 +1793,8 @@ class DeltaCSMNbSetWeight(NbSetWeight):
         self.delta_cn_weight_estimators_rfs = {}
         if delta_cn_weight_estimators is not None:
             for delta_cn, dcn_w_estimator in delta_cn_weight_estimators.items():
-                self.delta_cn_weight_estimators_rfs[delta_cn] = DeltaCSMRatioFunction.from_dict(dcn_w_estimator)
+                # The keys are strings when read back from json
+                self.delta_cn_weight_estimators_rfs[int(delta_cn)] = DeltaCSMRatioFunction.from_dict(dcn_w_estimator)
         self.symmetry_measure_type = symmetry_measure_type
         self.max_effective_csm = self.effective_csm_estimator["options"]["max_csm"]
 
@@ -19,9 +19,11 @@ import logging
 import time
 import warnings
 from random import shuffle
+from types import SimpleNamespace
 from typing import TYPE_CHECKING
 
 import numpy as np
+from joblib import Parallel, delayed
 from numpy.linalg import norm, svd
 
 from pymatgen.analysis.bond_valence import BVAnalyzer
@@ -234,16 +236,14 @@ class AbstractGeometry:
     def points_wcs_ctwcc(self, permutation=None):
         """
         Args:
-            permutation:
+            permutation: A permutation of the points, or an array of permutations with
+                shape (n_permutations, cn), in which case the permuted points are stacked.
         """
         if permutation is None:
             return self._points_wcs_ctwcc
-        return np.concatenate(
-            (
-                self._points_wcs_ctwcc[:1],
-                self._points_wocs_ctwcc.take(np.array(permutation, dtype=np.intp), axis=0),
-            )
-        )
+        permutation = np.array(permutation, dtype=np.intp)
+        central = np.broadcast_to(self._points_wcs_ctwcc[:1], (*permutation.shape[:-1], 1, 3))
+        return np.concatenate((central, self._points_wocs_ctwcc.take(permutation, axis=0)), axis=-2)
 
     def points_wocs_ctwcc(self, permutation=None):
         """
@@ -328,6 +328,44 @@ def symmetry_measure(points_distorted, points_perfect):
     }
 
 
+def symmetry_measures(points_distorted, points_perfect):
+    """
+    Computes the continuous symmetry measures of a stack of (distorted) sets of points, e.g. the points of a local
+    environment in different permutations, with respect to the same (perfect) set of points. Equivalent to calling
+    symmetry_measure for each set of points, but the rotations, scaling factors and measures are obtained for all
+    sets at once.
+
+    Args:
+        points_distorted: Array of shape (n_sets, n_points, 3) with the sets of points describing the (distorted)
+            polyhedra for which the symmetry measures have to be computed.
+        points_perfect: List of "perfect" points describing a given model polyhedron.
+
+    Returns:
+        list[dict]: The symmetry measure, scaling factor and rotation matrix of each set of points, as returned by
+            symmetry_measure.
+    """
+    points_distorted = np.asarray(points_distorted, dtype=float)
+    points_perfect = np.asarray(points_perfect, dtype=float)
+    if points_distorted.shape[1] == 1:
+        return [symmetry_measure(points, points_perfect) for points in points_distorted]
+
+    # Rotations aligning each set of distorted points to the perfect points in a least-square sense (Kabsch)
+    U, _S, Vt = svd(np.matmul(points_distorted.transpose(0, 2, 1), points_perfect))
+    rots = np.matmul(Vt.transpose(0, 2, 1), U.transpose(0, 2, 1))
+    # Scaling factors in a least-square sense
+    rotated_coords = np.matmul(points_distorted, rots.transpose(0, 2, 1))
+    scaling_factors = np.einsum("nij,ij->n", rotated_coords, points_perfect) / np.einsum(
+        "nij,nij->n", rotated_coords, rotated_coords
+    )
+    # Continuous symmetry measures [see Eq. 1 in Pinsky et al., Inorganic Chemistry 37, 5575 (1998)]
+    diff = points_perfect - scaling_factors[:, None, None] * rotated_coords
+    csms = np.einsum("nij,nij->n", diff, diff) / np.tensordot(points_perfect, points_perfect) * 100.0
+    return [
+        {"symmetry_measure": csm, "scaling_factor": scaling_factor, "rotation_matrix": rot}
+        for csm, scaling_factor, rot in zip(csms, scaling_factors, rots, strict=True)
+    ]
+
+
 def find_rotation(points_distorted, points_perfect):
     """
     This finds the rotation matrix that aligns the (distorted) set of points "points_distorted" with respect to the
@@ -366,6 +404,46 @@ def find_scaling_factor(points_distorted, points_perfect, rot):
     return num / denom, rotated_coords, points_perfect
 
 
+def _permutation_maps(permutation):
+    """Maps from the indices of the local points to the indices of the perfect points and back."""
+    perfect2local_map = dict(enumerate(permutation))
+    local2perfect_map = {ii: iperfect for iperfect, ii in perfect2local_map.items()}
+    return local2perfect_map, perfect2local_map
+
+
+def _site_symmetry_measures(finder, central_site, nb_sets_coords, optimization):
+    """Symmetry measures of the neighbors sets of one site, computed in a worker process by
+    LocalGeometryFinder.compute_structure_environments with n_jobs != 1.
+
+    Args:
+        finder: LocalGeometryFinder without structure, see LocalGeometryFinder._parameters_only.
+        central_site: Cartesian coordinates of the site.
+        nb_sets_coords: Coordinates of the neighbors in each neighbors set.
+        optimization: Optimization level.
+
+    Returns:
+        list[tuple]: The symmetry measures, separation planes and computation time of each neighbors set.
+    """
+    results = []
+    for coords in nb_sets_coords:
+        t1 = time.process_time()
+        finder.local_geometry = AbstractGeometry(
+            central_site=central_site,
+            bare_coords=coords,
+            centering_type=finder.centering_type,
+            include_central_site_in_centroid=finder.include_central_site_in_centroid,
+            optimization=optimization,
+        )
+        if optimization > 0:
+            planes = SimpleNamespace(local_planes={}, separations={})
+            cncgsm = finder.get_coordination_symmetry_measures_optim(nb_set=planes, optimization=optimization)
+            results.append((cncgsm, planes.local_planes, planes.separations, time.process_time() - t1))
+        else:
+            cncgsm = finder.get_coordination_symmetry_measures()
+            results.append((cncgsm, None, None, time.process_time() - t1))
+    return results
+
+
 class LocalGeometryFinder:
     """Main class used to find the local environments in a structure."""
 
@@ -584,6 +662,7 @@ class LocalGeometryFinder:
         voronoi_distance_cutoff=None,
         recompute=None,
         optimization=PRESETS["DEFAULT"]["optimization"],
+        n_jobs: int = 1,
     ):
         """Compute and returns the StructureEnvironments object containing all the information
         about the coordination environments in the structure.
@@ -617,6 +696,9 @@ class LocalGeometryFinder:
             recompute: whether to recompute the sites already computed (when initial_structure_environments
                 is not None)
             optimization: optimization algorithm
+            n_jobs: number of processes among which the sites are distributed to compute the symmetry
+                measures of their neighbors sets. Defaults to 1, i.e. serial. The time limit is not applied
+                to sites computed in parallel.
 
         Returns:
             StructureEnvironments: contains all the information about the coordination
@@ -754,6 +836,20 @@ class LocalGeometryFinder:
             self.detailed_voronoi.local_planes = [None] * len(self.structure)
             self.detailed_voronoi.separations = [None] * len(self.structure)
 
+        # Symmetry measures of the neighbors sets computed in parallel, site by site
+        precomputed = {}
+        if n_jobs != 1:
+            precomputed = self._compute_sites_symmetry_measures(
+                struct_envs,
+                sites_indices=[idx for idx in range(len(self.structure)) if idx in sites_indices],
+                all_cns=all_cns,
+                additional_conditions=additional_conditions,
+                valences=valences,
+                recompute=do_recompute,
+                optimization=optimization,
+                n_jobs=n_jobs,
+            )
+
         # Loop on all the sites
         for site_idx, site in enumerate(self.structure):
             if site_idx not in sites_indices:
@@ -766,14 +862,15 @@ class LocalGeometryFinder:
                 continue
             logger.debug(f" ... in site #{site_idx}/{len(self.structure)} ({site.species_string})")
             t1 = time.process_time()
-            if optimization > 0:
-                self.detailed_voronoi.local_planes[site_idx] = {}
-                self.detailed_voronoi.separations[site_idx] = {}
-            struct_envs.init_neighbors_sets(
-                isite=site_idx,
-                additional_conditions=additional_conditions,
-                valences=valences,
-            )
+            if site_idx not in precomputed:
+                if optimization > 0:
+                    self.detailed_voronoi.local_planes[site_idx] = {}
+                    self.detailed_voronoi.separations[site_idx] = {}
+                struct_envs.init_neighbors_sets(
+                    isite=site_idx,
+                    additional_conditions=additional_conditions,
+                    valences=valences,
+                )
 
             to_add_from_hints = []
             nb_sets_info = {}
@@ -785,6 +882,7 @@ class LocalGeometryFinder:
                 for inb_set, nb_set in enumerate(nb_sets):
                     logger.debug(f"    ... getting environments for nb_set ({cn}, {inb_set})")
                     t_nbset1 = time.process_time()
+                    nb_set_precomputed = precomputed.get(site_idx, {}).get((cn, inb_set))
                     ce = self.update_nb_set_environments(
                         se=struct_envs,
                         isite=site_idx,
@@ -793,10 +891,13 @@ class LocalGeometryFinder:
                         nb_set=nb_set,
                         recompute=do_recompute,
                         optimization=optimization,
+                        precomputed=nb_set_precomputed,
                     )
                     t_nbset2 = time.process_time()
                     nb_sets_info.setdefault(cn, {})
-                    nb_sets_info[cn][inb_set] = {"time": t_nbset2 - t_nbset1}
+                    nb_sets_info[cn][inb_set] = {
+                        "time": t_nbset2 - t_nbset1 if nb_set_precomputed is None else nb_set_precomputed[3]
+                    }
                     if get_from_hints:
                         for cg_symbol, cg_dict in ce:
                             cg = self.allcg[cg_symbol]
@@ -886,7 +987,63 @@ class LocalGeometryFinder:
         logger.debug(f"    ... compute_structure_environments ended in {time_end - time_init:.2f} seconds")
         return struct_envs
 
-    def update_nb_set_environments(self, se, isite, cn, inb_set, nb_set, recompute=False, optimization=None):
+    def _parameters_only(self) -> Self:
+        """Copy of this LocalGeometryFinder without the structure and Voronoi data, holding what is needed
+        to compute symmetry measures from the coordinates of a neighbors set.
+        """
+        finder = type(self).__new__(type(self))
+        for attr in (
+            "allcg",
+            "permutations_safe_override",
+            "plane_ordering_override",
+            "plane_safe_permutations",
+            "centering_type",
+            "include_central_site_in_centroid",
+        ):
+            setattr(finder, attr, getattr(self, attr))
+        return finder
+
+    def _compute_sites_symmetry_measures(
+        self, se, *, sites_indices, all_cns, additional_conditions, valences, recompute, optimization, n_jobs
+    ):
+        """Initialize the neighbors sets of the given sites and compute their symmetry measures in parallel,
+        one task per site.
+
+        Returns:
+            dict: For each site, a dict mapping (cn, inb_set) to the symmetry measures, separation planes and
+                computation time of the neighbors set.
+        """
+        tasks = []
+        for site_idx in sites_indices:
+            if optimization > 0:
+                self.detailed_voronoi.local_planes[site_idx] = {}
+                self.detailed_voronoi.separations[site_idx] = {}
+            se.init_neighbors_sets(isite=site_idx, additional_conditions=additional_conditions, valences=valences)
+            keys, nb_sets_coords = [], []
+            for cn, nb_sets in se.neighbors_sets[site_idx].items():
+                if cn not in all_cns:
+                    continue
+                for inb_set, nb_set in enumerate(nb_sets):
+                    if not recompute and se.get_coordination_environments(site_idx, cn, nb_set) is not None:
+                        continue
+                    keys.append((cn, inb_set))
+                    nb_sets_coords.append(nb_set.neighb_coordsOpt if optimization == 2 else nb_set.neighb_coords)
+            tasks.append((site_idx, keys, nb_sets_coords))
+
+        finder = self._parameters_only()
+        cart_coords = self.structure.cart_coords
+        results = Parallel(n_jobs=n_jobs)(
+            delayed(_site_symmetry_measures)(finder, cart_coords[site_idx], nb_sets_coords, optimization)
+            for site_idx, _, nb_sets_coords in tasks
+        )
+        return {
+            site_idx: dict(zip(keys, site_results, strict=True))
+            for (site_idx, keys, _), site_results in zip(tasks, results, strict=True)
+        }
+
+    def update_nb_set_environments(
+        self, se, isite, cn, inb_set, nb_set, recompute=False, optimization=None, precomputed=None
+    ):
         """
         Args:
             se:
@@ -896,11 +1053,19 @@ class LocalGeometryFinder:
             nb_set:
             recompute:
             optimization:
+            precomputed: Symmetry measures, separation planes and computation time of the neighbors set
+                computed in a worker process, see compute_structure_environments.
         """
         ce = se.get_coordination_environments(isite=isite, cn=cn, nb_set=nb_set)
         if ce is not None and not recompute:
             return ce
         ce = ChemicalEnvironments()
+        if precomputed is not None:
+            cncgsm, local_planes, separations, _ = precomputed
+            if optimization > 0:
+                nb_set.local_planes = local_planes
+                nb_set.separations = separations
+            return self._add_nb_set_environments(se, ce, cncgsm, isite=isite, cn=cn, inb_set=inb_set, nb_set=nb_set)
         neighb_coords = nb_set.neighb_coordsOpt if optimization == 2 else nb_set.neighb_coords
         self.setup_local_geometry(isite, coords=neighb_coords, optimization=optimization)
         if optimization > 0:
@@ -911,6 +1076,13 @@ class LocalGeometryFinder:
         else:
             logger.debug("Getting StructureEnvironments with standard algorithm")
             cncgsm = self.get_coordination_symmetry_measures()
+        return self._add_nb_set_environments(se, ce, cncgsm, isite=isite, cn=cn, inb_set=inb_set, nb_set=nb_set)
+
+    @staticmethod
+    def _add_nb_set_environments(se, ce, cncgsm, *, isite, cn, inb_set, nb_set):
+        """Add the coordination geometries with their symmetry measures to the ChemicalEnvironments of a
+        neighbors set and store it in the StructureEnvironments.
+        """
         for coord_geom_symb, dct in cncgsm.items():
             other_csms = {
                 "csm_wocs_ctwocc": dct["csm_wocs_ctwocc"],
@@ -1447,68 +1619,35 @@ class LocalGeometryFinder:
         Returns:
             The symmetry measures for the given coordination geometry for each permutation investigated.
         """
-        # permutations_symmetry_measures = np.zeros(len(algo.permutations),
-        #                                           np.float_)
-        if optimization == 2:
-            permutations_symmetry_measures = [None] * len(algo.permutations)
-            permutations = []
-            algos = []
-            local2perfect_maps = []
-            perfect2local_maps = []
-            for idx, perm in enumerate(algo.permutations):
-                local2perfect_map = {}
-                perfect2local_map = {}
-                permutations.append(perm)
-                for iperfect, ii in enumerate(perm):
-                    perfect2local_map[iperfect] = ii
-                    local2perfect_map[ii] = iperfect
-                local2perfect_maps.append(local2perfect_map)
-                perfect2local_maps.append(perfect2local_map)
-
-                points_distorted = self.local_geometry.points_wcs_ctwcc(permutation=perm)
-
-                sm_info = symmetry_measure(points_distorted=points_distorted, points_perfect=points_perfect)
-                sm_info["translation_vector"] = self.local_geometry.centroid_with_centre
-
-                permutations_symmetry_measures[idx] = sm_info
-                algos.append(str(algo))
-            return (
-                permutations_symmetry_measures,
-                permutations,
-                algos,
-                local2perfect_maps,
-                perfect2local_maps,
-            )
+        permutations = list(algo.permutations)
+        maps = [_permutation_maps(perm) for perm in permutations]
+        return (
+            self._permutations_symmetry_measures(permutations, points_perfect),
+            permutations,
+            [str(algo)] * len(permutations),
+            [local2perfect_map for local2perfect_map, _ in maps],
+            [perfect2local_map for _, perfect2local_map in maps],
+        )
 
-        permutations_symmetry_measures = [None] * len(algo.permutations)
-        permutations = []
-        algos = []
-        local2perfect_maps = []
-        perfect2local_maps = []
-        for idx, perm in enumerate(algo.permutations):
-            local2perfect_map = {}
-            perfect2local_map = {}
-            permutations.append(perm)
-            for iperfect, ii in enumerate(perm):
-                perfect2local_map[iperfect] = ii
-                local2perfect_map[ii] = iperfect
-            local2perfect_maps.append(local2perfect_map)
-            perfect2local_maps.append(perfect2local_map)
+    def _permutations_symmetry_measures(self, permutations, points_perfect):
+        """Symmetry measures of the local geometry in each of the given permutations with respect to the perfect
+        points, evaluated for all permutations at once.
 
-            points_distorted = self.local_geometry.points_wcs_ctwcc(permutation=perm)
+        Args:
+            permutations: Permutations of the points of the local geometry.
+            points_perfect: Points of the perfect geometry.
 
-            sm_info = symmetry_measure(points_distorted=points_distorted, points_perfect=points_perfect)
+        Returns:
+            list[dict]: The symmetry measure information (see symmetry_measure) of each permutation, including the
+                translation vector.
+        """
+        if len(permutations) == 0:
+            return []
+        points_distorted = self.local_geometry.points_wcs_ctwcc(permutation=permutations)
+        sm_infos = symmetry_measures(points_distorted=points_distorted, points_perfect=points_perfect)
+        for sm_info in sm_infos:
             sm_info["translation_vector"] = self.local_geometry.centroid_with_centre
-
-            permutations_symmetry_measures[idx] = sm_info
-            algos.append(str(algo))
-        return (
-            permutations_symmetry_measures,
-            permutations,
-            algos,
-            local2perfect_maps,
-            perfect2local_maps,
-        )
+        return sm_infos
 
     def coordination_geometry_symmetry_measures_separation_plane(
         self,
@@ -1586,11 +1725,7 @@ class LocalGeometryFinder:
                     permutations_symmetry_measures.extend(csm)
                     permutations.extend(perm)
                     for thisperm in perm:
-                        p2l = {}
-                        l2p = {}
-                        for i_p, pp in enumerate(thisperm):
-                            p2l[i_p] = pp
-                            l2p[pp] = i_p
+                        l2p, p2l = _permutation_maps(thisperm)
                         perfect2local_maps.append(p2l)
                         local2perfect_maps.append(l2p)
                     algos.extend(algo)
@@ -1666,11 +1801,7 @@ class LocalGeometryFinder:
                 permutations_symmetry_measures.extend(csm)
                 permutations.extend(perm)
                 for thisperm in perm:
-                    p2l = {}
-                    l2p = {}
-                    for i_p, pp in enumerate(thisperm):
-                        p2l[i_p] = pp
-                        l2p[pp] = i_p
+                    l2p, p2l = _permutation_maps(thisperm)
                     perfect2local_maps.append(p2l)
                     local2perfect_maps.append(l2p)
                 algos.extend(algo)
@@ -1754,11 +1885,7 @@ class LocalGeometryFinder:
                     permutations_symmetry_measures.extend(csm)
                     permutations.extend(perm)
                     for thisperm in perm:
-                        p2l = {}
-                        l2p = {}
-                        for i_p, pp in enumerate(thisperm):
-                            p2l[i_p] = pp
-                            l2p[pp] = i_p
+                        l2p, p2l = _permutation_maps(thisperm)
                         perfect2local_maps.append(p2l)
                         local2perfect_maps.append(l2p)
                     algos.extend(algo)
@@ -1854,6 +1981,7 @@ class LocalGeometryFinder:
 
             # plane_found = True
 
+            new_permutations = []
             for sep_perm in sep_perms:
                 perm1 = [separation_perm[ii] for ii in sep_perm]
                 pp = [perm1[ii] for ii in argref_separation]
@@ -1864,16 +1992,14 @@ class LocalGeometryFinder:
                         continue
                     tested_permutations.add(tuple_ref_perm)
 
-                permutations.append(pp)
+                new_permutations.append(pp)
                 if testing:
                     separation_permutations.append(sep_perm)
 
-                points_distorted = self.local_geometry.points_wcs_ctwcc(permutation=pp)
-
-                sm_info = symmetry_measure(points_distorted=points_distorted, points_perfect=points_perfect)
-                sm_info["translation_vector"] = self.local_geometry.centroid_with_centre
-
-                permutations_symmetry_measures.append(sm_info)
+            permutations.extend(new_permutations)
+            permutations_symmetry_measures.extend(
+                self._permutations_symmetry_measures(new_permutations, points_perfect)
+            )
             if plane_found:
                 break
         if len(permutations_symmetry_measures) > 0:
@@ -1947,13 +2073,7 @@ class LocalGeometryFinder:
 
             permutations.append(pp)
 
-            points_distorted = self.local_geometry.points_wcs_ctwcc(permutation=pp)
-
-            sm_info = symmetry_measure(points_distorted=points_distorted, points_perfect=points_perfect)
-
-            sm_info["translation_vector"] = self.local_geometry.centroid_with_centre
-
-            permutations_symmetry_measures.append(sm_info)
+        permutations_symmetry_measures = self._permutations_symmetry_measures(permutations, points_perfect)
 
         if len(permutations_symmetry_measures) > 0:
             return (
@@ -2022,13 +2142,7 @@ class LocalGeometryFinder:
 
             permutations.append(pp)
 
-            points_distorted = self.local_geometry.points_wcs_ctwcc(permutation=pp)
-
-            sm_info = symmetry_measure(points_distorted=points_distorted, points_perfect=points_perfect)
-
-            sm_info["translation_vector"] = self.local_geometry.centroid_with_centre
-
-            permutations_symmetry_measures.append(sm_info)
+        permutations_symmetry_measures = self._permutations_symmetry_measures(permutations, points_perfect)
 
         if len(permutations_symmetry_measures) > 0:
             return (
@@ -2056,29 +2170,19 @@ class LocalGeometryFinder:
         if "NRANDOM" in kwargs:
             warnings.warn("NRANDOM is deprecated, use n_random instead", category=DeprecationWarning, stacklevel=2)
             n_random = kwargs.pop("NRANDOM")
-        permutations_symmetry_measures = [None] * n_random
         permutations = []
         algos = []
         perfect2local_maps = []
         local2perfect_maps = []
         rng = np.random.default_rng()
-        for idx in range(n_random):
+        for _ in range(n_random):
             perm = rng.permutation(coordination_geometry.coordination_number)
             permutations.append(perm)
-            p2l = {}
-            l2p = {}
-            for i_p, pp in enumerate(perm):
-                p2l[i_p] = pp
-                l2p[pp] = i_p
+            l2p, p2l = _permutation_maps(perm)
             perfect2local_maps.append(p2l)
             local2perfect_maps.append(l2p)
-
-            points_distorted = self.local_geometry.points_wcs_ctwcc(permutation=perm)
-            sm_info = symmetry_measure(points_distorted=points_distorted, points_perfect=points_perfect)
-            sm_info["translation_vector"] = self.local_geometry.centroid_with_centre
-
-            permutations_symmetry_measures[idx] = sm_info
             algos.append("APPROXIMATE_FALLBACK")
+        permutations_symmetry_measures = self._permutations_symmetry_measures(permutations, points_perfect)
         return (
             permutations_symmetry_measures,
             permutations,
@@ -0,0 +1,334 @@
+"""
+This module provides an on-disk cache for the StructureEnvironments and LightStructureEnvironments objects.
+
+Computing the StructureEnvironments of a structure (Voronoi analysis and continuous symmetry measures of all the
+neighbors sets) is by far the most expensive step of a chemenv analysis, whereas applying a strategy on it to get
+the LightStructureEnvironments is cheap. The cache stores the StructureEnvironments (including the data of its
+DetailedVoronoiContainer) as compressed json files keyed by a hash of the structure and of all the parameters of the
+LocalGeometryFinder, so that analyzing the same structure again, e.g. with different chemenv strategies, only
+reloads it.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+import orjson
+from monty.json import jsanitize
+
+from pymatgen.analysis.chemenv.coordination_environments.structure_environments import (
+    LightStructureEnvironments,
+    StructureEnvironments,
+)
+from pymatgen.core import __version__ as PYMATGEN_VERSION
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from pymatgen.analysis.chemenv.coordination_environments.chemenv_strategies import AbstractChemenvStrategy
+    from pymatgen.analysis.chemenv.coordination_environments.coordination_geometry_finder import LocalGeometryFinder
+    from pymatgen.core import Structure
+
+# Arguments of compute_structure_environments that do not change the resulting StructureEnvironments
+_UNKEYED_ARGUMENTS = frozenset({"n_jobs"})
+# Arguments of compute_structure_environments for which the result cannot be cached
+_UNCACHEABLE_ARGUMENTS = frozenset({"timelimit", "initial_structure_environments"})
+
+
+def _dumps(obj: Any) -> bytes:
+    return orjson.dumps(
+        obj,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        default=lambda o: getattr(o, "tolist", lambda: o)(),
+    )
+
+
+def structure_hash(structure: Structure, decimals: int = 8) -> str:
+    """Get a hash of a structure identifying it up to numerical noise.
+
+    The sites are hashed in order (the StructureEnvironments refer to the sites by their index), with their
+    species and occupancies, fractional coordinates and properties, together with the lattice and the charge.
+
+    Args:
+        structure: Structure to hash.
+        decimals: Number of decimals the lattice matrix and fractional coordinates are rounded to.
+
+    Returns:
+        str: Hexadecimal sha256 digest.
+    """
+    # Adding 0.0 turns negative zeros into positive ones so that they hash identically
+    matrix = np.round(structure.lattice.matrix, decimals) + 0.0
+    frac_coords = np.round(structure.frac_coords, decimals) + 0.0
+    species = [sorted((str(sp), occu) for sp, occu in site.species.items()) for site in structure]
+    content = {
+        "lattice": matrix,
+        "pbc": structure.pbc,
+        "species": species,
+        "frac_coords": frac_coords,
+        "charge": structure.charge,
+        "site_properties": jsanitize(structure.site_properties),
+    }
+    return hashlib.sha256(_dumps(content)).hexdigest()
+
+
+class StructureEnvironmentsCache:
+    """On-disk, content-addressed cache of StructureEnvironments and LightStructureEnvironments.
+
+    Each entry is a gzip-compressed json file in cache_dir named after its key. The cache is shared between
+    processes: entries are written atomically and a missing or corrupted entry is treated as a cache miss. When the
+    total size of the entries exceeds max_size_bytes, the least recently used ones are removed.
+
+    Example:
+        cache = StructureEnvironmentsCache("~/.cache/chemenv")
+        se = cache.get_or_compute(lgf, structure, maximum_distance_factor=1.41)
+        lse = cache.get_or_compute_light(lgf, structure, strategy, maximum_distance_factor=1.41)
+    """
+
+    SE_SUFFIX = ".se.json.gz"
+    LSE_SUFFIX = ".lse.json.gz"
+
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        max_size_bytes: int | None = 1024**3,
+        compresslevel: int = 6,
+    ) -> None:
+        """
+        Args:
+            cache_dir: Directory of the cache, created if needed.
+            max_size_bytes: Maximum total size of the cache entries. None for an unbounded cache.
+            compresslevel: gzip compression level of the entries.
+        """
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size_bytes = max_size_bytes
+        self.compresslevel = compresslevel
+
+    @staticmethod
+    def finder_parameters(lgf: LocalGeometryFinder) -> dict:
+        """Get the parameters of a LocalGeometryFinder that the StructureEnvironments depend on.
+
+        Args:
+            lgf: LocalGeometryFinder.
+
+        Returns:
+            dict: Parameters of the finder.
+        """
+        return {
+            "centering_type": lgf.centering_type,
+            "include_central_site_in_centroid": lgf.include_central_site_in_centroid,
+            "bva_distance_scale_factor": lgf.bva_distance_scale_factor,
+            "structure_refinement": lgf.structure_refinement,
+            "spg_analyzer_options": lgf.spg_analyzer_options,
+            "permutations_safe_override": lgf.permutations_safe_override,
+            "plane_ordering_override": lgf.plane_ordering_override,
+            "plane_safe_permutations": lgf.plane_safe_permutations,
+        }
+
+    def structure_environments_key(self, lgf: LocalGeometryFinder, structure: Structure, **kwargs) -> str:
+        """Get the cache key of the StructureEnvironments of a structure.
+
+        Args:
+            lgf: LocalGeometryFinder used to compute the StructureEnvironments.
+            structure: Structure (before the refinement done by the LocalGeometryFinder).
+            kwargs: Arguments of LocalGeometryFinder.compute_structure_environments.
+
+        Returns:
+            str: Hexadecimal sha256 digest.
+        """
+        content = {
+            "pymatgen_version": PYMATGEN_VERSION,
+            "structure": structure_hash(structure),
+            "finder": self.finder_parameters(lgf),
+            "arguments": {key: val for key, val in kwargs.items() if key not in _UNKEYED_ARGUMENTS},
+        }
+        return hashlib.sha256(_dumps(jsanitize(content, strict=False, allow_bson=False))).hexdigest()
+
+    @staticmethod
+    def light_structure_environments_key(se_key: str, strategy: AbstractChemenvStrategy, **kwargs) -> str:
+        """Get the cache key of the LightStructureEnvironments obtained from a given StructureEnvironments.
+
+        Args:
+            se_key: Cache key of the StructureEnvironments.
+            strategy: ChemEnv strategy applied on the StructureEnvironments.
+            kwargs: Other arguments of LightStructureEnvironments.from_structure_environments.
+
+        Returns:
+            str: Hexadecimal sha256 digest.
+        """
+        content = {"se_key": se_key, "strategy": strategy.as_dict(), "arguments": kwargs}
+        return hashlib.sha256(_dumps(jsanitize(content, strict=False, allow_bson=False))).hexdigest()
+
+    def _path(self, key: str, suffix: str) -> Path:
+        return self.cache_dir / f"{key}{suffix}"
+
+    def _read(self, key: str, suffix: str) -> dict | None:
+        path = self._path(key, suffix)
+        try:
+            with open(path, "rb") as file:
+                dct = orjson.loads(gzip.decompress(file.read()))
+        except (OSError, EOFError, orjson.JSONDecodeError):
+            return None
+        # Mark the entry as recently used for the eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return dct
+
+    def _write(self, key: str, suffix: str, dct: dict) -> None:
+        data = gzip.compress(_dumps(dct), compresslevel=self.compresslevel)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            os.replace(tmp_path, self._path(key, suffix))
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+        self.evict()
+
+    def get(self, key: str) -> StructureEnvironments | None:
+        """Get a StructureEnvironments from the cache.
+
+        Args:
+            key: Cache key, see structure_environments_key.
+
+        Returns:
+            StructureEnvironments or None if it is not in the cache.
+        """
+        dct = self._read(key, self.SE_SUFFIX)
+        return None if dct is None else StructureEnvironments.from_dict(dct)
+
+    def put(self, key: str, structure_environments: StructureEnvironments) -> None:
+        """Store a StructureEnvironments in the cache.
+
+        Args:
+            key: Cache key, see structure_environments_key.
+            structure_environments: StructureEnvironments to store.
+        """
+        self._write(key, self.SE_SUFFIX, structure_environments.as_dict())
+
+    def get_or_compute(self, lgf: LocalGeometryFinder, structure: Structure, **kwargs) -> StructureEnvironments:
+        """Get the StructureEnvironments of a structure from the cache, computing and storing it if needed.
+
+        Args:
+            lgf: LocalGeometryFinder used to compute the StructureEnvironments. Its structure is set up to the
+                given structure on a cache miss.
+            structure: Structure to analyze.
+            kwargs: Arguments of LocalGeometryFinder.compute_structure_environments. The results obtained with
+                a timelimit or from initial_structure_environments are not cached.
+
+        Returns:
+            StructureEnvironments: Environments of the structure.
+        """
+        if _UNCACHEABLE_ARGUMENTS.intersection(key for key, val in kwargs.items() if val is not None):
+            lgf.setup_structure(structure)
+            return lgf.compute_structure_environments(**kwargs)
+
+        key = self.structure_environments_key(lgf, structure, **kwargs)
+        se = self.get(key)
+        if se is None:
+            lgf.setup_structure(structure)
+            se = lgf.compute_structure_environments(**kwargs)
+            self.put(key, se)
+        return se
+
+    def get_or_compute_light(
+        self,
+        lgf: LocalGeometryFinder,
+        structure: Structure,
+        strategy: AbstractChemenvStrategy,
+        valences: str | list[int] | None = None,
+        valences_origin: str | None = None,
+        **kwargs,
+    ) -> LightStructureEnvironments:
+        """Get the LightStructureEnvironments of a structure for a given strategy from the cache, computing and
+        storing it if needed. The StructureEnvironments it is obtained from is itself taken from the cache when
+        possible, so that only applying the strategy is needed for a new strategy.
+
+        Args:
+            lgf: LocalGeometryFinder used to compute the StructureEnvironments.
+            structure: Structure to analyze.
+            strategy: ChemEnv strategy applied on the StructureEnvironments.
+            valences: Valences of the sites, see LightStructureEnvironments.from_structure_environments.
+            valences_origin: Origin of the valences.
+            kwargs: Arguments of LocalGeometryFinder.compute_structure_environments.
+
+        Returns:
+            LightStructureEnvironments: Coordination environments of the structure according to the strategy.
+        """
+        if _UNCACHEABLE_ARGUMENTS.intersection(key for key, val in kwargs.items() if val is not None):
+            key = None
+        else:
+            se_key = self.structure_environments_key(lgf, structure, **kwargs)
+            key = self.light_structure_environments_key(
+                se_key, strategy, valences=valences, valences_origin=valences_origin
+            )
+            dct = self._read(key, self.LSE_SUFFIX)
+            if dct is not None:
+                return LightStructureEnvironments.from_dict(dct)
+
+        lse = LightStructureEnvironments.from_structure_environments(
+            strategy=strategy,
+            structure_environments=self.get_or_compute(lgf, structure, **kwargs),
+            valences=valences,
+            valences_origin=valences_origin,
+        )
+        if key is not None:
+            self._write(key, self.LSE_SUFFIX, lse.as_dict())
+        return lse
+
+    def entries(self) -> list[Path]:
+        """Get the files of the cache entries, from the least to the most recently used.
+
+        Returns:
+            list[Path]: Paths of the entries.
+        """
+        paths = [*self.cache_dir.glob(f"*{self.SE_SUFFIX}"), *self.cache_dir.glob(f"*{self.LSE_SUFFIX}")]
+        mtimes = {}
+        for path in paths:
+            try:
+                mtimes[path] = path.stat().st_mtime
+            except FileNotFoundError:  # removed by another process
+                continue
+        return sorted(mtimes, key=mtimes.__getitem__)
+
+    def evict(self, max_size_bytes: int | None = None) -> int:
+        """Remove the least recently used entries until the total size of the cache is at most max_size_bytes.
+
+        Args:
+            max_size_bytes: Maximum total size of the entries. Defaults to the max_size_bytes of the cache.
+
+        Returns:
+            int: Number of removed entries.
+        """
+        max_size_bytes = self.max_size_bytes if max_size_bytes is None else max_size_bytes
+        if max_size_bytes is None:
+            return 0
+        entries = self.entries()
+        sizes = []
+        for path in entries:
+            try:
+                sizes.append(path.stat().st_size)
+            except FileNotFoundError:
+                sizes.append(0)
+        total = sum(sizes)
+        n_removed = 0
+        for path, size in zip(entries, sizes, strict=True):
+            if total <= max_size_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            n_removed += 1
+        return n_removed
+
+    def clear(self) -> None:
+        """Remove all the entries of the cache."""
+        self.evict(max_size_bytes=0)
@@ -24,14 +24,16 @@ from __future__ import annotations
 
 import copy
 import itertools
-from collections import defaultdict
 
 import networkx as nx
 import numpy as np
+from joblib import Parallel, delayed
 from networkx.readwrite import json_graph
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import breadth_first_order, connected_components
 
 from pymatgen.analysis.graphs import MoleculeGraph, StructureGraph
-from pymatgen.analysis.local_env import JmolNN
+from pymatgen.analysis.local_env import CrystalNN, JmolNN
 from pymatgen.analysis.structure_analyzer import get_max_bond_lengths
 from pymatgen.core import Molecule, Species, Structure
 from pymatgen.core.lattice import get_integer_index
@@ -69,7 +71,39 @@ def get_dimensionality_larsen(bonded_structure):
     Returns:
         int: The dimensionality of the structure.
     """
-    return max(c["dimensionality"] for c in get_structure_components(bonded_structure))
+    _, cycle_vectors = _get_periodic_components(bonded_structure)
+    return max(_get_dimensionality_and_vertices(cycles)[0] for cycles in cycle_vectors)
+
+
+def get_dimensionality_larsen_many(structures, nn=None, n_jobs=1):
+    """
+    Gets the dimensionality of many structures, for example to screen a
+    database for low-dimensional materials.
+
+    The structures that are not bonded yet are bonded with the near neighbor
+    strategy, in the same parallel jobs that compute the dimensionalities.
+
+    Args:
+        structures (Sequence[Structure | StructureGraph]): Structures or bonded
+            structures to get the dimensionality of.
+        nn (NearNeighbors): Near neighbor strategy used to bond the structures
+            that are not StructureGraph objects. Defaults to CrystalNN().
+        n_jobs (int): Number of parallel jobs. -1 uses all CPUs.
+
+    Returns:
+        list[int]: The dimensionalities of the structures, in the same order.
+    """
+    nn = nn or CrystalNN()
+    if n_jobs == 1:
+        return [_get_dimensionality_larsen(structure, nn) for structure in structures]
+    return Parallel(n_jobs=n_jobs)(delayed(_get_dimensionality_larsen)(structure, nn) for structure in structures)
+
+
+def _get_dimensionality_larsen(structure, nn):
+    """Bond a structure if needed and get its dimensionality."""
+    if not isinstance(structure, StructureGraph):
+        structure = nn.get_bonded_structure(structure)
+    return get_dimensionality_larsen(structure)
 
 
 def get_structure_components(
@@ -116,19 +150,22 @@ def get_structure_components(
             - "dimensionality": The dimensionality of the structure component as an
                 int.
             - "orientation": If inc_orientation is `True`, the orientation of the
-                component as a tuple. E.g. (1, 1, 1)
+                component as a tuple. E.g. (1, 1, 1). An orientation and its negation
+                are equivalent; when get_integer_index does not choose between them,
+                e.g. for (1, -1, 0) and (-1, 1, 0), the one with a positive first
+                nonzero index is returned. Previously the sign in that case depended
+                on the order in which the component was traversed.
             - "site_ids": If inc_site_ids is `True`, the site indices of the
                 sites in the component as a tuple.
             - "molecule_graph": If inc_molecule_graph is `True`, the site a
                 MoleculeGraph object for zero-dimensional components.
     """
+    labels, cycle_vectors = _get_periodic_components(bonded_structure)
     comp_graphs = (bonded_structure.graph.subgraph(c) for c in nx.weakly_connected_components(bonded_structure.graph))
 
     components = []
     for graph in comp_graphs:
-        dimensionality, vertices = calculate_dimensionality_of_site(
-            bonded_structure, next(iter(graph.nodes())), inc_vertices=True
-        )
+        dimensionality, vertices = _get_dimensionality_and_vertices(cycle_vectors[labels[next(iter(graph.nodes()))]])
 
         component = {"dimensionality": dimensionality}
 
@@ -144,7 +181,12 @@ def get_structure_components(
                 # get direction (first column is best fit line,
                 # 3rd column is unitary norm)
                 index = 2 if dimensionality == 2 else 0
-                orientation = get_integer_index(vh[index, :])
+                orientation = get_integer_index(vh[index, :].copy())
+
+                # the sign of the singular vector is arbitrary, so pick the one with a positive
+                # first nonzero index when get_integer_index does not decide, e.g. for (1, -1, 0)
+                if get_integer_index(-vh[index, :], verbose=False) != orientation:
+                    orientation = max(orientation, tuple(-idx for idx in orientation))
             else:
                 orientation = None
 
@@ -191,55 +233,102 @@ def calculate_dimensionality_of_site(bonded_structure, site_index, inc_vertices=
             vertices is a list of tuples. E.g. [(0, 0, 0), (1, 1, 1)].
     """
 
-    def neighbors(comp_index):
-        return [(s.index, s.jimage) for s in bonded_structure.get_connected_sites(comp_index)]
-
-    def rank(vertices):
-        if len(vertices) == 0:
-            return -1
-        if len(vertices) == 1:
-            return 0
-        vertices = np.array(list(vertices))
-        return np.linalg.matrix_rank(vertices[1:] - vertices[0])
-
-    def rank_increase(seen, candidate):
-        rank0 = len(seen) - 1
-        rank1 = rank(seen | {candidate})
-        return rank1 > rank0
-
-    connected_sites = {idx: neighbors(idx) for idx in range(len(bonded_structure))}
-
-    seen_vertices = set()
-    seen_comp_vertices = defaultdict(set)
-
-    queue = [(site_index, (0, 0, 0))]
-    while len(queue) > 0:
-        comp_i, image_i = queue.pop(0)
+    labels, cycle_vectors = _get_periodic_components(bonded_structure)
+    dimensionality, vertices = _get_dimensionality_and_vertices(cycle_vectors[labels[site_index]])
+    if inc_vertices:
+        return dimensionality, vertices
+    return dimensionality
 
-        if (comp_i, image_i) in seen_vertices:
-            continue
-        seen_vertices.add((comp_i, image_i))
 
-        if not rank_increase(seen_comp_vertices[comp_i], image_i):
-            continue
+def _get_periodic_components(bonded_structure):
+    """Find the connected components of a bonded structure and the lattice
+    vectors along which each of them is periodic.
 
-        seen_comp_vertices[comp_i].add(image_i)
+    Rather than exploring the site images breadth-first, every site is placed at
+    an image (offset) through a spanning forest of the bond graph. A bond from
+    site i to site j that is not in the forest then closes a cycle, connecting
+    site i to site j translated by the cycle vector offset_i + to_jimage -
+    offset_j. The images of a site that are connected to it are the integer
+    combinations of the cycle vectors of its component, so the rank of the cycle
+    vectors is the dimensionality of the component (Larsen et al.).
 
-        for comp_j, image_j in connected_sites[comp_i]:
-            image_j = tuple(np.add(image_j, image_i))
+    Args:
+        bonded_structure (StructureGraph): A structure with bonds, represented
+            as a pymatgen structure graph.
 
-            if (comp_j, image_j) in seen_vertices:
-                continue
+    Returns:
+        tuple[np.ndarray, list[np.ndarray]]: The component label of every site
+            and, for every component, its unique non-zero cycle vectors as an
+            integer array of shape (n_cycles, 3).
+    """
+    n_sites = len(bonded_structure)
+    from_indices, to_indices, to_jimages, _ = bonded_structure.get_edge_arrays()
+    adjacency = csr_matrix(
+        (np.ones(len(from_indices)), (from_indices, to_indices)),
+        shape=(n_sites, n_sites),
+    )
+    n_components, labels = connected_components(adjacency, directed=True, connection="weak")
+
+    # spanning forest from a breadth-first search starting at a virtual site
+    # bonded to the first site of every component
+    _, roots = np.unique(labels, return_index=True)
+    forest = csr_matrix(
+        (
+            np.ones(len(from_indices) + n_components),
+            (
+                np.concatenate([from_indices, np.full(n_components, n_sites)]),
+                np.concatenate([to_indices, roots]),
+            ),
+        ),
+        shape=(n_sites + 1, n_sites + 1),
+    )
+    _, predecessors = breadth_first_order(forest, n_sites, directed=False, return_predecessors=True)
+    parents = predecessors[:n_sites]
+    parents[roots] = roots
+
+    # image of every site relative to its parent, through any bond between them
+    bond_keys = np.concatenate([from_indices * n_sites + to_indices, to_indices * n_sites + from_indices])
+    bond_images = np.concatenate([to_jimages, -to_jimages])
+    order = np.argsort(bond_keys, kind="stable")
+    bond_idx = np.searchsorted(bond_keys[order], parents * n_sites + np.arange(n_sites))
+    offsets = bond_images[order[np.minimum(bond_idx, len(order) - 1)]] if len(order) else np.zeros((n_sites, 3))
+    offsets[roots] = 0
+
+    # accumulate the images along the paths to the roots by pointer jumping
+    offsets = offsets.astype(int)
+    ancestors = parents
+    while np.any(ancestors[ancestors] != ancestors):
+        offsets += offsets[ancestors]
+        ancestors = ancestors[ancestors]
+
+    cycles = offsets[from_indices] + to_jimages - offsets[to_indices]
+    is_cycle = np.any(cycles != 0, axis=1)
+    comp_cycles = np.unique(np.column_stack([labels[from_indices[is_cycle]], cycles[is_cycle]]), axis=0)
+    splits = np.searchsorted(comp_cycles[:, 0], np.arange(1, n_components))
+    return labels, [comp[:, 1:] for comp in np.split(comp_cycles, splits)]
+
+
+def _get_dimensionality_and_vertices(cycle_vectors):
+    """Get the dimensionality of a component from its cycle vectors, along with
+    affinely independent images of one of its sites, starting with (0, 0, 0).
 
-            if rank_increase(seen_comp_vertices[comp_j], image_j):
-                queue.append((comp_j, image_j))
+    Args:
+        cycle_vectors (np.ndarray): The cycle vectors of the component, see
+            _get_periodic_components().
 
-    if inc_vertices:
-        return (
-            rank(seen_comp_vertices[site_index]),
-            list(seen_comp_vertices[site_index]),
-        )
-    return rank(seen_comp_vertices[site_index])
+    Returns:
+        tuple[int, list[tuple]]: The dimensionality and the vertices.
+    """
+    if len(cycle_vectors) == 0:
+        return 0, [(0, 0, 0)]
+    dimensionality = int(np.linalg.matrix_rank(cycle_vectors))
+    basis = []
+    for vector in cycle_vectors:
+        if np.linalg.matrix_rank(np.array([*basis, vector])) > len(basis):
+            basis.append(vector)
+            if len(basis) == dimensionality:
+                break
+    return dimensionality, [(0, 0, 0), *(tuple(int(x) for x in vector) for vector in basis)]
 
 
 def zero_d_graph_to_molecule_graph(bonded_structure, graph):
@@ -401,27 +490,26 @@ def find_connected_atoms(struct, tolerance=0.45, ldict=None):
     if ldict is None:
         ldict = JmolNN().el_radius
 
-    n_atoms = len(struct.species)
-    fc = np.array(struct.frac_coords)
-    fc_copy = np.repeat(fc[:, :, None], 27, axis=2)
-    neighbors = np.array(list(itertools.product([0, 1, -1], [0, 1, -1], [0, 1, -1]))).T
-    neighbors = np.repeat(neighbors[None, :, :], 1, axis=0)
-    fc_diff = fc_copy - neighbors
     species = list(map(str, struct.species))
     # in case of charged species
     for ii, item in enumerate(species):
         if item not in ldict:
             species[ii] = str(Species.from_str(item).element)
+    radii = np.array([ldict[specie] for specie in species])
+
+    n_atoms = len(species)
+    fc = np.array(struct.frac_coords)
+    neighbors = np.array(list(itertools.product([0, 1, -1], [0, 1, -1], [0, 1, -1])))
     connected_matrix = np.zeros((n_atoms, n_atoms))
 
-    for ii in range(n_atoms):
-        for jj in range(ii + 1, n_atoms):
-            max_bond_length = ldict[species[ii]] + ldict[species[jj]] + tolerance
-            frac_diff = fc_diff[jj] - fc_copy[ii]
-            distance_ij = np.dot(struct.lattice.matrix.T, frac_diff)
-            if sum(np.linalg.norm(distance_ij, axis=0) < max_bond_length) > 0:
-                connected_matrix[ii, jj] = 1
-                connected_matrix[jj, ii] = 1
+    for ii in range(n_atoms - 1):
+        max_bond_lengths = radii[ii] + radii[ii + 1 :] + tolerance
+        # all 27 images of the atoms jj > ii around atom ii
+        frac_diff = fc[ii + 1 :, None, :] - neighbors[None, :, :] - fc[ii]
+        distances = np.linalg.norm(frac_diff @ struct.lattice.matrix, axis=2)
+        (bonded,) = np.nonzero(np.any(distances < max_bond_lengths[:, None], axis=1))
+        connected_matrix[ii, ii + 1 + bonded] = 1
+        connected_matrix[ii + 1 + bonded, ii] = 1
     return connected_matrix
 
 
@@ -452,30 +540,16 @@ def find_clusters(struct, connected_matrix):
     if 0 in np.sum(connected_matrix, axis=0):
         return [0, 1, 0]
 
-    cluster_sizes = []
-    clusters = []
-    visited = [False for item in range(n_atoms)]
     connected_matrix += np.eye(len(connected_matrix))
-
-    def visit(atom, atom_cluster):
-        visited[atom] = True
-        new_cluster = set(np.where(connected_matrix[atom] != 0)[0]) | atom_cluster
-        atom_cluster = new_cluster
-        for new_atom in atom_cluster:
-            if not visited[new_atom]:
-                visited[new_atom] = True
-                atom_cluster = visit(new_atom, atom_cluster)
-        return atom_cluster
-
-    for idx in range(n_atoms):
-        if not visited[idx]:
-            atom_cluster = set()
-            cluster = visit(idx, atom_cluster)
-            clusters.append(cluster)
-            cluster_sizes.append(len(cluster))
-
-    max_cluster = max(cluster_sizes)
-    min_cluster = min(cluster_sizes)
+    n_clusters, labels = connected_components(csr_matrix(connected_matrix), directed=False)
+    # components are labelled in order of their lowest atom index
+    clusters = [set() for _ in range(n_clusters)]
+    for idx, label in enumerate(labels.tolist()):
+        clusters[label].add(idx)
+    cluster_sizes = np.bincount(labels)
+
+    max_cluster = int(max(cluster_sizes))
+    min_cluster = int(min(cluster_sizes))
     return [max_cluster, min_cluster, clusters]
 
 
@@ -13,6 +13,7 @@ from copy import deepcopy
 from typing import TYPE_CHECKING
 
 import numpy as np
+from joblib import Parallel, delayed
 from scipy.optimize import leastsq, minimize
 
 try:
@@ -28,6 +29,8 @@ if TYPE_CHECKING:
     from typing import Any, ClassVar
 
     import matplotlib.pyplot as plt
+    from numpy.typing import NDArray
+    from typing_extensions import Self
 
 __author__ = "Kiran Mathew, gmatteo"
 __credits__ = "Cormac Toher"
@@ -110,6 +113,50 @@ class EOSBase(ABC):
         if ierr not in (1, 2, 3, 4):
             raise EOSError("Optimal parameters not found")
 
+    @classmethod
+    def fit_many(
+        cls,
+        volumes: Sequence[Sequence[float]],
+        energies: Sequence[Sequence[float]],
+        n_jobs: int = 1,
+        skip_failed: bool = False,
+    ) -> list[Self | None]:
+        """Fit many energy-volume curves with this equation of state.
+
+        For equations of state fit by least squares (all but the polynomial
+        ones), the quadratic initial guesses of all curves are solved at once
+        and refined by a vectorized Levenberg-Marquardt iteration. Curves that
+        do not converge in the batch, and all curves of polynomial equations of
+        state, are fit one by one with fit(), in parallel if n_jobs != 1.
+
+        Args:
+            volumes (Sequence[Sequence[float]]): volumes in Ang^3, one sequence per curve.
+            energies (Sequence[Sequence[float]]): energies in eV, one sequence per curve.
+            n_jobs (int): number of parallel jobs for the curves fit one by one.
+                Defaults to 1, -1 uses all CPUs.
+            skip_failed (bool): Whether to return None for curves that cannot be
+                fit instead of raising the error. Defaults to False.
+
+        Returns:
+            list[EOSBase | None]: the fitted equations of state, in the order of the curves.
+        """
+        if len(volumes) != len(energies):
+            raise ValueError(f"Got {len(volumes)} volume and {len(energies)} energy curves")
+
+        eos_fits: list[Self | None] = [cls(vols, ens) for vols, ens in zip(volumes, energies, strict=True)]
+        if cls.fit is EOSBase.fit and eos_fits:
+            pending = _fit_least_squares_batch(eos_fits)  # type:ignore[arg-type]
+        else:
+            pending = list(range(len(eos_fits)))
+
+        if n_jobs == 1:
+            refits = [_fit_single(eos_fits[idx], skip_failed) for idx in pending]  # type:ignore[arg-type]
+        else:
+            refits = Parallel(n_jobs=n_jobs)(delayed(_fit_single)(eos_fits[idx], skip_failed) for idx in pending)
+        for idx, eos_fit in zip(pending, refits, strict=True):
+            eos_fits[idx] = eos_fit
+        return eos_fits
+
     @abstractmethod
     def _func(self, volume, params):
         """
@@ -601,6 +648,153 @@ class EOS:
         eos_fit.fit()
         return eos_fit
 
+    def fit_many(
+        self,
+        volumes: Sequence[Sequence[float]],
+        energies: Sequence[Sequence[float]],
+        n_jobs: int = 1,
+        skip_failed: bool = False,
+    ) -> list[EOSBase | None]:
+        """Fit many energy-volume curves at once, see EOSBase.fit_many.
+
+        Args:
+            volumes (Sequence[Sequence[float]]): volumes in Ang^3, one sequence per curve.
+            energies (Sequence[Sequence[float]]): energies in eV, one sequence per curve.
+            n_jobs (int): number of parallel jobs for curves fit one by one. Defaults to 1.
+            skip_failed (bool): Whether to return None for curves that cannot be
+                fit instead of raising the error. Defaults to False.
+
+        Returns:
+            list[EOSBase | None]: the fitted equations of state, in the order of the curves.
+        """
+        return self.model.fit_many(volumes, energies, n_jobs=n_jobs, skip_failed=skip_failed)
+
+
+def _fit_single(eos_fit: EOSBase, skip_failed: bool = False) -> EOSBase | None:
+    """Fit one equation of state, returning None on failure if skip_failed."""
+    try:
+        eos_fit.fit()  # type:ignore[call-arg]
+    except Exception as exc:
+        if not skip_failed:
+            raise
+        logger.info(f"EOS fitting failed: {exc}")
+        return None
+    return eos_fit
+
+
+def _fit_least_squares_batch(
+    eos_fits: list[EOSBase],
+    max_iter: int = 200,
+    ftol: float = 1.49012e-8,
+    xtol: float = 1.49012e-8,
+) -> list[int]:
+    """Least squares fit of many curves at once with the same model.
+
+    Uses the quadratic initial guess of EOSBase, solved for all curves with one
+    batched pseudo-inverse, followed by a Levenberg-Marquardt iteration on all
+    curves at once with forward difference Jacobians. Curves of different
+    length are padded and masked.
+
+    Args:
+        eos_fits (list[EOSBase]): unfitted equations of state of the same class.
+        max_iter (int): maximum number of iterations.
+        ftol (float): relative tolerance on the sum of squared residuals.
+        xtol (float): relative tolerance on the parameters.
+
+    Returns:
+        list[int]: indices of the curves that were not fit, i.e. whose initial
+            guess was outside the volume range or which did not converge.
+    """
+    n_curves = len(eos_fits)
+    n_points = max(len(eos_fit.volumes) for eos_fit in eos_fits)
+    vols = np.empty((n_curves, n_points))
+    ens = np.zeros((n_curves, n_points))
+    mask = np.zeros((n_curves, n_points), dtype=bool)
+    for idx, eos_fit in enumerate(eos_fits):
+        n_vols = len(eos_fit.volumes)
+        vols[idx] = eos_fit.volumes[0]  # padding is masked, but must be a valid volume
+        vols[idx, :n_vols] = eos_fit.volumes
+        ens[idx, :n_vols] = eos_fit.energies
+        mask[idx, :n_vols] = True
+
+    # Quadratic fit for the initial guesses, as in EOSBase._initial_guess
+    vander = np.stack([vols**2, vols, np.ones_like(vols)], axis=-1) * mask[..., None]
+    scale = np.sqrt((vander**2).sum(axis=1, keepdims=True))
+    scale[scale == 0] = 1
+    coeffs = (np.linalg.pinv(vander / scale) @ ens[..., None])[..., 0] / scale[:, 0]
+    a, b, c = coeffs.T
+    with np.errstate(all="ignore"):
+        v0 = -b / (2 * a)
+        e0 = a * (v0**2) + b * v0 + c
+        b0 = 2 * a * v0
+    vol_min = np.where(mask, vols, np.inf).min(axis=1)
+    vol_max = np.where(mask, vols, -np.inf).max(axis=1)
+    valid = (vol_min < v0) & (v0 < vol_max) & (mask.sum(axis=1) >= 4)
+
+    params = np.stack([e0, b0, np.full(n_curves, 4.0), v0], axis=1)
+    func = eos_fits[0]._func
+
+    def get_residuals(indices: NDArray, pars: NDArray) -> NDArray:
+        with np.errstate(all="ignore"):
+            fitted = func(vols[indices], tuple(pars.T[..., None]))
+        return np.where(mask[indices], ens[indices] - fitted, 0)
+
+    def get_cost(residuals: NDArray) -> NDArray:
+        cost = (residuals**2).sum(axis=1)
+        return np.where(np.isfinite(cost), cost, np.inf)
+
+    converged = np.zeros(n_curves, dtype=bool)
+    active = np.flatnonzero(valid)
+    residuals = get_residuals(active, params[active])
+    cost = get_cost(residuals)
+    damping = np.full(len(active), 1e-3)
+    step_size = np.sqrt(np.finfo(float).eps)
+    for _ in range(max_iter):
+        if len(active) == 0:
+            break
+        pars = params[active]
+        # Forward difference Jacobian of the residuals, one column per parameter
+        steps = step_size * np.abs(pars)
+        steps[steps == 0] = step_size
+        jac = np.empty((*residuals.shape, 4))
+        for par_idx in range(4):
+            shifted = pars.copy()
+            shifted[:, par_idx] += steps[:, par_idx]
+            jac[..., par_idx] = (get_residuals(active, shifted) - residuals) / steps[:, par_idx, None]
+
+        jtj = np.einsum("cpi,cpj->cij", jac, jac)
+        grad = np.einsum("cpi,cp->ci", jac, residuals)
+        diag = np.einsum("cii->ci", jtj)
+        diag = np.maximum(diag, np.finfo(float).tiny)
+        lhs = jtj + damping[:, None, None] * diag[:, :, None] * np.eye(4)
+        with np.errstate(all="ignore"):
+            try:
+                delta = -np.linalg.solve(lhs, grad[..., None])[..., 0]
+            except np.linalg.LinAlgError:
+                delta = -(np.linalg.pinv(lhs) @ grad[..., None])[..., 0]
+        new_pars = pars + delta
+        new_residuals = get_residuals(active, new_pars)
+        new_cost = get_cost(new_residuals)
+
+        accepted = np.all(np.isfinite(delta), axis=1) & (new_cost <= cost)
+        params[active[accepted]] = new_pars[accepted]
+        residuals[accepted] = new_residuals[accepted]
+        small_step = np.all(np.abs(delta) <= xtol * (np.abs(pars) + xtol), axis=1)
+        small_decrease = cost - new_cost <= ftol * cost
+        done = accepted & (small_step | small_decrease)
+        cost = np.where(accepted, new_cost, cost)
+        damping = np.where(accepted, damping / 10, damping * 10)
+
+        converged[active[done]] = True
+        # Give up on curves where even tiny steps do not decrease the cost
+        keep = ~done & (damping < 1e16)
+        active, residuals, cost, damping = active[keep], residuals[keep], cost[keep], damping[keep]
+
+    for idx in np.flatnonzero(converged):
+        eos_fits[idx].eos_params = params[idx].copy()
+        eos_fits[idx]._params = eos_fits[idx].eos_params
+    return np.flatnonzero(~converged).tolist()
+
 
 class EOSError(Exception):
     """Error class for EOS fitting."""
@@ -10,6 +10,7 @@ from monty.json import MSONable
 from pymatgen.analysis.graphs import MoleculeGraph, MolGraphSplitError
 from pymatgen.analysis.local_env import OpenBabelNN, metal_edge_extender
 from pymatgen.io.babel import BabelMolAdaptor
+from pymatgen.util.graph_hashing import weisfeiler_lehman_graph_hash, weisfeiler_lehman_graph_hashes
 
 if TYPE_CHECKING:
     from pymatgen.core.structure import Molecule
@@ -85,6 +86,7 @@ class Fragmenter(MSONable):
             self.mol_graph = metal_edge_extender(self.mol_graph)
 
         self.prev_unique_frag_dict = prev_unique_frag_dict or {}
+        self._wl_hashes: dict[int, tuple[MoleculeGraph, str]] = {}  # Weisfeiler-Lehman hashes of fragments by id
         self.new_unique_frag_dict = {}  # new fragments from the given molecule not contained in prev_unique_frag_dict
         self.all_unique_frag_dict = {}  # all fragments from just the given molecule
         self.unique_frag_dict = {}  # all fragments from both the given molecule and prev_unique_frag_dict
@@ -125,16 +127,16 @@ class Fragmenter(MSONable):
         if self.prev_unique_frag_dict == {}:
             self.new_unique_frag_dict = copy.deepcopy(self.all_unique_frag_dict)
         else:
+            self._hash_fragments(
+                [frag for frags in self.all_unique_frag_dict.values() for frag in frags]
+                + [frag for frags in self.prev_unique_frag_dict.values() for frag in frags]
+            )
             for frag_key in self.all_unique_frag_dict:
                 if frag_key not in self.prev_unique_frag_dict:
                     self.new_unique_frag_dict[frag_key] = copy.deepcopy(self.all_unique_frag_dict[frag_key])
                 else:
                     for fragment in self.all_unique_frag_dict[frag_key]:
-                        found = False
-                        for prev_frag in self.prev_unique_frag_dict[frag_key]:
-                            if fragment.isomorphic_to(prev_frag):
-                                found = True
-                        if not found:
+                        if not self._is_isomorphic_to_any(fragment, self.prev_unique_frag_dict[frag_key]):
                             if frag_key not in self.new_unique_frag_dict:
                                 self.new_unique_frag_dict[frag_key] = [fragment]
                             else:
@@ -168,48 +170,64 @@ class Fragmenter(MSONable):
         that edge belongs to a ring. If we are opening rings, do so with that bond, and then again
         check if the resulting fragment is present in self.unique_fragments and add it if it is not.
         """
-        new_frag_dict = {}
+        fragments = []
         for old_frags in old_frag_dict.values():
             for old_frag in old_frags:
                 for edge in old_frag.graph.edges:
                     bond = [(edge[0], edge[1])]
-                    fragments = []
                     try:
-                        fragments = old_frag.split_molecule_subgraphs(bond, allow_reverse=True)
+                        fragments += old_frag.split_molecule_subgraphs(bond, allow_reverse=True)
                     except MolGraphSplitError:
                         if self.open_rings:
-                            fragments = [open_ring(old_frag, bond, self.opt_steps)]
-                    for fragment in fragments:
-                        alph_formula = fragment.molecule.composition.alphabetical_formula
-                        new_frag_key = f"{alph_formula} E{len(fragment.graph.edges())}"
-                        proceed = True
-                        if (
-                            self.assume_previous_thoroughness
-                            and self.prev_unique_frag_dict != {}
-                            and new_frag_key in self.prev_unique_frag_dict
-                        ):
-                            for unique_fragment in self.prev_unique_frag_dict[new_frag_key]:
-                                if unique_fragment.isomorphic_to(fragment):
-                                    proceed = False
-                                    break
-                        if proceed:
-                            if new_frag_key not in self.all_unique_frag_dict:
-                                self.all_unique_frag_dict[new_frag_key] = [fragment]
-                                new_frag_dict[new_frag_key] = [fragment]
-                            else:
-                                found = False
-                                for unique_fragment in self.all_unique_frag_dict[new_frag_key]:
-                                    if unique_fragment.isomorphic_to(fragment):
-                                        found = True
-                                        break
-                                if not found:
-                                    self.all_unique_frag_dict[new_frag_key].append(fragment)
-                                    if new_frag_key in new_frag_dict:
-                                        new_frag_dict[new_frag_key].append(fragment)
-                                    else:
-                                        new_frag_dict[new_frag_key] = [fragment]
+                            fragments.append(open_ring(old_frag, bond, self.opt_steps))
+        self._hash_fragments(fragments)
+
+        new_frag_dict = {}
+        for fragment in fragments:
+            alph_formula = fragment.molecule.composition.alphabetical_formula
+            new_frag_key = f"{alph_formula} E{len(fragment.graph.edges())}"
+            proceed = not (
+                self.assume_previous_thoroughness
+                and self.prev_unique_frag_dict != {}
+                and new_frag_key in self.prev_unique_frag_dict
+                and self._is_isomorphic_to_any(fragment, self.prev_unique_frag_dict[new_frag_key])
+            )
+            if proceed:
+                if new_frag_key not in self.all_unique_frag_dict:
+                    self.all_unique_frag_dict[new_frag_key] = [fragment]
+                    new_frag_dict[new_frag_key] = [fragment]
+                elif not self._is_isomorphic_to_any(fragment, self.all_unique_frag_dict[new_frag_key]):
+                    self.all_unique_frag_dict[new_frag_key].append(fragment)
+                    if new_frag_key in new_frag_dict:
+                        new_frag_dict[new_frag_key].append(fragment)
+                    else:
+                        new_frag_dict[new_frag_key] = [fragment]
         return new_frag_dict
 
+    def _is_isomorphic_to_any(self, fragment: MoleculeGraph, fragments: list[MoleculeGraph]) -> bool:
+        """Check whether a fragment is isomorphic to any of the given fragments. The (costly)
+        isomorphism test is only run on the fragments with the same Weisfeiler-Lehman hash.
+        """
+        frag_hash = self._get_wl_hash(fragment)
+        return any(self._get_wl_hash(other) == frag_hash and other.isomorphic_to(fragment) for other in fragments)
+
+    def _hash_fragments(self, fragments: list[MoleculeGraph]) -> None:
+        """Compute in one batch the Weisfeiler-Lehman hashes of the fragments that are not cached yet."""
+        new_fragments = list({id(frag): frag for frag in fragments if id(frag) not in self._wl_hashes}.values())
+        graphs = [frag.graph.to_undirected(as_view=True) for frag in new_fragments]
+        hashes = weisfeiler_lehman_graph_hashes(graphs, node_attr="specie")
+        for frag, graph_hash in zip(new_fragments, hashes, strict=True):
+            self._wl_hashes[id(frag)] = (frag, graph_hash)
+
+    def _get_wl_hash(self, mol_graph: MoleculeGraph) -> str:
+        """Get the Weisfeiler-Lehman hash of a fragment graph, which is identical for isomorphic
+        fragments. Hashes are cached along with the fragments, whose ids can thus not be reused.
+        """
+        if id(mol_graph) not in self._wl_hashes:
+            graph_hash = weisfeiler_lehman_graph_hash(mol_graph.graph.to_undirected(as_view=True), node_attr="specie")
+            self._wl_hashes[id(mol_graph)] = (mol_graph, graph_hash)
+        return self._wl_hashes[id(mol_graph)][1]
+
     def _open_all_rings(self) -> None:
         """
         Having already generated all unique fragments that did not require ring opening,
@@ -235,22 +253,10 @@ class Fragmenter(MSONable):
                             if frag_key not in new_frag_keys["0"]:
                                 new_frag_keys["0"].append(copy.deepcopy(frag_key))
                                 new_frag_key_dict[frag_key] = copy.deepcopy([new_fragment])
-                            else:
-                                found = False
-                                for unique_fragment in new_frag_key_dict[frag_key]:
-                                    if unique_fragment.isomorphic_to(new_fragment):
-                                        found = True
-                                        break
-                                if not found:
-                                    new_frag_key_dict[frag_key].append(copy.deepcopy(new_fragment))
-                        else:
-                            found = False
-                            for unique_fragment in self.all_unique_frag_dict[frag_key]:
-                                if unique_fragment.isomorphic_to(new_fragment):
-                                    found = True
-                                    break
-                            if not found:
-                                self.all_unique_frag_dict[frag_key].append(copy.deepcopy(new_fragment))
+                            elif not self._is_isomorphic_to_any(new_fragment, new_frag_key_dict[frag_key]):
+                                new_frag_key_dict[frag_key].append(copy.deepcopy(new_fragment))
+                        elif not self._is_isomorphic_to_any(new_fragment, self.all_unique_frag_dict[frag_key]):
+                            self.all_unique_frag_dict[frag_key].append(copy.deepcopy(new_fragment))
         for key, value in new_frag_key_dict.items():
             self.all_unique_frag_dict[key] = copy.deepcopy(value)
         idx = 0
@@ -270,22 +276,10 @@ class Fragmenter(MSONable):
                                 if frag_key not in new_frag_keys[str(idx)]:
                                     new_frag_keys[str(idx)].append(copy.deepcopy(frag_key))
                                     new_frag_key_dict[frag_key] = copy.deepcopy([new_fragment])
-                                else:
-                                    found = False
-                                    for unique_fragment in new_frag_key_dict[frag_key]:
-                                        if unique_fragment.isomorphic_to(new_fragment):
-                                            found = True
-                                            break
-                                    if not found:
-                                        new_frag_key_dict[frag_key].append(copy.deepcopy(new_fragment))
-                            else:
-                                found = False
-                                for unique_fragment in self.all_unique_frag_dict[frag_key]:
-                                    if unique_fragment.isomorphic_to(new_fragment):
-                                        found = True
-                                        break
-                                if not found:
-                                    self.all_unique_frag_dict[frag_key].append(copy.deepcopy(new_fragment))
+                                elif not self._is_isomorphic_to_any(new_fragment, new_frag_key_dict[frag_key]):
+                                    new_frag_key_dict[frag_key].append(copy.deepcopy(new_fragment))
+                            elif not self._is_isomorphic_to_any(new_fragment, self.all_unique_frag_dict[frag_key]):
+                                self.all_unique_frag_dict[frag_key].append(copy.deepcopy(new_fragment))
             for key, value in new_frag_key_dict.items():
                 self.all_unique_frag_dict[key] = copy.deepcopy(value)
         self.all_unique_frag_dict.pop(mol_key)
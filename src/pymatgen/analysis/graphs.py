@@ -11,7 +11,7 @@ from collections import defaultdict
 from itertools import combinations
 from operator import itemgetter
 from shutil import which
-from typing import TYPE_CHECKING, NamedTuple, cast
+from typing import TYPE_CHECKING, NamedTuple
 
 import networkx as nx
 import networkx.algorithms.isomorphism as iso
@@ -26,6 +26,7 @@ from scipy.stats import describe
 from pymatgen.core import Lattice, Molecule, PeriodicSite, Structure
 from pymatgen.core.structure import FunctionalGroups
 from pymatgen.util.coord import lattice_points_in_supercell
+from pymatgen.util.graph_hashing import group_isomorphic_graphs
 from pymatgen.vis.structure_vtk import EL_COLORS
 
 try:
@@ -291,7 +292,20 @@ class StructureGraph(MSONable):
 
         struct_graph = cls.from_empty_graph(structure, name="bonds")
 
-        for idx, neighbors in enumerate(strategy.get_all_nn_info(structure)):
+        all_nn_info = strategy.get_all_nn_info(structure)
+        if not edge_properties:
+            # local_env will always try to add two edges
+            # for any one bond, add_edges skips the duplicates
+            edges = [(idx, neighbor) for idx, neighbors in enumerate(all_nn_info) for neighbor in neighbors]
+            struct_graph.add_edges(
+                [idx for idx, _ in edges],
+                [neighbor["site_index"] for _, neighbor in edges],
+                [neighbor["image"] for _, neighbor in edges],
+                weights=[neighbor["weight"] for _, neighbor in edges] if weights else None,
+            )
+            return struct_graph
+
+        for idx, neighbors in enumerate(all_nn_info):
             for neighbor in neighbors:
                 # local_env will always try to add two edges
                 # for any one bond, one from site u to site v
@@ -303,7 +317,7 @@ class StructureGraph(MSONable):
                     to_index=neighbor["site_index"],
                     to_jimage=neighbor["image"],
                     weight=neighbor["weight"] if weights else None,
-                    edge_properties=(neighbor["edge_properties"] if edge_properties else None),
+                    edge_properties=neighbor["edge_properties"],
                     warn_duplicates=False,
                 )
 
@@ -458,6 +472,79 @@ class StructureGraph(MSONable):
         else:
             self.graph.add_edge(from_index, to_index, to_jimage=to_jimage, **edge_properties)
 
+    def add_edges(
+        self,
+        from_indices: ArrayLike,
+        to_indices: ArrayLike,
+        to_jimages: ArrayLike,
+        weights: Sequence[float | None] | None = None,
+    ) -> None:
+        """
+        Add many edges to the graph at once, all starting from
+        the (0, 0, 0) image. The edges are normalized like in
+        add_edge, but in bulk: duplicate edges, including those
+        already in the graph, are silently skipped.
+
+        Args:
+            from_indices (ArrayLike): indices of the sites connecting from
+            to_indices (ArrayLike): indices of the sites connecting to
+            to_jimages (ArrayLike): lattice vectors of the images of
+                the sites connecting to, shape (n_edges, 3)
+            weights (Sequence[float | None]): e.g. bond lengths, None
+                (or a falsy weight) means no weight
+        """
+        from_indices = np.asarray(from_indices, dtype=int).reshape(-1)
+        to_indices = np.asarray(to_indices, dtype=int).reshape(-1)
+        to_jimages = np.asarray(to_jimages, dtype=int).reshape(-1, 3)
+        if not len(from_indices) == len(to_indices) == len(to_jimages):
+            raise ValueError("from_indices, to_indices and to_jimages must have the same length.")
+        if weights is not None and len(weights) != len(from_indices):
+            raise ValueError("weights must have one value per edge.")
+
+        # from_index < to_index, the from_jimage then becomes (0, 0, 0)
+        swap = to_indices < from_indices
+        from_indices, to_indices = np.where(swap, to_indices, from_indices), np.where(swap, from_indices, to_indices)
+        to_jimages = np.where(swap[:, None], -to_jimages, to_jimages)
+
+        # edges from site i to site i: no bond to itself, first non-zero jimage index positive
+        loops = from_indices == to_indices
+        keep = ~(loops & ~to_jimages.any(axis=1))
+        if not keep.all():
+            warnings.warn("Tried to create a bond to itself, this doesn't make sense so was ignored.", stacklevel=2)
+        first_nonzero = to_jimages[np.arange(len(to_jimages)), np.argmax(to_jimages != 0, axis=1)]
+        to_jimages[loops & (first_nonzero < 0)] *= -1
+
+        existing = {(u, v, data["to_jimage"]) for u, v, data in self.graph.edges(data=True)}
+        for idx in np.flatnonzero(keep):
+            edge = (int(from_indices[idx]), int(to_indices[idx]), tuple(map(int, to_jimages[idx])))
+            if edge in existing:
+                continue
+            existing.add(edge)
+            weight = None if weights is None else weights[idx]
+            if weight:
+                self.graph.add_edge(edge[0], edge[1], to_jimage=edge[2], weight=weight)
+            else:
+                self.graph.add_edge(edge[0], edge[1], to_jimage=edge[2])
+
+    def get_edge_arrays(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Get the edges of the graph as arrays, in the order of graph.edges.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: from_index and to_index
+                of the edges with shape (n_edges,), to_jimage with shape (n_edges, 3) and
+                weight with shape (n_edges,), NaN for edges without weight.
+        """
+        n_edges = self.graph.number_of_edges()
+        from_indices = np.empty(n_edges, dtype=int)
+        to_indices = np.empty(n_edges, dtype=int)
+        to_jimages = np.empty((n_edges, 3), dtype=int)
+        weights = np.full(n_edges, np.nan)
+        for idx, (u, v, data) in enumerate(self.graph.edges(data=True)):
+            from_indices[idx], to_indices[idx], to_jimages[idx] = u, v, data["to_jimage"]
+            if (weight := data.get("weight")) is not None:
+                weights[idx] = weight
+        return from_indices, to_indices, to_jimages, weights
+
     def insert_node(
         self,
         idx: int,
@@ -769,42 +856,46 @@ class StructureGraph(MSONable):
             list of ConnectedSite tuples,
             sorted by closest first.
         """
-        connected_sites = set()
-        connected_site_images = set()
-
-        out_edges = [(u, v, d, "out") for u, v, d in self.graph.out_edges(n, data=True)]
-        in_edges = [(u, v, d, "in") for u, v, d in self.graph.in_edges(n, data=True)]
-
-        for u, v, data, dirc in out_edges + in_edges:
-            to_jimage = data["to_jimage"]
-
-            if dirc == "in":
-                u, v = v, u
-                to_jimage = np.multiply(-1, to_jimage)
-
-            to_jimage = tuple(map(int, np.add(to_jimage, jimage)))
-            site_d = self.structure[v].as_dict()
-            site_d["abc"] = np.add(site_d["abc"], to_jimage).tolist()
-            site = PeriodicSite.from_dict(site_d)
-
-            # from_site if jimage arg != (0, 0, 0)
-            relative_jimage = np.subtract(to_jimage, jimage)
-            u_site = cast("PeriodicSite", self.structure[u])  # tell mypy that u_site is a PeriodicSite
-            dist = u_site.distance(self.structure[v], jimage=relative_jimage)
-
-            weight = data.get("weight")
-
-            if (v, to_jimage) not in connected_site_images:
-                connected_site = ConnectedSite(site=site, jimage=to_jimage, index=v, weight=weight, dist=dist)
+        # neighbors as (index, to_jimage relative to site n, weight), edges pointing to n are reversed
+        neighbors = [(v, data["to_jimage"], data.get("weight")) for _, v, data in self.graph.out_edges(n, data=True)]
+        neighbors += [
+            (u, tuple(-img for img in data["to_jimage"]), data.get("weight"))
+            for u, _, data in self.graph.in_edges(n, data=True)
+        ]
+        if not neighbors:
+            return []
+
+        relative_jimages = np.array([to_jimage for _, to_jimage, _ in neighbors])
+        to_frac_coords = np.array([self.structure[v].frac_coords for v, _, _ in neighbors])
+        dists = np.linalg.norm(
+            self.structure.lattice.get_cartesian_coords(
+                relative_jimages + to_frac_coords - self.structure[n].frac_coords
+            ),
+            axis=1,
+        )
 
-                connected_sites.add(connected_site)
-                connected_site_images.add((v, to_jimage))
+        connected_sites = []
+        connected_site_images = set()
+        for (v, relative_jimage, weight), dist in zip(neighbors, dists, strict=True):
+            to_jimage = tuple(int(img) for img in np.add(relative_jimage, jimage))
+            if (v, to_jimage) in connected_site_images:
+                continue
+            connected_site_images.add((v, to_jimage))
+
+            to_site = self.structure[v]
+            site = PeriodicSite(
+                to_site.species,
+                np.add(to_site.frac_coords, to_jimage),
+                to_site.lattice,
+                properties=to_site.properties,
+                label=to_site.label,
+            )
+            connected_sites.append(ConnectedSite(site=site, jimage=to_jimage, index=v, weight=weight, dist=float(dist)))
 
         # return list sorted by closest sites first
-        _connected_sites = list(connected_sites)
-        _connected_sites.sort(key=lambda x: x.dist)
+        connected_sites.sort(key=lambda x: x.dist)
 
-        return _connected_sites
+        return connected_sites
 
     def get_coordination_of_site(self, n: int) -> int:
         """Get the number of neighbors of site n. In graph terms,
@@ -1133,158 +1224,137 @@ class StructureGraph(MSONable):
         frac_lattice = lattice_points_in_supercell(scale_matrix)
         cart_lattice = new_lattice.get_cartesian_coords(frac_lattice)
 
-        new_sites = []
-        new_graphs = []
-
-        for v in cart_lattice:
-            # create a map of nodes from original graph to its image
-            mapping = {n: n + len(new_sites) for n in range(len(self.structure))}
-
-            for site in self.structure:
-                site = PeriodicSite(
-                    site.species,
-                    site.coords + v,
-                    new_lattice,
-                    properties=site.properties,
-                    coords_are_cartesian=True,
-                    to_unit_cell=False,
-                )
-
-                new_sites.append(site)
-
-            new_graphs.append(nx.relabel_nodes(self.graph, mapping, copy=True))
-
-        new_structure = Structure.from_sites(new_sites)
+        # one image of the structure per lattice point, the sites of image i
+        # being i * n_sites, ..., (i + 1) * n_sites - 1
+        n_sites, n_images = len(self.structure), len(cart_lattice)
+        cart_coords = (cart_lattice[:, None, :] + self.structure.cart_coords[None, :, :]).reshape(-1, 3)
+        prop_keys = list(dict.fromkeys(key for site in self.structure for key in site.properties))
+        new_structure = Structure(
+            new_lattice,
+            [site.species for site in self.structure] * n_images,
+            new_lattice.get_fractional_coords(cart_coords),
+            site_properties={
+                key: [site.properties.get(key) for site in self.structure] * n_images for key in prop_keys
+            },
+        )
 
-        # merge all graphs into one big graph
+        # merge copies of the graph, one per image, into one big graph
+        edges = list(self.graph.edges(keys=True, data=True))
         new_g = nx.MultiDiGraph()
-        for new_graph in new_graphs:
-            new_g = nx.union(new_g, new_graph)
-
-        edges_to_remove = []  # tuple of (u, v, k)
-        edges_to_add = []  # tuple of (u, v, attr_dict)
+        new_g.graph.update(self.graph.graph)
+        for offset in range(0, n_images * n_sites, n_sites):
+            new_g.add_nodes_from((n + offset, data) for n, data in self.graph.nodes(data=True))
+            new_g.add_edges_from((u + offset, v + offset, k, data.copy()) for u, v, k, data in edges)
 
         # list of new edges inside supercell
         # for duplicate checking
-        edges_inside_supercell = [{u, v} for u, v, d in new_g.edges(data=True) if d["to_jimage"] == (0, 0, 0)]
-        new_periodic_images = []
-
-        orig_lattice = self.structure.lattice
-
-        # use k-d tree to match given position to an
-        # existing Site in Structure
-        kd_tree = KDTree(new_structure.cart_coords)
-
-        # tolerance in Å for sites to be considered equal
-        # this could probably be a lot smaller
-        tol = 0.05
-
-        for u, v, k, data in new_g.edges(keys=True, data=True):
-            to_jimage = data["to_jimage"]  # for node v
-
-            # reduce unnecessary checking
-            if to_jimage != (0, 0, 0):
-                # get index in original site
-                n_u = u % len(self.structure)
-                n_v = v % len(self.structure)
-
-                # get fractional coordinates of where atoms defined by edge are expected
-                # to be, relative to original lattice (keeping original lattice has
-                # significant benefits)
-                v_image_frac = np.add(self.structure[n_v].frac_coords, to_jimage)
-                u_frac = self.structure[n_u].frac_coords
+        edges_inside_supercell = {
+            frozenset((u + offset, v + offset))
+            for u, v, _, data in edges
+            if data["to_jimage"] == (0, 0, 0)
+            for offset in range(0, n_images * n_sites, n_sites)
+        }
 
-                # using the position of node u as a reference, get relative Cartesian
-                # coordinates of where atoms defined by edge are expected to be
-                v_image_cart = orig_lattice.get_cartesian_coords(v_image_frac)
-                u_cart = orig_lattice.get_cartesian_coords(u_frac)
-                v_rel = np.subtract(v_image_cart, u_cart)
+        # only the edges going through periodic boundaries need to be updated, for all
+        # of them at once: using the position of node u as a reference, get the expected
+        # Cartesian coordinates of node v (relative to the original lattice, keeping
+        # original lattice has significant benefits) and search for it in the supercell
+        periodic_edges = [(u, v, k, data) for u, v, k, data in edges if data["to_jimage"] != (0, 0, 0)]
+        n_periodic = len(periodic_edges)
+        if n_periodic:
+            orig_lattice = self.structure.lattice
+            frac_coords = self.structure.frac_coords
+            from_indices = np.array([u for u, _, _, _ in periodic_edges])
+            to_indices = np.array([v for _, v, _, _ in periodic_edges])
+            to_jimages = np.array([data["to_jimage"] for _, _, _, data in periodic_edges])
+            v_rel = orig_lattice.get_cartesian_coords(
+                frac_coords[to_indices] + to_jimages
+            ) - orig_lattice.get_cartesian_coords(frac_coords[from_indices])
+
+            # edges are ordered by image, then as in the original graph
+            new_from_indices = (np.arange(n_images)[:, None] * n_sites + from_indices).reshape(-1)
+            v_expect = new_structure.cart_coords[new_from_indices] + np.tile(v_rel, (n_images, 1))
+
+            # use k-d tree to match given position to an
+            # existing Site in Structure
+            kd_tree = KDTree(new_structure.cart_coords)
+
+            # tolerance in Å for sites to be considered equal
+            # this could probably be a lot smaller
+            tol = 0.05
+
+            dists, v_present = kd_tree.query(v_expect)
+            inside = dists <= tol
+
+            # for the image sites not present in the supercell, find new_v such that
+            # we have full periodic boundary conditions so that nodes on one side of
+            # supercell are connected to nodes on opposite side
+            v_expec_frac = new_structure.lattice.get_fractional_coords(v_expect[~inside])
+            # use np.around to fix issues with finite precision leading to incorrect image
+            v_expec_image = np.around(v_expec_frac, decimals=3)
+            v_expec_image -= v_expec_image % 1
+            dists_periodic, v_present_periodic = kd_tree.query(
+                new_structure.lattice.get_cartesian_coords(v_expec_frac - v_expec_image)
+            )
+            images = np.zeros((len(v_expect), 3), dtype=int)
+            images[~inside] = v_expec_image
+            periodic = np.zeros(len(v_expect), dtype=bool)
+            periodic[~inside] = dists_periodic <= tol
+            v_present[~inside] = v_present_periodic
+        else:
+            inside = periodic = np.zeros(0, dtype=bool)
 
-                # now retrieve position of node v in new supercell, and get absolute
-                # Cartesian coordinates of where atoms defined by edge are expected to be
-                v_expect = new_structure[u].coords + v_rel
+        edges_to_remove = []  # tuple of (u, v, k)
+        edges_to_add = []  # tuple of (u, v, attr_dict)
+        new_periodic_images = set()
 
-                # now search in new structure for these atoms query returns (distance, index)
-                v_present = kd_tree.query(v_expect)
-                v_present = v_present[1] if v_present[0] <= tol else None
+        for idx in np.flatnonzero(inside | periodic):
+            offset = idx // n_periodic * n_sites
+            u, v, k, data = periodic_edges[idx % n_periodic]
+            u, v = u + offset, v + offset
+            new_u, new_v = u, int(v_present[idx])
+            new_data = data.copy()
+            edges_to_remove.append((u, v, k))
 
+            if inside[idx]:
                 # check if image sites now present in supercell
                 # and if so, delete old edge that went through
-                # periodic boundary
-                if v_present is not None:
-                    new_u = u
-                    new_v = v_present
-                    new_data = data.copy()
-
-                    # node now inside supercell
-                    new_data["to_jimage"] = (0, 0, 0)
+                # periodic boundary, node now inside supercell
+                new_data["to_jimage"] = (0, 0, 0)
 
-                    edges_to_remove.append((u, v, k))
+                # make sure we don't try to add duplicate edges
+                # will remove two edges for everyone one we add
+                if frozenset((new_u, new_v)) not in edges_inside_supercell:
+                    # normalize direction
+                    if new_v < new_u:
+                        new_u, new_v = new_v, new_u
 
-                    # make sure we don't try to add duplicate edges
-                    # will remove two edges for everyone one we add
-                    if {new_u, new_v} not in edges_inside_supercell:
-                        # normalize direction
-                        if new_v < new_u:
-                            new_u, new_v = new_v, new_u
+                    edges_inside_supercell.add(frozenset((new_u, new_v)))
+                    edges_to_add.append((new_u, new_v, new_data))
 
-                        edges_inside_supercell.append({new_u, new_v})
-                        edges_to_add.append((new_u, new_v, new_data))
-
-                else:
-                    # want to find new_v such that we have
-                    # full periodic boundary conditions
-                    # so that nodes on one side of supercell
-                    # are connected to nodes on opposite side
-
-                    v_expec_frac = new_structure.lattice.get_fractional_coords(v_expect)
-
-                    # find new to_jimage
-                    # use np.around to fix issues with finite precision leading to incorrect image
-                    v_expec_image = np.around(v_expec_frac, decimals=3)
-                    v_expec_image -= v_expec_image % 1
-
-                    v_expec_frac = np.subtract(v_expec_frac, v_expec_image)
-                    v_expect = new_structure.lattice.get_cartesian_coords(v_expec_frac)
-                    v_present = kd_tree.query(v_expect)
-                    v_present = v_present[1] if v_present[0] <= tol else None
-
-                    if v_present is not None:
-                        new_u = u
-                        new_v = v_present
-                        new_data = data.copy()
-                        new_to_jimage = tuple(map(int, v_expec_image))
-
-                        # normalize direction
-                        if new_v < new_u:
-                            new_u, new_v = new_v, new_u
-                            new_to_jimage = tuple(np.multiply(-1, data["to_jimage"]).astype(int))
+            else:
+                new_to_jimage = tuple(int(img) for img in images[idx])
 
-                        new_data["to_jimage"] = new_to_jimage
+                # normalize direction
+                if new_v < new_u:
+                    new_u, new_v = new_v, new_u
+                    new_to_jimage = tuple(-int(img) for img in data["to_jimage"])
 
-                        edges_to_remove.append((u, v, k))
+                new_data["to_jimage"] = new_to_jimage
 
-                        if (new_u, new_v, new_to_jimage) not in new_periodic_images:
-                            edges_to_add.append((new_u, new_v, new_data))
-                            new_periodic_images.append((new_u, new_v, new_to_jimage))
+                if (new_u, new_v, new_to_jimage) not in new_periodic_images:
+                    edges_to_add.append((new_u, new_v, new_data))
+                    new_periodic_images.add((new_u, new_v, new_to_jimage))
 
         logger.debug(f"Removing {len(edges_to_remove)} edges, adding {len(edges_to_add)} new edges.")
 
         # add/delete marked edges
-        for edge in edges_to_remove:
-            new_g.remove_edge(*edge)
+        new_g.remove_edges_from(edges_to_remove)
         for u, v, data in edges_to_add:
             new_g.add_edge(u, v, **data)
 
         # return new instance of StructureGraph with supercell
-        data = {
-            "@module": type(self).__module__,
-            "@class": type(self).__name__,
-            "structure": new_structure.as_dict(),
-            "graphs": json_graph.adjacency_data(new_g),
-        }
-
-        return type(self).from_dict(data)
+        return type(self)(new_structure, json_graph.adjacency_data(new_g))
 
     def __rmul__(self, other):
         return self.__mul__(other)
@@ -1516,14 +1586,32 @@ class StructureGraph(MSONable):
                 return e1["weight"] == e2["weight"]
             return True
 
-        # prune duplicate subgraphs
+        # prune duplicate subgraphs, only comparing subgraphs with the same
+        # species and degrees, which isomorphic subgraphs must have
         unique_subgraphs: list = []
+        candidates: dict[tuple, list] = defaultdict(list)
+        images: set[tuple] = set()
+        n_sites = len(self.structure)
         for subgraph in molecule_subgraphs:
-            already_present = [
-                nx.is_isomorphic(subgraph, g, node_match=node_match, edge_match=edge_match) for g in unique_subgraphs
-            ]
+            # periodic images of a molecule are made of the images of the same sites
+            # and bonds (a molecule cannot contain two images of the same site)
+            image = (
+                frozenset(n % n_sites for n in subgraph),
+                frozenset(frozenset((u % n_sites, v % n_sites)) for u, v in subgraph.edges()),
+            )
+            if image in images:
+                continue
+            images.add(image)
 
-            if not any(already_present):
+            invariant = (
+                subgraph.number_of_edges(),
+                tuple(sorted((data["specie"], subgraph.degree(n)) for n, data in subgraph.nodes(data=True))),
+            )
+            if not any(
+                nx.is_isomorphic(subgraph, g, node_match=node_match, edge_match=edge_match)
+                for g in candidates[invariant]
+            ):
+                candidates[invariant].append(subgraph)
                 unique_subgraphs.append(subgraph)
 
         # get Molecule objects for each subgraph
@@ -2123,34 +2211,25 @@ class MoleculeGraph(MSONable):
         graph = self.graph.to_undirected()
 
         # find all possible fragments, aka connected induced subgraphs
+        # (subgraph views, only the unique fragments are copied)
+        species = [str(site.specie) for site in self.molecule]
         frag_dict = {}
         for ii in range(1, len(self.molecule)):
             for combination in combinations(graph.nodes, ii):
-                comp = []
-                for idx in combination:
-                    comp.append(str(self.molecule[idx].specie))
-                comp = "".join(sorted(comp))
+                comp = "".join(sorted(species[idx] for idx in combination))
                 subgraph = nx.subgraph(graph, combination)
                 if nx.is_connected(subgraph):
                     key = f"{comp} {len(subgraph.edges())}"
                     if key not in frag_dict:
-                        frag_dict[key] = [copy.deepcopy(subgraph)]
+                        frag_dict[key] = [subgraph]
                     else:
-                        frag_dict[key].append(copy.deepcopy(subgraph))
+                        frag_dict[key].append(subgraph)
 
-        # narrow to all unique fragments using graph isomorphism
+        # narrow to all unique fragments using graph isomorphism, bucketed by WL hash
         unique_frag_dict = {}
         for key, fragments in frag_dict.items():
-            unique_frags = []
-            for frag in fragments:
-                found = False
-                for fragment in unique_frags:
-                    if _isomorphic(frag, fragment):
-                        found = True
-                        break
-                if not found:
-                    unique_frags.append(frag)
-            unique_frag_dict[key] = copy.deepcopy(unique_frags)
+            groups = group_isomorphic_graphs(fragments, _isomorphic, node_attr="specie")
+            unique_frag_dict[key] = copy.deepcopy([fragments[group[0]] for group in groups])
 
         # convert back to molecule graphs
         unique_mol_graph_dict = {}
@@ -5,6 +5,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from joblib import Parallel, delayed
+
 from pymatgen.analysis.elasticity.strain import Deformation, Strain
 from pymatgen.analysis.interfaces.zsl import ZSLGenerator, ZSLMatch, reduce_vectors
 from pymatgen.core.surface import SlabGenerator, get_symmetrically_distinct_miller_indices
@@ -147,6 +149,10 @@ class SubstrateAnalyzer(ZSLGenerator):
 
         return vector_sets
 
+    def _list_matches(self, film_vectors, substrate_vectors, lowest: bool) -> list[ZSLMatch]:
+        """All ZSL matches for one film/substrate surface pair as a list."""
+        return list(self(film_vectors, substrate_vectors, lowest))
+
     def calculate(
         self,
         film: Structure,
@@ -156,6 +162,7 @@ class SubstrateAnalyzer(ZSLGenerator):
         substrate_millers: ArrayLike = None,
         ground_state_energy=0,
         lowest=False,
+        n_jobs: int = 1,
     ):
         """Find all topological matches for the substrate and calculates elastic
         strain energy and total energy for the film if elasticity tensor and
@@ -173,6 +180,9 @@ class SubstrateAnalyzer(ZSLGenerator):
                 defined by miller indices
             ground_state_energy (float): ground state energy for the film
             lowest (bool): only consider lowest matching area for each surface
+            n_jobs (int): Number of parallel jobs used to match different
+                film/substrate Miller index pairs. -1 uses all cores. Defaults
+                to 1, which matches lazily in serial.
         """
         # Generate miller indices if none specified for film
         if film_millers is None:
@@ -184,13 +194,19 @@ class SubstrateAnalyzer(ZSLGenerator):
 
         # Check each miller index combination
         surface_vector_sets = self.generate_surface_vectors(film, substrate, film_millers, substrate_millers)
-        for [
-            film_vectors,
-            substrate_vectors,
-            film_miller,
-            substrate_miller,
-        ] in surface_vector_sets:
-            for match in self(film_vectors, substrate_vectors, lowest):
+        if n_jobs == 1:
+            zsl_matches = (
+                self(film_vectors, substrate_vectors, lowest)
+                for film_vectors, substrate_vectors, *_ in surface_vector_sets
+            )
+        else:
+            zsl_matches = Parallel(n_jobs=n_jobs)(
+                delayed(self._list_matches)(film_vectors, substrate_vectors, lowest)
+                for film_vectors, substrate_vectors, *_ in surface_vector_sets
+            )
+
+        for (_, _, film_miller, substrate_miller), matches in zip(surface_vector_sets, zsl_matches, strict=True):
+            for match in matches:
                 sub_match = SubstrateMatch.from_zsl(
                     match=match,
                     film=film,
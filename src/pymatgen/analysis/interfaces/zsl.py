@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from itertools import product
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -162,30 +161,16 @@ class ZSLGenerator(MSONable):
         """
         for film_transformations, substrate_transformations in transformation_sets:
             # Apply transformations and reduce using Zur reduce methodology
-            films = np.array(
-                [reduce_vectors(*v) for v in np.dot(film_transformations, film_vectors)],
-                dtype=float,
-            )
+            films = _reduce_vectors_batch(np.dot(film_transformations, film_vectors))
+            substrates = _reduce_vectors_batch(np.dot(substrate_transformations, substrate_vectors))
 
-            substrates = np.array(
-                [reduce_vectors(*v) for v in np.dot(substrate_transformations, substrate_vectors)],
-                dtype=float,
-            )
+            # Check all film/substrate super lattice pairs at once
+            same = _is_same_vectors_batch(films, substrates, self.max_length_tol, self.max_angle_tol)
+            if self.bidirectional:
+                same |= _is_same_vectors_batch(substrates, films, self.max_length_tol, self.max_angle_tol).T
 
-            # Check if equivalent super lattices
-            for (f_trans, s_trans), (f, s) in zip(
-                product(film_transformations, substrate_transformations),
-                product(films, substrates),
-                strict=True,
-            ):
-                if is_same_vectors(
-                    f,
-                    s,
-                    bidirectional=self.bidirectional,
-                    max_length_tol=self.max_length_tol,
-                    max_angle_tol=self.max_angle_tol,
-                ):
-                    yield [f, s, f_trans, s_trans]
+            for f_idx, s_idx in zip(*np.nonzero(same), strict=True):
+                yield [films[f_idx], substrates[s_idx], film_transformations[f_idx], substrate_transformations[s_idx]]
 
     def __call__(self, film_vectors, substrate_vectors, lowest=False) -> Iterator[ZSLMatch]:
         """Runs the ZSL algorithm to generate all possible matching."""
@@ -197,7 +182,7 @@ class ZSLGenerator(MSONable):
         # and had to be re-written as a staticmethod if using numba, so was left unchanged)
         transformation_sets = self.generate_sl_transformation_sets(film_area, substrate_area)
 
-        # Optimization note: could not use njit here due to use of itertools.product
+        # Super lattices of each transformation set are reduced and compared as arrays
         equiv_transformations = self.get_equiv_transformations(transformation_sets, film_vectors, substrate_vectors)
 
         # Check each super-lattice pair to see if they match
@@ -310,6 +295,81 @@ def reduce_vectors(a, b):
     return (a, b)
 
 
+def _dots(vectors1, vectors2):
+    """Dot products along the last axis. matmul rounds like np.dot, so exact ties
+    in the reduction below are broken the same way as in reduce_vectors.
+    """
+    return (vectors1[..., None, :] @ vectors2[..., :, None])[..., 0, 0]
+
+
+def _norms(vectors):
+    """Norms along the last axis, equal to fast_norm of each vector."""
+    return np.sqrt(_dots(vectors, vectors))
+
+
+def _reduce_vectors_batch(vector_pairs):
+    """Vectorized reduce_vectors for a stack of vector pairs.
+
+    Args:
+        vector_pairs (array): shape (n, 2, 3) array of (a, b) vector pairs.
+
+    Returns:
+        np.ndarray: shape (n, 2, 3) array of the reduced pairs.
+    """
+    a = np.array(vector_pairs[:, 0], dtype=np.float64)
+    b = np.array(vector_pairs[:, 1], dtype=np.float64)
+
+    # Apply the first applicable reduce_vectors rule to every unreduced pair
+    # until none applies, in the same order as the recursive version
+    active = np.arange(len(a))
+    while len(active) > 0:
+        a_act, b_act = a[active], b[active]
+        norm_b = _norms(b_act)
+
+        flip = _dots(a_act, b_act) < 0
+        swap = ~flip & (_norms(a_act) > norm_b)
+        add = ~flip & ~swap & (norm_b > _norms(b_act + a_act))
+        subtract = ~flip & ~swap & ~add & (norm_b > _norms(b_act - a_act))
+
+        b_act[flip] *= -1
+        a_act[swap], b_act[swap] = b_act[swap], a_act[swap]
+        b_act[add] += a_act[add]
+        b_act[subtract] -= a_act[subtract]
+        a[active], b[active] = a_act, b_act
+
+        active = active[flip | swap | add | subtract]
+
+    return np.stack([a, b], axis=1)
+
+
+def _is_same_vectors_batch(vec_sets1, vec_sets2, max_length_tol, max_angle_tol):
+    """Vectorized unidirectional is_same_vectors for all pairs of two stacks of
+    vector sets.
+
+    Args:
+        vec_sets1 (array): shape (n, 2, 3) array of vector sets.
+        vec_sets2 (array): shape (m, 2, 3) array of vector sets.
+        max_length_tol (float): maximum relative length mismatch.
+        max_angle_tol (float): maximum relative angle mismatch.
+
+    Returns:
+        np.ndarray: shape (n, m) boolean array, True where
+            is_same_vectors(vec_sets1[i], vec_sets2[j]).
+    """
+
+    def lengths_and_angles(vec_sets):
+        cos_ang = _dots(vec_sets[:, 0], vec_sets[:, 1])
+        sin_ang = _norms(np.cross(vec_sets[:, 0], vec_sets[:, 1]))
+        return _norms(vec_sets), np.arctan2(sin_ang, cos_ang)
+
+    lengths1, angles1 = lengths_and_angles(vec_sets1)
+    lengths2, angles2 = lengths_and_angles(vec_sets2)
+
+    strains = lengths2[None, :, :] / lengths1[:, None, :] - 1
+    same_lengths = np.all(np.absolute(strains) <= max_length_tol, axis=-1)
+    return same_lengths & (np.absolute(angles2[None, :] / angles1[:, None] - 1) <= max_angle_tol)
+
+
 @njit
 def get_factors(n):
     """Generate all factors of n."""
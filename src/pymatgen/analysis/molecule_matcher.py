@@ -20,6 +20,7 @@ import re
 from typing import TYPE_CHECKING
 
 import numpy as np
+from joblib import Parallel, delayed
 from monty.dev import requires
 from monty.json import MSONable
 from scipy.optimize import linear_sum_assignment
@@ -83,6 +84,20 @@ class AbstractMolAtomMapper(MSONable, abc.ABC):
             A hashable object. Examples can be string formulas, etc.
         """
 
+    def get_label_data(self, mol):
+        """
+        Data that uniform_labels computes for each molecule on its own. When
+        a molecule is fitted against several others, e.g. in
+        MoleculeMatcher.group_molecules, it is computed once and passed to
+        uniform_labels as label_data1 or label_data2.
+
+        Args:
+            mol: The molecule. OpenBabel OBMol or pymatgen Molecule object
+
+        Returns:
+            The data, None if the mapper has none (the default).
+        """
+
     @classmethod
     def from_dict(cls, dct: dict) -> Self:
         """
@@ -511,11 +526,15 @@ class InchiMolAtomMapper(AbstractMolAtomMapper):
                 return False
         return True
 
-    def uniform_labels(self, mol1, mol2):
+    def uniform_labels(self, mol1, mol2, label_data1=None, label_data2=None):
         """
         Args:
             mol1 (Molecule): Molecule 1
             mol2 (Molecule): Molecule 2.
+            label_data1: InChI labels of molecule 1 from get_label_data.
+                Computed if None.
+            label_data2: InChI labels of molecule 2 from get_label_data.
+                Computed if None.
 
         Returns:
             Labels
@@ -523,8 +542,8 @@ class InchiMolAtomMapper(AbstractMolAtomMapper):
         ob_mol1 = BabelMolAdaptor(mol1).openbabel_mol
         ob_mol2 = BabelMolAdaptor(mol2).openbabel_mol
 
-        ilabel1, iequal_atom1, inchi1 = self._inchi_labels(ob_mol1)
-        ilabel2, iequal_atom2, inchi2 = self._inchi_labels(ob_mol2)
+        ilabel1, iequal_atom1, inchi1 = label_data1 or self._inchi_labels(ob_mol1)
+        ilabel2, iequal_atom2, inchi2 = label_data2 or self._inchi_labels(ob_mol2)
 
         if inchi1 != inchi2:
             return None, None  # Topologically different
@@ -560,6 +579,12 @@ class InchiMolAtomMapper(AbstractMolAtomMapper):
         ob_mol = BabelMolAdaptor(mol).openbabel_mol
         return self._inchi_labels(ob_mol)[2]
 
+    def get_label_data(self, mol):
+        """Get the InChI labels of the heavy atoms, equivalent atoms and InChI
+        of a molecule, see uniform_labels.
+        """
+        return self._inchi_labels(BabelMolAdaptor(mol).openbabel_mol)
+
 
 class MoleculeMatcher(MSONable):
     """Match molecules and identify whether molecules are the same."""
@@ -580,26 +605,39 @@ class MoleculeMatcher(MSONable):
         self._tolerance = tolerance
         self._mapper = mapper or InchiMolAtomMapper()
 
-    def fit(self, mol1, mol2):
+    def fit(self, mol1, mol2, label_data1=None, label_data2=None):
         """Fit two molecules.
 
         Args:
             mol1: First molecule. OpenBabel OBMol or pymatgen Molecule object
             mol2: Second molecule. OpenBabel OBMol or pymatgen Molecule object
+            label_data1: Data of the mapper for mol1, from its get_label_data
+                method. Computed by the mapper if None.
+            label_data2: Data of the mapper for mol2, see label_data1.
 
         Returns:
             bool: True if two molecules are the same.
         """
-        return self.get_rmsd(mol1, mol2) < self._tolerance
+        return self.get_rmsd(mol1, mol2, label_data1, label_data2) < self._tolerance
 
-    def get_rmsd(self, mol1, mol2):
+    def get_rmsd(self, mol1, mol2, label_data1=None, label_data2=None):
         """Get RMSD between two molecule with arbitrary atom order.
 
+        Args:
+            mol1: First molecule. OpenBabel OBMol or pymatgen Molecule object
+            mol2: Second molecule. OpenBabel OBMol or pymatgen Molecule object
+            label_data1: Data of the mapper for mol1, from its get_label_data
+                method. Computed by the mapper if None.
+            label_data2: Data of the mapper for mol2, see label_data1.
+
         Returns:
             RMSD if topology of the two molecules are the same
             Infinite if the topology is different
         """
-        label1, label2 = self._mapper.uniform_labels(mol1, mol2)
+        if label_data1 is None and label_data2 is None:
+            label1, label2 = self._mapper.uniform_labels(mol1, mol2)
+        else:
+            label1, label2 = self._mapper.uniform_labels(mol1, mol2, label_data1, label_data2)
         if label1 is None or label2 is None:
             return float("Inf")
         return self._calc_rms(mol1, mol2, label1, label2)
@@ -644,48 +682,80 @@ class MoleculeMatcher(MSONable):
         aligner.Align()
         return aligner.GetRMSD()
 
-    def group_molecules(self, mol_list):
+    def group_molecules(self, mol_list, n_jobs: int = 1):
         """
         Group molecules by structural equality.
 
         Args:
             mol_list: List of OpenBabel OBMol or pymatgen objects
+            n_jobs (int): Number of parallel jobs used to compare molecules in
+                different hash groups. -1 uses all cores. Defaults to 1 (serial).
+                OpenBabel OBMol objects cannot be sent to parallel jobs, so
+                mol_list must only contain pymatgen Molecules if n_jobs != 1.
 
         Returns:
             A list of lists of matched molecules
             Assumption: if s1=s2 and s2=s3, then s1=s3
             This may not be true for small tolerances.
         """
+        if n_jobs != 1 and not all(isinstance(mol, Molecule) for mol in mol_list):
+            raise ValueError("OpenBabel OBMol objects cannot be grouped in parallel, use n_jobs=1")
+
         mol_hash = [(idx, self._mapper.get_molecule_hash(mol)) for idx, mol in enumerate(mol_list)]
         mol_hash.sort(key=lambda x: x[1])
 
         # Use molecular hash to pre-group molecules.
         raw_groups = tuple(tuple(m[0] for m in g) for k, g in itertools.groupby(mol_hash, key=lambda x: x[1]))
 
-        group_indices = []
-        for rg in raw_groups:
-            mol_eq_test = [
-                (p[0], p[1], self.fit(mol_list[p[0]], mol_list[p[1]])) for p in itertools.combinations(sorted(rg), 2)
-            ]
-            mol_eq = {(p[0], p[1]) for p in mol_eq_test if p[2]}
-            not_alone_mols = set(itertools.chain.from_iterable(mol_eq))
-            alone_mols = set(rg) - not_alone_mols
-            group_indices.extend([[m] for m in alone_mols])
-            while len(not_alone_mols) > 0:
-                current_group = {not_alone_mols.pop()}
-                while len(not_alone_mols) > 0:
-                    candidate_pairs = {tuple(sorted(p)) for p in itertools.product(current_group, not_alone_mols)}
-                    mutual_pairs = candidate_pairs & mol_eq
-                    if len(mutual_pairs) == 0:
-                        break
-                    mutual_mols = set(itertools.chain.from_iterable(mutual_pairs))
-                    current_group |= mutual_mols
-                    not_alone_mols -= mutual_mols
-                group_indices.append(sorted(current_group))
+        if n_jobs == 1:
+            bucket_groups = [self._group_hash_bucket(rg, [mol_list[idx] for idx in rg]) for rg in raw_groups]
+        else:
+            bucket_groups = Parallel(n_jobs=n_jobs)(
+                delayed(self._group_hash_bucket)(rg, [mol_list[idx] for idx in rg]) for rg in raw_groups
+            )
 
+        group_indices = [group for groups in bucket_groups for group in groups]
         group_indices.sort(key=lambda x: (len(x), -x[0]), reverse=True)
         return [[mol_list[idx] for idx in g] for g in group_indices]
 
+    def _group_hash_bucket(self, indices, mols):
+        """Group molecules sharing the same hash into connected components of
+        matching pairs.
+
+        Args:
+            indices: Indices of the molecules in the original list.
+            mols: The molecules, in the same order as indices.
+
+        Returns:
+            list[list[int]]: Sorted original indices of each group.
+        """
+        if len(indices) == 1:
+            return [list(indices)]
+
+        order = sorted(range(len(indices)), key=lambda idx: indices[idx])
+        mols = [mols[idx] for idx in order]
+        # Label each molecule once, instead of once for every pair that is fitted
+        label_data = [self._mapper.get_label_data(mol) for mol in mols]
+
+        parents = list(range(len(mols)))
+
+        def find_root(idx):
+            while parents[idx] != idx:
+                parents[idx] = parents[parents[idx]]
+                idx = parents[idx]
+            return idx
+
+        for idx1, idx2 in itertools.combinations(range(len(mols)), 2):
+            root1, root2 = find_root(idx1), find_root(idx2)
+            # A pair already connected through other matches cannot change the groups
+            if root1 != root2 and self.fit(mols[idx1], mols[idx2], label_data[idx1], label_data[idx2]):
+                parents[max(root1, root2)] = min(root1, root2)
+
+        groups: dict[int, list[int]] = {}
+        for idx in range(len(mols)):
+            groups.setdefault(find_root(idx), []).append(indices[order[idx]])
+        return list(groups.values())
+
     def as_dict(self):
         """Get MSONable dict."""
         return {
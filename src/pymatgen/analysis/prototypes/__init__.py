@@ -30,27 +30,35 @@ Physical Review Materials, 8(10), 103801. https://doi.org/10.1103/PhysRevMateria
 
 from __future__ import annotations
 
+import hashlib
 import os
+import pickle
 import re
 import subprocess
+import tempfile
 from collections import Counter, defaultdict
+from functools import cache
 from itertools import chain, groupby, permutations, product
 from operator import itemgetter
+from pathlib import Path
 from shutil import which
 from string import ascii_uppercase, digits
 from typing import TYPE_CHECKING
 
 import orjson
+import spglib
+from joblib import Parallel, delayed
 from monty.fractions import gcd
 from monty.serialization import loadfn
 
 from pymatgen.analysis.structure_matcher import StructureMatcher
-from pymatgen.core import Composition, Structure
+from pymatgen.core import SETTINGS, Composition, Structure, __version__
 from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
 from pymatgen.util.due import Doi, due
 
 if TYPE_CHECKING:
-    from typing import Literal
+    from collections.abc import Callable, Sequence
+    from typing import Any, Literal
 
     from pymatgen.core.structure import Structure
 
@@ -112,6 +120,93 @@ RE_ANONYMOUS = re.compile(r"([A-Z])(?![0-9])")
 RE_SUBST_ONE_PREFIX = r"1\g<1>"
 RE_SUBST_ONE_SUFFIX = r"\g<1>1"
 
+# Directory where the reduced prototype structures and the prototype label index are pickled,
+# None to compute them once per process
+AFLOW_PROTOTYPE_CACHE_DIR = SETTINGS.get("AFLOW_PROTOTYPE_CACHE_DIR")
+
+
+def _load_prototype_data(name: str, compute: Callable[[], Any], cache_dir: str | Path | None) -> Any:
+    """Load data derived from the AFLOW prototype library from cache_dir, computing and pickling it there
+    if it is missing. The file name contains a digest of the library and of the pymatgen and spglib
+    versions, so that stale data is never loaded.
+
+    Args:
+        name (str): Name of the data, used in the file name.
+        compute (Callable[[], Any]): Function computing the data.
+        cache_dir (str | Path | None): Directory where the data is pickled. None to always compute it.
+
+    Returns:
+        Any: The data.
+    """
+    if cache_dir is None:
+        return compute()
+
+    hasher = hashlib.blake2b(digest_size=16)
+    with open(f"{MODULE_DIR}/aflow_prototypes.json.gz", "rb") as file:
+        hasher.update(file.read())
+    hasher.update(f"{__version__}/{spglib.__version__}".encode())
+    path = Path(cache_dir).expanduser() / f"aflow_prototypes_{name}_{hasher.hexdigest()}.pkl"
+    try:
+        with open(path, "rb") as file:
+            return pickle.load(file)  # noqa: S301
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass
+
+    data = compute()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            pickle.dump(data, file)
+        os.replace(tmp_path, path)
+    except OSError:
+        Path(tmp_path).unlink(missing_ok=True)
+    return data
+
+
+@cache
+def _get_reduced_prototype_structures() -> list[Structure]:
+    """Reduced structures of the AFLOW prototypes, in the order of AFLOW_PROTOTYPE_LIBRARY."""
+    return _load_prototype_data(
+        "reduced_structures",
+        lambda: [AflowPrototypeMatcher._preprocess_structure(dct["snl"].structure) for dct in AFLOW_PROTOTYPE_LIBRARY],
+        AFLOW_PROTOTYPE_CACHE_DIR,
+    )
+
+
+@cache
+def _get_prototype_label_index() -> dict[str, list[int]]:
+    """Indices in AFLOW_PROTOTYPE_LIBRARY of the prototypes, keyed by the canonical prototype of their
+    spglib protostructure label. The labels are computed from the prototype structures rather than taken
+    from the AFLOW tags, as these do not always agree with spglib.
+    """
+
+    def get_index() -> dict[str, list[int]]:
+        index: dict[str, list[int]] = defaultdict(list)
+        for idx, dct in enumerate(AFLOW_PROTOTYPE_LIBRARY):
+            if (prototype := _get_prototype_from_structure(dct["snl"].structure)) is not None:
+                index[prototype].append(idx)
+        return dict(index)
+
+    return _load_prototype_data("label_index", get_index, AFLOW_PROTOTYPE_CACHE_DIR)
+
+
+def _get_prototype_from_structure(structure: Structure) -> str | None:
+    """Canonical prototype of the spglib protostructure label of a structure, None if the label is invalid."""
+    try:
+        return get_prototype_from_protostructure(get_protostructure_label_from_spglib(structure, raise_errors=True))
+    except ValueError:
+        return None
+
+
+def _get_prototype_key(structure: Structure) -> tuple[int, tuple[float, ...]]:
+    """Number of sites and sorted amounts of the reduced composition of a (reduced) structure. Anonymous
+    matching without supercells requires these to be equal, so only the prototypes with the key of a
+    structure have to be matched against it.
+    """
+    amounts = structure.composition.reduced_composition.values()
+    return len(structure), tuple(sorted(round(amount, 8) for amount in amounts))
+
 
 @due.dcite(
     Doi("10.1016/j.commatsci.2017.01.017"),
@@ -152,12 +247,14 @@ class AflowPrototypeMatcher:
         self.initial_stol = initial_stol
         self.initial_angle_tol = initial_angle_tol
 
-        # Preprocess AFLOW prototypes
-        self._aflow_prototype_library: list[tuple[Structure, dict]] = []
-        for dct in AFLOW_PROTOTYPE_LIBRARY:
-            structure: Structure = dct["snl"].structure
-            reduced_structure = self._preprocess_structure(structure)
-            self._aflow_prototype_library.append((reduced_structure, dct))
+        # Reduced AFLOW prototypes, computed once per process (or loaded from AFLOW_PROTOTYPE_CACHE_DIR)
+        self._aflow_prototype_library: list[tuple[Structure, dict]] = list(
+            zip(_get_reduced_prototype_structures(), AFLOW_PROTOTYPE_LIBRARY, strict=True)
+        )
+        # Prototypes that can be matched to a structure, by number of sites and reduced composition
+        self._prototype_index: dict[tuple[int, tuple[float, ...]], list[int]] = defaultdict(list)
+        for idx, (reduced_structure, _) in enumerate(self._aflow_prototype_library):
+            self._prototype_index[_get_prototype_key(reduced_structure)].append(idx)
 
     @staticmethod
     def _preprocess_structure(structure: Structure) -> Structure:
@@ -167,9 +264,11 @@ class AflowPrototypeMatcher:
         self,
         structure_matcher: StructureMatcher,
         reduced_structure: Structure,
+        candidates: list[int],
     ) -> list[dict]:
         tags = []
-        for aflow_reduced_structure, dct in self._aflow_prototype_library:
+        for idx in candidates:
+            aflow_reduced_structure, dct = self._aflow_prototype_library[idx]
             # Since both structures are already reduced, we can skip the structure reduction step
             match = structure_matcher.fit_anonymous(
                 aflow_reduced_structure, reduced_structure, skip_structure_reduction=True
@@ -178,7 +277,7 @@ class AflowPrototypeMatcher:
                 tags.append(dct)
         return tags
 
-    def _match_single_prototype(self, structure: Structure) -> list[dict]:
+    def _match_single_prototype(self, structure: Structure, prefilter_by_label: bool = False) -> list[dict]:
         sm = StructureMatcher(
             ltol=self.initial_ltol,
             stol=self.initial_stol,
@@ -186,17 +285,25 @@ class AflowPrototypeMatcher:
             primitive_cell=True,
         )
         reduced_structure = self._preprocess_structure(structure)
-        tags = self._match_prototype(sm, reduced_structure)
+        candidates = self._prototype_index.get(_get_prototype_key(reduced_structure), [])
+        tags = []
+        if prefilter_by_label and candidates:
+            prototype = _get_prototype_from_structure(structure)
+            labelled = [idx for idx in _get_prototype_label_index().get(prototype or "", []) if idx in candidates]
+            if labelled and (tags := self._match_prototype(sm, reduced_structure, labelled)):
+                candidates = labelled
+        if not tags:
+            tags = self._match_prototype(sm, reduced_structure, candidates)
         while len(tags) > 1:
             sm.ltol *= 0.8
             sm.stol *= 0.8
             sm.angle_tol *= 0.8
-            tags = self._match_prototype(sm, reduced_structure)
+            tags = self._match_prototype(sm, reduced_structure, candidates)
             if sm.ltol < 0.01:
                 break
         return tags
 
-    def get_prototypes(self, structure: Structure) -> list[dict] | None:
+    def get_prototypes(self, structure: Structure, prefilter_by_label: bool = False) -> list[dict] | None:
         """Get prototype(s) structures for a given input structure. If you use this method in
         your work, please cite the appropriate AFLOW publication:
 
@@ -206,6 +313,12 @@ class AflowPrototypeMatcher:
 
         Args:
             structure (Structure): structure to match
+            prefilter_by_label (bool): Whether to first match the structure only against the
+                prototypes with the same spglib protostructure label (up to the chemical system).
+                If none of them matches, all the prototypes are tried as usual. This skips most
+                of the structure matching, but a structure that matches a prototype with its exact
+                symmetry is no longer matched against the other prototypes it fits within the
+                tolerances. Defaults to False.
 
         Returns:
             list[dict] | None: A list of dicts with keys "snl" for the matched prototype and
@@ -213,10 +326,33 @@ class AflowPrototypeMatcher:
                 prototype. This should be a list containing just a single entry, but it is
                 possible a material can match multiple prototypes.
         """
-        tags: list[dict] = self._match_single_prototype(structure)
+        tags: list[dict] = self._match_single_prototype(structure, prefilter_by_label)
 
         return tags or None
 
+    def get_prototypes_many(
+        self,
+        structures: Sequence[Structure],
+        prefilter_by_label: bool = False,
+        n_jobs: int = 1,
+    ) -> list[list[dict] | None]:
+        """Get the prototype(s) of many structures, e.g. to label a database. See get_prototypes.
+
+        Args:
+            structures (Sequence[Structure]): structures to match
+            prefilter_by_label (bool): Whether to first match each structure only against the
+                prototypes with the same spglib protostructure label. See get_prototypes.
+            n_jobs (int): Number of parallel jobs. -1 uses all CPUs.
+
+        Returns:
+            list[list[dict] | None]: The prototypes of the structures, in the same order.
+        """
+        if n_jobs == 1:
+            return [self.get_prototypes(structure, prefilter_by_label) for structure in structures]
+        return Parallel(n_jobs=n_jobs)(
+            delayed(self.get_prototypes)(structure, prefilter_by_label) for structure in structures
+        )
+
 
 def split_alpha_numeric(s: str) -> dict[str, list[str]]:
     """Split a string into separate lists of alpha and numeric groups.
@@ -282,6 +418,37 @@ def get_protostructure_label(
     raise ValueError(f"Invalid method: {method}")
 
 
+def get_protostructure_labels(
+    structures: Sequence[Structure],
+    method: Literal["aflow", "spglib", "moyopy"],
+    raise_errors: bool = False,
+    n_jobs: int = 1,
+    **kwargs,
+) -> list[str | None]:
+    """Get the protostructure labels of many structures, e.g. to label a database.
+
+    Args:
+        structures (Sequence[Structure]): pymatgen Structures
+        method (Literal["aflow", "spglib", "moyopy"]): Method to use for symmetry
+            detection
+        raise_errors (bool): Whether to raise errors or annotate them. Defaults to
+            False.
+        n_jobs (int): Number of parallel jobs. -1 uses all CPUs.
+        **kwargs: Additional arguments for the specific method
+
+    Returns:
+        list[str | None]: protostructure_labels of the structures, in the same order.
+            See get_protostructure_label.
+    """
+    if method not in {"aflow", "spglib", "moyopy"}:
+        raise ValueError(f"Invalid method: {method}")
+    if n_jobs == 1:
+        return [get_protostructure_label(struct, method, raise_errors, **kwargs) for struct in structures]
+    return Parallel(n_jobs=n_jobs)(
+        delayed(get_protostructure_label)(struct, method, raise_errors, **kwargs) for struct in structures
+    )
+
+
 def get_protostructure_label_from_aflow(
     struct: Structure,
     raise_errors: bool = False,
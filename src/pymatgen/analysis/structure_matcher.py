@@ -47,11 +47,22 @@ class SiteOrderedIStructure(IStructure):
 
     def __eq__(self, other: object) -> bool:
         """Check for IStructure equality and same site order."""
-        if not super().__eq__(other):
-            return False
+        needed_attrs = ("lattice", "sites", "properties")
+        if not all(hasattr(other, attr) for attr in needed_attrs):
+            return NotImplemented
         other = cast("SiteOrderedIStructure", other)  # make mypy happy
 
-        return list(self.sites) == list(other.sites)
+        if other is self:
+            return True
+
+        # Equal sites in the same order imply the unordered site check of
+        # IStructure.__eq__, which is quadratic in the number of sites
+        return (
+            len(self) == len(other)
+            and self.lattice == other.lattice
+            and self.properties == other.properties
+            and list(self.sites) == list(other.sites)
+        )
 
     def __hash__(self) -> int:
         """Use the composition hash for now."""
@@ -29,16 +29,17 @@ import fractions
 import itertools
 import logging
 import math
+import os
 import re
 import subprocess
+import tempfile
+from glob import escape as glob_escape
 from glob import glob
 from shutil import which
 from typing import TYPE_CHECKING
 
 import numpy as np
-from monty.dev import requires
 from monty.fractions import lcm
-from monty.tempfile import ScratchDir
 
 from pymatgen.core import DummySpecies, PeriodicSite, Structure
 from pymatgen.io.vasp.inputs import Poscar
@@ -57,16 +58,13 @@ ENUM_CMD = which("enum.x") or which("multienum.x")
 MAKESTR_CMD = which("makestr.x") or which("makeStr.x") or which("makeStr.py")
 
 
-@requires(
-    ENUM_CMD and MAKESTR_CMD,  # type: ignore[arg-type]
-    "EnumlibAdaptor requires the executables 'enum.x' or 'multienum.x' "
-    "and 'makestr.x' or 'makeStr.py' to be in the path. Please download the "
-    "library at https://github.com/msg-byu/enumlib and follow the instructions "
-    "in the README to compile these two executables accordingly.",
-)
 class EnumlibAdaptor:
     """An adaptor for enumlib.
 
+    Every run works in its own temporary directory and does not change the
+    working directory of the process, so that several adaptors can be run
+    concurrently from different threads.
+
     Attributes:
         structures (list[Structure]): all enumerated structures.
     """
@@ -116,6 +114,16 @@ class EnumlibAdaptor:
                 enumerations in a high-throughput context, for some enumerations
                 which will not terminate in a realistic length of time.
         """
+        # Checked here rather than at import time, so that the executables can
+        # be set (or replaced by stand-ins) after importing this module.
+        if not (ENUM_CMD and MAKESTR_CMD):
+            raise RuntimeError(
+                "EnumlibAdaptor requires the executables 'enum.x' or 'multienum.x' "
+                "and 'makestr.x' or 'makeStr.py' to be in the path. Please download the "
+                "library at https://github.com/msg-byu/enumlib and follow the instructions "
+                "in the README to compile these two executables accordingly."
+            )
+
         if refine_structure:
             finder = SpacegroupAnalyzer(structure, symm_prec)
             self.structure = finder.get_refined_structure()
@@ -128,27 +136,40 @@ class EnumlibAdaptor:
         self.enum_precision_parameter = enum_precision_parameter
         self.check_ordered_symmetry = check_ordered_symmetry
         self.timeout = timeout
+        self._process: subprocess.Popen | None = None
+        self._killed = False
 
     def run(self) -> None:
         """Run the enumeration."""
         # Work in a temporary directory
-        with ScratchDir(".") as tmp_dir:
+        with tempfile.TemporaryDirectory() as tmp_dir:
             logger.debug(f"Temp dir : {tmp_dir}")
             # Generate input files
-            self._gen_input_file()
+            self._gen_input_file(tmp_dir)
 
             # Perform the actual enumeration
-            num_structs = self._run_multienum()
+            num_structs = self._run_multienum(tmp_dir)
 
             # Read in the enumeration output as structures.
-            if num_structs > 0:
-                self.structures = self._get_structures(num_structs)
+            if num_structs > 0 and not self._killed:
+                self.structures = self._get_structures(num_structs, tmp_dir)
             else:
                 raise EnumError("Unable to enumerate structure.")
 
-    def _gen_input_file(self) -> None:
+    def kill(self) -> None:
+        """Kill the enumeration, e.g. when it is run in another thread and its
+        result is no longer needed. The run then raises an EnumError.
+        """
+        self._killed = True
+        if self._process is not None:
+            self._process.kill()
+
+    def _gen_input_file(self, work_dir: str = ".") -> None:
         """Generate the necessary struct_enum.in file for enumlib. See enumlib
         documentation for details.
+
+        Args:
+            work_dir (str): Directory in which the file is written.
         """
         coord_format = "{:.6f} {:.6f} {:.6f}"
         # Use symmetry finder to get the symmetrically distinct sites
@@ -283,19 +304,29 @@ class EnumlibAdaptor:
         output.append("")
 
         logger.debug("Generated input file:\n" + "\n".join(output))
-        with open("struct_enum.in", mode="w", encoding="utf-8") as file:
+        with open(os.path.join(work_dir, "struct_enum.in"), mode="w", encoding="utf-8") as file:
             file.write("\n".join(output))
 
-    def _run_multienum(self) -> int:
+    def _run_multienum(self, work_dir: str = ".") -> int:
         """Run enumlib to get multiple structure.
 
+        Args:
+            work_dir (str): Directory containing the struct_enum.in file.
+
         Returns:
             int: number of structures.
         """
         if ENUM_CMD is None:
             raise RuntimeError("enumlib is not available")
+        if self._killed:
+            return 0
 
-        with subprocess.Popen([ENUM_CMD], stdout=subprocess.PIPE, stdin=subprocess.PIPE, close_fds=True) as process:
+        with subprocess.Popen(
+            [ENUM_CMD], stdout=subprocess.PIPE, stdin=subprocess.PIPE, close_fds=True, cwd=work_dir
+        ) as process:
+            self._process = process
+            if self._killed:  # killed before the process was registered
+                process.kill()
             timeout = self.timeout * 60 if self.timeout is not None else None
 
             try:
@@ -304,6 +335,8 @@ class EnumlibAdaptor:
                 process.kill()
                 process.wait()
                 raise TimeoutError(f"Enumeration took more than timeout {self.timeout} minutes") from exc
+            finally:
+                self._process = None
 
         count = 0
         start_count = False
@@ -315,7 +348,7 @@ class EnumlibAdaptor:
         logger.debug(f"Enumeration resulted in {count} structures")
         return count
 
-    def _get_structures(self, num_structs: int) -> list[Structure]:
+    def _get_structures(self, num_structs: int, work_dir: str = ".") -> list[Structure]:
         if MAKESTR_CMD is None:
             raise RuntimeError("makestr.x is not available")
 
@@ -331,6 +364,7 @@ class EnumlibAdaptor:
             stdout=subprocess.PIPE,
             stdin=subprocess.PIPE,
             close_fds=True,
+            cwd=work_dir,
         ) as rs:
             _stdout, stderr = rs.communicate()
 
@@ -368,7 +402,7 @@ class EnumlibAdaptor:
             ordered_structure = None  # type: ignore[assignment]
             inv_org_latt = None  # type: ignore[assignment]
 
-        for file in glob("vasp.*"):
+        for file in glob(os.path.join(glob_escape(work_dir), "vasp.*")):
             with open(file, encoding="utf-8") as _file:
                 data = _file.read()
                 data = re.sub(r"scale factor", "1", data)
@@ -5,29 +5,41 @@ and a ChemicalPotential class to represent potentials.
 from __future__ import annotations
 
 import collections
+import functools
 import math
 import os
 import re
 import string
 import warnings
 from collections import defaultdict
-from functools import total_ordering
+from functools import cached_property, total_ordering
 from itertools import combinations_with_replacement, product
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, cast, overload
 
+import numpy as np
 from monty.dev import deprecated
-from monty.fractions import gcd, gcd_float
+from monty.fractions import gcd_float
 from monty.json import MSONable
 from monty.serialization import loadfn
-
-from pymatgen.core.periodic_table import DummySpecies, Element, ElementType, Species, get_el_sp
+from scipy.sparse import csr_array, issparse
+
+from pymatgen.core.periodic_table import (
+    DummySpecies,
+    Element,
+    ElementType,
+    Species,
+    get_el_sp,
+    get_element_property_table,
+)
 from pymatgen.core.units import Mass
 from pymatgen.util.string import Stringify, formula_double_format
 
 if TYPE_CHECKING:
-    from collections.abc import Generator, ItemsView, Iterator, Mapping
+    from collections.abc import Callable, Generator, ItemsView, Iterable, Iterator, Mapping, Sequence
     from typing import Any, ClassVar, Literal
 
+    from numpy.typing import ArrayLike
+    from scipy.sparse import sparray
     from typing_extensions import Self
 
     from pymatgen.util.typing import SpeciesLike
@@ -35,6 +47,23 @@ if TYPE_CHECKING:
 MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
 
 
+def _memoized(method: Callable) -> Callable:
+    """Cache the results of a Composition method per instance and arguments.
+    Compositions are immutable, so derived quantities never change.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__name__, args, tuple(kwargs.items()))
+        try:
+            return self._memo[key]
+        except KeyError:
+            result = self._memo[key] = method(self, *args, **kwargs)
+            return result
+
+    return wrapper
+
+
 @total_ordering
 class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, Stringify):
     """
@@ -192,12 +221,19 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, S
             if isinstance(sp, Species):
                 return self._data.get(sp, 0)
             # sp is Element or str
-            return sum(
-                val for key, val in self._data.items() if getattr(key, "symbol", key) == getattr(sp, "symbol", sp)
-            )
+            return self._amounts_by_symbol().get(getattr(sp, "symbol", sp), 0)
         except ValueError as exc:
             raise KeyError(f"Invalid {key=}") from exc
 
+    @_memoized
+    def _amounts_by_symbol(self) -> dict[str, float]:
+        """Total amount of all species of each element symbol."""
+        amounts: dict[str, float] = {}
+        for key, val in self._data.items():
+            symbol = getattr(key, "symbol", key)
+            amounts[symbol] = amounts[symbol] + val if symbol in amounts else val
+        return amounts
+
     def __len__(self) -> int:
         return len(self._data)
 
@@ -303,10 +339,22 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, S
 
     __div__ = __truediv__
 
+    @_memoized
     def __hash__(self) -> int:
         """Hash based on the chemical system."""
         return hash(frozenset(self._data))
 
+    def __getstate__(self) -> dict[str, Any]:
+        # Do not pickle memoized results
+        state = self.__dict__.copy()
+        state.pop("_memo", None)
+        return state
+
+    @cached_property
+    def _memo(self) -> dict[tuple, Any]:
+        """Memoized results of derived quantities, see _memoized."""
+        return {}
+
     def __repr__(self) -> str:
         formula = " ".join(f"{key}{':' if hasattr(key, 'oxi_state') else ''}{val:g}" for key, val in self.items())
         cls_name = type(self).__name__
@@ -415,6 +463,7 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, S
         """
         return self.get_reduced_composition_and_factor()[0]
 
+    @_memoized
     def get_reduced_composition_and_factor(self) -> tuple[Self, float]:
         """Calculate a reduced composition and factor.
 
@@ -425,6 +474,7 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, S
         factor: float = self.get_reduced_formula_and_factor()[1]
         return self / factor, factor
 
+    @_memoized
     def get_reduced_formula_and_factor(self, iupac_ordering: bool = False) -> tuple[str, float]:
         """Calculate a reduced formula and factor.
 
@@ -549,7 +599,8 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, S
     @property
     def weight(self) -> float:
         """Total molecular weight of Composition."""
-        return Mass(sum(amount * el.atomic_mass for el, amount in self.items()), "amu")  # type: ignore[operator,misc]
+        masses = get_element_property_table().get("atomic_mass", self._data).tolist()
+        return Mass(sum(amount * mass for amount, mass in zip(self._data.values(), masses, strict=True)), "amu")
 
     def get_atomic_fraction(self, el: SpeciesLike) -> float:
         """Calculate atomic fraction of an Element or Species.
@@ -611,45 +662,11 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, S
             In the case of Metallofullerene formula (e.g. Y3N@C80),
             the @ mark will be dropped and passed to parser.
         """
-        # Raise error if formula contains special characters or only spaces and/or numbers
-        if strict and re.match(r"[\s\d.*/]*$", formula):
-            raise ValueError(f"Invalid {formula=}")
-
-        # For Metallofullerene like "Y3N@C80"
-        formula = formula.replace("@", "")
-        # Square brackets are used in formulas to denote coordination complexes (gh-3583)
-        formula = formula.replace("[", "(")
-        formula = formula.replace("]", ")")
-        # next 2 lines covered by test_curly_bracket_deeply_nested_formulas
-        formula = formula.replace("{", "(")
-        formula = formula.replace("}", ")")
-
-        def get_sym_dict(form: str, factor: float) -> dict[str, float]:
-            sym_dict: dict[str, float] = defaultdict(float)
-            for match in re.finditer(r"([A-Z][a-z]*)\s*([-*\.e\d]*)", form):
-                el = match[1]
-                amt = 1.0
-                if match[2].strip() != "":
-                    amt = float(match[2])
-                sym_dict[el] += amt * factor
-                form = form.replace(match.group(), "", 1)
-            if form.strip():
-                raise ValueError(f"{form} is an invalid formula!")
-            return sym_dict
-
-        match = re.search(r"\(([^\(\)]+)\)\s*([\.e\d]*)", formula)
-        while match:
-            factor = 1.0
-            if match[2] != "":
-                factor = float(match[2])
-            unit_sym_dict = get_sym_dict(match[1], factor)
-            expanded_sym = "".join(f"{el}{amt}" for el, amt in unit_sym_dict.items())
-            expanded_formula = formula.replace(match.group(), expanded_sym, 1)
-            formula = expanded_formula
-            match = re.search(r"\(([^\(\)]+)\)\s*([\.e\d]*)", formula)
-        return get_sym_dict(formula, 1)
+        # Parsed formulas are cached, hand out a copy
+        return defaultdict(float, _parse_formula_str(formula, strict))
 
     @property
+    @_memoized
     def anonymized_formula(self) -> str:
         """An anonymized formula. Unique species are arranged in ordering of
         increasing amounts and assigned ascending alphabets. Useful for
@@ -658,7 +675,7 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, S
         """
         reduced = self.element_composition
         if all(val == int(val) for val in self.values()):
-            reduced /= gcd(*(int(i) for i in self.values()))
+            reduced /= math.gcd(*(int(i) for i in self.values()))
 
         anon = ""
         for elem, amt in zip(string.ascii_uppercase, sorted(reduced.values()), strict=False):
@@ -909,6 +926,36 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, S
             return ({self.elements[0].symbol: 0.0},)
         return self._get_oxi_state_guesses(all_oxi_states, max_sites, oxi_states_override, target_charge)[0]
 
+    @classmethod
+    def oxi_state_guesses_many(
+        cls,
+        compositions: Iterable[Composition | str | Mapping[SpeciesLike, float]],
+        n_jobs: int = 1,
+        **kwargs,
+    ) -> list[tuple]:
+        """Guess the oxidation states of many compositions, see oxi_state_guesses.
+
+        Oxidation state sums of the same element and number of sites are cached
+        across compositions, so large batches of related compositions are much
+        faster than the first guess suggests.
+
+        Args:
+            compositions (Iterable[Composition | str | Mapping[SpeciesLike, float]]): Compositions,
+                or formulas and dicts to construct them from.
+            n_jobs (int): Number of parallel processes. Defaults to 1, i.e. serial.
+            **kwargs: Passed to oxi_state_guesses, e.g. max_sites or all_oxi_states.
+
+        Returns:
+            list[tuple]: The oxidation_state_guesses of each composition.
+        """
+        comps = [comp if isinstance(comp, Composition) else cls(comp) for comp in compositions]
+        if n_jobs == 1:
+            return [comp.oxi_state_guesses(**kwargs) for comp in comps]
+
+        from joblib import Parallel, delayed
+
+        return Parallel(n_jobs=n_jobs)(delayed(comp.oxi_state_guesses)(**kwargs) for comp in comps)
+
     def replace(self, elem_map: dict[str, str | dict[str, float]]) -> Self:
         """Replace elements in a composition. Returns a new Composition, leaving the old one unchanged.
 
@@ -1092,60 +1139,44 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, S
         el_amt = comp.get_el_amt_dict()
         elements = list(el_amt)
         el_sums: list = []  # matrix: dim1= el_idx, dim2=possible sums
-        el_sum_scores: defaultdict = defaultdict(set)  # dict of el_idx, sum -> score
-        el_best_oxid_combo: dict = {}  # dict of el_idx, sum -> oxid combo with best score
-        for idx, el in enumerate(elements):
-            el_sum_scores[idx] = {}
-            el_best_oxid_combo[idx] = {}
-            el_sums.append([])
+        el_sum_scores: list = []  # per el_idx: dict of sum -> score
+        el_best_oxid_combo: list = []  # per el_idx: dict of sum -> oxid combo with best score
+        for el in elements:
             if oxi_states_override.get(el):
                 oxids: list | tuple = oxi_states_override[el]
             elif all_oxi_states:
                 oxids = Element(el).oxidation_states
             else:
                 oxids = Element(el).icsd_oxidation_states or Element(el).common_oxidation_states
-
-            # Get all possible combinations of oxidation states
-            # and sum each combination
-            for oxid_combo in combinations_with_replacement(oxids, int(el_amt[el])):
-                # List this sum as a possible option
-                oxid_sum = sum(oxid_combo)
-                if oxid_sum not in el_sums[idx]:
-                    el_sums[idx].append(oxid_sum)
-
-                # Determine how probable is this combo?
-                score = sum(type(self).oxi_prob.get(Species(el, o), 0) for o in oxid_combo)  # type: ignore[union-attr]
-
-                # If it is the most probable combo for a certain sum,
-                # store the combination
-                if oxid_sum not in el_sum_scores[idx] or score > el_sum_scores[idx].get(oxid_sum, 0):
-                    el_sum_scores[idx][oxid_sum] = score
-                    el_best_oxid_combo[idx][oxid_sum] = oxid_combo
+            probs = tuple(type(self).oxi_prob.get(Species(el, o), 0) for o in oxids)  # type: ignore[union-attr]
+            sums, sum_scores, best_oxid_combo = _oxi_state_sums(tuple(oxids), probs, int(el_amt[el]))
+            el_sums.append(sums)
+            el_sum_scores.append(sum_scores)
+            el_best_oxid_combo.append(best_oxid_combo)
 
         # Determine which combination of oxidation states for each element
         # is the most probable
         all_sols = []  # will contain all solutions
         all_oxid_combo = []  # will contain the best combination of oxidation states for each site
         all_scores = []  # will contain a score for each solution
-        for x in product(*el_sums):
+        for x in _charge_balanced_sums(el_sums, target_charge):
             # Each x is a trial of one possible oxidation sum for each element
-            if sum(x) == target_charge:  # charge balance condition
-                el_sum_sol = dict(zip(elements, x, strict=True))  # element->oxid_sum
-                # Normalize oxid_sum by amount to get avg oxid state
-                sol = {el: v / el_amt[el] for el, v in el_sum_sol.items()}
-                # Add the solution to the list of solutions
-                all_sols.append(sol)
-
-                # Determine the score for this solution
-                score = 0
-                for idx, v in enumerate(x):
-                    score += el_sum_scores[idx][v]
-                all_scores.append(score)
-
-                # Collect the combination of oxidation states for each site
-                all_oxid_combo.append(
-                    {e: el_best_oxid_combo[idx][v] for idx, (e, v) in enumerate(zip(elements, x, strict=True))}
-                )
+            el_sum_sol = dict(zip(elements, x, strict=True))  # element->oxid_sum
+            # Normalize oxid_sum by amount to get avg oxid state
+            sol = {el: v / el_amt[el] for el, v in el_sum_sol.items()}
+            # Add the solution to the list of solutions
+            all_sols.append(sol)
+
+            # Determine the score for this solution
+            score = 0
+            for idx, v in enumerate(x):
+                score += el_sum_scores[idx][v]
+            all_scores.append(score)
+
+            # Collect the combination of oxidation states for each site
+            all_oxid_combo.append(
+                {e: el_best_oxid_combo[idx][v] for idx, (e, v) in enumerate(zip(elements, x, strict=True))}
+            )
 
         # Sort the solutions from highest to lowest score
         if all_scores:
@@ -1342,6 +1373,285 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, S
                         yield match
 
 
+class CompositionArray(collections.abc.Sequence):
+    """Many compositions stored as one sparse matrix of amounts, with a row per
+    composition and a column per species.
+
+    Quantities that would otherwise be computed Composition by Composition,
+    e.g. normalizing or reducing the compositions of a large set of entries,
+    are computed for all rows at once. Indexing with an integer returns a
+    Composition, indexing with a slice or an index array returns a new
+    CompositionArray.
+
+    Examples:
+        >>> comps = CompositionArray.from_compositions(["Fe2O3", "LiFePO4", "Li4O2"])
+        >>> comps.num_atoms
+        array([5., 7., 6.])
+        >>> comps.reduced_composition[2]
+        Composition('Li2 O1')
+    """
+
+    def __init__(self, amounts: ArrayLike | sparray, species: Sequence[SpeciesLike]) -> None:
+        """
+        Args:
+            amounts (ArrayLike | sparray): Amounts with shape (n_compositions, n_species),
+                dense or as a SciPy sparse array. Amounts below Composition.amount_tolerance
+                are dropped, as in Composition.
+            species (Sequence[SpeciesLike]): Species of the columns.
+        """
+        self.species: tuple[Element | Species | DummySpecies, ...] = tuple(get_el_sp(sp) for sp in species)
+        if not issparse(amounts):
+            amounts = np.atleast_2d(np.asarray(amounts, dtype=np.float64))
+        amounts = csr_array(amounts, dtype=np.float64)
+        if amounts.shape[1] != len(self.species):
+            raise ValueError(f"Got {amounts.shape[1]} columns of amounts for {len(self.species)} species")
+
+        amounts.data[np.abs(amounts.data) < Composition.amount_tolerance] = 0
+        amounts.eliminate_zeros()
+        amounts.sort_indices()
+        self.amounts: csr_array = amounts
+
+    @classmethod
+    def from_compositions(cls, compositions: Iterable[Composition | str | Mapping[SpeciesLike, float]]) -> Self:
+        """Stack many compositions. Columns are ordered by first appearance of each species.
+
+        Args:
+            compositions (Iterable[Composition | str | Mapping[SpeciesLike, float]]): Compositions,
+                or formulas and dicts to construct them from.
+        """
+        columns: dict[Element | Species | DummySpecies, int] = {}
+        indptr, indices, data = [0], [], []
+        for comp in compositions:
+            if not isinstance(comp, Composition):
+                comp = Composition(comp)
+            for sp, amt in comp.items():
+                indices.append(columns.setdefault(sp, len(columns)))
+                data.append(amt)
+            indptr.append(len(indices))
+        amounts = csr_array((data, indices, indptr), shape=(len(indptr) - 1, len(columns)), dtype=np.float64)
+        return cls(amounts, list(columns))
+
+    def __len__(self) -> int:
+        return self.amounts.shape[0]
+
+    @overload
+    def __getitem__(self, idx: int) -> Composition: ...
+
+    @overload
+    def __getitem__(self, idx: slice | ArrayLike) -> Self: ...
+
+    def __getitem__(self, idx: int | slice | ArrayLike) -> Composition | Self:
+        if isinstance(idx, int | np.integer):
+            if idx < 0:
+                idx += len(self)
+            if not 0 <= idx < len(self):
+                raise IndexError(f"{idx=} out of range for {len(self)} compositions")
+            start, end = self.amounts.indptr[idx : idx + 2]
+            amounts = self.amounts.data[start:end]
+            species = [self.species[col] for col in self.amounts.indices[start:end]]
+            return Composition(dict(zip(species, amounts.tolist(), strict=True)), allow_negative=bool(any(amounts < 0)))
+        return type(self)(self.amounts[idx], self.species)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(n_compositions={len(self)}, n_species={len(self.species)})"
+
+    def to_compositions(self) -> list[Composition]:
+        """All rows as Composition objects."""
+        return list(self)
+
+    def _scale_rows(self, factors: np.ndarray) -> Self:
+        """New CompositionArray with each row divided by a factor, rows with factor 0 are unchanged."""
+        divisors = np.where(factors != 0, factors, 1)
+        amounts = self.amounts.copy()
+        amounts.data = amounts.data / np.repeat(divisors, np.diff(amounts.indptr))
+        return type(self)(amounts, self.species)
+
+    @property
+    def num_atoms(self) -> np.ndarray:
+        """Total number of atoms of each composition, see Composition.num_atoms."""
+        return abs(self.amounts).sum(axis=1)
+
+    @property
+    def weight(self) -> np.ndarray:
+        """Total molecular weight of each composition in amu, see Composition.weight."""
+        return self.amounts @ get_element_property_table().get("atomic_mass", self.species)
+
+    @property
+    def fractional_composition(self) -> Self:
+        """The compositions normalized to amounts summing to 1, see Composition.fractional_composition."""
+        return self._scale_rows(self.num_atoms)
+
+    def get_reduced_factors(self) -> np.ndarray:
+        """The factors by which the compositions are reduced, i.e. the factors of
+        Composition.get_reduced_composition_and_factor, including the handling of
+        Composition.special_formulas. Compositions with non-integer amounts have
+        factor 1, empty compositions factor 0.
+        """
+        n_comps = len(self)
+        row_idx = np.repeat(np.arange(n_comps), np.diff(self.amounts.indptr))
+        data = self.amounts.data
+
+        # Only compositions with all integer amounts are reduced
+        is_int = np.abs(data - np.round(data)) < Composition.amount_tolerance
+        all_int = np.bincount(row_idx[~is_int], minlength=n_comps) == 0
+
+        # Integer amounts per element, merging species of the same element
+        symbols, el_cols = np.unique([sp.symbol for sp in self.species], return_inverse=True)
+        int_entries = all_int[row_idx]
+        el_amounts = csr_array(
+            (data[int_entries], (row_idx[int_entries], el_cols[self.amounts.indices[int_entries]])),
+            shape=(n_comps, len(symbols)),
+        )
+        el_amounts.sum_duplicates()
+        el_amounts.data = np.round(el_amounts.data)
+        el_amounts.eliminate_zeros()
+        el_ptr = el_amounts.indptr
+
+        factors = np.ones(n_comps)
+        factors[all_int & (np.diff(el_ptr) == 0)] = 0
+        gcd_rows = np.flatnonzero(all_int & (np.diff(el_ptr) > 0))
+        if len(gcd_rows) > 0:
+            el_data = el_amounts.data
+            if np.all(np.abs(el_data) < 2**53):
+                factors[gcd_rows] = np.abs(np.gcd.reduceat(el_data.astype(np.int64), el_ptr[gcd_rows]))
+            else:
+                for row in gcd_rows:
+                    factors[row] = abs(math.gcd(*map(int, el_data[el_ptr[row] : el_ptr[row + 1]])))
+
+        # Do not "completely reduce" certain formulas, as in Composition.get_reduced_formula_and_factor
+        special = {
+            frozenset(Composition(formula).get_el_amt_dict().items()) for formula in Composition.special_formulas
+        }
+        max_special_len = max(map(len, special))
+        for row in gcd_rows[np.diff(el_ptr)[gcd_rows] <= max_special_len]:
+            start, end = el_ptr[row : row + 2]
+            reduced = zip(
+                symbols[el_amounts.indices[start:end]], el_amounts.data[start:end] / factors[row], strict=True
+            )
+            if frozenset(reduced) in special:
+                factors[row] /= 2
+        return factors
+
+    def get_reduced_composition_and_factor(self) -> tuple[Self, np.ndarray]:
+        """The reduced compositions and the reduction factors, see
+        Composition.get_reduced_composition_and_factor.
+        """
+        factors = self.get_reduced_factors()
+        return self._scale_rows(factors), factors
+
+    @property
+    def reduced_composition(self) -> Self:
+        """The reduced compositions, see Composition.reduced_composition."""
+        return self.get_reduced_composition_and_factor()[0]
+
+
+@functools.lru_cache(maxsize=2**12)
+def _oxi_state_sums(
+    oxids: tuple[float, ...], probs: tuple[float, ...], n_sites: int
+) -> tuple[tuple[float, ...], dict[float, float], dict[float, tuple[float, ...]]]:
+    """All possible sums of the oxidation states of n_sites sites of one element,
+    with the score and the oxidation states of the most probable combination for
+    each sum. Cached, as the same (element, count) pairs recur across compositions.
+
+    Args:
+        oxids (tuple[float, ...]): Allowed oxidation states of the element.
+        probs (tuple[float, ...]): Prior probability of each oxidation state.
+        n_sites (int): Number of sites of the element.
+
+    Returns:
+        tuple: The sums in order of first occurrence, a dict of sum -> best score
+            and a dict of sum -> best combination of oxidation states.
+    """
+    sum_scores: dict[float, float] = {}
+    best_oxid_combo: dict[float, tuple[float, ...]] = {}
+    # Both iterate over the multisets of states in the same order
+    prob_combos = combinations_with_replacement(probs, n_sites)
+    for oxid_combo, prob_combo in zip(combinations_with_replacement(oxids, n_sites), prob_combos, strict=True):
+        oxid_sum = sum(oxid_combo)
+        score = sum(prob_combo)
+        # If it is the most probable combo for a certain sum, store the combination
+        if oxid_sum not in sum_scores or score > sum_scores[oxid_sum]:
+            sum_scores[oxid_sum] = score
+            best_oxid_combo[oxid_sum] = oxid_combo
+    return tuple(sum_scores), sum_scores, best_oxid_combo
+
+
+def _charge_balanced_sums(el_sums: list[tuple[float, ...]], target_charge: float) -> Iterator[tuple[float, ...]]:
+    """Combinations of one oxidation state sum per element that add up to the
+    target charge, in the order of itertools.product(*el_sums).
+
+    For integer sums, partial combinations are pruned as soon as the remaining
+    elements cannot make up the target charge, instead of enumerating the full
+    product, which grows exponentially with the number of elements.
+    """
+    is_integer = all(float(val).is_integer() for sums in el_sums for val in sums)
+    if not el_sums or not is_integer or not float(target_charge).is_integer():
+        yield from (x for x in product(*el_sums) if sum(x) == target_charge)
+        return
+
+    # Charges reachable by the elements from idx onwards
+    reachable: list[set[float]] = [{0}]
+    for sums in reversed(el_sums):
+        reachable.insert(0, {val + rest for val in sums for rest in reachable[0]})
+
+    def search(idx: int, partial: float, prefix: tuple[float, ...]) -> Iterator[tuple[float, ...]]:
+        if idx == len(el_sums) - 1:
+            # Pruning guarantees that exactly one sum of the last element balances the charge
+            yield (*prefix, next(val for val in el_sums[idx] if partial + val == target_charge))
+            return
+        for val in el_sums[idx]:
+            if target_charge - (partial + val) in reachable[idx + 1]:
+                yield from search(idx + 1, partial + val, (*prefix, val))
+
+    if target_charge in reachable[0]:
+        yield from search(0, 0, ())
+
+
+@functools.lru_cache(maxsize=2**14)
+def _parse_formula_str(formula: str, strict: bool = True) -> dict[str, float]:
+    """Parse a formula string into a {symbol: amount} dict, see Composition._parse_formula.
+
+    The returned dict is cached and must not be modified.
+    """
+    # Raise error if formula contains special characters or only spaces and/or numbers
+    if strict and re.match(r"[\s\d.*/]*$", formula):
+        raise ValueError(f"Invalid {formula=}")
+
+    # For Metallofullerene like "Y3N@C80"
+    formula = formula.replace("@", "")
+    # Square brackets are used in formulas to denote coordination complexes (gh-3583)
+    formula = formula.replace("[", "(")
+    formula = formula.replace("]", ")")
+    # next 2 lines covered by test_curly_bracket_deeply_nested_formulas
+    formula = formula.replace("{", "(")
+    formula = formula.replace("}", ")")
+
+    def get_sym_dict(form: str, factor: float) -> dict[str, float]:
+        sym_dict: dict[str, float] = defaultdict(float)
+        for match in re.finditer(r"([A-Z][a-z]*)\s*([-*\.e\d]*)", form):
+            el = match[1]
+            amt = 1.0
+            if match[2].strip() != "":
+                amt = float(match[2])
+            sym_dict[el] += amt * factor
+            form = form.replace(match.group(), "", 1)
+        if form.strip():
+            raise ValueError(f"{form} is an invalid formula!")
+        return sym_dict
+
+    match = re.search(r"\(([^\(\)]+)\)\s*([\.e\d]*)", formula)
+    while match:
+        factor = 1.0
+        if match[2] != "":
+            factor = float(match[2])
+        unit_sym_dict = get_sym_dict(match[1], factor)
+        expanded_sym = "".join(f"{el}{amt}" for el, amt in unit_sym_dict.items())
+        expanded_formula = formula.replace(match.group(), expanded_sym, 1)
+        formula = expanded_formula
+        match = re.search(r"\(([^\(\)]+)\)\s*([\.e\d]*)", formula)
+    return get_sym_dict(formula, 1)
+
+
 def reduce_formula(
     sym_amt: Mapping[str, float],
     iupac_ordering: bool = False,
@@ -1369,7 +1679,7 @@ def reduce_formula(
     # Enforce integer for calculating greatest common divisor
     factor: int = 1
     if all(int(i) == i for i in sym_amt.values()):
-        factor = abs(gcd(*(int(i) for i in sym_amt.values())))
+        factor = abs(math.gcd(*(int(i) for i in sym_amt.values())))
 
     # If the composition contains polyanion
     poly_anions: list[str] = []
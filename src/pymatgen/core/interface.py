@@ -8,7 +8,7 @@ import logging
 import math
 import warnings
 from fractions import Fraction
-from functools import reduce
+from functools import lru_cache, reduce
 from itertools import chain, combinations, product
 from typing import TYPE_CHECKING, Literal, cast
 
@@ -705,18 +705,8 @@ class GrainBoundaryGenerator:
         )
         index_incident = np.nonzero(t_and_b_dis < np.min(t_and_b_dis) + tol_coi)
 
-        top_labels = []
-        for idx in range(n_sites):
-            if idx in index_incident[0]:
-                top_labels.append("top_incident")
-            else:
-                top_labels.append("top")
-        bottom_labels = []
-        for idx in range(n_sites):
-            if idx in index_incident[1]:
-                bottom_labels.append("bottom_incident")
-            else:
-                bottom_labels.append("bottom")
+        top_labels = np.where(np.isin(np.arange(n_sites), index_incident[0]), "top_incident", "top").tolist()
+        bottom_labels = np.where(np.isin(np.arange(n_sites), index_incident[1]), "bottom_incident", "bottom").tolist()
         top_grain = Structure(
             Lattice(top_grain.lattice.matrix),
             top_grain.species,
@@ -742,9 +732,7 @@ class GrainBoundaryGenerator:
         c_adjust = (edge_t - edge_b) / 2.0
 
         # Construct all species
-        all_species = []
-        all_species.extend([site.specie for site in bottom_grain])
-        all_species.extend([site.specie for site in top_grain])
+        all_species = bottom_grain.species + top_grain.species
 
         half_lattice = top_grain.lattice
         # Calculate translation vector, perpendicular to the plane
@@ -760,19 +748,16 @@ class GrainBoundaryGenerator:
         whole_lat = Lattice(whole_matrix_with_vac)
 
         # Construct the coords, move top grain with translation_v
-        all_coords = []
         grain_labels = bottom_grain.site_properties["grain_label"] + top_grain.site_properties["grain_label"]  # type: ignore[operator]
-        for site in bottom_grain:
-            all_coords.append(site.coords)
-        for site in top_grain:
-            all_coords.append(
-                site.coords
-                + half_lattice.matrix[2] * (1 + c_adjust)
-                + unit_ab_adjust * np.linalg.norm(half_lattice.matrix[2] * (1 + c_adjust))
-                + translation_v
-                + ab_shift[0] * whole_matrix_with_vac[0]
-                + ab_shift[1] * whole_matrix_with_vac[1]
-            )
+        top_coords = (
+            top_grain.cart_coords
+            + half_lattice.matrix[2] * (1 + c_adjust)
+            + unit_ab_adjust * np.linalg.norm(half_lattice.matrix[2] * (1 + c_adjust))
+            + translation_v
+            + ab_shift[0] * whole_matrix_with_vac[0]
+            + ab_shift[1] * whole_matrix_with_vac[1]
+        )
+        all_coords = np.concatenate([bottom_grain.cart_coords, top_coords])
 
         gb_with_vac = Structure(
             whole_lat,
@@ -784,17 +769,14 @@ class GrainBoundaryGenerator:
         # Merge closer atoms. extract near GB atoms.
         cos_c_norm_plane = np.dot(unit_normal_v, whole_matrix_with_vac[2]) / whole_lat.c
         range_c_len = abs(bond_length / cos_c_norm_plane / whole_lat.c)
-        sites_near_gb = []
-        sites_away_gb: list[PeriodicSite] = []
-        for site in gb_with_vac:
-            if (
-                site.frac_coords[2] < range_c_len
-                or site.frac_coords[2] > 1 - range_c_len
-                or (site.frac_coords[2] > 0.5 - range_c_len and site.frac_coords[2] < 0.5 + range_c_len)
-            ):
-                sites_near_gb.append(site)
-            else:
-                sites_away_gb.append(site)
+        frac_c = gb_with_vac.frac_coords[:, 2]
+        near_gb = (
+            (frac_c < range_c_len)
+            | (frac_c > 1 - range_c_len)
+            | ((frac_c > 0.5 - range_c_len) & (frac_c < 0.5 + range_c_len))
+        )
+        sites_near_gb = [gb_with_vac[idx] for idx in np.flatnonzero(near_gb).tolist()]
+        sites_away_gb: list[PeriodicSite] = [gb_with_vac[idx] for idx in np.flatnonzero(~near_gb).tolist()]
         if len(sites_near_gb) >= 1:
             s_near_gb = Structure.from_sites(sites_near_gb)
             s_near_gb.merge_sites(tol=bond_length * rm_ratio, mode="delete")
@@ -1475,57 +1457,33 @@ class GrainBoundaryGenerator:
         n_max = int(np.sqrt((cutoff * 12 * mu * mv) / abs(d)))
 
         # Enumerate all possible n, m to give possible sigmas within the cutoff
-        sigmas: dict[int, list[float]] = {}
-        for n in range(1, n_max + 1):
+        def get_m_max(n: int) -> int:
             if (c2_a2_ratio is None) and w == 0:
-                m_max = 0
-            else:
-                m_max = int(np.sqrt((cutoff * 12 * mu * mv - n**2 * d) / (3 * mu)))
-            for m in range(m_max + 1):
-                if math.gcd(m, n) == 1 or m == 0:
-                    # Construct the rotation matrix, refer to the reference
-                    R_list = [
-                        (u**2 * mv - v**2 * mv - w**2 * mu) * n**2 + 2 * w * mu * m * n + 3 * mu * m**2,
-                        (2 * v - u) * u * mv * n**2 - 4 * w * mu * m * n,
-                        2 * u * w * mu * n**2 + 2 * (2 * v - u) * mu * m * n,
-                        (2 * u - v) * v * mv * n**2 + 4 * w * mu * m * n,
-                        (v**2 * mv - u**2 * mv - w**2 * mu) * n**2 - 2 * w * mu * m * n + 3 * mu * m**2,
-                        2 * v * w * mu * n**2 - 2 * (2 * u - v) * mu * m * n,
-                        (2 * u - v) * w * mv * n**2 - 3 * v * mv * m * n,
-                        (2 * v - u) * w * mv * n**2 + 3 * u * mv * m * n,
-                        (w**2 * mu - u**2 * mv - v**2 * mv + u * v * mv) * n**2 + 3 * mu * m**2,
-                    ]
-                    m = -1 * m
-                    # Inverse of the rotation matrix
-                    R_list_inv = [
-                        (u**2 * mv - v**2 * mv - w**2 * mu) * n**2 + 2 * w * mu * m * n + 3 * mu * m**2,
-                        (2 * v - u) * u * mv * n**2 - 4 * w * mu * m * n,
-                        2 * u * w * mu * n**2 + 2 * (2 * v - u) * mu * m * n,
-                        (2 * u - v) * v * mv * n**2 + 4 * w * mu * m * n,
-                        (v**2 * mv - u**2 * mv - w**2 * mu) * n**2 - 2 * w * mu * m * n + 3 * mu * m**2,
-                        2 * v * w * mu * n**2 - 2 * (2 * u - v) * mu * m * n,
-                        (2 * u - v) * w * mv * n**2 - 3 * v * mv * m * n,
-                        (2 * v - u) * w * mv * n**2 + 3 * u * mv * m * n,
-                        (w**2 * mu - u**2 * mv - v**2 * mv + u * v * mv) * n**2 + 3 * mu * m**2,
-                    ]
-                    m = -1 * m
-                    F = 3 * mu * m**2 + d * n**2
-                    all_list = R_list_inv + R_list + [F]
-                    # Compute the max common factors for the elements of the rotation matrix
-                    # and its inverse.
-                    com_fac = reduce(math.gcd, all_list)
-                    sigma = round((3 * mu * m**2 + d * n**2) / com_fac)
-                    if 1 < sigma <= cutoff:
-                        if sigma not in list(sigmas):
-                            angle = 180.0 if m == 0 else 2 * np.arctan(n / m * np.sqrt(d / 3.0 / mu)) / np.pi * 180
-                            sigmas[sigma] = [angle]
-                        else:
-                            angle = 180.0 if m == 0 else 2 * np.arctan(n / m * np.sqrt(d / 3.0 / mu)) / np.pi * 180
-                            if angle not in sigmas[sigma]:
-                                sigmas[sigma].append(angle)
-            if m_max == 0:
-                break
-        return sigmas
+                return 0
+            return int(np.sqrt((cutoff * 12 * mu * mv - n**2 * d) / (3 * mu)))
+
+        def get_rotation(n: NDArray, m: NDArray) -> list[NDArray]:
+            # Construct the rotation matrix, refer to the reference
+            return [
+                (u**2 * mv - v**2 * mv - w**2 * mu) * n**2 + 2 * w * mu * m * n + 3 * mu * m**2,
+                (2 * v - u) * u * mv * n**2 - 4 * w * mu * m * n,
+                2 * u * w * mu * n**2 + 2 * (2 * v - u) * mu * m * n,
+                (2 * u - v) * v * mv * n**2 + 4 * w * mu * m * n,
+                (v**2 * mv - u**2 * mv - w**2 * mu) * n**2 - 2 * w * mu * m * n + 3 * mu * m**2,
+                2 * v * w * mu * n**2 - 2 * (2 * u - v) * mu * m * n,
+                (2 * u - v) * w * mv * n**2 - 3 * v * mv * m * n,
+                (2 * v - u) * w * mv * n**2 + 3 * u * mv * m * n,
+                (w**2 * mu - u**2 * mv - v**2 * mv + u * v * mv) * n**2 + 3 * mu * m**2,
+            ]
+
+        return _enum_csl_sigmas(
+            cutoff,
+            n_max,
+            get_m_max=get_m_max,
+            get_rotation=get_rotation,
+            get_norm=lambda n, m: 3 * mu * m**2 + d * n**2,
+            get_angle=lambda n, m: 2 * np.arctan(n / m * np.sqrt(d / 3.0 / mu)) / np.pi * 180,
+        )
 
     @staticmethod
     def enum_sigma_rho(
@@ -1587,74 +1545,42 @@ class GrainBoundaryGenerator:
         n_max = int(np.sqrt((cutoff * abs(4 * mu * (mu - 3 * mv))) / abs(d)))
 
         # Enumerate all possible n, m to give possible sigmas within the cutoff
-        sigmas: dict[int, list[float]] = {}
-        for n in range(1, n_max + 1):
+        def get_m_max(n: int) -> int:
             if ratio_alpha is None and u + v + w == 0:
-                m_max = 0
-            else:
-                m_max = int(np.sqrt((cutoff * abs(4 * mu * (mu - 3 * mv)) - n**2 * d) / (mu)))
-            for m in range(m_max + 1):
-                if math.gcd(m, n) == 1 or m == 0:
-                    # Construct the rotation matrix, refer to the reference
-                    R_list = [
-                        (mu - 2 * mv) * (u**2 - v**2 - w**2) * n**2
-                        + 2 * mv * (v - w) * m * n
-                        - 2 * mv * v * w * n**2
-                        + mu * m**2,
-                        2 * (mv * u * n * (w * n + u * n - m) - (mu - mv) * m * w * n + (mu - 2 * mv) * u * v * n**2),
-                        2 * (mv * u * n * (v * n + u * n + m) + (mu - mv) * m * v * n + (mu - 2 * mv) * w * u * n**2),
-                        2 * (mv * v * n * (w * n + v * n + m) + (mu - mv) * m * w * n + (mu - 2 * mv) * u * v * n**2),
-                        (mu - 2 * mv) * (v**2 - w**2 - u**2) * n**2
-                        + 2 * mv * (w - u) * m * n
-                        - 2 * mv * u * w * n**2
-                        + mu * m**2,
-                        2 * (mv * v * n * (v * n + u * n - m) - (mu - mv) * m * u * n + (mu - 2 * mv) * w * v * n**2),
-                        2 * (mv * w * n * (w * n + v * n - m) - (mu - mv) * m * v * n + (mu - 2 * mv) * w * u * n**2),
-                        2 * (mv * w * n * (w * n + u * n + m) + (mu - mv) * m * u * n + (mu - 2 * mv) * w * v * n**2),
-                        (mu - 2 * mv) * (w**2 - u**2 - v**2) * n**2
-                        + 2 * mv * (u - v) * m * n
-                        - 2 * mv * u * v * n**2
-                        + mu * m**2,
-                    ]
-                    m = -1 * m
-                    # Inverse of the rotation matrix
-                    R_list_inv = [
-                        (mu - 2 * mv) * (u**2 - v**2 - w**2) * n**2
-                        + 2 * mv * (v - w) * m * n
-                        - 2 * mv * v * w * n**2
-                        + mu * m**2,
-                        2 * (mv * u * n * (w * n + u * n - m) - (mu - mv) * m * w * n + (mu - 2 * mv) * u * v * n**2),
-                        2 * (mv * u * n * (v * n + u * n + m) + (mu - mv) * m * v * n + (mu - 2 * mv) * w * u * n**2),
-                        2 * (mv * v * n * (w * n + v * n + m) + (mu - mv) * m * w * n + (mu - 2 * mv) * u * v * n**2),
-                        (mu - 2 * mv) * (v**2 - w**2 - u**2) * n**2
-                        + 2 * mv * (w - u) * m * n
-                        - 2 * mv * u * w * n**2
-                        + mu * m**2,
-                        2 * (mv * v * n * (v * n + u * n - m) - (mu - mv) * m * u * n + (mu - 2 * mv) * w * v * n**2),
-                        2 * (mv * w * n * (w * n + v * n - m) - (mu - mv) * m * v * n + (mu - 2 * mv) * w * u * n**2),
-                        2 * (mv * w * n * (w * n + u * n + m) + (mu - mv) * m * u * n + (mu - 2 * mv) * w * v * n**2),
-                        (mu - 2 * mv) * (w**2 - u**2 - v**2) * n**2
-                        + 2 * mv * (u - v) * m * n
-                        - 2 * mv * u * v * n**2
-                        + mu * m**2,
-                    ]
-                    m = -1 * m
-                    F = mu * m**2 + d * n**2
-                    all_list = R_list_inv + R_list + [F]
-                    # Compute the max common factors for the elements of the rotation matrix and its inverse.
-                    com_fac = reduce(math.gcd, all_list)
-                    sigma = round(abs(F / com_fac))
-                    if 1 < sigma <= cutoff:
-                        if sigma not in list(sigmas):
-                            angle = 180.0 if m == 0 else 2 * np.arctan(n / m * np.sqrt(d / mu)) / np.pi * 180
-                            sigmas[sigma] = [angle]
-                        else:
-                            angle = 180 if m == 0 else 2 * np.arctan(n / m * np.sqrt(d / mu)) / np.pi * 180.0
-                            if angle not in sigmas[sigma]:
-                                sigmas[sigma].append(angle)
-            if m_max == 0:
-                break
-        return sigmas
+                return 0
+            return int(np.sqrt((cutoff * abs(4 * mu * (mu - 3 * mv)) - n**2 * d) / (mu)))
+
+        def get_rotation(n: NDArray, m: NDArray) -> list[NDArray]:
+            # Construct the rotation matrix, refer to the reference
+            return [
+                (mu - 2 * mv) * (u**2 - v**2 - w**2) * n**2
+                + 2 * mv * (v - w) * m * n
+                - 2 * mv * v * w * n**2
+                + mu * m**2,
+                2 * (mv * u * n * (w * n + u * n - m) - (mu - mv) * m * w * n + (mu - 2 * mv) * u * v * n**2),
+                2 * (mv * u * n * (v * n + u * n + m) + (mu - mv) * m * v * n + (mu - 2 * mv) * w * u * n**2),
+                2 * (mv * v * n * (w * n + v * n + m) + (mu - mv) * m * w * n + (mu - 2 * mv) * u * v * n**2),
+                (mu - 2 * mv) * (v**2 - w**2 - u**2) * n**2
+                + 2 * mv * (w - u) * m * n
+                - 2 * mv * u * w * n**2
+                + mu * m**2,
+                2 * (mv * v * n * (v * n + u * n - m) - (mu - mv) * m * u * n + (mu - 2 * mv) * w * v * n**2),
+                2 * (mv * w * n * (w * n + v * n - m) - (mu - mv) * m * v * n + (mu - 2 * mv) * w * u * n**2),
+                2 * (mv * w * n * (w * n + u * n + m) + (mu - mv) * m * u * n + (mu - 2 * mv) * w * v * n**2),
+                (mu - 2 * mv) * (w**2 - u**2 - v**2) * n**2
+                + 2 * mv * (u - v) * m * n
+                - 2 * mv * u * v * n**2
+                + mu * m**2,
+            ]
+
+        return _enum_csl_sigmas(
+            cutoff,
+            n_max,
+            get_m_max=get_m_max,
+            get_rotation=get_rotation,
+            get_norm=lambda n, m: np.abs(mu * m**2 + d * n**2),
+            get_angle=lambda n, m: 2 * np.arctan(n / m * np.sqrt(d / mu)) / np.pi * 180,
+        )
 
     @staticmethod
     def enum_sigma_tet(
@@ -1708,55 +1634,31 @@ class GrainBoundaryGenerator:
         n_max = int(np.sqrt((cutoff * 4 * mu * mv) / d))
 
         # Enumerate all possible n, m to give possible sigmas within the cutoff
-        sigmas: dict[int, list[float]] = {}
-        for n in range(1, n_max + 1):
-            m_max = 0 if c2_a2_ratio is None and w == 0 else int(np.sqrt((cutoff * 4 * mu * mv - n**2 * d) / mu))
-            for m in range(m_max + 1):
-                if math.gcd(m, n) == 1 or m == 0:
-                    # Construct the rotation matrix, refer to the reference
-                    R_list = [
-                        (u**2 * mv - v**2 * mv - w**2 * mu) * n**2 + mu * m**2,
-                        2 * v * u * mv * n**2 - 2 * w * mu * m * n,
-                        2 * u * w * mu * n**2 + 2 * v * mu * m * n,
-                        2 * u * v * mv * n**2 + 2 * w * mu * m * n,
-                        (v**2 * mv - u**2 * mv - w**2 * mu) * n**2 + mu * m**2,
-                        2 * v * w * mu * n**2 - 2 * u * mu * m * n,
-                        2 * u * w * mv * n**2 - 2 * v * mv * m * n,
-                        2 * v * w * mv * n**2 + 2 * u * mv * m * n,
-                        (w**2 * mu - u**2 * mv - v**2 * mv) * n**2 + mu * m**2,
-                    ]
-                    m = -1 * m
-                    # Inverse of rotation matrix
-                    R_list_inv = [
-                        (u**2 * mv - v**2 * mv - w**2 * mu) * n**2 + mu * m**2,
-                        2 * v * u * mv * n**2 - 2 * w * mu * m * n,
-                        2 * u * w * mu * n**2 + 2 * v * mu * m * n,
-                        2 * u * v * mv * n**2 + 2 * w * mu * m * n,
-                        (v**2 * mv - u**2 * mv - w**2 * mu) * n**2 + mu * m**2,
-                        2 * v * w * mu * n**2 - 2 * u * mu * m * n,
-                        2 * u * w * mv * n**2 - 2 * v * mv * m * n,
-                        2 * v * w * mv * n**2 + 2 * u * mv * m * n,
-                        (w**2 * mu - u**2 * mv - v**2 * mv) * n**2 + mu * m**2,
-                    ]
-                    m = -1 * m
-                    F = mu * m**2 + d * n**2
-                    all_list = R_list + R_list_inv + [F]
-                    # Compute the max common factors for the elements of the rotation matrix
-                    # and its inverse
-                    com_fac = reduce(math.gcd, all_list)
-                    sigma = round((mu * m**2 + d * n**2) / com_fac)
-                    if 1 < sigma <= cutoff:
-                        if sigma not in list(sigmas):
-                            angle = 180.0 if m == 0 else 2 * np.arctan(n / m * np.sqrt(d / mu)) / np.pi * 180
-                            sigmas[sigma] = [angle]
-                        else:
-                            angle = 180.0 if m == 0 else 2 * np.arctan(n / m * np.sqrt(d / mu)) / np.pi * 180
-                            if angle not in sigmas[sigma]:
-                                sigmas[sigma].append(angle)
-            if m_max == 0:
-                break
+        def get_m_max(n: int) -> int:
+            return 0 if c2_a2_ratio is None and w == 0 else int(np.sqrt((cutoff * 4 * mu * mv - n**2 * d) / mu))
+
+        def get_rotation(n: NDArray, m: NDArray) -> list[NDArray]:
+            # Construct the rotation matrix, refer to the reference
+            return [
+                (u**2 * mv - v**2 * mv - w**2 * mu) * n**2 + mu * m**2,
+                2 * v * u * mv * n**2 - 2 * w * mu * m * n,
+                2 * u * w * mu * n**2 + 2 * v * mu * m * n,
+                2 * u * v * mv * n**2 + 2 * w * mu * m * n,
+                (v**2 * mv - u**2 * mv - w**2 * mu) * n**2 + mu * m**2,
+                2 * v * w * mu * n**2 - 2 * u * mu * m * n,
+                2 * u * w * mv * n**2 - 2 * v * mv * m * n,
+                2 * v * w * mv * n**2 + 2 * u * mv * m * n,
+                (w**2 * mu - u**2 * mv - v**2 * mv) * n**2 + mu * m**2,
+            ]
 
-        return sigmas
+        return _enum_csl_sigmas(
+            cutoff,
+            n_max,
+            get_m_max=get_m_max,
+            get_rotation=get_rotation,
+            get_norm=lambda n, m: mu * m**2 + d * n**2,
+            get_angle=lambda n, m: 2 * np.arctan(n / m * np.sqrt(d / mu)) / np.pi * 180,
+        )
 
     @staticmethod
     def enum_sigma_ort(
@@ -1842,59 +1744,34 @@ class GrainBoundaryGenerator:
         # Compute the max n we need to enumerate
         n_max = int(np.sqrt((cutoff * 4 * mu * mv * mv * lam) / d))
         # Enumerate all possible n, m to give possible sigmas within the cutoff
-        sigmas: dict[int, list[float]] = {}
-        for n in range(1, n_max + 1):
-            mu_temp, lam_temp, mv_temp = c2_b2_a2_ratio
-            if (mu_temp is None and w == 0) or (lam_temp is None and v == 0) or (mv_temp is None and u == 0):
-                m_max = 0
-            else:
-                m_max = int(np.sqrt((cutoff * 4 * mu * mv * lam * mv - n**2 * d) / mu / lam))
-            for m in range(m_max + 1):
-                if math.gcd(m, n) == 1 or m == 0:
-                    # Construct the rotation matrix, refer to the reference
-                    R_list = [
-                        (u**2 * mv * mv - lam * v**2 * mv - w**2 * mu * mv) * n**2 + lam * mu * m**2,
-                        2 * lam * (v * u * mv * n**2 - w * mu * m * n),
-                        2 * mu * (u * w * mv * n**2 + v * lam * m * n),
-                        2 * mv * (u * v * mv * n**2 + w * mu * m * n),
-                        (v**2 * mv * lam - u**2 * mv * mv - w**2 * mu * mv) * n**2 + lam * mu * m**2,
-                        2 * mv * mu * (v * w * n**2 - u * m * n),
-                        2 * mv * (u * w * mv * n**2 - v * lam * m * n),
-                        2 * lam * mv * (v * w * n**2 + u * m * n),
-                        (w**2 * mu * mv - u**2 * mv * mv - v**2 * mv * lam) * n**2 + lam * mu * m**2,
-                    ]
-                    m = -1 * m
-                    # Inverse of rotation matrix
-                    R_list_inv = [
-                        (u**2 * mv * mv - lam * v**2 * mv - w**2 * mu * mv) * n**2 + lam * mu * m**2,
-                        2 * lam * (v * u * mv * n**2 - w * mu * m * n),
-                        2 * mu * (u * w * mv * n**2 + v * lam * m * n),
-                        2 * mv * (u * v * mv * n**2 + w * mu * m * n),
-                        (v**2 * mv * lam - u**2 * mv * mv - w**2 * mu * mv) * n**2 + lam * mu * m**2,
-                        2 * mv * mu * (v * w * n**2 - u * m * n),
-                        2 * mv * (u * w * mv * n**2 - v * lam * m * n),
-                        2 * lam * mv * (v * w * n**2 + u * m * n),
-                        (w**2 * mu * mv - u**2 * mv * mv - v**2 * mv * lam) * n**2 + lam * mu * m**2,
-                    ]
-                    m = -1 * m
-                    F = mu * lam * m**2 + d * n**2
-                    all_list = R_list + R_list_inv + [F]
-                    # Compute the max common factors for the elements of the rotation matrix
-                    # and its inverse.
-                    com_fac = reduce(math.gcd, all_list)  # type: ignore[arg-type]
-                    sigma = round((mu * lam * m**2 + d * n**2) / com_fac)
-                    if 1 < sigma <= cutoff:
-                        if sigma not in list(sigmas):
-                            angle = 180.0 if m == 0 else 2 * np.arctan(n / m * np.sqrt(d / mu / lam)) / np.pi * 180
-                            sigmas[sigma] = [angle]
-                        else:
-                            angle = 180.0 if m == 0 else 2 * np.arctan(n / m * np.sqrt(d / mu / lam)) / np.pi * 180
-                            if angle not in sigmas[sigma]:
-                                sigmas[sigma].append(angle)
-            if m_max == 0:
-                break
+        mu_temp, lam_temp, mv_temp = c2_b2_a2_ratio
+        m_max_zero = (mu_temp is None and w == 0) or (lam_temp is None and v == 0) or (mv_temp is None and u == 0)
 
-        return sigmas
+        def get_m_max(n: int) -> int:
+            return 0 if m_max_zero else int(np.sqrt((cutoff * 4 * mu * mv * lam * mv - n**2 * d) / mu / lam))
+
+        def get_rotation(n: NDArray, m: NDArray) -> list[NDArray]:
+            # Construct the rotation matrix, refer to the reference
+            return [
+                (u**2 * mv * mv - lam * v**2 * mv - w**2 * mu * mv) * n**2 + lam * mu * m**2,
+                2 * lam * (v * u * mv * n**2 - w * mu * m * n),
+                2 * mu * (u * w * mv * n**2 + v * lam * m * n),
+                2 * mv * (u * v * mv * n**2 + w * mu * m * n),
+                (v**2 * mv * lam - u**2 * mv * mv - w**2 * mu * mv) * n**2 + lam * mu * m**2,
+                2 * mv * mu * (v * w * n**2 - u * m * n),
+                2 * mv * (u * w * mv * n**2 - v * lam * m * n),
+                2 * lam * mv * (v * w * n**2 + u * m * n),
+                (w**2 * mu * mv - u**2 * mv * mv - v**2 * mv * lam) * n**2 + lam * mu * m**2,
+            ]
+
+        return _enum_csl_sigmas(
+            cutoff,
+            n_max,
+            get_m_max=get_m_max,
+            get_rotation=get_rotation,
+            get_norm=lambda n, m: mu * lam * m**2 + d * n**2,
+            get_angle=lambda n, m: 2 * np.arctan(n / m * np.sqrt(d / mu / lam)) / np.pi * 180,
+        )
 
     @staticmethod
     def enum_possible_plane_cubic(
@@ -2020,49 +1897,24 @@ class GrainBoundaryGenerator:
 
         if lat_type == "c":
             logger.info("Make sure this is for cubic system")
-            sigma_dict = GrainBoundaryGenerator.enum_sigma_cubic(
-                cutoff=sigma, r_axis=cast("tuple[int, int, int]", r_axis)
-            )
-
         elif lat_type == "t":
             logger.info("Make sure this is for tetragonal system")
             if ratio is None:
                 logger.info("Make sure this is for irrational c2/a2 ratio")
-            sigma_dict = GrainBoundaryGenerator.enum_sigma_tet(
-                cutoff=sigma,
-                r_axis=cast("tuple[int, int, int]", r_axis),
-                c2_a2_ratio=cast("tuple[int, int]", ratio),
-            )
-
         elif lat_type == "o":
             logger.info("Make sure this is for orthorhombic system")
-            sigma_dict = GrainBoundaryGenerator.enum_sigma_ort(
-                cutoff=sigma,
-                r_axis=cast("tuple[int, int, int]", r_axis),
-                c2_b2_a2_ratio=cast("tuple[int, int, int]", ratio),
-            )
-
         elif lat_type == "h":
             logger.info("Make sure this is for hexagonal system")
             if ratio is None:
                 logger.info("Make sure this is for irrational c2/a2 ratio")
-            sigma_dict = GrainBoundaryGenerator.enum_sigma_hex(
-                cutoff=sigma, r_axis=r_axis, c2_a2_ratio=cast("tuple[int, int]", ratio)
-            )
-
         elif lat_type == "r":
             logger.info("Make sure this is for rhombohedral system")
             if ratio is None:
                 logger.info("Make sure this is for irrational (1+2*cos(alpha)/cos(alpha) ratio")
-            sigma_dict = GrainBoundaryGenerator.enum_sigma_rho(
-                cutoff=sigma,
-                r_axis=cast("tuple[int, int, int]", r_axis),
-                ratio_alpha=cast("tuple[int, int]", ratio),
-            )
-
         else:
             raise RuntimeError("Lattice type not implemented")
 
+        sigma_dict = _sigma_angles_table(lat_type, tuple(r_axis), None if ratio is None else tuple(ratio), sigma)
         sigmas = list(sigma_dict)
         if not sigmas:
             raise RuntimeError("This is a wrong sigma value, and no sigma exists smaller than this value.")
@@ -2076,8 +1928,8 @@ class GrainBoundaryGenerator:
                 stacklevel=2,
             )
             rotation_angles = sigma_dict[sigmas[-1]]
-        rotation_angles.sort()
-        return rotation_angles
+        # Sorted copy, the cached angle lists are shared between calls
+        return sorted(rotation_angles)
 
     @staticmethod
     def slab_from_csl(
@@ -2451,6 +2303,99 @@ def symm_group_cubic(mat: NDArray) -> list:
     return np.unique(np.array(all_vectors), axis=0)
 
 
+def _enum_csl_sigmas(
+    cutoff: int,
+    n_max: int,
+    *,
+    get_m_max: Callable[[int], int],
+    get_rotation: Callable[[NDArray, NDArray], list[NDArray]],
+    get_norm: Callable[[NDArray, NDArray], NDArray],
+    get_angle: Callable[[int, int], float],
+) -> dict[int, list[float]]:
+    """Enumerate CSL sigma values and rotation angles for all coprime (n, m).
+
+    All candidate pairs are generated up front and the common factor of the
+    rotation matrix, its inverse (m -> -m) and the norm F is reduced in one go,
+    so only accepted pairs go through Python. Pairs are visited in the same
+    order as the nested n, m loops of the reference algorithms.
+
+    Args:
+        cutoff (int): the cutoff of sigma values.
+        n_max (int): the largest n to enumerate.
+        get_m_max (Callable): the largest m for a given n. The enumeration stops
+            after the first n with no nonzero m.
+        get_rotation (Callable): the 9 integer entries of the (unnormalized)
+            rotation matrix for arrays of n and m.
+        get_norm (Callable): the norm F of the rotation for arrays of n and m.
+        get_angle (Callable): the rotation angle in degrees for nonzero m.
+
+    Returns:
+        dict[int, list[float]]: sigma values and the corresponding rotation angles.
+    """
+    n_list, m_list = [], []
+    for n in range(1, n_max + 1):
+        m_max = get_m_max(n)
+        n_list.append(np.full(m_max + 1, n, dtype=np.int64))
+        m_list.append(np.arange(m_max + 1, dtype=np.int64))
+        if m_max == 0:
+            break
+    if not n_list:
+        return {}
+
+    ns, ms = np.concatenate(n_list), np.concatenate(m_list)
+    coprime = (np.gcd(ms, ns) == 1) | (ms == 0)
+    ns, ms = ns[coprime], ms[coprime]
+
+    norms = get_norm(ns, ms)
+    com_fac = np.gcd.reduce(np.array([*get_rotation(ns, ms), *get_rotation(ns, -ms), norms]), axis=0)
+    all_sigmas = norms // com_fac
+    accepted = np.flatnonzero((all_sigmas > 1) & (all_sigmas <= cutoff))
+
+    sigmas: dict[int, list[float]] = {}
+    for n, m, sigma in zip(ns[accepted].tolist(), ms[accepted].tolist(), all_sigmas[accepted].tolist(), strict=True):
+        angle = 180.0 if m == 0 else get_angle(n, m)
+        angles = sigmas.setdefault(sigma, [])
+        if angle not in angles:
+            angles.append(angle)
+    return sigmas
+
+
+@lru_cache(maxsize=256)
+def _sigma_angles_table(
+    lat_type: str,
+    r_axis: tuple[int, ...],
+    ratio: tuple[int | None, ...] | None,
+    cutoff: int,
+) -> dict[int, list[float]]:
+    """Cached sigma enumeration for get_rotation_angle_from_sigma.
+
+    The returned dict is shared between calls and must not be modified.
+    """
+    if lat_type == "c":
+        return GrainBoundaryGenerator.enum_sigma_cubic(cutoff=cutoff, r_axis=cast("tuple[int, int, int]", r_axis))
+    if lat_type == "t":
+        return GrainBoundaryGenerator.enum_sigma_tet(
+            cutoff=cutoff, r_axis=cast("tuple[int, int, int]", r_axis), c2_a2_ratio=cast("tuple[int, int]", ratio)
+        )
+    if lat_type == "o":
+        return GrainBoundaryGenerator.enum_sigma_ort(
+            cutoff=cutoff,
+            r_axis=cast("tuple[int, int, int]", r_axis),
+            c2_b2_a2_ratio=cast("tuple[int, int, int]", ratio),
+        )
+    if lat_type == "h":
+        return GrainBoundaryGenerator.enum_sigma_hex(
+            cutoff=cutoff,
+            r_axis=cast("tuple[int, int, int]", r_axis),
+            c2_a2_ratio=cast("tuple[int, int]", ratio),
+        )
+    if lat_type == "r":
+        return GrainBoundaryGenerator.enum_sigma_rho(
+            cutoff=cutoff, r_axis=cast("tuple[int, int, int]", r_axis), ratio_alpha=cast("tuple[int, int]", ratio)
+        )
+    raise RuntimeError("Lattice type not implemented")
+
+
 class Interface(Structure):
     """Store data for defining an interface between two Structures."""
 
@@ -27,8 +27,8 @@ from pymatgen.io.core import ParseError
 from pymatgen.util.string import Stringify, formula_double_format
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
-    from typing import Any, Literal
+    from collections.abc import Callable, Iterable
+    from typing import Any, ClassVar, Literal
 
     from typing_extensions import Self
 
@@ -1660,6 +1660,138 @@ def get_el_sp(obj: int | SpeciesLike) -> Element | Species | DummySpecies:
         raise ValueError(f"Can't parse Element or Species from {obj!r}") from exc
 
 
+class ElementPropertyTable:
+    """Element properties as NumPy arrays for vectorized lookups.
+
+    Row Z holds the element with atomic number Z, row 0 is left empty (NaN) and
+    the named isotopes (D, T) are appended after the last element. Missing data
+    is NaN. The arrays are read-only and shared by all users of the table, use
+    get_element_property_table() to get the table, which is built on first use.
+
+    Examples:
+        >>> table = get_element_property_table()
+        >>> table["atomic_mass"][26]
+        55.845
+        >>> table.get("X", ["Li", "Fe", "O"])
+        array([0.98, 1.83, 3.44])
+    """
+
+    #: Names of the float properties, same as the corresponding Element attributes.
+    PROPERTIES: ClassVar[tuple[str, ...]] = (
+        "atomic_mass",
+        "X",
+        "atomic_radius",
+        "atomic_radius_calculated",
+        "van_der_waals_radius",
+        "metallic_radius",
+        "average_ionic_radius",
+        "average_cationic_radius",
+        "average_anionic_radius",
+        "electron_affinity",
+        "ionization_energy",
+        "mendeleev_no",
+        "min_oxidation_state",
+        "max_oxidation_state",
+        "row",
+        "group",
+    )
+
+    def __init__(self) -> None:
+        """Build the table from the Element data."""
+        elements = sorted(Element, key=lambda el: el.Z)
+        elements = [None, *elements, *Element.named_isotopes]
+        self.symbols: tuple[str, ...] = tuple("" if el is None else el.name for el in elements)
+        self.Z: np.ndarray = np.array([0 if el is None else el.Z for el in elements])
+        self._rows: dict[Element, int] = {el: row for row, el in enumerate(elements) if el is not None}
+
+        columns: dict[str, list[float]] = {name: [] for name in self.PROPERTIES}
+        oxi_states: dict[str, list[tuple[int, ...]]] = {
+            "oxidation_states": [],
+            "common_oxidation_states": [],
+            "icsd_oxidation_states": [],
+        }
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            for el in elements:
+                for name, values in columns.items():
+                    try:
+                        val = None if el is None else getattr(el, name)
+                    except (AttributeError, KeyError, TypeError, ValueError):
+                        val = None
+                    values.append(np.nan if val is None else float(val))
+                for name, states in oxi_states.items():
+                    states.append(() if el is None else getattr(el, name))
+
+        self._columns: dict[str, np.ndarray] = {name: np.array(values) for name, values in columns.items()}
+
+        # Boolean matrices, [row, idx] is True if oxidation_state_range[idx] is an oxidation state
+        all_states = [state for states in oxi_states["oxidation_states"] for state in states]
+        self.oxidation_state_range: np.ndarray = np.arange(min(all_states), max(all_states) + 1)
+        for name, states in oxi_states.items():
+            matrix = np.zeros((len(elements), len(self.oxidation_state_range)), dtype=bool)
+            for row, row_states in enumerate(states):
+                matrix[row, np.array(row_states, dtype=int) - self.oxidation_state_range[0]] = True
+            self._columns[name] = matrix
+
+        for arr in (self.Z, self.oxidation_state_range, *self._columns.values()):
+            arr.flags.writeable = False
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """The property with the given name for all rows."""
+        try:
+            return self._columns[name]
+        except KeyError:
+            raise KeyError(f"Unknown property {name!r}, must be one of {tuple(self._columns)}") from None
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._columns
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def rows(self, species: Iterable[SpeciesLike]) -> np.ndarray:
+        """Row indices of the elements of the given species.
+
+        Args:
+            species (Iterable[SpeciesLike]): Elements, Species, symbols or atomic numbers.
+                Species are looked up by their element.
+
+        Raises:
+            ValueError: for DummySpecies, which have no element data.
+
+        Returns:
+            np.ndarray: integer row index for each species.
+        """
+        rows = []
+        for sp in species:
+            row = self._rows.get(sp)  # type:ignore[call-overload]
+            if row is None:
+                sp = get_el_sp(sp)
+                if isinstance(sp, DummySpecies):
+                    raise ValueError(f"No element data for {sp!r}")
+                row = self._rows[sp.element if isinstance(sp, Species) else sp]
+            rows.append(row)
+        return np.array(rows, dtype=np.intp)
+
+    def get(self, name: str, species: Iterable[SpeciesLike]) -> np.ndarray:
+        """Look up a property for many species at once.
+
+        Args:
+            name (str): The property, e.g. "atomic_mass" or "X".
+            species (Iterable[SpeciesLike]): Elements, Species, symbols or atomic numbers.
+
+        Returns:
+            np.ndarray: The property of each species.
+        """
+        return self[name][self.rows(species)]
+
+
+@functools.cache
+def get_element_property_table() -> ElementPropertyTable:
+    """The ElementPropertyTable, built on first use and shared afterwards."""
+    return ElementPropertyTable()
+
+
 @unique
 class ElementType(Enum):
     """Enum for element types."""
@@ -68,6 +68,7 @@ FileFormats: TypeAlias = Literal[
     "poscar",
     "cssr",
     "json",
+    "npz",
     "yaml",
     "yml",
     "xsf",
@@ -2926,9 +2927,10 @@ class IStructure(SiteCollection, MSONable):
             fmt (str): Format to output to. Defaults to JSON unless filename
                 is provided. If specified, it overrides whatever the
                 filename is. Options include "cif", "poscar", "cssr", "json",
-                "xsf", "mcsqs", "prismatic", "yaml", "yml", "fleur-inpgen", "pwmat",
-                "aims".
-                Case insensitive.
+                "npz", "xsf", "mcsqs", "prismatic", "yaml", "yml", "fleur-inpgen",
+                "pwmat", "aims".
+                Case insensitive. Note that "npz" is a binary format, for which
+                bytes are returned instead of str.
             **kwargs: Kwargs pass thru to relevant methods. This allows
                 the passing of parameters like `symprec` to the
                 `CifWriter.__init__ method` for generation of symmetric CIFs.
@@ -2971,6 +2973,11 @@ class IStructure(SiteCollection, MSONable):
                     file.write(json_str)  # type:ignore[arg-type]
             return json_str
 
+        elif fmt == "npz" or fnmatch(filename.lower(), "*.npz*"):
+            from pymatgen.io.npz import dump_npz
+
+            return dump_npz(self, filename or None)  # type:ignore[return-value]
+
         elif fmt == "xsf" or fnmatch(filename.lower(), "*.xsf*"):
             from pymatgen.io.xcrysden import XSF
 
@@ -3171,7 +3178,7 @@ class IStructure(SiteCollection, MSONable):
         """Read a structure from a file. For example, anything ending in
         a "cif" is assumed to be a Crystallographic Information Format file.
         Supported formats include CIF, POSCAR/CONTCAR, CHGCAR, LOCPOT,
-        vasprun.xml, CSSR, Netcdf and pymatgen's JSON-serialized structures.
+        vasprun.xml, CSSR, Netcdf and pymatgen's JSON- and npz-serialized structures.
 
         Args:
             filename (PathLike): The file to read.
@@ -3195,6 +3202,19 @@ class IStructure(SiteCollection, MSONable):
                 struct = struct.get_sorted_structure()
             return struct
 
+        if fnmatch(filename.lower(), "*.npz*"):
+            from pymatgen.io.npz import load_npz
+
+            obj = load_npz(filename)[0]
+            struct = getattr(obj, "structure", obj)  # first object may be a ComputedStructureEntry
+            # the stored structure may be an IStructure, which cannot merge sites
+            struct = Structure.from_sites(struct, properties=struct.properties)
+            if sort:
+                struct = struct.get_sorted_structure()
+            if merge_tol:
+                struct.merge_sites(merge_tol)
+            return cls.from_sites(struct, properties=struct.properties)
+
         fname = os.path.basename(filename)
         with zopen(filename, mode="rt", errors="replace", encoding="utf-8") as file:
             contents: str = file.read()  # type:ignore[assignment]
@@ -3998,13 +4018,14 @@ class IMolecule(SiteCollection, MSONable):
                 filename. Defaults is None, i.e. string output.
             fmt (str): Format to output to. Defaults to JSON unless filename
                 is provided. If fmt is specifies, it overrides whatever the
-                filename is. Options include "xyz", "gjf", "g03", "json". If
-                you have OpenBabel installed, any of the formats supported by
+                filename is. Options include "xyz", "gjf", "g03", "json", "npz".
+                If you have OpenBabel installed, any of the formats supported by
                 OpenBabel. Non-case sensitive.
 
         Returns:
             str: String representation of molecule in given format. If a filename
-                is provided, the same string is written to the file.
+                is provided, the same string is written to the file. For the
+                binary "npz" format, bytes are returned.
         """
         fmt = fmt.lower()
         writer: Any
@@ -4022,6 +4043,10 @@ class IMolecule(SiteCollection, MSONable):
                 with zopen(filename, mode="wt", encoding="utf-8") as file:
                     file.write(json_str)  # type:ignore[arg-type]
             return json_str
+        elif fmt == "npz" or fnmatch(filename.lower(), "*.npz*"):
+            from pymatgen.io.npz import dump_npz
+
+            return dump_npz(self, filename or None)  # type:ignore[return-value]
         elif fmt in {"yaml", "yml"} or fnmatch(filename, "*.yaml*") or fnmatch(filename, "*.yml*"):
             yaml = YAML()
             str_io = io.StringIO()
@@ -4098,7 +4123,7 @@ class IMolecule(SiteCollection, MSONable):
     def from_file(cls, filename: PathLike) -> IMolecule | Molecule:  # type:ignore[override]
         """Read a molecule from a file. Supported formats include xyz,
         gaussian input (gjf|g03|g09|com|inp), Gaussian output (.out|and
-        pymatgen's JSON-serialized molecules. Using openbabel,
+        pymatgen's JSON- and npz-serialized molecules. Using openbabel,
         many more extensions are supported but requires openbabel to be
         installed.
 
@@ -4109,6 +4134,13 @@ class IMolecule(SiteCollection, MSONable):
             Molecule
         """
         filename = str(filename)
+        if fnmatch(filename.lower(), "*.npz*"):
+            from pymatgen.io.npz import load_npz
+
+            mol = load_npz(filename)[0]
+            return cls.from_sites(
+                mol, charge=mol.charge, spin_multiplicity=mol.spin_multiplicity, properties=mol.properties
+            )
 
         with zopen(filename, mode="rt", encoding="utf-8") as file:
             contents: str = file.read()  # type:ignore[assignment]
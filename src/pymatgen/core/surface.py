@@ -25,9 +25,9 @@ from typing import TYPE_CHECKING, cast
 
 import numpy as np
 import orjson
+from joblib import Parallel, delayed
 from monty.fractions import lcm
 from scipy.cluster.hierarchy import fcluster, linkage
-from scipy.spatial.distance import squareform
 
 from pymatgen.analysis.structure_matcher import StructureMatcher
 from pymatgen.core import Lattice, PeriodicSite, Structure, get_el_sp
@@ -793,6 +793,16 @@ def center_slab(slab: Structure) -> Structure:
     return slab
 
 
+def _add_bulk_site_types(structure: Structure | IStructure) -> None:
+    """Add Wyckoff symbols and equivalent sites to a bulk structure in place,
+    unless both site properties are already present.
+    """
+    if "bulk_wyckoff" not in structure.site_properties or "bulk_equivalent" not in structure.site_properties:
+        sym_dataset = SpacegroupAnalyzer(structure).get_symmetry_dataset()
+        structure.add_site_property("bulk_wyckoff", sym_dataset.wyckoffs)
+        structure.add_site_property("bulk_equivalent", sym_dataset.equivalent_atoms.tolist())
+
+
 def get_slab_regions(
     slab: Slab,
     blength: float = 3.5,
@@ -948,19 +958,6 @@ class SlabGenerator:
             divisor = abs(reduce(math.gcd, vector))  # type: ignore[arg-type]
             return cast("tuple[int, int, int]", tuple(int(idx / divisor) for idx in vector))
 
-        def add_site_types() -> None:
-            """Add Wyckoff symbols and equivalent sites to the initial structure."""
-            if (
-                "bulk_wyckoff" not in initial_structure.site_properties
-                or "bulk_equivalent" not in initial_structure.site_properties
-            ):
-                spg_analyzer = SpacegroupAnalyzer(initial_structure)
-                initial_structure.add_site_property("bulk_wyckoff", spg_analyzer.get_symmetry_dataset().wyckoffs)
-                initial_structure.add_site_property(
-                    "bulk_equivalent",
-                    spg_analyzer.get_symmetry_dataset().equivalent_atoms.tolist(),
-                )
-
         def calculate_surface_normal() -> np.ndarray:
             """Calculate the unit surface normal vector using the reciprocal
             lattice vector.
@@ -1042,7 +1039,7 @@ class SlabGenerator:
 
         # Add Wyckoff symbols and equivalent sites to the initial structure,
         # to help identify types of sites in the generated slab
-        add_site_types()
+        _add_bulk_site_types(initial_structure)
 
         # Calculate the surface normal
         lattice = initial_structure.lattice
@@ -1248,18 +1245,14 @@ class SlabGenerator:
                 termination = frac_coords[0][2] + 0.5
                 return [termination - math.floor(termination)]
 
-            # Compute a Cartesian z-coordinate distance matrix
+            # Compute condensed Cartesian z-coordinate distances (i < j pairs)
             # TODO (@DanielYang59): account for periodic boundary condition
-            dist_matrix: NDArray = np.zeros((n_atoms, n_atoms))
-            for i, j in itertools.combinations(list(range(n_atoms)), 2):
-                if i != j:
-                    z_dist = frac_coords[i][2] - frac_coords[j][2]
-                    z_dist = abs(z_dist - round(z_dist)) * self._proj_height
-                    dist_matrix[i, j] = z_dist
-                    dist_matrix[j, i] = z_dist
+            idx_i, idx_j = np.triu_indices(n_atoms, k=1)
+            z_dists: NDArray = frac_coords[idx_i, 2] - frac_coords[idx_j, 2]
+            z_dists = np.abs(z_dists - np.round(z_dists)) * self._proj_height
 
             # Cluster the sites by z coordinates
-            z_matrix = linkage(squareform(dist_matrix))
+            z_matrix = linkage(z_dists)
             clusters = fcluster(z_matrix, ftol, criterion="distance")
 
             # Generate cluster to z-coordinate mapping
@@ -1584,6 +1577,7 @@ def generate_all_slabs(
     repair: bool = False,
     include_reconstructions: bool = False,
     in_unit_planes: bool = False,
+    n_jobs: int = 1,
 ) -> list[Slab]:
     """Find all unique Slabs up to a given Miller index.
 
@@ -1644,10 +1638,11 @@ def generate_all_slabs(
             Fe(100) will have more layers. The slab thickness
             will be in min_slab_size/math.ceil(self._proj_height/dhkl)
             multiples of oriented unit cells.
+        n_jobs (int): Number of parallel jobs used to generate slabs for
+            different Miller indices. -1 uses all cores. Defaults to 1 (serial).
     """
-    all_slabs: list[Slab] = []
 
-    for miller in get_symmetrically_distinct_miller_indices(structure, max_index):
+    def get_slabs(miller: tuple[int, ...]) -> list[Slab]:
         gen = SlabGenerator(
             structure,
             miller,
@@ -1659,7 +1654,7 @@ def generate_all_slabs(
             max_normal_search=max_normal_search,
             in_unit_planes=in_unit_planes,
         )
-        slabs = gen.get_slabs(
+        return gen.get_slabs(
             bonds=bonds,
             tol=tol,
             ftol=ftol,
@@ -1668,6 +1663,16 @@ def generate_all_slabs(
             repair=repair,
         )
 
+    miller_indices = get_symmetrically_distinct_miller_indices(structure, max_index)
+    if n_jobs == 1:
+        miller_slabs = [get_slabs(miller) for miller in miller_indices]
+    else:
+        # Analyze the bulk symmetry once here rather than in every worker
+        _add_bulk_site_types(structure)
+        miller_slabs = Parallel(n_jobs=n_jobs)(delayed(get_slabs)(miller) for miller in miller_indices)
+
+    all_slabs: list[Slab] = []
+    for miller, slabs in zip(miller_indices, miller_slabs, strict=True):
         if len(slabs) > 0:
             logger.debug(f"{miller} has {len(slabs)} slabs... ")
             all_slabs.extend(slabs)
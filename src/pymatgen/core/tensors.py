@@ -6,7 +6,9 @@ which provides basic methods for creating and manipulating rank 2 tensors.
 from __future__ import annotations
 
 import collections
+import functools
 import itertools
+import math
 import os
 import string
 import warnings
@@ -329,7 +331,7 @@ class Tensor(np.ndarray, MSONable):
         """
         sga = SpacegroupAnalyzer(structure, symprec)
         symm_ops = sga.get_symmetry_operations(cartesian=True)
-        return sum(self.transform(symm_op) for symm_op in symm_ops) / len(symm_ops)
+        return type(self)(transform_tensors([self], symm_ops)[:, 0].sum(axis=0) / len(symm_ops))
 
     def is_fit_to_structure(self, structure: Structure, tol: float = 1e-2) -> bool:
         """Test whether a tensor is invariant with respect to the
@@ -752,7 +754,29 @@ class TensorCollection(collections.abc.Sequence, MSONable):
         Returns:
             TensorCollection.
         """
-        return type(self)([tensor.transform(symm_op) for tensor in self])
+        return type(self)(self._transform_by_rank([symm_op], lambda transformed: transformed[0]))
+
+    def _transform_by_rank(self, symm_ops: Sequence[SymmOp], reduce_ops) -> list[Tensor]:
+        """Apply symmetry operations to all tensors, with one einsum per
+        tensor rank, and reduce the stacked results over operations.
+
+        Args:
+            symm_ops (Sequence[SymmOp]): symmetry operations to apply.
+            reduce_ops (Callable): maps an array of shape (n_ops, *tensor.shape)
+                to the new tensor.
+
+        Returns:
+            list[Tensor]: the new tensors, in the order of the collection.
+        """
+        new_tensors: list[Tensor] = [None] * len(self)  # type:ignore[list-item]
+        by_rank: dict[int, list[int]] = collections.defaultdict(list)
+        for idx, tensor in enumerate(self):
+            by_rank[tensor.ndim].append(idx)
+        for indices in by_rank.values():
+            transformed = transform_tensors([self[idx] for idx in indices], symm_ops)
+            for pos, idx in enumerate(indices):
+                new_tensors[idx] = type(self[idx])(reduce_ops(transformed[:, pos]))
+        return new_tensors
 
     def rotate(self, matrix, tol: float = 1e-3) -> Self:
         """Rotates TensorCollection.
@@ -795,7 +819,11 @@ class TensorCollection(collections.abc.Sequence, MSONable):
         Returns:
             TensorCollection.
         """
-        return type(self)([tensor.fit_to_structure(structure, symprec) for tensor in self])
+        sga = SpacegroupAnalyzer(structure, symprec)
+        symm_ops = sga.get_symmetry_operations(cartesian=True)
+        return type(self)(
+            self._transform_by_rank(symm_ops, lambda transformed: transformed.sum(axis=0) / len(symm_ops))
+        )
 
     def is_fit_to_structure(
         self,
@@ -1019,12 +1047,48 @@ class SquareTensor(Tensor):
         return polar(self, side=side)
 
 
+@functools.cache
+def _bucket_weights(size: int) -> NDArray[np.float64]:
+    """Positive, pairwise distinct weights for hashing TensorMapping keys,
+    so that permuted or transposed keys land in different buckets.
+    """
+    return 1 + (np.arange(1, size + 1) * 0.6180339887498949) % 1
+
+
 def get_uvec(vec: NDArray[np.float64]) -> NDArray[np.float64]:
     """Get a unit vector parallel to input vector."""
     norm = np.linalg.norm(vec)
     return vec if norm < 1e-8 else vec / norm
 
 
+def transform_tensors(tensors: Sequence[NDArray] | NDArray, symm_ops: Sequence[SymmOp]) -> NDArray:
+    """Apply the rotation part of every symmetry operation to every tensor
+    in a single einsum.
+
+    Args:
+        tensors (Sequence[NDArray]): tensors of the same rank in full (non-Voigt) form,
+            or a stacked array of shape (n_tensors, 3, ..., 3).
+        symm_ops (Sequence[SymmOp]): symmetry operations to apply.
+
+    Returns:
+        NDArray: array of shape (n_ops, n_tensors, 3, ..., 3), where entry [i, j]
+            equals symm_ops[i].transform_tensor(tensors[j]).
+    """
+    stack = np.asarray(tensors, dtype=np.float64)
+    rank = stack.ndim - 1
+    if any(dim != 3 for dim in stack.shape[1:]):
+        raise ValueError("Some dimension in tensor is not 3.")
+    rotations = np.array([symm_op.rotation_matrix for symm_op in symm_ops]).reshape(-1, 3, 3)
+
+    # Same index layout as SymmOp.transform_tensor, with the operation and
+    # tensor axes in front
+    lc = string.ascii_lowercase
+    indices = lc[:rank], lc[rank : 2 * rank]
+    einsum_string = ",".join(f"Y{a}{i}" for a, i in zip(*indices, strict=True))
+    einsum_string += f",Z{indices[1]}->YZ{indices[0]}"
+    return np.einsum(einsum_string, *[rotations] * rank, stack)
+
+
 def symmetry_reduce(
     tensors,
     structure: Structure,
@@ -1051,15 +1115,21 @@ def symmetry_reduce(
     sga = SpacegroupAnalyzer(structure, **kwargs)
     symm_ops = sga.get_symmetry_operations(cartesian=True)
     unique_mapping = TensorMapping([tensors[0]], [[]], tol=tol)
+    # All symmetry images of the unique tensors so far, shape (n_unique, n_ops, 3, ..., 3)
+    images = np.swapaxes(transform_tensors([tensors[0]], symm_ops), 0, 1)
+    unique_tensors = [tensors[0]]
     for tensor in tensors[1:]:
-        is_unique = True
-        for unique_tensor, symm_op in itertools.product(unique_mapping, symm_ops):
-            if np.allclose(unique_tensor.transform(symm_op), tensor, atol=tol):
-                unique_mapping[unique_tensor].append(symm_op)
-                is_unique = False
-                break
-        if is_unique:
+        # Same test as np.allclose(image, tensor, atol=tol) for every image at once
+        diff = np.abs(images - np.asarray(tensor))
+        close = diff <= tol + 1e-5 * np.abs(np.asarray(tensor))
+        matches = np.all(close.reshape(*close.shape[:2], -1), axis=-1)
+        if matches.any():
+            unique_idx, op_idx = np.unravel_index(np.argmax(matches), matches.shape)
+            unique_mapping[unique_tensors[unique_idx]].append(symm_ops[op_idx])
+        else:
             unique_mapping[tensor] = []
+            unique_tensors.append(tensor)
+            images = np.concatenate([images, np.swapaxes(transform_tensors([tensor], symm_ops), 0, 1)])
     return unique_mapping
 
 
@@ -1072,6 +1142,12 @@ class TensorMapping(collections.abc.MutableMapping):
     stress-strain pairs and fitting data manipulation. In general,
     it is significantly less robust than a typical hashing
     and should be used with care.
+
+    Keys are bucketed by a weighted sum of their entries, with buckets
+    wide enough that any two keys equal within tol fall into the same
+    or adjacent buckets. Lookups only compare against keys in those
+    three buckets, so they take constant time on average instead of
+    scanning the whole mapping.
     """
 
     def __init__(
@@ -1097,6 +1173,31 @@ class TensorMapping(collections.abc.MutableMapping):
         self._value_list = list(values)  # needs to be a list
         self.tol = tol
 
+    @property
+    def tol(self) -> float:
+        """Absolute tolerance for getting and setting items in the mapping."""
+        return self._tol
+
+    @tol.setter
+    def tol(self, tol: float) -> None:
+        self._tol = tol
+        self._rebuild_index()
+
+    def _rebuild_index(self) -> None:
+        self._buckets: dict[tuple, list[int]] = collections.defaultdict(list)
+        for idx, tensor in enumerate(self._tensor_list):
+            self._buckets[self._bucket_key(np.asarray(tensor, dtype=np.float64))].append(idx)
+
+    def _bucket_key(self, item: NDArray) -> tuple:
+        """Shape and bucket index of the weighted sum of the entries of a key."""
+        weights = _bucket_weights(item.size)
+        # Keys within tol differ by less than tol * sum(weights) in the weighted
+        # sum, the extra 1% absorbs rounding in the sum itself
+        projection = float(item.ravel() @ weights) / (1.01 * self._tol * float(weights.sum()))
+        if not np.isfinite(projection):
+            return item.shape, None
+        return item.shape, math.floor(projection)
+
     def __getitem__(self, item):
         index = self._get_item_index(item)
         if index is None:
@@ -1106,6 +1207,7 @@ class TensorMapping(collections.abc.MutableMapping):
     def __setitem__(self, key, value) -> None:
         index = self._get_item_index(key)
         if index is None:
+            self._buckets[self._bucket_key(np.asarray(key, dtype=np.float64))].append(len(self._tensor_list))
             self._tensor_list.append(key)
             self._value_list.append(value)
         else:
@@ -1113,8 +1215,11 @@ class TensorMapping(collections.abc.MutableMapping):
 
     def __delitem__(self, key) -> None:
         index = self._get_item_index(key)
+        if index is None:
+            raise KeyError(f"{key} not found in mapping.")
         self._tensor_list.pop(index)
         self._value_list.pop(index)
+        self._rebuild_index()
 
     def __len__(self) -> int:
         return len(self._tensor_list)
@@ -1136,11 +1241,18 @@ class TensorMapping(collections.abc.MutableMapping):
     def _get_item_index(self, item):
         if len(self._tensor_list) == 0:
             return None
-        item = np.array(item)
+        item = np.asarray(item, dtype=np.float64)
+        shape, bucket = self._bucket_key(item)
+        if bucket is None:
+            candidates = self._buckets.get((shape, None), [])
+        else:
+            candidates = sorted(idx for offset in (-1, 0, 1) for idx in self._buckets.get((shape, bucket + offset), []))
+        if not candidates:
+            return None
         axis = tuple(range(1, len(item.shape) + 1))
-        mask = np.all(np.abs(np.array(self._tensor_list) - item) < self.tol, axis=axis)
+        mask = np.all(np.abs(np.array([self._tensor_list[idx] for idx in candidates]) - item) < self.tol, axis=axis)
         indices = np.where(mask)[0]
         if len(indices) > 1:
             raise ValueError("Tensor key collision.")
 
-        return None if len(indices) == 0 else indices[0]
+        return None if len(indices) == 0 else candidates[indices[0]]
@@ -15,6 +15,7 @@ from collections import defaultdict
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
+import numpy as np
 from monty.json import MontyDecoder, MontyEncoder, MSONable
 
 from pymatgen.analysis.phase_diagram import PDEntry
@@ -356,3 +357,233 @@ class EntrySet(collections.abc.MutableSet, MSONable):
                             comp[Element(elements[ind - 1])] = float(row[ind])
                     entries.append(PDEntry(Composition(comp), energy, name))
         return cls(entries)
+
+    def to_npz(self, filename: str, compress: bool = True) -> None:
+        """Exports ComputedEntries/ComputedStructureEntries to the compact
+        columnar npz format, see pymatgen.io.npz. This is much smaller and
+        faster to load than JSON for large entry sets.
+
+        Args:
+            filename: Filename to write to.
+            compress: Whether to compress the arrays. Defaults to True.
+        """
+        from pymatgen.io.npz import dump_npz
+
+        dump_npz(list(self.entries), filename, compress=compress)
+
+    @classmethod
+    def from_npz(cls, filename: str) -> Self:
+        """Imports entries written by to_npz.
+
+        Args:
+            filename: Filename to import from.
+
+        Returns:
+            EntrySet
+        """
+        from pymatgen.io.npz import load_npz
+
+        return cls(load_npz(filename))
+
+
+class EntryTable(collections.abc.Sequence):
+    """A read-only, columnar view of a list of entries for fast bulk queries.
+
+    Compositions are stored as an (n_entries, n_elements) matrix of element
+    amounts, alongside arrays of energies and corrections. Entries are indexed
+    by chemical system once at construction, so that chemical system subsets,
+    grouping by composition and ground state selection run as NumPy operations
+    instead of Python loops over entries.
+    """
+
+    def __init__(self, entries: Iterable[PDEntry | ComputedEntry | ComputedStructureEntry]) -> None:
+        """
+        Args:
+            entries: All the entries.
+        """
+        self.entries = list(entries)
+
+        columns: dict[str, int] = {}
+        rows, cols, amounts = [], [], []
+        for idx, entry in enumerate(self.entries):
+            for sp, amt in entry.composition.items():
+                rows.append(idx)
+                cols.append(columns.setdefault(sp.symbol, len(columns)))
+                amounts.append(amt)
+
+        # Sort element columns by atomic number for reproducible ordering
+        self.elements: list[Element] = sorted(map(Element, columns), key=lambda el: el.Z)
+        col_order = np.argsort([Element(sym).Z for sym in columns]).argsort()
+        self.amounts = np.zeros((len(self.entries), len(columns)))
+        np.add.at(self.amounts, (np.array(rows, dtype=int), col_order[np.array(cols, dtype=int)]), amounts)
+
+        self.energies = np.array([entry.energy for entry in self.entries], dtype=float)
+        self.corrections = np.array([getattr(entry, "correction", 0.0) for entry in self.entries], dtype=float)
+        self._build_index()
+
+    def _build_index(self) -> None:
+        self.num_atoms = self.amounts.sum(axis=1)
+        self.energies_per_atom = self.energies / self.num_atoms
+        present = self.amounts > Composition.amount_tolerance
+
+        # Chemical system index: unique element sets and the entries with each set
+        chemsys_inv = _row_labels(np.packbits(present, axis=1))
+        self._chemsys_members = _group_indices(chemsys_inv)
+        self._chemsys_masks = present[[members[0] for members in self._chemsys_members]]
+
+        # Composition index: entries with the same fractional composition share a reduced formula
+        self._comp_inv = _row_labels(np.round(self.amounts / self.num_atoms[:, None], 10) + 0.0)
+        self._comp_members = _group_indices(self._comp_inv)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __getitem__(self, idx):
+        return self.entries[idx]
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def take(self, indices: np.ndarray | list[int]) -> EntryTable:
+        """Get an EntryTable containing only the entries at the given indices.
+        The existing columns are sliced, no entry is re-read.
+
+        Args:
+            indices: Indices of the entries to keep.
+
+        Returns:
+            EntryTable
+        """
+        indices = np.asarray(indices, dtype=int)
+        table = object.__new__(type(self))
+        table.entries = [self.entries[idx] for idx in indices]
+        used = self.amounts[indices].any(axis=0)
+        table.elements = [el for el, keep in zip(self.elements, used, strict=True) if keep]
+        table.amounts = self.amounts[indices][:, used]
+        table.energies = self.energies[indices]
+        table.corrections = self.corrections[indices]
+        table._build_index()
+        return table
+
+    @property
+    def chemsys(self) -> set[str]:
+        """The set of all elements in the entries, e.g. {"Li", "Fe", "P", "O"}."""
+        return {el.symbol for el in self.elements}
+
+    @property
+    def chemsys_index(self) -> dict[str, np.ndarray]:
+        """Indices of the entries in each chemical system, keyed by the
+        dash-joined alphabetically sorted elements, e.g. "Fe-Li-O".
+        """
+        return {
+            "-".join(sorted(el.symbol for el, has_el in zip(self.elements, mask, strict=True) if has_el)): members
+            for mask, members in zip(self._chemsys_masks, self._chemsys_members, strict=True)
+        }
+
+    def get_indices_in_chemsys(self, chemsys: list[str]) -> np.ndarray:
+        """Get the indices of all entries belonging to a chemical system,
+        including all its subsystems.
+
+        Args:
+            chemsys: Chemical system specified as list of elements. e.g.
+                ["Li", "O"]
+
+        Returns:
+            np.ndarray: Sorted entry indices.
+        """
+        chem_sys = set(chemsys)
+        if not chem_sys.issubset(self.chemsys):
+            raise ValueError(
+                f"{sorted(chem_sys)} is not a subset of {sorted(self.chemsys)}, extra: {chem_sys - self.chemsys}"
+            )
+        outside = np.array([el.symbol not in chem_sys for el in self.elements], dtype=bool)
+        in_chemsys = ~self._chemsys_masks[:, outside].any(axis=1)
+        members = [self._chemsys_members[idx] for idx in np.flatnonzero(in_chemsys)]
+        return np.sort(np.concatenate(members)) if members else np.zeros(0, dtype=int)
+
+    def get_subset_in_chemsys(self, chemsys: list[str]) -> EntryTable:
+        """Get an EntryTable containing only the entries belonging to a
+        particular chemical system (including all sub systems), see
+        EntrySet.get_subset_in_chemsys.
+
+        Args:
+            chemsys: Chemical system specified as list of elements. e.g.
+                ["Li", "O"]
+
+        Returns:
+            EntryTable
+        """
+        return self.take(self.get_indices_in_chemsys(chemsys))
+
+    def group_by_composition(self) -> list[np.ndarray]:
+        """Group entries with the same reduced composition.
+
+        Returns:
+            list[np.ndarray]: Entry indices of each group, sorted by energy
+                per atom within each group.
+        """
+        return [members[np.argsort(self.energies_per_atom[members], kind="stable")] for members in self._comp_members]
+
+    def get_ground_state_indices(self) -> np.ndarray:
+        """Indices of the lowest energy per atom entry at each composition."""
+        order = np.lexsort((self.energies_per_atom, self._comp_inv))
+        is_first = np.ones(len(order), dtype=bool)
+        is_first[1:] = self._comp_inv[order][1:] != self._comp_inv[order][:-1]
+        return order[is_first]
+
+    @property
+    def ground_states(self) -> list:
+        """The lowest energy per atom entry at each composition."""
+        return [self.entries[idx] for idx in self.get_ground_state_indices()]
+
+    def get_indices_in_energy_window(self, window: float) -> np.ndarray:
+        """Get the indices of all entries within an energy window above the
+        ground state of their composition.
+
+        Args:
+            window (float): Energy window in eV/atom.
+
+        Returns:
+            np.ndarray: Sorted entry indices.
+        """
+        ground_state_energies = np.empty(len(self._comp_members))
+        gs_indices = self.get_ground_state_indices()
+        ground_state_energies[self._comp_inv[gs_indices]] = self.energies_per_atom[gs_indices]
+        return np.flatnonzero(self.energies_per_atom - ground_state_energies[self._comp_inv] <= window)
+
+    def get_pd_entries(self, indices: np.ndarray | list[int] | None = None) -> list[PDEntry]:
+        """Get PDEntries for use in PhaseDiagram. The Composition objects of the
+        original entries are shared rather than copied, and the original entry
+        is kept as the PDEntry attribute.
+
+        Args:
+            indices: Indices of the entries to convert. Defaults to all.
+
+        Returns:
+            list[PDEntry]
+        """
+        if indices is None:
+            indices = range(len(self))
+        return [
+            PDEntry(
+                self.entries[idx].composition,
+                self.energies[idx],
+                name=self.entries[idx].name,
+                attribute=self.entries[idx],
+            )
+            for idx in indices
+        ]
+
+
+def _row_labels(arr: np.ndarray) -> np.ndarray:
+    """Label the rows of a 2D array such that equal rows get equal labels."""
+    labels: dict[bytes, int] = {}
+    return np.array([labels.setdefault(row.tobytes(), len(labels)) for row in arr], dtype=int)
+
+
+def _group_indices(labels: np.ndarray) -> list[np.ndarray]:
+    """Split indices 0..len(labels)-1 into groups by integer label."""
+    if len(labels) == 0:
+        return []
+    order = np.argsort(labels, kind="stable")
+    return np.split(order, np.searchsorted(labels[order], np.arange(1, labels.max(initial=-1) + 1)))
@@ -0,0 +1,328 @@
+"""Compact columnar binary (NumPy .npz) serialization of Structures, Molecules
+and computed entries.
+
+Instead of nested per-site dicts as produced by as_dict(), all objects in a
+collection share flat arrays (lattices, coordinates, species indices,
+occupancies and numeric site properties) plus a small JSON blob per object for
+the remaining metadata. Collections are read back lazily: arrays are loaded
+once, and each object is only constructed when it is accessed.
+
+    >>> dump_npz(entries, "entries.npz")
+    >>> coll = load_npz("entries.npz")
+    >>> coll[42]  # only this entry is deserialized
+"""
+
+from __future__ import annotations
+
+import collections.abc
+import io
+import itertools
+import json
+from importlib import import_module
+from typing import TYPE_CHECKING, overload
+
+import numpy as np
+import orjson
+from monty.io import zopen
+from monty.json import MontyDecoder, MontyEncoder
+
+from pymatgen.core import DummySpecies, Element, Lattice, Species
+from pymatgen.core.structure import IMolecule, IStructure, SiteCollection
+from pymatgen.entries.computed_entries import ComputedEntry, ComputedStructureEntry
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+    from typing import Any
+
+    from typing_extensions import Self
+
+    from pymatgen.util.typing import PathLike
+
+__author__ = "Pymatgen Development Team"
+
+NPZ_FORMAT_VERSION = 1
+
+NpzSerializable = SiteCollection | ComputedEntry
+
+
+def _species_from_dict(dct: dict) -> Element | Species | DummySpecies:
+    """Same species decoding as PeriodicSite.from_dict."""
+    if "oxidation_state" in dct and Element.is_valid_symbol(dct["element"]):
+        return Species.from_dict(dct)
+    if "oxidation_state" in dct:
+        return DummySpecies.from_dict(dct)
+    return Element(dct["element"])
+
+
+def _columnar_properties(site_collections: list[SiteCollection | None]) -> dict[str, np.ndarray]:
+    """Find site properties that can be stored as one numeric array across all
+    objects, i.e. present on every site with a consistent numeric shape.
+    """
+    with_sites = [sc for sc in site_collections if sc is not None and len(sc) > 0]
+    if not with_sites:
+        return {}
+
+    columns: dict[str, np.ndarray] = {}
+    for key in with_sites[0].site_properties:
+        chunks = []
+        for sc in with_sites:
+            values = sc.site_properties.get(key)
+            if values is None or any(val is None for val in values):
+                break
+            try:
+                arr = np.asarray(values)
+            except ValueError:  # ragged
+                break
+            if arr.dtype.kind not in "biuf" or (chunks and arr.shape[1:] != chunks[0].shape[1:]):
+                break
+            chunks.append(arr)
+        else:
+            columns[key] = np.concatenate(chunks)
+    return columns
+
+
+def dump_npz(
+    objs: NpzSerializable | Sequence[NpzSerializable],
+    filename: PathLike | None = None,
+    compress: bool = True,
+) -> bytes:
+    """Serialize one or many Structures, Molecules, ComputedEntries or
+    ComputedStructureEntries to the columnar npz format.
+
+    Args:
+        objs: A single object or a sequence of objects. Different types can be
+            mixed in one collection.
+        filename (PathLike): If given, also write the bytes to this file.
+        compress (bool): Whether to deflate the arrays. Compressed files are
+            several times smaller at a modest cost in load time. Defaults to True.
+
+    Returns:
+        bytes: The npz file contents.
+    """
+    if isinstance(objs, SiteCollection | ComputedEntry):
+        objs = [objs]
+
+    site_collections: list[SiteCollection | None] = []
+    metas: list[dict[str, Any]] = []
+    for obj in objs:
+        if isinstance(obj, ComputedEntry):
+            if type(obj).as_dict in (ComputedEntry.as_dict, ComputedStructureEntry.as_dict):
+                # Skip the expensive structure dict, the structure is stored in columns
+                meta = ComputedEntry.as_dict(obj)
+            else:
+                meta = obj.as_dict()
+                meta.pop("structure", None)
+            meta = {"entry": meta}
+            site_collections.append(obj.structure if isinstance(obj, ComputedStructureEntry) else None)
+        elif isinstance(obj, SiteCollection):
+            site_collections.append(obj)
+            meta = {}
+        else:
+            raise TypeError(f"Cannot serialize {type(obj).__name__} to npz")
+        metas.append(meta)
+
+    columns = _columnar_properties(site_collections)
+
+    species_table: dict[Element | Species | DummySpecies, int] = {}
+    n_sites: list[int] = []
+    lattices: list[np.ndarray] = []
+    pbcs: list[tuple[bool, bool, bool]] = []
+    coords: list[np.ndarray] = []
+    n_species: list[int] = []
+    species_idx: list[int] = []
+    occus: list[float] = []
+    for sc, meta in zip(site_collections, metas, strict=True):
+        if sc is None:
+            n_sites.append(0)
+            lattices.append(np.zeros((3, 3)))
+            pbcs.append((False, False, False))
+            continue
+
+        n_sites.append(len(sc))
+        meta.update({"@module": type(sc).__module__, "@class": type(sc).__name__, "properties": sc.properties})
+        meta["charge"] = sc.charge
+        if isinstance(sc, IStructure):
+            lattices.append(sc.lattice.matrix)
+            pbcs.append(sc.lattice.pbc)
+            coords.append(sc.frac_coords)
+        else:
+            lattices.append(np.zeros((3, 3)))
+            pbcs.append((False, False, False))
+            coords.append(sc.cart_coords)
+            meta["spin_multiplicity"] = sc.spin_multiplicity
+
+        species_strings = []
+        for site in sc:
+            comp = site.species
+            n_species.append(len(comp))
+            for sp, occu in comp.items():
+                species_idx.append(species_table.setdefault(sp, len(species_table)))
+                occus.append(occu)
+            species_strings.append(site.species_string)
+        if (labels := sc.labels) != species_strings:
+            meta["labels"] = labels
+        if site_props := {key: val for key, val in sc.site_properties.items() if key not in columns}:
+            meta["site_properties"] = site_props
+
+    species_dicts = []
+    for sp in species_table:
+        sp_dct = sp.as_dict()
+        del sp_dct["@module"]
+        del sp_dct["@class"]
+        species_dicts.append(sp_dct)
+
+    meta_blobs = [json.dumps(meta, cls=MontyEncoder).encode() for meta in metas]
+    arrays: dict[str, np.ndarray] = {
+        "version": np.array(NPZ_FORMAT_VERSION),
+        "lattice": np.array(lattices, dtype=np.float64).reshape(-1, 3, 3),
+        "pbc": np.array(pbcs, dtype=bool).reshape(-1, 3),
+        "site_ptr": np.concatenate([[0], np.cumsum(n_sites)]).astype(np.int64),
+        "coords": np.concatenate(coords).astype(np.float64) if coords else np.zeros((0, 3)),
+        "species_ptr": np.concatenate([[0], np.cumsum(n_species)]).astype(np.int64),
+        "species": np.array(species_idx, dtype=np.int32),
+        "occu": np.array(occus, dtype=np.float64),
+        "species_table": np.frombuffer(orjson.dumps(species_dicts), dtype=np.uint8),
+        "meta_ptr": np.concatenate([[0], np.cumsum([len(blob) for blob in meta_blobs])]).astype(np.int64),
+        "meta": np.frombuffer(b"".join(meta_blobs), dtype=np.uint8),
+    }
+    for key, arr in columns.items():
+        arrays[f"prop:{key}"] = arr
+
+    buffer = io.BytesIO()
+    (np.savez_compressed if compress else np.savez)(buffer, **arrays)
+    data = buffer.getvalue()
+    if filename:
+        with zopen(filename, mode="wb") as file:
+            file.write(data)
+    return data
+
+
+class NpzCollection(collections.abc.Sequence):
+    """Lazily deserialized collection read from the columnar npz format.
+
+    All arrays are loaded up front, but objects are only constructed on item
+    access, so e.g. reading a single entry from a file with 500k entries does
+    not pay for building the other structures.
+    """
+
+    def __init__(self, arrays: dict[str, np.ndarray]) -> None:
+        """
+        Args:
+            arrays (dict[str, np.ndarray]): The arrays stored in the npz file.
+        """
+        if (version := int(arrays["version"])) > NPZ_FORMAT_VERSION:
+            raise ValueError(f"npz format {version=} is newer than supported version {NPZ_FORMAT_VERSION}")
+
+        self._arrays = arrays
+        self._species_table = [_species_from_dict(dct) for dct in orjson.loads(arrays["species_table"].tobytes())]
+        self._site_ptr = arrays["site_ptr"]
+        self._species_ptr = arrays["species_ptr"]
+        self._meta_ptr = arrays["meta_ptr"]
+        self._meta = arrays["meta"].tobytes()
+        self._columns = {key.removeprefix("prop:"): arr for key, arr in arrays.items() if key.startswith("prop:")}
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self:
+        """Read a collection from the bytes returned by dump_npz."""
+        with np.load(io.BytesIO(data), allow_pickle=False) as npz:
+            return cls({key: npz[key] for key in npz.files})
+
+    @classmethod
+    def from_file(cls, filename: PathLike) -> Self:
+        """Read a collection from a file written by dump_npz."""
+        with zopen(filename, mode="rb") as file:
+            return cls.from_bytes(file.read())  # type:ignore[arg-type]
+
+    def __len__(self) -> int:
+        return len(self._site_ptr) - 1
+
+    @overload
+    def __getitem__(self, idx: int) -> NpzSerializable: ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> list[NpzSerializable]: ...
+
+    def __getitem__(self, idx: int | slice) -> NpzSerializable | list[NpzSerializable]:
+        if isinstance(idx, slice):
+            return [self._build(i) for i in range(*idx.indices(len(self)))]
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError(f"{idx=} out of range for collection of length {len(self)}")
+        return self._build(idx)
+
+    def __iter__(self) -> Iterator[NpzSerializable]:
+        return (self._build(idx) for idx in range(len(self)))
+
+    def _build(self, idx: int) -> NpzSerializable:
+        meta = orjson.loads(self._meta[self._meta_ptr[idx] : self._meta_ptr[idx + 1]])
+        sc = self._build_site_collection(idx, meta) if "@class" in meta else None
+        if "entry" not in meta:
+            return sc  # type:ignore[return-value]
+
+        # The metadata was written with MontyEncoder, so decode its MSONable values as loadfn would
+        decoder = MontyDecoder()
+        entry_dct = {
+            key: val if key.startswith("@") else decoder.process_decoded(val) for key, val in meta["entry"].items()
+        }
+        entry_cls = getattr(import_module(entry_dct["@module"]), entry_dct["@class"])
+        if sc is not None:
+            entry_dct["structure"] = sc
+        return entry_cls.from_dict(entry_dct)
+
+    def _build_site_collection(self, idx: int, meta: dict[str, Any]) -> SiteCollection:
+        start, end = self._site_ptr[idx], self._site_ptr[idx + 1]
+        sp_ptr = self._species_ptr[start : end + 1]
+        sp_idx = self._arrays["species"][sp_ptr[0] : sp_ptr[-1]].tolist()
+        occus = self._arrays["occu"][sp_ptr[0] : sp_ptr[-1]].tolist()
+        offsets = (sp_ptr - sp_ptr[0]).tolist()
+
+        species: list[Any] = []
+        for site_start, site_end in itertools.pairwise(offsets):
+            if site_end - site_start == 1 and occus[site_start] == 1:
+                species.append(self._species_table[sp_idx[site_start]])
+            else:
+                species.append({self._species_table[sp_idx[i]]: occus[i] for i in range(site_start, site_end)})
+
+        decoder = MontyDecoder()
+        site_properties = {key: arr[start:end].tolist() for key, arr in self._columns.items()}
+        for key, values in meta.get("site_properties", {}).items():
+            site_properties[key] = decoder.process_decoded(values)
+        properties = decoder.process_decoded(meta.get("properties"))
+
+        sc_cls = getattr(import_module(meta["@module"]), meta["@class"])
+        coords = self._arrays["coords"][start:end]
+        if issubclass(sc_cls, IStructure):
+            lattice = Lattice(self._arrays["lattice"][idx], pbc=tuple(self._arrays["pbc"][idx].tolist()))
+            return sc_cls(
+                lattice,
+                species,
+                coords,
+                charge=meta["charge"],
+                site_properties=site_properties or None,
+                labels=meta.get("labels"),
+                properties=properties,
+            )
+        if issubclass(sc_cls, IMolecule):
+            return sc_cls(
+                species,
+                coords,
+                charge=meta["charge"],
+                spin_multiplicity=meta.get("spin_multiplicity"),
+                site_properties=site_properties or None,
+                labels=meta.get("labels"),
+                properties=properties,
+            )
+        raise TypeError(f"Cannot deserialize {sc_cls.__name__} from npz")
+
+
+def load_npz(filename: PathLike) -> NpzCollection:
+    """Open a file written by dump_npz as a lazily deserialized collection.
+
+    Args:
+        filename (PathLike): The npz file.
+
+    Returns:
+        NpzCollection
+    """
+    return NpzCollection.from_file(filename)
@@ -13,6 +13,7 @@ from typing import TYPE_CHECKING
 import networkx as nx
 import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed
 from monty.io import zopen
 from monty.json import MSONable, jsanitize
 
@@ -33,6 +34,7 @@ except ImportError:
     openbabel = None
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from pathlib import Path
     from typing import Any
 
@@ -651,6 +653,22 @@ class QCOutput(MSONable):
         if not self.data.get("completion", []) and self.data.get("errors") == []:
             self._check_completion_errors()
 
+    @staticmethod
+    def parse_many(filenames: Sequence[str | Path], n_jobs: int = 1) -> list[QCOutput]:
+        """Parse many single-job QChem output files, optionally in parallel.
+
+        Args:
+            filenames (Sequence[str | Path]): Output files to parse.
+            n_jobs (int): Number of parallel jobs. -1 uses all cores.
+                Defaults to 1 (serial).
+
+        Returns:
+            list[QCOutput]: One QCOutput per file, in the order of filenames.
+        """
+        if n_jobs == 1:
+            return [QCOutput(str(filename)) for filename in filenames]
+        return Parallel(n_jobs=n_jobs)(delayed(QCOutput)(str(filename)) for filename in filenames)
+
     @staticmethod
     def multiple_outputs_from_file(filename, keep_sub_files=True):
         """
@@ -4,12 +4,55 @@ from __future__ import annotations
 
 import re
 from collections import defaultdict
+from functools import lru_cache
 
 import numpy as np
 
 __author__ = "Samuel Blau, Brandon Wood, Shyam Dwaraknath, Evan Spotte-Smith, Ryan Kingsbury"
 __copyright__ = "Copyright 2018-2022, The Materials Project"
 
+# A leading "\s*" followed by a plain (non-whitespace, non-optional) character,
+# optionally behind inline flags such as "(?i)"
+_LEADING_WHITESPACE = re.compile(r"^(\(\?[aiLmsux]+\))?\\s\*(?=(?:[\w<>=:,;#'\"]|\\[^\w\s])(?![*?{]))")
+
+
+def _has_top_level_alternation(pattern: str) -> bool:
+    """Whether a pattern has a "|" outside of any group or character class."""
+    depth = 0
+    in_class = escaped = False
+    for char in pattern:
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            return True
+    return False
+
+
+@lru_cache(maxsize=512)
+def _compile(pattern: str) -> re.Pattern:
+    r"""Compile a pattern with MULTILINE and DOTALL, caching the result.
+
+    Patterns starting with "\s*" in front of a literal character are searched
+    without it. The re module retries such a pattern from every position in a
+    run of whitespace, which is quadratic in the length of the run and makes up
+    most of the time spent parsing long Q-Chem outputs. As the literal cannot
+    match whitespace, dropping the prefix matches and captures exactly the same
+    text.
+    """
+    if not _has_top_level_alternation(pattern):
+        pattern = _LEADING_WHITESPACE.sub(r"\1", pattern, count=1)
+    return re.compile(pattern, re.MULTILINE | re.DOTALL)
+
 
 def read_pattern(text_str, patterns, terminate_on_match=False, postprocess=str):
     r"""General pattern reading on an input string.
@@ -30,7 +73,7 @@ def read_pattern(text_str, patterns, terminate_on_match=False, postprocess=str):
         results from regex and postprocess. Note that the returned values
         are lists of lists, because you can grep multiple items on one line.
     """
-    compiled = {key: re.compile(pattern, re.MULTILINE | re.DOTALL) for key, pattern in patterns.items()}
+    compiled = {key: _compile(pattern) for key, pattern in patterns.items()}
     matches = defaultdict(list)
     for key, pattern in compiled.items():
         for match in pattern.finditer(text_str):
@@ -99,7 +142,7 @@ def read_table_pattern(
         row_pattern.
     """
     table_pattern_text = header_pattern + r"\s*(?P<table_body>(?:" + row_pattern + r")+)\s*" + footer_pattern
-    table_pattern = re.compile(table_pattern_text, re.MULTILINE | re.DOTALL)
+    table_pattern = _compile(table_pattern_text)
     rp = re.compile(row_pattern)
     data = {}
     tables = []
@@ -25,6 +25,7 @@ from zipfile import ZipFile
 import numpy as np
 import orjson
 import scipy.constants as const
+from joblib import Parallel, delayed
 from monty.io import zopen
 from monty.json import MontyDecoder, MSONable
 from monty.os import cd
@@ -496,25 +497,27 @@ class Poscar(MSONable):
                     stacklevel=2,
                 )
 
-        # Read the atomic coordinates
-        coords: list[list[float]] = []
-        selective_dynamics: list[list[bool]] | None = [] if has_selective_dynamics else None
-        for idx in range(n_sites):
-            tokens: list[str] = lines[ipos + 1 + idx].split()
-
+        # Read the atomic coordinates. Tokenize all lines first so the float
+        # conversion can be done in bulk by NumPy rather than per token
+        all_tokens: list[list[str]] = [lines[ipos + 1 + idx].split() for idx in range(n_sites)]
+        for idx, tokens in enumerate(all_tokens):
             # Attempt to fix bad formatting in POSCAR/CONTCAR/XDATCAR
             if len(tokens) < 3:
                 new_tokens = []
                 for token in tokens:
                     new_tokens.extend([t if i == 0 else f"-{t}" for i, t in enumerate(token.split("-")) if len(t) > 0])
                 if len(new_tokens) == 3:
-                    tokens = new_tokens
+                    all_tokens[idx] = new_tokens
                 else:
                     raise BadPoscarWarning(f"Cannot parse coordinates on this line:\n{lines[ipos + 1 + idx]}")
 
-            crd_scale: float = scale if cart else 1
-            coords.append([float(j) * crd_scale for j in tokens[:3]])
-            if selective_dynamics is not None:
+        coords: np.ndarray = np.array([tokens[:3] for tokens in all_tokens], dtype=float).reshape(n_sites, 3)
+        if cart:
+            coords *= scale
+
+        selective_dynamics: list[list[bool]] | None = [] if has_selective_dynamics else None
+        if selective_dynamics is not None:
+            for idx, tokens in enumerate(all_tokens):
                 # Warn when values contain suspicious entries
                 if any(value not in {"T", "F"} for value in tokens[3:6]):
                     warnings.warn(
@@ -648,15 +651,22 @@ class Poscar(MSONable):
 
         lines.append("direct" if direct else "cartesian")
 
-        # Add ion positions and selective dynamics
-        for idx, site in enumerate(self.structure):
-            coords: ArrayLike = site.frac_coords if direct else site.coords
-            line: str = " ".join(format_str.format(c) for c in coords)
-            if self.selective_dynamics is not None:
-                sd: list[str] = ["T" if j else "F" for j in self.selective_dynamics[idx]]  # type:ignore[index]
-                line += f" {sd[0]} {sd[1]} {sd[2]}"
-            line += f" {site.species_string}"
-            lines.append(line)
+        # Add ion positions and selective dynamics. Format whole rows at once
+        # instead of going through the sites one by one
+        coords: np.ndarray = self.structure.frac_coords if direct else self.structure.cart_coords
+        row_format: str = " ".join([f"%{significant_figures + 5}.{significant_figures}f"] * 3)
+        species: list[str] = [site.species_string for site in self.structure]
+        if self.selective_dynamics is not None:
+            flags: list[str] = [
+                " ".join("T" if j else "F" for j in sd)
+                for sd in self.selective_dynamics  # type:ignore[union-attr]
+            ]
+            lines.extend(
+                f"{row_format % tuple(row)} {sd} {sp}"
+                for row, sd, sp in zip(coords.tolist(), flags, species, strict=True)
+            )
+        else:
+            lines.extend(f"{row_format % tuple(row)} {sp}" for row, sp in zip(coords.tolist(), species, strict=True))
 
         if self.lattice_velocities is not None:
             try:
@@ -788,6 +798,24 @@ class BadPoscarWarning(UserWarning):
     """Warning class for bad POSCAR entries."""
 
 
+def read_poscars(filenames: Sequence[PathLike], n_jobs: int = 1, **kwargs) -> list[Poscar]:
+    """Read many POSCAR/CONTCAR files, e.g. for bulk dataset conversion.
+
+    Args:
+        filenames (Sequence[PathLike]): Paths to the POSCAR files.
+        n_jobs (int): Number of parallel jobs (joblib convention, -1 uses
+            all CPUs). Defaults to 1, i.e. serial.
+        **kwargs: Passed to Poscar.from_file, e.g. check_for_potcar=False
+            to skip looking for a POTCAR next to every file.
+
+    Returns:
+        list[Poscar]: In the same order as filenames.
+    """
+    if n_jobs == 1:
+        return [Poscar.from_file(filename, **kwargs) for filename in filenames]
+    return Parallel(n_jobs=n_jobs)(delayed(Poscar.from_file)(filename, **kwargs) for filename in filenames)
+
+
 class Incar(UserDict, MSONable):
     """
     A case-insensitive dictionary to read/write INCAR files with additional helper functions.
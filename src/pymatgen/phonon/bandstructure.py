@@ -11,6 +11,7 @@ from monty.json import MSONable
 from pymatgen.core.lattice import Lattice
 from pymatgen.core.structure import Structure
 from pymatgen.electronic_structure.bandstructure import Kpoint
+from pymatgen.optimization.linear_assignment import LinearAssignment
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -37,26 +38,72 @@ def get_reasonable_repetitions(n_atoms: int) -> tuple[int, int, int]:
 
 
 def eigenvectors_from_displacements(disp: ArrayLike, masses: ArrayLike) -> np.ndarray:
-    """Calculate the eigenvectors from the atomic displacements."""
-    return np.einsum("nax,a->nax", disp, masses**0.5)  # type:ignore[arg-type]
+    """Calculate the eigenvectors from the atomic displacements.
+
+    Args:
+        disp: eigendisplacements with shape (..., n_atoms, 3).
+        masses: atomic masses with shape (n_atoms,).
+    """
+    return np.einsum("...ax,a->...ax", disp, np.asarray(masses) ** 0.5)
 
 
 def estimate_band_connection(prev_eigvecs, eigvecs, prev_band_order) -> list[int]:
-    """A function to order the phonon eigenvectors taken from phonopy."""
+    """A function to order the phonon eigenvectors taken from phonopy.
+
+    Each band of the previous q-point is connected to a band of the new one
+    such that the total overlap of the connected eigenvectors is maximal.
+
+    Args:
+        prev_eigvecs: eigenvectors at the previous q-point, one band per column.
+        eigvecs: eigenvectors at the new q-point, one band per column.
+        prev_band_order: the band order at the previous q-point.
+
+    Returns:
+        list[int]: the band order at the new q-point.
+    """
     metric = np.abs(np.dot(prev_eigvecs.conjugate().T, eigvecs))
-    connection_order = []
-    for overlaps in metric:
-        max_val = max_idx = 0
-        for idx in reversed(range(len(metric))):
-            val = overlaps[idx]
-            if idx in connection_order:
-                continue
-            if val > max_val:
-                max_val = val
-                max_idx = idx
-        connection_order.append(max_idx)
+    connection_order = LinearAssignment(-metric).solution
 
-    return [connection_order[x] for x in prev_band_order]
+    return connection_order[np.asarray(prev_band_order)].tolist()
+
+
+def get_band_connections(eigendisplacements: ArrayLike, masses: ArrayLike) -> np.ndarray:
+    """Band order at every q-point from the overlaps of the eigenvectors at
+    consecutive q-points, see estimate_band_connection.
+
+    The overlap matrices of all pairs of consecutive q-points are computed at
+    once, leaving only one linear assignment per q-point step.
+
+    Args:
+        eigendisplacements: eigendisplacements with shape (n_bands, n_qpoints, n_atoms, 3).
+        masses: atomic masses with shape (n_atoms,).
+
+    Returns:
+        np.ndarray: band order with shape (n_qpoints, n_bands), i.e. order[iq, ib] is the
+            band at q-point iq connected to band ib at the first q-point.
+    """
+    eigvecs = eigenvectors_from_displacements(eigendisplacements, masses)
+    n_bands, n_qpoints = eigvecs.shape[:2]
+    # (n_qpoints, n_bands, 3 * n_atoms), one band per row
+    eigvecs = eigvecs.reshape(n_bands, n_qpoints, -1).transpose(1, 0, 2)
+    metrics = np.abs(eigvecs[:-1].conj() @ eigvecs[1:].transpose(0, 2, 1))
+
+    order = np.empty((n_qpoints, n_bands), dtype=np.int64)
+    order[0] = np.arange(n_bands)
+    for nq, metric in enumerate(metrics, start=1):
+        order[nq] = LinearAssignment(-metric).solution[order[nq - 1]]
+    return order
+
+
+def _find_direction(direction: Sequence[float], directions: list[list[float]]) -> int | None:
+    """Index of the first of the normalized directions close to the given direction,
+    None if there is none.
+    """
+    if not directions:
+        return None
+    versor = np.asarray(direction) / np.linalg.norm(direction)
+    (matches,) = np.nonzero(np.isclose(versor, np.asarray(directions)).all(axis=1))
+    return int(matches[0]) if len(matches) > 0 else None
 
 
 class PhononBandStructure(MSONable):
@@ -117,7 +164,7 @@ class PhononBandStructure(MSONable):
         self.structure = structure
         if eigendisplacements is None:
             eigendisplacements = np.array([])
-        self.eigendisplacements = eigendisplacements
+        self.eigendisplacements = np.asarray(eigendisplacements)
         if labels_dict is None:
             labels_dict = {}
 
@@ -233,12 +280,8 @@ class PhononBandStructure(MSONable):
             the frequencies as a numpy array o(3*len(structure), len(qpoints)).
             None if not found.
         """
-        versor = [idx / np.linalg.norm(direction) for idx in direction]
-        for dist, freq in self.nac_frequencies:
-            if np.allclose(versor, dist):
-                return freq
-
-        return None
+        idx = _find_direction(direction, [dist for dist, _ in self.nac_frequencies])
+        return None if idx is None else self.nac_frequencies[idx][1]
 
     def get_nac_eigendisplacements_along_dir(self, direction) -> np.ndarray | None:
         """Get the nac_eigendisplacements for the given direction (not necessarily a versor).
@@ -251,12 +294,8 @@ class PhononBandStructure(MSONable):
             the eigendisplacements as a numpy array of complex numbers with shape
             (3*len(structure), len(structure), 3). None if not found.
         """
-        versor = [idx / np.linalg.norm(direction) for idx in direction]
-        for dist, eigen_disp in self.nac_eigendisplacements:
-            if np.allclose(versor, dist):
-                return eigen_disp
-
-        return None
+        idx = _find_direction(direction, [dist for dist, _ in self.nac_eigendisplacements])
+        return None if idx is None else self.nac_eigendisplacements[idx][1]
 
     def asr_breaking(self, tol_eigendisplacements: float = 1e-5) -> np.ndarray | None:
         """Get the breaking of the acoustic sum rule for the three acoustic modes,
@@ -270,11 +309,9 @@ class PhononBandStructure(MSONable):
         for idx in range(self.nb_qpoints):
             if np.allclose(self.qpoints[idx].frac_coords, (0, 0, 0)):
                 if self.has_eigendisplacements:
-                    acoustic_modes_index = []
-                    for j in range(self.nb_bands):
-                        eig = self.eigendisplacements[j][idx]
-                        if np.max(np.abs(eig[1:] - eig[:1])) < tol_eigendisplacements:
-                            acoustic_modes_index.append(j)
+                    eig = self.eigendisplacements[:, idx]
+                    is_translation = np.max(np.abs(eig[:, 1:] - eig[:, :1]), axis=(1, 2)) < tol_eigendisplacements
+                    acoustic_modes_index = np.flatnonzero(is_translation).tolist()
                     # if acoustic modes are not correctly identified return use
                     # the first three modes
                     if len(acoustic_modes_index) != 3:
@@ -611,34 +648,17 @@ class PhononBandStructureSymmLine(PhononBandStructure):
 
     def band_reorder(self) -> None:
         """Re-order the eigenvalues according to the similarity of the eigenvectors."""
-        eigen_displacements = self.eigendisplacements
-        eig = self.bands
-
-        n_phonons, n_qpoints = self.bands.shape
-        order = np.zeros([n_qpoints, n_phonons], dtype=np.int64)
-        order[0] = np.array(range(n_phonons))
-
         # Get the atomic masses
         if self.structure is None:
             raise RuntimeError("Structure is required for band_reorder")
         atomic_masses = [site.specie.atomic_mass for site in self.structure]
 
-        # Get order
-        for nq in range(1, n_qpoints):
-            old_eig_vecs = eigenvectors_from_displacements(eigen_displacements[:, nq - 1], atomic_masses)  # type:ignore[arg-type]
-            new_eig_vecs = eigenvectors_from_displacements(eigen_displacements[:, nq], atomic_masses)  # type:ignore[arg-type]
-            order[nq] = estimate_band_connection(
-                old_eig_vecs.reshape([n_phonons, n_phonons]).T,
-                new_eig_vecs.reshape([n_phonons, n_phonons]).T,
-                order[nq - 1],
-            )
-
-        # reorder
-        for nq in range(1, n_qpoints):
-            eivq = eigen_displacements[:, nq]
-            eigq = eig[:, nq]
-            eigen_displacements[:, nq] = eivq[order[nq]]
-            eig[:, nq] = eigq[order[nq]]
+        order = get_band_connections(self.eigendisplacements, atomic_masses)
+
+        # reorder all q-points at once, in place
+        q_idx = np.arange(self.nb_qpoints)
+        self.eigendisplacements[:] = self.eigendisplacements[order.T, q_idx]
+        self.bands[:] = self.bands[order.T, q_idx]
 
     def as_dict(self) -> dict:
         """Get MSONable dict."""
@@ -19,6 +19,8 @@ if version.parse(np.__version__) < version.parse("2.0.0"):
     np.trapezoid = np.trapz  # type:ignore[assignment]  # noqa: NPY201
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from numpy.typing import ArrayLike, NDArray
     from typing_extensions import Self
 
@@ -26,6 +28,56 @@ BOLTZ_THZ_PER_K = const.value("Boltzmann constant in Hz/K") / const.tera  # Bolt
 THZ_TO_J = const.value("hertz-joule relationship") * const.tera
 
 
+THERMODYNAMIC_PROPERTIES = ("cv", "entropy", "internal_energy", "helmholtz_free_energy")
+_ZPE_PROPERTIES = ("internal_energy", "helmholtz_free_energy")
+
+
+def _thermodynamic_integrals(
+    freqs: NDArray,
+    dens: NDArray,
+    temps: NDArray,
+    properties: Sequence[str] = THERMODYNAMIC_PROPERTIES,
+) -> dict[str, NDArray]:
+    """Integrate thermodynamic properties over a stack of DOSes for all
+    temperatures at once.
+
+    Args:
+        freqs: positive frequencies in THz, shape (n_dos, n_freqs).
+        dens: the corresponding densities, shape (n_dos, n_freqs).
+        temps: nonzero temperatures in K, shape (n_temps,).
+        properties: the properties to compute, a subset of THERMODYNAMIC_PROPERTIES.
+
+    Returns:
+        dict[str, NDArray]: property name to values of shape (n_dos, n_temps), in J/(K*mol-c)
+            for cv and entropy and J/mol-c for the energies.
+    """
+    if unknown := set(properties) - set(THERMODYNAMIC_PROPERTIES):
+        raise ValueError(f"Unknown thermodynamic properties {sorted(unknown)}")
+
+    freqs = freqs[:, None, :]
+    dens = dens[:, None, :]
+    wd2kt = freqs / (2 * BOLTZ_THZ_PER_K * temps[:, None])
+    sinh = np.sinh(wd2kt)
+    tanh = np.tanh(wd2kt) if {"entropy", "internal_energy"} & set(properties) else None
+
+    integrals = {}
+    for prop in properties:
+        if prop == "cv":
+            integral = np.trapezoid(wd2kt**2 * (1.0 / (sinh**2)) * dens, x=freqs)
+            integral *= const.Boltzmann * const.Avogadro
+        elif prop == "entropy":
+            integral = np.trapezoid((wd2kt * 1 / tanh - np.log(2 * sinh)) * dens, x=freqs)
+            integral *= const.Boltzmann * const.Avogadro
+        elif prop == "internal_energy":
+            integral = np.trapezoid(freqs * 1 / tanh * dens, x=freqs) / 2
+            integral *= THZ_TO_J * const.Avogadro
+        else:
+            integral = np.trapezoid(np.log(2 * sinh) * dens, x=freqs)
+            integral *= const.Boltzmann * const.Avogadro * temps
+        integrals[prop] = integral
+    return integrals
+
+
 class PhononDos(MSONable):
     """Basic DOS object. All other DOS objects are extended versions of this object."""
 
@@ -170,7 +222,9 @@ class PhononDos(MSONable):
         """Numpy array containing the list of densities corresponding to positive frequencies."""
         return self.densities[self.ind_zero_freq :]
 
-    def cv(self, temp: float | None = None, structure: Structure | None = None, **kwargs) -> float:
+    def cv(
+        self, temp: float | ArrayLike | None = None, structure: Structure | None = None, **kwargs
+    ) -> float | NDArray:
         """Constant volume specific heat C_v at temperature T obtained from the integration of the DOS.
         Only positive frequencies will be used.
         Result in J/(K*mol-c). A mol-c is the abbreviation of a mole-cell, that is, the number
@@ -179,35 +233,20 @@ class PhononDos(MSONable):
         the division is performed internally and the result is in J/(K*mol).
 
         Args:
-            temp: a temperature in K
+            temp: a temperature in K, or an array of temperatures which are all evaluated at once
             structure: the structure of the system. If not None it will be used to determine the number of
                 formula units
             **kwargs: allows passing in deprecated t parameter for temp
 
         Returns:
-            float: Constant volume specific heat C_v
+            float | NDArray: Constant volume specific heat C_v, with the same shape as temp
         """
         temp = kwargs.get("t", temp)
-        if temp == 0:
-            return 0
-
-        freqs = self._positive_frequencies
-        dens = self._positive_densities
-
-        def csch2(x):
-            return 1.0 / (np.sinh(x) ** 2)
-
-        wd2kt = freqs / (2 * BOLTZ_THZ_PER_K * temp)
-        cv = np.trapezoid(wd2kt**2 * csch2(wd2kt) * dens, x=freqs)
-        cv *= const.Boltzmann * const.Avogadro
+        return self.get_thermodynamic_properties(temp, structure, properties=("cv",))["cv"]
 
-        if structure:
-            formula_units = structure.composition.num_atoms / structure.composition.reduced_composition.num_atoms
-            cv /= formula_units
-
-        return cv
-
-    def entropy(self, temp: float | None = None, structure: Structure | None = None, **kwargs) -> float:
+    def entropy(
+        self, temp: float | ArrayLike | None = None, structure: Structure | None = None, **kwargs
+    ) -> float | NDArray:
         """Vibrational entropy at temperature T obtained from the integration of the DOS.
         Only positive frequencies will be used.
         Result in J/(K*mol-c). A mol-c is the abbreviation of a mole-cell, that is, the number
@@ -216,33 +255,20 @@ class PhononDos(MSONable):
         the division is performed internally and the result is in J/(K*mol).
 
         Args:
-            temp: a temperature in K
+            temp: a temperature in K, or an array of temperatures which are all evaluated at once
             structure: the structure of the system. If not None it will be used to determine the number of
                 formula units
             **kwargs: allows passing in deprecated t parameter for temp
 
         Returns:
-            float: Vibrational entropy
+            float | NDArray: Vibrational entropy, with the same shape as temp
         """
         temp = kwargs.get("t", temp)
-        if temp == 0:
-            return 0
-
-        freqs = self._positive_frequencies
-        dens = self._positive_densities
-
-        wd2kt = freqs / (2 * BOLTZ_THZ_PER_K * temp)
-        entropy = np.trapezoid((wd2kt * 1 / np.tanh(wd2kt) - np.log(2 * np.sinh(wd2kt))) * dens, x=freqs)
-
-        entropy *= const.Boltzmann * const.Avogadro
-
-        if structure:
-            formula_units = structure.composition.num_atoms / structure.composition.reduced_composition.num_atoms
-            entropy /= formula_units
-
-        return entropy
+        return self.get_thermodynamic_properties(temp, structure, properties=("entropy",))["entropy"]
 
-    def internal_energy(self, temp: float | None = None, structure: Structure | None = None, **kwargs) -> float:
+    def internal_energy(
+        self, temp: float | ArrayLike | None = None, structure: Structure | None = None, **kwargs
+    ) -> float | NDArray:
         """Phonon contribution to the internal energy at temperature T obtained from the integration of the DOS.
         Only positive frequencies will be used.
         Result in J/mol-c. A mol-c is the abbreviation of a mole-cell, that is, the number
@@ -251,33 +277,20 @@ class PhononDos(MSONable):
         the division is performed internally and the result is in J/mol.
 
         Args:
-            temp: a temperature in K
+            temp: a temperature in K, or an array of temperatures which are all evaluated at once
             structure: the structure of the system. If not None it will be used to determine the number of
                 formula units
             **kwargs: allows passing in deprecated t parameter for temp
 
         Returns:
-            float: Phonon contribution to the internal energy
+            float | NDArray: Phonon contribution to the internal energy, with the same shape as temp
         """
         temp = kwargs.get("t", temp)
-        if temp == 0:
-            return self.zero_point_energy(structure=structure)
+        return self.get_thermodynamic_properties(temp, structure, properties=("internal_energy",))["internal_energy"]
 
-        freqs = self._positive_frequencies
-        dens = self._positive_densities
-
-        wd2kt = freqs / (2 * BOLTZ_THZ_PER_K * temp)
-        e_phonon = np.trapezoid(freqs * 1 / np.tanh(wd2kt) * dens, x=freqs) / 2
-
-        e_phonon *= THZ_TO_J * const.Avogadro
-
-        if structure:
-            formula_units = structure.composition.num_atoms / structure.composition.reduced_composition.num_atoms
-            e_phonon /= formula_units
-
-        return e_phonon
-
-    def helmholtz_free_energy(self, temp: float | None = None, structure: Structure | None = None, **kwargs) -> float:
+    def helmholtz_free_energy(
+        self, temp: float | ArrayLike | None = None, structure: Structure | None = None, **kwargs
+    ) -> float | NDArray:
         """Phonon contribution to the Helmholtz free energy at temperature T obtained from the integration of the DOS.
         Only positive frequencies will be used.
         Result in J/mol-c. A mol-c is the abbreviation of a mole-cell, that is, the number
@@ -286,31 +299,59 @@ class PhononDos(MSONable):
         the division is performed internally and the result is in J/mol.
 
         Args:
-            temp: a temperature in K
+            temp: a temperature in K, or an array of temperatures which are all evaluated at once
             structure: the structure of the system. If not None it will be used to determine the number of
                 formula units
             **kwargs: allows passing in deprecated t parameter for temp
 
         Returns:
-            float: Phonon contribution to the Helmholtz free energy
+            float | NDArray: Phonon contribution to the Helmholtz free energy, with the same shape as temp
         """
         temp = kwargs.get("t", temp)
-        if temp == 0:
-            return self.zero_point_energy(structure=structure)
-
-        freqs = self._positive_frequencies
-        dens = self._positive_densities
+        return self.get_thermodynamic_properties(temp, structure, properties=("helmholtz_free_energy",))[
+            "helmholtz_free_energy"
+        ]
 
-        wd2kt = freqs / (2 * BOLTZ_THZ_PER_K * temp)
-        e_free = np.trapezoid(np.log(2 * np.sinh(wd2kt)) * dens, x=freqs)
+    def get_thermodynamic_properties(
+        self,
+        temps: float | ArrayLike,
+        structure: Structure | None = None,
+        properties: Sequence[str] = THERMODYNAMIC_PROPERTIES,
+    ) -> dict[str, float | NDArray]:
+        """Constant volume specific heat, vibrational entropy and the phonon contributions
+        to the internal and Helmholtz free energy on a grid of temperatures, all evaluated
+        in one broadcasted integration of the DOS. Units are as in the individual methods,
+        e.g. cv, per mol-c or, if the structure is provided, per mol of formula units.
 
-        e_free *= const.Boltzmann * const.Avogadro * temp
+        Args:
+            temps: a temperature or an array of temperatures in K.
+            structure: the structure of the system. If not None it will be used to determine the number of
+                formula units
+            properties: the properties to compute. Defaults to all of THERMODYNAMIC_PROPERTIES.
 
-        if structure:
-            formula_units = structure.composition.num_atoms / structure.composition.reduced_composition.num_atoms
-            e_free /= formula_units
+        Returns:
+            dict[str, float | NDArray]: property name to values with the same shape as temps.
+        """
+        if temps is None:
+            raise ValueError("A temperature or an array of temperatures is required")
+        temps_arr = np.asarray(temps, dtype=np.float64)
+        flat_temps = temps_arr.ravel()
+        nonzero = flat_temps != 0
+        integrals = _thermodynamic_integrals(
+            self._positive_frequencies[None], self._positive_densities[None], flat_temps[nonzero], properties
+        )
 
-        return e_free
+        results: dict[str, float | NDArray] = {}
+        for prop, integral in integrals.items():
+            values = integral[0]
+            if not nonzero.all():
+                # At T = 0, C_v and S vanish and both energies reduce to the zero point energy
+                values = np.full(len(flat_temps), self.zero_point_energy() if prop in _ZPE_PROPERTIES else 0.0)
+                values[nonzero] = integral[0]
+            if structure:
+                values /= structure.composition.num_atoms / structure.composition.reduced_composition.num_atoms
+            results[prop] = values.reshape(temps_arr.shape)[()]
+        return results
 
     def zero_point_energy(self, structure: Structure | None = None) -> float:
         """Zero point energy of the system. Only positive frequencies will be used.
@@ -565,6 +606,78 @@ class PhononDos(MSONable):
         raise ValueError("Cannot compute similarity index. When normalize=True, then please set metric=cosine-sim")
 
 
+def get_thermodynamic_properties(
+    doses: Sequence[PhononDos],
+    temps: ArrayLike,
+    structures: Sequence[Structure | None] | None = None,
+    properties: Sequence[str] = THERMODYNAMIC_PROPERTIES,
+    chunk_size: int = 2**18,
+) -> dict[str, NDArray]:
+    """Thermodynamic properties of many phonon DOSes on a temperature grid.
+
+    DOSes with the same number of positive frequencies are stacked and integrated
+    together, which gives the same values as PhononDos.get_thermodynamic_properties
+    for each DOS, without a Python loop over DOSes and temperatures.
+
+    Args:
+        doses (Sequence[PhononDos]): the phonon DOSes.
+        temps (ArrayLike): 1D array of temperatures in K.
+        structures (Sequence[Structure | None]): structures used to convert the
+            results to per mol of formula units, one per DOS. Defaults to None,
+            i.e. results per mol-c for all DOSes.
+        properties (Sequence[str]): the properties to compute. Defaults to all of
+            THERMODYNAMIC_PROPERTIES.
+        chunk_size (int): the maximum number of array elements (DOSes x temperatures
+            x frequencies) integrated at once, to bound memory use.
+
+    Returns:
+        dict[str, NDArray]: property name to an array of shape (len(doses), len(temps)).
+    """
+    temps = np.asarray(temps, dtype=np.float64)
+    if temps.ndim != 1:
+        raise ValueError(f"temps must be a 1D array, got shape {temps.shape}")
+    if structures is not None and len(structures) != len(doses):
+        raise ValueError(f"Got {len(structures)} structures for {len(doses)} DOSes")
+
+    results = {prop: np.empty((len(doses), len(temps))) for prop in properties}
+    nonzero = temps != 0
+    by_n_freqs: dict[int, list[int]] = {}
+    for idx, dos in enumerate(doses):
+        by_n_freqs.setdefault(len(dos._positive_frequencies), []).append(idx)
+
+    for n_freqs, indices in by_n_freqs.items():
+        step = max(1, chunk_size // max(1, n_freqs * len(temps)))
+        for start in range(0, len(indices), step):
+            chunk = indices[start : start + step]
+            integrals = _thermodynamic_integrals(
+                np.array([doses[idx]._positive_frequencies for idx in chunk]),
+                np.array([doses[idx]._positive_densities for idx in chunk]),
+                temps[nonzero],
+                properties,
+            )
+            for prop, integral in integrals.items():
+                results[prop][np.ix_(chunk, nonzero)] = integral
+
+    if not nonzero.all():
+        # At T = 0, C_v and S vanish and both energies reduce to the zero point energy
+        zpes = np.array([dos.zero_point_energy() for dos in doses])
+        for prop, values in results.items():
+            values[:, ~nonzero] = zpes[:, None] if prop in _ZPE_PROPERTIES else 0.0
+
+    if structures is not None:
+        formula_units = np.array(
+            [
+                structure.composition.num_atoms / structure.composition.reduced_composition.num_atoms
+                if structure
+                else 1
+                for structure in structures
+            ]
+        )
+        for values in results.values():
+            values /= formula_units[:, None]
+    return results
+
+
 class PhononDosFingerprint(NamedTuple):
     """
     Represents a Phonon Density of States (DOS) fingerprint.
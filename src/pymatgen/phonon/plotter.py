@@ -794,7 +794,7 @@ class ThermoPlotter:
 
     def _plot_thermo(
         self,
-        func: Callable[[float, Structure | None], float],
+        func: Callable[[ArrayLike, Structure | None], ArrayLike],
         temperatures: ArrayLike,
         factor: float = 1,
         ax: Axes = None,
@@ -806,8 +806,8 @@ class ThermoPlotter:
         """Plots a thermodynamic property for a generic function from a PhononDos instance.
 
         Args:
-            func (Callable[[float, Structure | None], float]): Takes a temperature and structure (in that order)
-                and returns a thermodynamic property (e.g., heat capacity, entropy, etc.).
+            func (Callable[[ArrayLike, Structure | None], ArrayLike]): Takes an array of temperatures and a structure
+                (in that order) and returns a thermodynamic property (e.g., heat capacity, entropy, etc.) for each.
             temperatures (list[float]): temperatures (in K) at which to evaluate func.
             factor: a multiplicative factor applied to the thermodynamic property calculated. Used to change
                 the units. Defaults to 1.
@@ -822,10 +822,8 @@ class ThermoPlotter:
         """
         ax, fig = get_ax_fig(ax)
 
-        values = []
-
-        for temp in temperatures:
-            values.append(func(temp, self.structure) * factor)  # type:ignore[arg-type]
+        # The PhononDos methods evaluate the whole temperature grid at once
+        values = func(np.asarray(temperatures), self.structure) * factor  # type:ignore[arg-type]
 
         ax.plot(temperatures, values, label=label, **kwargs)
 
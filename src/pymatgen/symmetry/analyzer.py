@@ -11,21 +11,28 @@ v3.0 - pymatgen no longer ships with spglib. Instead, spglib (the python
 from __future__ import annotations
 
 import copy
+import hashlib
 import itertools
 import logging
 import math
+import os
+import pickle
+import tempfile
+import threading
 import warnings
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from collections.abc import Sequence
 from fractions import Fraction
-from functools import lru_cache
 from math import cos, sin
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import numpy as np
 import scipy.cluster
 import spglib
+from joblib import Parallel, delayed
 
+from pymatgen.core import SETTINGS
 from pymatgen.core.lattice import Lattice
 from pymatgen.core.operations import SymmOp
 from pymatgen.core.structure import Molecule, PeriodicSite, Structure
@@ -34,10 +41,12 @@ from pymatgen.util.coord import find_in_coord_list, pbc_diff
 from pymatgen.util.due import Doi, due
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from typing import Any, Literal
 
-    from numpy.typing import NDArray
+    from numpy.typing import ArrayLike, NDArray
     from spglib import SpglibDataset
+    from typing_extensions import Self
 
     from pymatgen.core import Element, IStructure, Species
     from pymatgen.core.sites import Site
@@ -70,17 +79,201 @@ class SymmetryUndeterminedError(ValueError):
     """
 
 
-@lru_cache(maxsize=32)
-def _get_symmetry_dataset(cell, symprec, angle_tolerance):
-    """Simple wrapper to cache results of spglib.get_symmetry_dataset since this call is
-    expensive.
+class SymmetryDatasetCache:
+    """Size-bounded LRU cache of spglib symmetry datasets, shared by all SpacegroupAnalyzer instances (and
+    hence by everything built on them, e.g. XRDCalculator, RemoveDuplicatesFilter, SlabGenerator, KPath or
+    the input sets).
+
+    The datasets are keyed by a digest of the spglib cell and of the tolerances. If cache_dir is set, they
+    are also pickled to that directory so that they persist across processes and sessions. The number of
+    datasets kept in memory and on disk is bounded by maxsize, the least recently used ones being evicted
+    first.
+
+    The default instance, SYMMETRY_DATASET_CACHE, is configured with the SYMMETRY_DATASET_CACHE_SIZE and
+    SYMMETRY_DATASET_CACHE_DIR settings and can be reconfigured at runtime through its attributes.
     """
+
+    SUFFIX = ".spglib.pkl"
+
+    def __init__(self, maxsize: int = 256, cache_dir: str | Path | None = None) -> None:
+        """
+        Args:
+            maxsize (int): Maximum number of datasets kept. 0 disables the cache.
+            cache_dir (str | Path | None): Directory where the datasets are persisted. None to keep
+                them in memory only.
+        """
+        self._datasets: OrderedDict[str, SpglibDataset] = OrderedDict()
+        self._lock = threading.Lock()
+        self._maxsize = maxsize
+        self.cache_dir = cache_dir
+
+    @property
+    def maxsize(self) -> int:
+        """Maximum number of datasets kept in memory and on disk."""
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        with self._lock:
+            self._evict()
+        self._evict_disk()
+
+    @property
+    def cache_dir(self) -> Path | None:
+        """Directory where the datasets are persisted, None if they are kept in memory only."""
+        return self._cache_dir
+
+    @cache_dir.setter
+    def cache_dir(self, cache_dir: str | Path | None) -> None:
+        self._cache_dir = None if cache_dir is None else Path(cache_dir).expanduser()
+        if self._cache_dir is not None:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def digest(
+        lattice: ArrayLike,
+        frac_coords: ArrayLike,
+        numbers: ArrayLike,
+        magmoms: ArrayLike,
+        *,
+        symprec: float,
+        angle_tolerance: float,
+    ) -> str:
+        """Digest of a spglib cell and of the symmetry tolerances. Hashing the raw bytes of the arrays is
+        much cheaper than hashing nested tuples of floats.
+
+        Args:
+            lattice (ArrayLike): Lattice matrix.
+            frac_coords (ArrayLike): Fractional coordinates of the sites.
+            numbers (ArrayLike): Integers identifying the species of the sites.
+            magmoms (ArrayLike): Magnetic moments of the sites, empty if there are none.
+            symprec (float): Distance tolerance.
+            angle_tolerance (float): Angle tolerance.
+
+        Returns:
+            str: Hexadecimal digest.
+        """
+        hasher = hashlib.blake2b(digest_size=20)
+        for array in (lattice, frac_coords, numbers, magmoms):
+            array = np.ascontiguousarray(array, dtype=float)
+            hasher.update(str(array.shape).encode())
+            hasher.update(array.tobytes())
+        hasher.update(f"{symprec!r}/{angle_tolerance!r}/{spglib.__version__}".encode())
+        return hasher.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self._cache_dir / f"{key}{self.SUFFIX}"  # type: ignore[operator]
+
+    def get(self, key: str) -> SpglibDataset | None:
+        """Get a dataset from the cache.
+
+        Args:
+            key (str): Digest of the cell, see SymmetryDatasetCache.digest.
+
+        Returns:
+            SpglibDataset | None: The dataset, None if it is not in the cache.
+        """
+        with self._lock:
+            if key in self._datasets:
+                self._datasets.move_to_end(key)
+                return self._datasets[key]
+        if self._cache_dir is None or self.maxsize <= 0:
+            return None
+
+        path = self._path(key)
+        try:
+            with open(path, "rb") as file:
+                dataset = pickle.load(file)  # noqa: S301
+            os.utime(path)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+        with self._lock:
+            self._datasets[key] = dataset
+            self._evict()
+        return dataset
+
+    def put(self, key: str, dataset: SpglibDataset) -> None:
+        """Store a dataset in the cache.
+
+        Args:
+            key (str): Digest of the cell, see SymmetryDatasetCache.digest.
+            dataset (SpglibDataset): Symmetry dataset of the cell.
+        """
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._datasets[key] = dataset
+            self._datasets.move_to_end(key)
+            self._evict()
+        if self._cache_dir is None:
+            return
+
+        fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                pickle.dump(dataset, file)
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            Path(tmp_path).unlink(missing_ok=True)
+            return
+        self._evict_disk()
+
+    def _evict(self) -> None:
+        while len(self._datasets) > max(self.maxsize, 0):
+            self._datasets.popitem(last=False)
+
+    def _evict_disk(self) -> None:
+        if self._cache_dir is None:
+            return
+        mtimes = {}
+        for path in self._cache_dir.glob(f"*{self.SUFFIX}"):
+            try:
+                mtimes[path] = path.stat().st_mtime
+            except FileNotFoundError:  # removed by another process
+                continue
+        for path in sorted(mtimes, key=mtimes.__getitem__)[: max(len(mtimes) - max(self.maxsize, 0), 0)]:
+            path.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Remove all the datasets from the cache, including the ones persisted on disk."""
+        with self._lock:
+            self._datasets.clear()
+        if self._cache_dir is not None:
+            for path in self._cache_dir.glob(f"*{self.SUFFIX}"):
+                path.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._datasets)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._datasets
+
+
+SYMMETRY_DATASET_CACHE = SymmetryDatasetCache(
+    maxsize=SETTINGS.get("SYMMETRY_DATASET_CACHE_SIZE", 256),
+    cache_dir=SETTINGS.get("SYMMETRY_DATASET_CACHE_DIR"),
+)
+
+
+def _compute_symmetry_dataset(cell, symprec, angle_tolerance):
     dataset = spglib.get_symmetry_dataset(cell, symprec=symprec, angle_tolerance=angle_tolerance)
     if dataset is None:
         raise SymmetryUndeterminedError(spglib.get_error_message())
     return dataset
 
 
+def _get_symmetry_dataset(cell, symprec, angle_tolerance, key):
+    """Get the results of spglib.get_symmetry_dataset from SYMMETRY_DATASET_CACHE since this call is
+    expensive.
+    """
+    dataset = SYMMETRY_DATASET_CACHE.get(key)
+    if dataset is None:
+        dataset = _compute_symmetry_dataset(cell, symprec, angle_tolerance)
+        SYMMETRY_DATASET_CACHE.put(key, dataset)
+    return dataset
+
+
 class SpacegroupAnalyzer:
     """Takes a pymatgen Structure object and a symprec.
 
@@ -105,6 +298,11 @@ class SpacegroupAnalyzer:
                 Project) is often needed.
             angle_tolerance (float): Angle tolerance for symmetry finding. Defaults to 5 degrees.
         """
+        self._init_cell(structure, symprec, angle_tolerance)
+        self._space_group_data = _get_symmetry_dataset(self._cell, symprec, angle_tolerance, self._cache_key)
+
+    def _init_cell(self, structure: Structure | IStructure, symprec: float, angle_tolerance: float) -> None:
+        """Set up everything but the symmetry dataset."""
         self._symprec = symprec
         self._angle_tol = angle_tolerance
         self._structure = structure
@@ -148,8 +346,67 @@ class SpacegroupAnalyzer:
                 tuple(map(tuple, structure.frac_coords.tolist())),
                 tuple(zs),
             )
+        self._cache_key = SymmetryDatasetCache.digest(
+            structure.lattice.matrix,
+            structure.frac_coords,
+            zs,
+            self._cell[3] if len(magmoms) > 0 else (),
+            symprec=symprec,
+            angle_tolerance=angle_tolerance,
+        )
+
+    @classmethod
+    def analyze_many(
+        cls,
+        structures: Iterable[Structure | IStructure],
+        symprec: float = 0.01,
+        angle_tolerance: float = 5,
+        n_jobs: int = 1,
+    ) -> list[Self]:
+        """Analyze the symmetry of many structures, computing in parallel the symmetry datasets that are
+        not in SYMMETRY_DATASET_CACHE yet. Identical structures are only analyzed once.
+
+        Args:
+            structures (Iterable[Structure | IStructure]): Structures to find the symmetry of.
+            symprec (float): Tolerance for symmetry finding, see SpacegroupAnalyzer.
+            angle_tolerance (float): Angle tolerance for symmetry finding. Defaults to 5 degrees.
+            n_jobs (int): Number of parallel jobs computing the symmetry datasets. -1 uses all CPUs.
+
+        Raises:
+            SymmetryUndeterminedError: If the symmetry of one of the structures cannot be determined.
+
+        Returns:
+            list[SpacegroupAnalyzer]: Analyzers of the structures, in the same order. Their symmetry
+                datasets are also available from SpacegroupAnalyzer.get_symmetry_dataset.
+        """
+        analyzers = []
+        for structure in structures:
+            analyzer = cls.__new__(cls)
+            analyzer._init_cell(structure, symprec, angle_tolerance)
+            analyzers.append(analyzer)
+
+        datasets: dict[str, SpglibDataset | None] = {}
+        missing: dict[str, tuple] = {}
+        for analyzer in analyzers:
+            key = analyzer._cache_key
+            if key not in datasets:
+                datasets[key] = SYMMETRY_DATASET_CACHE.get(key)
+                if datasets[key] is None:
+                    missing[key] = analyzer._cell
+
+        if n_jobs == 1:
+            computed = [_compute_symmetry_dataset(cell, symprec, angle_tolerance) for cell in missing.values()]
+        else:
+            computed = Parallel(n_jobs=n_jobs)(
+                delayed(_compute_symmetry_dataset)(cell, symprec, angle_tolerance) for cell in missing.values()
+            )
+        for key, dataset in zip(missing, computed, strict=True):
+            datasets[key] = dataset
+            SYMMETRY_DATASET_CACHE.put(key, dataset)
 
-        self._space_group_data = _get_symmetry_dataset(self._cell, symprec, angle_tolerance)
+        for analyzer in analyzers:
+            analyzer._space_group_data = datasets[analyzer._cache_key]
+        return analyzers
 
     def get_space_group_symbol(self) -> str:
         """Get the spacegroup symbol (e.g., Pnma) for structure.
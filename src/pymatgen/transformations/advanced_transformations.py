@@ -2,19 +2,23 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 import math
 import warnings
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from fractions import Fraction
 from itertools import groupby, product
 from string import ascii_lowercase
 from typing import TYPE_CHECKING
 
 import numpy as np
-from joblib import Parallel, delayed
+from joblib import Parallel, delayed, effective_n_jobs
 from monty.dev import requires
 from monty.fractions import lcm
-from monty.json import MSONable
+from monty.json import MontyEncoder, MSONable
 
 from pymatgen.analysis.adsorption import AdsorbateSiteFinder
 from pymatgen.analysis.bond_valence import BVAnalyzer
@@ -23,9 +27,10 @@ from pymatgen.analysis.ewald import EwaldSummation
 from pymatgen.analysis.local_env import MinimumDistanceNN
 from pymatgen.analysis.structure_matcher import SpinComparator, StructureMatcher
 from pymatgen.analysis.structure_prediction.substitution_probability import SubstitutionPredictor
+from pymatgen.command_line import enumlib_caller
 from pymatgen.command_line.enumlib_caller import EnumError, EnumlibAdaptor
 from pymatgen.command_line.mcsqs_caller import run_mcsqs
-from pymatgen.core import DummySpecies, Element, Species, Structure, get_el_sp
+from pymatgen.core import SETTINGS, DummySpecies, Element, Species, Structure, get_el_sp
 from pymatgen.core.interface import GrainBoundaryGenerator
 from pymatgen.core.surface import SlabGenerator
 from pymatgen.electronic_structure.core import Spin
@@ -46,7 +51,7 @@ except ImportError:
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Iterable, Sequence
-    from typing import Any, Literal
+    from typing import Any, ClassVar, Literal
 
     from numpy.typing import NDArray
 
@@ -247,8 +252,17 @@ class EnumerateStructureTransformation(AbstractTransformation):
     """Order a disordered structure using enumlib. For complete orderings, this
     generally produces fewer structures that the OrderDisorderedStructure
     transformation, and at a much faster speed.
+
+    The enumerated structures, and their ranking by a sort criterion given as a
+    string, are kept in an in-memory cache keyed by the (refined) disordered
+    structure and the enumeration parameters, so that repeated enumerations of
+    the same structure return immediately. Its size is set by the
+    ENUMERATION_CACHE_SIZE setting or the enumeration_cache_size attribute.
     """
 
+    enumeration_cache_size: ClassVar[int] = SETTINGS.get("ENUMERATION_CACHE_SIZE", 64)
+    _enumeration_cache: ClassVar[OrderedDict[tuple, dict]] = OrderedDict()
+
     def __init__(
         self,
         min_cell_size: int = 1,
@@ -306,8 +320,9 @@ class EnumerateStructureTransformation(AbstractTransformation):
                 speeds up the subsequent DFT calculations. Alternatively, a callable can be supplied that returns a
                 (Structure, energy) tuple.
             timeout (float): timeout in minutes to pass to EnumlibAdaptor.
-            n_jobs (int): Number of parallel jobs used to compute energy criteria. This is used only when the Ewald
-                or m3gnet or callable sort_criteria is used. Default is -1, which uses all available CPUs.
+            n_jobs (int): Number of parallel jobs used to compute energy criteria, when the Ewald or m3gnet or
+                callable sort_criteria is used, and to run enumlib for several cell sizes at once, when
+                max_disordered_sites is used. Default is -1, which uses all available CPUs.
         """
         self.symm_prec = symm_prec
         self.min_cell_size = min_cell_size
@@ -359,28 +374,80 @@ class EnumerateStructureTransformation(AbstractTransformation):
 
         contains_oxidation_state = all(hasattr(sp, "oxi_state") and sp.oxi_state != 0 for sp in structure.elements)
 
-        structures = None
-
         if structure.is_ordered:
             warnings.warn(
                 f"Enumeration skipped for structure with composition {structure.composition} because it is ordered",
                 stacklevel=2,
             )
-            structures = [structure.copy()]
 
         if self.max_disordered_sites:
             n_disordered = sum(1 for site in structure if not site.is_ordered)
             if n_disordered > self.max_disordered_sites:
                 raise ValueError(f"Too many disordered sites! ({n_disordered} > {self.max_disordered_sites})")
-            max_cell_sizes: Iterable[int] = range(
+            max_cell_sizes: Sequence[int] = range(
                 self.min_cell_size,
                 math.floor(self.max_disordered_sites / n_disordered) + 1,
             )
         else:
             max_cell_sizes = [self.max_cell_size]
 
-        for max_cell_size in max_cell_sizes:
-            adaptor = EnumlibAdaptor(
+        cache_key = self._get_cache_key(structure, max_cell_sizes)
+        cached = self._enumeration_cache.get(cache_key)
+        if cached is not None:
+            self._enumeration_cache.move_to_end(cache_key)
+            structures = cached["structures"]
+        elif (structures := self._enumerate(structure, max_cell_sizes)) is not None:  # type: ignore[assignment]
+            cached = {"structures": structures, "ranked": {}}
+            self._enumeration_cache[cache_key] = cached
+            while len(self._enumeration_cache) > max(self.enumeration_cache_size, 0):
+                self._enumeration_cache.popitem(last=False)
+        elif structure.is_ordered:
+            structures = [structure.copy()]
+        else:
+            raise ValueError("Unable to enumerate")
+
+        # Rankings by a custom callable are not cached, it may not be deterministic
+        sort_key = self.sort_criteria if isinstance(self.sort_criteria, str) else None
+        if cached is not None and sort_key in cached["ranked"]:
+            all_structures = cached["ranked"][sort_key]
+        else:
+            all_structures = self._rank_structures(structure, structures, contains_oxidation_state)
+            if cached is not None and sort_key is not None:
+                cached["ranked"][sort_key] = all_structures
+
+        # The cached structures must not be modified
+        self._all_structures = [{**dct, "structure": dct["structure"].copy()} for dct in all_structures]
+
+        if return_ranked_list:
+            return self._all_structures[:num_to_return]
+        return self._all_structures[0]["structure"]
+
+    def _get_cache_key(self, structure: Structure, max_cell_sizes: Sequence[int]) -> tuple:
+        """Key of the enumeration cache: a digest of the structure to enumerate, the
+        enumeration parameters and the enumlib executables.
+        """
+        structure_json = json.dumps(structure.as_dict(), cls=MontyEncoder, sort_keys=True)
+        return (
+            hashlib.sha256(structure_json.encode()).hexdigest(),
+            self.min_cell_size,
+            tuple(max_cell_sizes),
+            self.symm_prec,
+            self.enum_precision_parameter,
+            self.check_ordered_symmetry,
+            enumlib_caller.ENUM_CMD,
+            enumlib_caller.MAKESTR_CMD,
+        )
+
+    def _enumerate(self, structure: Structure, max_cell_sizes: Sequence[int]) -> list[Structure] | None:
+        """Enumerate the orderings of a structure with the smallest of max_cell_sizes for which
+        enumlib finds any. Several cell sizes are enumerated concurrently if n_jobs allows it,
+        the runs with larger cell sizes are killed once a smaller one has succeeded.
+
+        Returns:
+            list[Structure] | None: Ordered structures, None if the enumeration failed for all cell sizes.
+        """
+        adaptors = [
+            EnumlibAdaptor(
                 structure,
                 min_cell_size=self.min_cell_size,
                 max_cell_size=max_cell_size,
@@ -390,20 +457,49 @@ class EnumerateStructureTransformation(AbstractTransformation):
                 check_ordered_symmetry=self.check_ordered_symmetry,
                 timeout=self.timeout,
             )
-            try:
-                adaptor.run()
-                structures = adaptor.structures
+            for max_cell_size in max_cell_sizes
+        ]
+
+        def first_enumeration(results: Iterable[list[Structure] | None]) -> list[Structure] | None:
+            for adaptor, structures in zip(adaptors, results, strict=False):
                 if structures:
-                    break
-            except EnumError:
-                warnings.warn(f"Unable to enumerate for {max_cell_size = }", stacklevel=2)
+                    return structures
+                if structures is None:
+                    warnings.warn(f"Unable to enumerate for max_cell_size = {adaptor.max_cell_size}", stacklevel=3)
+            return None
 
-        if structures is None:
-            raise ValueError("Unable to enumerate")
+        n_workers = min(len(adaptors), effective_n_jobs(self.n_jobs))
+        if n_workers <= 1:
+            return first_enumeration(map(_run_enumlib, adaptors))
+
+        # enumlib runs in subprocesses, threads are enough to run several of them at once
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            futures = [executor.submit(_run_enumlib, adaptor) for adaptor in adaptors]
+            try:
+                return first_enumeration(future.result() for future in futures)
+            finally:
+                for future, adaptor in zip(futures, adaptors, strict=True):
+                    future.cancel()
+                    adaptor.kill()
+
+    def _rank_structures(
+        self, structure: Structure, structures: list[Structure], contains_oxidation_state: bool
+    ) -> list[dict]:
+        """Rank the enumerated structures according to sort_criteria."""
+        if isinstance(self.sort_criteria, str) and self.sort_criteria == "ewald" and contains_oxidation_state:
+            energies = self._get_ewald_energies(structure, structures)
+            all_structures = [
+                {"num_sites": len(struct), "energy": energy, "structure": struct}
+                for struct, energy in zip(structures, energies, strict=True)
+            ]
+            return sorted(all_structures, key=lambda dct: dct["energy"] / dct["num_sites"])
+
+        if not callable(self.sort_criteria) and not self.sort_criteria.startswith("m3gnet"):
+            return sorted(
+                ({"num_sites": len(struct), "structure": struct} for struct in structures),
+                key=lambda dct: dct["num_sites"],
+            )
 
-        original_latt = structure.lattice
-        inv_latt = np.linalg.inv(original_latt.matrix)
-        ewald_matrices = {}
         m3gnet_model: Relaxer | M3GNetCalculator | None = None
 
         if not callable(self.sort_criteria) and self.sort_criteria.startswith("m3gnet"):
@@ -425,58 +521,93 @@ class EnumerateStructureTransformation(AbstractTransformation):
                     "energy": energy,
                     "structure": struct,
                 }
-            if contains_oxidation_state and self.sort_criteria == "ewald":
-                new_latt = struct.lattice
-                transformation = np.dot(new_latt.matrix, inv_latt)
-                transformation = tuple(tuple(round(cell) for cell in row) for row in transformation)
-                if transformation not in ewald_matrices:
-                    s_supercell = structure * transformation
-                    ewald = EwaldSummation(s_supercell)
-                    ewald_matrices[transformation] = ewald
-                else:
-                    ewald = ewald_matrices[transformation]
-                energy = ewald.compute_sub_structure(struct)
-                return {"num_sites": len(struct), "energy": energy, "structure": struct}
-            if self.sort_criteria.startswith("m3gnet"):
-                if self.sort_criteria == "m3gnet_relax":
-                    relax_results = m3gnet_model.relax(struct)
-                    energy = float(relax_results["trajectory"].energies[-1])
-                    struct = relax_results["final_structure"]
-
-                elif self.sort_criteria == "m3gnet":
-                    atoms = AseAtomsAdaptor().get_atoms(struct)
-                    m3gnet_model.calculate(atoms)
-                    energy = float(m3gnet_model.results["energy"])
-
-                else:
-                    raise ValueError("Unsupported sort criteria.")
-
-                return {"num_sites": len(struct), "energy": energy, "structure": struct}
+            if self.sort_criteria == "m3gnet_relax":
+                relax_results = m3gnet_model.relax(struct)
+                energy = float(relax_results["trajectory"].energies[-1])
+                struct = relax_results["final_structure"]
 
-            return {"num_sites": len(struct), "structure": struct}
+            elif self.sort_criteria == "m3gnet":
+                atoms = AseAtomsAdaptor().get_atoms(struct)
+                m3gnet_model.calculate(atoms)
+                energy = float(m3gnet_model.results["energy"])
 
-        all_structures = Parallel(n_jobs=self.n_jobs)(delayed(_get_stats)(struct) for struct in structures)
+            else:
+                raise ValueError("Unsupported sort criteria.")
+
+            return {"num_sites": len(struct), "energy": energy, "structure": struct}
+
+        # Copies, as the structures may be cached and the criteria may work in place
+        all_structures = Parallel(n_jobs=self.n_jobs)(delayed(_get_stats)(struct.copy()) for struct in structures)
+        return sorted(all_structures, key=lambda dct: dct["energy"] / dct["num_sites"])
+
+    def _get_ewald_energies(self, structure: Structure, structures: list[Structure]) -> list[float]:
+        """Ewald energies of the enumerated structures. The structures are grouped by supercell of
+        the disordered structure, so that the Ewald summation of each supercell is computed once per
+        chunk of structures rather than once per structure, and the chunks are spread over n_jobs
+        processes.
+        """
+        inv_latt = np.linalg.inv(structure.lattice.matrix)
+        groups: dict[tuple, list[int]] = {}
+        for idx, struct in enumerate(structures):
+            transformation = np.dot(struct.lattice.matrix, inv_latt)
+            groups.setdefault(tuple(tuple(round(cell) for cell in row) for row in transformation), []).append(idx)
+
+        n_jobs = effective_n_jobs(self.n_jobs)
+        chunk_size = max(1, math.ceil(len(structures) / n_jobs))
+        chunks = [
+            (scaling_matrix, indices[start : start + chunk_size])
+            for scaling_matrix, indices in groups.items()
+            for start in range(0, len(indices), chunk_size)
+        ]
+        tasks = (
+            delayed(_get_sub_structure_energies)(structure, scaling_matrix, [structures[idx] for idx in indices])
+            for scaling_matrix, indices in chunks
+        )
+        if n_jobs == 1 or len(chunks) == 1:
+            results = [func(*args, **kwargs) for func, args, kwargs in tasks]
+        else:
+            results = Parallel(n_jobs=min(n_jobs, len(chunks)))(tasks)
 
-        def sort_func(struct):
-            return (
-                struct["energy"] / struct["num_sites"]
-                if callable(self.sort_criteria)
-                or self.sort_criteria.startswith("m3gnet")
-                or (contains_oxidation_state and self.sort_criteria == "ewald")
-                else struct["num_sites"]
-            )
+        energies = [0.0] * len(structures)
+        for (_scaling_matrix, indices), chunk_energies in zip(chunks, results, strict=True):
+            for idx, energy in zip(indices, chunk_energies, strict=True):
+                energies[idx] = energy
+        return energies
 
-        self._all_structures = sorted(all_structures, key=sort_func)
-
-        if return_ranked_list:
-            return self._all_structures[:num_to_return]
-        return self._all_structures[0]["structure"]
+    @classmethod
+    def clear_enumeration_cache(cls) -> None:
+        """Remove all the enumerations from the cache."""
+        cls._enumeration_cache.clear()
 
     @property
     def is_one_to_many(self) -> Literal[True]:
         """Transform one structure to many."""
         return True
 
+    @property
+    def use_multiprocessing(self) -> bool:
+        """The transformation can be applied to many structures in parallel by a transmuter,
+        unless it uses a custom sort criterion, which may not be picklable.
+        """
+        return isinstance(self.sort_criteria, str)
+
+
+def _run_enumlib(adaptor: EnumlibAdaptor) -> list[Structure] | None:
+    """Run an enumeration, returning None if it failed."""
+    try:
+        adaptor.run()
+    except EnumError:
+        return None
+    return adaptor.structures
+
+
+def _get_sub_structure_energies(
+    structure: Structure, scaling_matrix: tuple, sub_structures: list[Structure]
+) -> list[float]:
+    """Ewald energies of ordered sub-structures of the same supercell of a disordered structure."""
+    ewald = EwaldSummation(structure * scaling_matrix)
+    return [ewald.compute_sub_structure(struct) for struct in sub_structures]
+
 
 class SubstitutionPredictorTransformation(AbstractTransformation):
     """This transformation takes a structure and uses the structure
@@ -537,6 +668,11 @@ class SubstitutionPredictorTransformation(AbstractTransformation):
         """Transform one structure to many."""
         return True
 
+    @property
+    def use_multiprocessing(self) -> bool:
+        """The transformation can be applied to many structures in parallel by a transmuter."""
+        return True
+
 
 class MagOrderParameterConstraint(MSONable):
     """This class can be used to supply MagOrderingTransformation
@@ -900,6 +1036,11 @@ class MagOrderingTransformation(AbstractTransformation):
         """Transform one structure to many."""
         return True
 
+    @property
+    def use_multiprocessing(self) -> bool:
+        """The transformation can be applied to many structures in parallel by a transmuter."""
+        return True
+
 
 def find_codopant(
     target: Species,
@@ -649,9 +649,16 @@ class OrderDisorderedStructureTransformation(AbstractTransformation):
         """Transform one structure to many."""
         return True
 
+    @property
+    def use_multiprocessing(self) -> bool:
+        """The transformation can be applied to many structures in parallel by a transmuter."""
+        return True
+
     @property
     def lowest_energy_structure(self):
-        """Lowest energy structure found."""
+        """Lowest energy structure found by the last apply_transformation call. It is not set
+        when a transmuter with ncores applies the transformation, as that runs on copies.
+        """
         return self._all_structures[0]["structure"]
 
 
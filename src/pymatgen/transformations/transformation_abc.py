@@ -69,6 +69,8 @@ class AbstractTransformation(MSONable, abc.ABC):
     def use_multiprocessing(self) -> bool:
         """Indicates whether the transformation can be applied by a
         subprocessing pool. This should be overridden to return True for
-        transformations that the transmuter can parallelize.
+        transformations that the transmuter can parallelize. The pool applies
+        pickled copies of the transformation, so any state that
+        apply_transformation sets on the instance is not updated.
         """
         return False
@@ -38,15 +38,25 @@ Functions for hashing graphs to strings.
 Isomorphic graphs should be assigned identical hashes.
 For now, only Weisfeiler-Lehman hashing is implemented.
 
+The node labels are refined on integer label ids and compressed sparse row
+(CSR) adjacency arrays, so that the neighborhoods of all the nodes (of all the
+graphs hashed together) are sorted and deduplicated in NumPy and every distinct
+neighborhood is hashed only once. The hashes are the same as those of the
+NetworkX implementation.
+
 """
 
 from __future__ import annotations
 
-from collections import Counter, defaultdict
+from collections import defaultdict
 from hashlib import blake2b
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
     import networkx as nx
 
 
@@ -62,15 +72,125 @@ def _init_node_labels(graph: nx.Graph, edge_attr, node_attr):
     return {u: str(deg) for u, deg in graph.degree()}
 
 
-def _neighborhood_aggregate(graph: nx.Graph, node, node_labels, edge_attr=None):
-    """Compute new labels for given node by aggregating
-    the labels of each node's neighbors.
+def _csr_adjacency(graph: nx.Graph, edge_attr, edge_label_ids):
+    """Get the degrees of the nodes of a graph and the indices of their neighbors
+    (as in a CSR matrix), in the order of the nodes, and if edge_attr is given, the
+    ids of the labels of the edges in edge_label_ids.
+    """
+    node_ids = {node: idx for idx, node in enumerate(graph)}
+    degrees: list[int] = []
+    indices: list[int] = []
+    edge_labels: list[int] = []
+    for _, nbrs in graph.adjacency():
+        n_indices = len(indices)
+        if edge_attr is None:
+            indices.extend(map(node_ids.__getitem__, nbrs))
+        else:
+            for nbr, data in nbrs.items():
+                indices.append(node_ids[nbr])
+                edge_labels.append(edge_label_ids.setdefault(str(data[edge_attr]), len(edge_label_ids)))
+        degrees.append(len(indices) - n_indices)
+    return degrees, indices, edge_labels
+
+
+def _unique_rows(array):
+    """Find the unique rows of an integer array, as np.unique(array, axis=0,
+    return_inverse=True) but in any order. The rows are compared through 64-bit
+    polynomial fingerprints, which are checked for collisions.
     """
-    label_list = []
-    for nbr in graph.neighbors(node):
-        prefix = "" if edge_attr is None else str(graph[node][nbr][edge_attr])
-        label_list.append(prefix + node_labels[nbr])
-    return node_labels[node] + "".join(sorted(label_list))
+    fingerprints = np.zeros(len(array), dtype=np.uint64)
+    for column in array.T.astype(np.uint64):
+        fingerprints = fingerprints * np.uint64(1_000_003) + column
+    _, first, inverse = np.unique(fingerprints, return_index=True, return_inverse=True)
+    unique = array[first]
+    if not np.array_equal(unique[inverse], array):
+        unique, inverse = np.unique(array, axis=0, return_inverse=True)
+    return unique, inverse.reshape(-1)
+
+
+def _weisfeiler_lehman_labels(graphs: list[nx.Graph], edge_attr, node_attr, iterations, digest_size):
+    """Refine the node labels of several graphs at once.
+
+    The labels are stored as integer ids. At every iteration, the neighborhood of
+    each node is written as a row of its label id followed by the sorted (edge
+    label and) neighbor label ids, so that the distinct neighborhoods of all the
+    graphs are found at once. Only those are aggregated into strings and hashed,
+    as in _neighborhood_aggregate.
+
+    Returns:
+        tuple[np.ndarray, list[np.ndarray], list[str]]: The index of the first
+            node of every graph (followed by the total number of nodes), the label
+            ids of all the nodes after every iteration and the label of every id.
+    """
+    labels: list[str] = []
+    label_ids: dict[str, int] = {}
+
+    def get_label_id(label):
+        label_id = label_ids.setdefault(label, len(labels))
+        if label_id == len(labels):
+            labels.append(label)
+        return label_id
+
+    edge_label_ids: dict[str, int] = {}
+    node_offsets = [0]
+    node_labels: list[int] = []
+    degrees: list[int] = []
+    indices: list[int] = []
+    edge_labels: list[int] = []
+    n_graph_edges = []
+    for graph in graphs:
+        graph_degrees, graph_indices, graph_edge_labels = _csr_adjacency(graph, edge_attr, edge_label_ids)
+        node_labels.extend(map(get_label_id, _init_node_labels(graph, edge_attr, node_attr).values()))
+        degrees.extend(graph_degrees)
+        indices.extend(graph_indices)
+        n_graph_edges.append(len(graph_indices))
+        edge_labels.extend(graph_edge_labels)
+        node_offsets.append(len(node_labels))
+
+    n_nodes = len(node_labels)
+    current = np.array(node_labels, dtype=int)
+    degrees = np.array(degrees, dtype=int)
+    # indices of the neighbors among the nodes of all the graphs
+    indices = np.array(indices, dtype=int) + np.repeat(np.array(node_offsets[:-1], dtype=int), n_graph_edges)
+    edge_labels = np.array(edge_labels, dtype=int)
+    edge_strings = list(edge_label_ids)
+
+    # neighbors are stored by node, so sorting them by node keeps them in place
+    rows = np.repeat(np.arange(n_nodes), degrees)
+    columns = np.arange(len(indices)) - np.repeat(np.cumsum(degrees) - degrees, degrees)
+    max_degree = int(degrees.max(initial=0))
+
+    history = []
+    for _ in range(iterations):
+        nbr_labels = current[indices]
+        if edge_attr is None:
+            order = np.lexsort((nbr_labels, rows))
+            neighborhoods = np.full((n_nodes, 1 + max_degree), -1)
+            neighborhoods[rows, 1 + columns] = nbr_labels[order]
+        else:
+            order = np.lexsort((nbr_labels, edge_labels, rows))
+            neighborhoods = np.full((n_nodes, 1 + 2 * max_degree), -1)
+            neighborhoods[rows, 1 + 2 * columns] = edge_labels[order]
+            neighborhoods[rows, 2 + 2 * columns] = nbr_labels[order]
+        neighborhoods[:, 0] = current
+        unique, inverse = _unique_rows(neighborhoods)
+
+        new_ids = []
+        for own, *neighborhood in unique.tolist():
+            if edge_attr is None:
+                nbr_label_list = [labels[nbr] for nbr in neighborhood if nbr >= 0]
+            else:
+                nbr_label_list = [
+                    edge_strings[edge] + labels[nbr]
+                    for edge, nbr in zip(neighborhood[::2], neighborhood[1::2], strict=True)
+                    if edge >= 0
+                ]
+            label = labels[own] + "".join(sorted(nbr_label_list))
+            new_ids.append(get_label_id(_hash_label(label, digest_size)))
+        current = np.array(new_ids, dtype=int)[inverse]
+        history.append(current)
+
+    return np.array(node_offsets), history, labels
 
 
 def weisfeiler_lehman_graph_hash(graph: nx.Graph, edge_attr=None, node_attr=None, iterations=3, digest_size=16):
@@ -122,30 +242,102 @@ def weisfeiler_lehman_graph_hash(graph: nx.Graph, edge_attr=None, node_attr=None
     See Also:
         weisfeiler_lehman_subgraph_hashes
     """
+    return weisfeiler_lehman_graph_hashes([graph], edge_attr, node_attr, iterations, digest_size)[0]
 
-    def weisfeiler_lehman_step(G, labels, edge_attr=None):
-        """Apply neighborhood aggregation to each node
-        in the graph.
-        Computes a dictionary with labels for each node.
-        """
-        new_labels = {}
-        for node in G.nodes():
-            label = _neighborhood_aggregate(G, node, labels, edge_attr=edge_attr)
-            new_labels[node] = _hash_label(label, digest_size)
-        return new_labels
-
-    # set initial node labels
-    node_labels = _init_node_labels(graph, edge_attr, node_attr)
-
-    subgraph_hash_counts = []
-    for _ in range(iterations):
-        node_labels = weisfeiler_lehman_step(graph, node_labels, edge_attr=edge_attr)
-        counter = Counter(node_labels.values())
-        # sort the counter, extend total counts
-        subgraph_hash_counts.extend(sorted(counter.items(), key=lambda x: x[0]))
 
+def weisfeiler_lehman_graph_hashes(
+    graphs: Iterable[nx.Graph], edge_attr=None, node_attr=None, iterations=3, digest_size=16
+) -> list[str]:
+    """Return the Weisfeiler Lehman (WL) graph hashes of many graphs.
+
+    Equivalent to calling weisfeiler_lehman_graph_hash on every graph, but the
+    neighborhoods shared by the graphs (e.g. fragments of the same molecule) are
+    only hashed once.
+
+    Args:
+        graphs: Iterable[nx.Graph]
+            The graphs to be hashed.
+        edge_attr: string, default=None
+            The key in edge attribute dictionary to be used for hashing.
+            If None, edge labels are ignored.
+        node_attr: string, default=None
+            The key in node attribute dictionary to be used for hashing.
+            If None, and no edge_attr given, use the degrees of the nodes as labels.
+        iterations: int, default=3
+            Number of neighbor aggregations to perform.
+        digest_size: int, default=16
+            Size (in bits) of blake2b hash digest to use for hashing node labels.
+
+    Returns:
+        list[str]: Hexadecimal strings corresponding to the hashes of the graphs.
+
+    See Also:
+        weisfeiler_lehman_graph_hash
+    """
+    graphs = list(graphs)
+    node_offsets, history, labels = _weisfeiler_lehman_labels(graphs, edge_attr, node_attr, iterations, digest_size)
+
+    # count the labels of all the graphs at once
+    graph_indices = np.repeat(np.arange(len(graphs)), np.diff(node_offsets))
+    subgraph_hash_counts: list[list] = [[] for _ in graphs]
+    for node_labels in history:
+        keys, counts = np.unique(graph_indices * len(labels) + node_labels, return_counts=True)
+        counters: list[list] = [[] for _ in graphs]
+        for key, count in zip(keys.tolist(), counts.tolist(), strict=True):
+            counters[key // len(labels)].append((labels[key % len(labels)], count))
+        # sort the counter, extend total counts
+        for hash_counts, counter in zip(subgraph_hash_counts, counters, strict=True):
+            hash_counts.extend(sorted(counter))
     # hash the final counter
-    return _hash_label(str(tuple(subgraph_hash_counts)), digest_size)
+    return [_hash_label(str(tuple(hash_counts)), digest_size) for hash_counts in subgraph_hash_counts]
+
+
+def group_isomorphic_graphs(
+    graphs: Iterable[nx.Graph],
+    is_isomorphic: Callable[[nx.Graph, nx.Graph], bool],
+    edge_attr=None,
+    node_attr=None,
+    iterations=3,
+) -> list[list[int]]:
+    """Group graphs into sets of isomorphic graphs.
+
+    The graphs are bucketed by their WL hash, which is identical for isomorphic
+    graphs, so is_isomorphic is only called on graphs with the same hash
+    (instead of on all pairs of graphs).
+
+    Args:
+        graphs: Iterable[nx.Graph]
+            The graphs to be grouped.
+        is_isomorphic: Callable[[nx.Graph, nx.Graph], bool]
+            Isomorphism test, called with a graph and the first graph of a group.
+            It must not distinguish graphs which differ in more than the node and
+            edge attributes used for hashing.
+        edge_attr: string, default=None
+            The key in edge attribute dictionary to be used for hashing.
+        node_attr: string, default=None
+            The key in node attribute dictionary to be used for hashing.
+        iterations: int, default=3
+            Number of neighbor aggregations to perform for hashing.
+
+    Returns:
+        list[list[int]]: The indices of the graphs in every group, in order of the
+            first graph of the groups.
+    """
+    graphs = list(graphs)
+    hashes = weisfeiler_lehman_graph_hashes(graphs, edge_attr=edge_attr, node_attr=node_attr, iterations=iterations)
+
+    groups: list[list[int]] = []
+    buckets: dict[str, list[list[int]]] = defaultdict(list)
+    for idx, (graph, graph_hash) in enumerate(zip(graphs, hashes, strict=True)):
+        for group in buckets[graph_hash]:
+            if is_isomorphic(graph, graphs[group[0]]):
+                group.append(idx)
+                break
+        else:
+            group = [idx]
+            buckets[graph_hash].append(group)
+            groups.append(group)
+    return groups
 
 
 def weisfeiler_lehman_subgraph_hashes(graph, edge_attr=None, node_attr=None, iterations=3, digest_size=16):
@@ -225,26 +417,7 @@ def weisfeiler_lehman_subgraph_hashes(graph, edge_attr=None, node_attr=None, ite
     See Also:
         weisfeiler_lehman_graph_hash
     """
-
-    def weisfeiler_lehman_step(G, labels, node_subgraph_hashes, edge_attr=None):
-        """Apply neighborhood aggregation to each node
-        in the graph.
-        Computes a dictionary with labels for each node.
-        Appends the new hashed label to the dictionary of subgraph hashes
-        originating from and indexed by each node in G.
-        """
-        new_labels = {}
-        for node in G.nodes():
-            label = _neighborhood_aggregate(G, node, labels, edge_attr=edge_attr)
-            hashed_label = _hash_label(label, digest_size)
-            new_labels[node] = hashed_label
-            node_subgraph_hashes[node].append(hashed_label)
-        return new_labels
-
-    node_labels = _init_node_labels(graph, edge_attr, node_attr)
-
-    node_subgraph_hashes = defaultdict(list)
-    for _ in range(iterations):
-        node_labels = weisfeiler_lehman_step(graph, node_labels, node_subgraph_hashes, edge_attr)
-
-    return dict(node_subgraph_hashes)
+    _, history, labels = _weisfeiler_lehman_labels([graph], edge_attr, node_attr, iterations, digest_size)
+    if not history:
+        return {}
+    return {node: [labels[node_labels[idx]] for node_labels in history] for idx, node in enumerate(graph)}
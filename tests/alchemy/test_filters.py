@@ -9,6 +9,7 @@ from pymatgen.alchemy.filters import (
     RemoveDuplicatesFilter,
     RemoveExistingFilter,
     SpecieProximityFilter,
+    StructureIndex,
 )
 from pymatgen.alchemy.transmuters import StandardTransmuter
 from pymatgen.analysis.structure_matcher import StructureMatcher
@@ -82,6 +83,11 @@ class TestRemoveDuplicatesFilter:
         transmuter.apply_filter(dup_filter)
         assert len(transmuter.transformed_structures) == 11
 
+    def test_filter_symprec(self):
+        transmuter = StandardTransmuter.from_structures(self._struct_list)
+        transmuter.apply_filter(RemoveDuplicatesFilter(symprec=1e-3))
+        assert len(transmuter.transformed_structures) == 13
+
     def test_as_from_dict(self):
         fil = RemoveDuplicatesFilter()
         dct = fil.as_dict()
@@ -105,3 +111,49 @@ class TestRemoveExistingFilter:
             self._struct_list[-1],
             transmuter.transformed_structures[-1].final_structure,
         )
+
+    def test_filter_symprec(self):
+        fil = RemoveExistingFilter(self._existing_structures, symprec=1e-3)
+        assert [fil.test(struct) for struct in self._struct_list].count(True) == 1
+        assert fil.structure_list == [self._struct_list[-1]]
+
+    def test_filter_ignored_species(self):
+        cscl = Structure(Lattice.cubic(4.1), ["Cs", "Cl"], [[0, 0, 0], [0.5, 0.5, 0.5]])
+        matcher = StructureMatcher(ignored_species=["Cl"])
+        for symprec in (None, 1e-3):
+            fil = RemoveExistingFilter([cscl], structure_matcher=matcher, symprec=symprec)
+            assert not fil.test(Structure(Lattice.cubic(4.1), ["Cs"], [[0, 0, 0]]))
+
+
+class TestStructureIndex:
+    def setup_method(self):
+        with open(f"{TEST_FILES_DIR}/entries/TiO2_entries.json", encoding="utf-8") as file:
+            entries = json.load(file, cls=MontyDecoder)
+        self._struct_list = [entry.structure for entry in entries]
+
+    def test_find(self):
+        index = StructureIndex(StructureMatcher(), symprec=1e-3)
+        for struct in self._struct_list:
+            index.add(*index.get_key(struct))
+        assert len(index) == len(self._struct_list)
+
+        # a supercell has the same reduced structure
+        key, reduced = index.get_key(self._struct_list[3] * (1, 2, 1))
+        assert key == index.get_key(self._struct_list[3])[0]
+        assert index.find(key, reduced) is not None
+
+        # structures are only compared within the same bucket
+        struct = self._struct_list[3].copy()
+        struct.replace_species({"Ti": "Zr"})
+        key, reduced = index.get_key(struct)
+        assert key not in index._buckets
+        assert index.find(key, reduced) is None
+
+    def test_get_key(self):
+        key, reduced = StructureIndex(StructureMatcher(), symprec=None).get_key(self._struct_list[5] * (1, 1, 2))
+        assert key[1] is None
+        assert key[2] == len(reduced) == len(self._struct_list[5])
+
+        # with supercells, reduced structures with different numbers of sites can match
+        index = StructureIndex(StructureMatcher(attempt_supercell=True), by_composition=False)
+        assert index.get_key(self._struct_list[5])[0] == (None, None, None)
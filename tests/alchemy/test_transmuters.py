@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from pymatgen.alchemy.filters import ContainsSpecieFilter
+import pytest
+
+from pymatgen.alchemy.filters import AbstractStructureFilter, ContainsSpecieFilter, RemoveDuplicatesFilter
 from pymatgen.alchemy.transmuters import CifTransmuter, PoscarTransmuter
 from pymatgen.transformations.advanced_transformations import SuperTransformation
 from pymatgen.transformations.standard_transformations import (
@@ -11,6 +13,19 @@ from pymatgen.transformations.standard_transformations import (
 from pymatgen.util.testing import TEST_FILES_DIR, VASP_IN_DIR, MatSciTest
 
 
+class LoggingFilter(AbstractStructureFilter):
+    """Keep every structure, logging the name of the filter each time it is tested."""
+
+    def __init__(self, name: str, log: list[str], order_dependent: bool) -> None:
+        self.name = name
+        self.log = log
+        self.order_dependent = order_dependent
+
+    def test(self, structure):
+        self.log.append(self.name)
+        return True
+
+
 class TestCifTransmuter(MatSciTest):
     def test_init(self):
         trafos = [SubstitutionTransformation({"Fe": "Mn", "Fe2+": "Mn2+"})]
@@ -70,3 +85,73 @@ class TestPoscarTransmuter(MatSciTest):
             "world",
             "universe",
         ]
+
+
+class TestStandardTransmuter(MatSciTest):
+    @staticmethod
+    def _transmute(ncores=None, structure_filters=None):
+        tsc = PoscarTransmuter.from_filenames([f"{VASP_IN_DIR}/POSCAR", f"{VASP_IN_DIR}/POSCAR"])
+        tsc.ncores = ncores
+        tsc.chunksize = 1
+        tsc.stage_timings = []
+        tsc.extend_transformations(
+            [
+                RemoveSpeciesTransformation("O"),
+                SubstitutionTransformation({"Fe": {"Fe2+": 0.25, "Mn3+": 0.75}, "P": "P5+"}),
+            ]
+        )
+        tsc.append_transformation(
+            OrderDisorderedStructureTransformation(), extend_collection=50, structure_filters=structure_filters
+        )
+        return tsc
+
+    @pytest.mark.parametrize("ncores", [None, 2])
+    def test_append_transformation(self, ncores):
+        serial = self._transmute()
+        tsc = self._transmute(ncores=ncores)
+        assert len(tsc) == len(serial) == 8
+        for ts, ref in zip(tsc, serial, strict=True):
+            assert ts.final_structure == ref.final_structure
+            # the first history item is the source, with its creation time
+            assert ts.history[1:] == ref.history[1:]
+
+        assert [timing["transformation"] for timing in tsc.stage_timings] == [
+            "RemoveSpeciesTransformation",
+            "SubstitutionTransformation",
+            "OrderDisorderedStructureTransformation",
+        ]
+        assert tsc.stage_timings[-1]["n_inputs"] == 2
+        assert tsc.stage_timings[-1]["n_outputs"] == tsc.stage_timings[-1]["n_kept"] == 8
+
+    @pytest.mark.parametrize("ncores", [None, 2])
+    def test_structure_filters(self, ncores):
+        serial = self._transmute()
+        for structure_filter in (ContainsSpecieFilter(["Fe2+"]), RemoveDuplicatesFilter()):
+            serial.apply_filter(structure_filter)
+
+        tsc = self._transmute(
+            ncores=ncores, structure_filters=[ContainsSpecieFilter(["Fe2+"]), RemoveDuplicatesFilter()]
+        )
+        assert 0 < len(tsc) == len(serial) < 8
+        assert tsc.stage_timings[-1]["n_kept"] == len(tsc)
+        for ts, ref in zip(tsc, serial, strict=True):
+            assert ts.final_structure == ref.final_structure
+            assert ts.as_dict()["history"][1:] == ref.as_dict()["history"][1:]
+
+    def test_structure_filters_order(self):
+        # alternatives go through the filters that are not order-dependent as they are produced,
+        # and through the others only after the structures of all the inputs
+        log: list[str] = []
+        tsc = self._transmute(
+            structure_filters=[
+                LoggingFilter("early", log, order_dependent=False),
+                LoggingFilter("late", log, order_dependent=True),
+            ]
+        )
+        n_inputs, n_outputs = tsc.stage_timings[-1]["n_inputs"], tsc.stage_timings[-1]["n_outputs"]
+        assert len(tsc) == n_outputs > n_inputs
+        assert log.count("early") == log.count("late") == n_outputs
+        n_alternatives = n_outputs - n_inputs
+        assert log[-n_alternatives - 1 :] == ["early"] + ["late"] * n_alternatives
+        for ts in tsc:
+            assert [filt["@class"] for filt in ts.as_dict()["history"][-2:]] == ["LoggingFilter"] * 2
@@ -17,6 +17,7 @@ from pymatgen.analysis.chemenv.coordination_environments.coordination_geometry_f
     AbstractGeometry,
     LocalGeometryFinder,
     symmetry_measure,
+    symmetry_measures,
 )
 from pymatgen.core.structure import Lattice, Structure
 from pymatgen.util.testing import TEST_FILES_DIR, MatSciTest
@@ -134,6 +135,38 @@ class TestCoordinationGeometryFinder(MatSciTest):
         for perm_csm_dict in permutations_symmetry_measures:
             assert perm_csm_dict["symmetry_measure"] == approx(0.140355832317)
 
+    def test_symmetry_measures(self):
+        rng = np.random.default_rng(0)
+        points_perfect = rng.normal(size=(9, 3))
+        points_distorted = rng.normal(size=(5, 9, 3))
+        for sm_info, points in zip(symmetry_measures(points_distorted, points_perfect), points_distorted, strict=True):
+            expected = symmetry_measure(points, points_perfect)
+            assert sm_info["symmetry_measure"] == approx(expected["symmetry_measure"])
+            assert sm_info["scaling_factor"] == approx(expected["scaling_factor"])
+            assert_allclose(sm_info["rotation_matrix"], expected["rotation_matrix"], atol=1e-12)
+
+        # stacked permutations of the local geometry
+        geom = AbstractGeometry(central_site=[0, 0, 0], bare_coords=rng.normal(size=(4, 3)))
+        perms = [[0, 1, 2, 3], [3, 1, 0, 2]]
+        stacked = geom.points_wcs_ctwcc(permutation=perms)
+        assert stacked.shape == (2, 5, 3)
+        for points, perm in zip(stacked, perms, strict=True):
+            assert_allclose(points, geom.points_wcs_ctwcc(permutation=perm))
+
+    def test_compute_structure_environments_n_jobs(self):
+        self.lgf.setup_structure(self.get_structure("LiFePO4"))
+        kwargs = {"only_indices": [4, 10], "maximum_distance_factor": 1.2}
+        se_serial = self.lgf.compute_structure_environments(**kwargs)
+        se_parallel = self.lgf.compute_structure_environments(n_jobs=2, **kwargs)
+        for site_idx in kwargs["only_indices"]:
+            for ce_serial, ce_parallel in zip(
+                se_serial.ce_list[site_idx][4], se_parallel.ce_list[site_idx][4], strict=True
+            ):
+                assert ce_parallel.minimum_geometry()[0] == ce_serial.minimum_geometry()[0]
+                assert ce_parallel.minimum_geometry()[1]["symmetry_measure"] == approx(
+                    ce_serial.minimum_geometry()[1]["symmetry_measure"]
+                )
+
     def _strategy_test(self, strategy):
         files = []
         for _dirpath, _dirnames, filenames in os.walk(json_dir):
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from pymatgen.analysis.chemenv.coordination_environments.chemenv_strategies import (
+    MultiWeightsChemenvStrategy,
+    SimplestChemenvStrategy,
+)
+from pymatgen.analysis.chemenv.coordination_environments.coordination_geometry_finder import LocalGeometryFinder
+from pymatgen.analysis.chemenv.coordination_environments.structure_environments_cache import (
+    StructureEnvironmentsCache,
+    structure_hash,
+)
+from pymatgen.util.testing import MatSciTest
+
+KWARGS = {"only_indices": [4, 10], "maximum_distance_factor": 1.2}
+
+
+class TestStructureEnvironmentsCache(MatSciTest):
+    @pytest.fixture(autouse=True)
+    def _setup(self, tmp_path):
+        self.lgf = LocalGeometryFinder()
+        self.lgf.setup_parameters(centering_type="standard", structure_refinement=self.lgf.STRUCTURE_REFINEMENT_NONE)
+        self.struct = self.get_structure("LiFePO4")
+        self.cache = StructureEnvironmentsCache(tmp_path / "cache")
+
+    def _forbid_compute(self):
+        def compute(**kwargs):
+            raise AssertionError("cache miss")
+
+        self.lgf.compute_structure_environments = compute
+
+    def test_structure_hash(self):
+        struct = self.struct.copy()
+        assert structure_hash(struct) == structure_hash(self.struct)
+        struct.translate_sites([0], [1e-12, 0, 0])
+        assert structure_hash(struct) == structure_hash(self.struct)
+        struct.translate_sites([0], [1e-3, 0, 0])
+        assert structure_hash(struct) != structure_hash(self.struct)
+        # the site indices are part of the StructureEnvironments, the order of the sites matters
+        assert structure_hash(self.struct.get_sorted_structure(reverse=True)) != structure_hash(self.struct)
+
+    def test_get_or_compute(self):
+        key = self.cache.structure_environments_key(self.lgf, self.struct, **KWARGS)
+        assert self.cache.get(key) is None
+        se = self.cache.get_or_compute(self.lgf, self.struct, **KWARGS)
+        assert len(self.cache.entries()) == 1
+
+        self._forbid_compute()
+        assert self.cache.get_or_compute(self.lgf, self.struct, n_jobs=2, **KWARGS) == se
+        assert StructureEnvironmentsCache(self.cache.cache_dir).get(key) == se
+
+    def test_keys(self):
+        key = self.cache.structure_environments_key(self.lgf, self.struct, **KWARGS)
+        assert self.cache.structure_environments_key(self.lgf, self.struct, n_jobs=4, **KWARGS) == key
+        assert self.cache.structure_environments_key(self.lgf, self.struct, only_indices=[4]) != key
+        self.lgf.setup_parameters(centering_type="centroid", structure_refinement=self.lgf.STRUCTURE_REFINEMENT_NONE)
+        assert self.cache.structure_environments_key(self.lgf, self.struct, **KWARGS) != key
+
+        lse_keys = {
+            self.cache.light_structure_environments_key(key, strategy, valences="undefined")
+            for strategy in (
+                SimplestChemenvStrategy(),
+                SimplestChemenvStrategy(distance_cutoff=1.6),
+                MultiWeightsChemenvStrategy.stats_article_weights_parameters(),
+            )
+        }
+        assert len(lse_keys) == 3
+
+    def test_get_or_compute_light(self):
+        lse = self.cache.get_or_compute_light(
+            self.lgf, self.struct, SimplestChemenvStrategy(), valences="undefined", **KWARGS
+        )
+        assert len(self.cache.entries()) == 2
+
+        self._forbid_compute()
+        cached = self.cache.get_or_compute_light(
+            self.lgf, self.struct, SimplestChemenvStrategy(), valences="undefined", **KWARGS
+        )
+        for site_idx in KWARGS["only_indices"]:
+            assert cached.coordination_environments[site_idx] == lse.coordination_environments[site_idx]
+
+        # a new strategy is applied on the cached StructureEnvironments
+        other = self.cache.get_or_compute_light(
+            self.lgf, self.struct, SimplestChemenvStrategy(distance_cutoff=1.6), valences="undefined", **KWARGS
+        )
+        assert other.coordination_environments[4][0]["ce_symbol"] == "O:6"
+        assert len(self.cache.entries()) == 3
+
+    def test_evict(self):
+        self.cache.get_or_compute(self.lgf, self.struct, **KWARGS)
+        self.cache.get_or_compute(self.lgf, self.struct, only_indices=[4], maximum_distance_factor=1.2)
+        old, new = self.cache.entries()
+        # using the oldest entry makes it the most recently used one
+        os.utime(old, (0, 0))
+        os.utime(new, (1, 1))
+        self.cache.get(old.name.split(".")[0])
+        assert self.cache.entries() == [new, old]
+
+        assert self.cache.evict(max_size_bytes=old.stat().st_size) == 1
+        assert self.cache.entries() == [old]
+
+        self.cache.max_size_bytes = 0
+        self.cache.get_or_compute(self.lgf, self.struct, only_indices=[10], maximum_distance_factor=1.2)
+        assert self.cache.entries() == []
+
+        self.cache.max_size_bytes = None
+        self.cache.get_or_compute(self.lgf, self.struct, **KWARGS)
+        self.cache.clear()
+        assert self.cache.entries() == []
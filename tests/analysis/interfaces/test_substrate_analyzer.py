@@ -35,6 +35,11 @@ def test_substrate_analyzer_init():
     for match in matches:
         assert isinstance(match.match_area, float)
 
+    parallel_matches = list(analyzer.calculate(film, substrate, film_elastic_tensor, n_jobs=2))
+    assert [(match.film_miller, match.substrate_miller, match.match_area) for match in parallel_matches] == [
+        (match.film_miller, match.substrate_miller, match.match_area) for match in matches
+    ]
+
 
 def test_generate_surface_vectors():
     film_miller_indices = [(1, 0, 0)]
@@ -6,6 +6,8 @@ from pytest import approx
 
 from pymatgen.analysis.interfaces.zsl import (
     ZSLGenerator,
+    _is_same_vectors_batch,
+    _reduce_vectors_batch,
     fast_norm,
     get_factors,
     is_same_vectors,
@@ -71,3 +73,19 @@ class TestZSLGen(MatSciTest):
         for match in matches:
             assert match is not None
             assert isinstance(match.match_area, float)
+
+    def test_batch_matches_scalar(self):
+        rng = np.random.default_rng(0)
+        vector_pairs = rng.integers(-4, 5, size=(50, 2, 3)).astype(float)
+        vector_pairs[:, :, 2] = 0
+        vector_pairs = vector_pairs[np.absolute(np.cross(vector_pairs[:, 0], vector_pairs[:, 1])[:, 2]) > 0]
+
+        reduced = _reduce_vectors_batch(vector_pairs)
+        for pair, reduced_pair in zip(vector_pairs, reduced, strict=True):
+            assert_array_equal(reduced_pair, reduce_vectors(*pair))
+
+        same = _is_same_vectors_batch(reduced, reduced[::-1], max_length_tol=0.1, max_angle_tol=0.1)
+        for idx1, idx2 in np.ndindex(same.shape):
+            assert same[idx1, idx2] == is_same_vectors(
+                reduced[idx1], reduced[::-1][idx2], max_length_tol=0.1, max_angle_tol=0.1
+            )
@@ -6,14 +6,17 @@ from monty.serialization import loadfn
 
 from pymatgen.analysis.dimensionality import (
     calculate_dimensionality_of_site,
+    find_clusters,
+    find_connected_atoms,
     get_dimensionality_cheon,
     get_dimensionality_gorai,
     get_dimensionality_larsen,
+    get_dimensionality_larsen_many,
     get_structure_components,
     zero_d_graph_to_molecule_graph,
 )
 from pymatgen.analysis.graphs import StructureGraph
-from pymatgen.analysis.local_env import CrystalNN
+from pymatgen.analysis.local_env import CrystalNN, JmolNN
 from pymatgen.core.structure import Structure
 from pymatgen.util.testing import TEST_FILES_DIR, MatSciTest
 
@@ -62,6 +65,27 @@ class TestLarsenDimensionality(MatSciTest):
         """
         assert get_dimensionality_larsen(self.tricky_structure) == 3
 
+    def test_supercell(self):
+        # periodic images of the same component are still found as separate components
+        components = get_structure_components(self.graphite * (1, 1, 2), inc_orientation=True)
+        assert [comp["dimensionality"] for comp in components] == [2] * 4
+        assert {comp["orientation"] for comp in components} == {(0, 0, 1)}
+        assert get_dimensionality_larsen(self.tricky_structure * (2, 2, 1)) == 3
+
+    @pytest.mark.parametrize("tol", [None, 0.3])
+    def test_orientation_sign(self, tol):
+        # the layers are normal to (1, -1, 0), which get_integer_index cannot tell apart from (-1, 1, 0),
+        # the orientation does not depend on the bonds found along the layers
+        structure = Structure.from_file(f"{TEST_FILES_DIR}/cif/Li8Fe2NiCoO8.cif")
+        bonded_structure = (JmolNN() if tol is None else JmolNN(tol=tol)).get_bonded_structure(structure)
+        components = get_structure_components(bonded_structure, inc_orientation=True)
+        assert [comp["orientation"] for comp in components if comp["dimensionality"] == 2] == [(1, -1, 0)]
+
+    @pytest.mark.parametrize("n_jobs", [1, 2])
+    def test_get_dimensionality_larsen_many(self, n_jobs):
+        structures = [self.graphite, self.get_structure("CsCl"), self.mol_structure, self.lifepo]
+        assert get_dimensionality_larsen_many(structures, n_jobs=n_jobs) == [2, 3, 0, 3]
+
     def test_get_structure_components(self):
         # test components are returned correctly with the right keys
         components = get_structure_components(self.tricky_structure)
@@ -127,6 +151,17 @@ class TestCheonDimensionality(MatSciTest):
         assert get_dimensionality_cheon(struct) == "intercalated ion"
         assert get_dimensionality_cheon(struct, ldict={"Cs": 3.7, "Cl": 3}) == "3D"
 
+    def test_find_clusters(self):
+        struct = self.get_structure("Graphite") * (1, 1, 2)
+        connected_matrix = find_connected_atoms(struct)
+        assert connected_matrix.shape == (8, 8)
+        assert (connected_matrix == connected_matrix.T).all()
+        assert connected_matrix.sum() == 8
+
+        max_cluster, min_cluster, clusters = find_clusters(struct, connected_matrix)
+        assert max_cluster == min_cluster == 2
+        assert clusters == [{0, 4}, {1, 5}, {2, 6}, {3, 7}]
+
     def test_tricky_structure(self):
         tricky_structure = Structure(
             [5.79, 0.0, 0.0, 0, 5.79, 0.0, 0.0, 0.0, 5.79],
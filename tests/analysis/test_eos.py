@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import numpy as np
+import pytest
 from numpy.testing import assert_allclose
 from pytest import approx
 
-from pymatgen.analysis.eos import EOS, NumericalEOS
+from pymatgen.analysis.eos import EOS, EOSError, NumericalEOS
 from pymatgen.util.testing import MatSciTest
 
 
@@ -462,3 +463,27 @@ class TestEOS(MatSciTest):
             "b1": self.num_eos_fit.b1,
             "v0": self.num_eos_fit.v0,
         }
+
+    def test_fit_many(self):
+        # ragged curves: the full Si curve, a truncated one and a shifted one
+        volumes = [self.volumes, self.volumes[4:20], self.volumes[2:]]
+        energies = [self.energies, self.energies[4:20], [ene + 1.5 for ene in self.energies[2:]]]
+        for eos_name in EOS.MODELS:
+            eos = EOS(eos_name)
+            eos_fits = eos.fit_many(volumes, energies)
+            assert len(eos_fits) == 3
+            for eos_fit, vols, ens in zip(eos_fits, volumes, energies, strict=True):
+                ref_fit = eos.fit(vols, ens)
+                assert type(eos_fit) is type(ref_fit)
+                assert_allclose(eos_fit.volumes, ref_fit.volumes)
+                for attr in ("e0", "b0", "v0"):
+                    assert getattr(eos_fit, attr) == approx(getattr(ref_fit, attr), rel=1e-5), f"{eos_name}.{attr}"
+                assert eos_fit.b1 == approx(ref_fit.b1, rel=1e-3)
+
+        # a curve without a minimum in range cannot be fit
+        bad_volumes, bad_energies = [self.volumes, self.volumes[-5:]], [self.energies, self.energies[-5:]]
+        eos_fits = EOS("birch_murnaghan").fit_many(bad_volumes, bad_energies, skip_failed=True)
+        assert eos_fits[0].v0 == approx(40.98, abs=0.01)
+        assert eos_fits[1] is None
+        with pytest.raises(EOSError, match="The minimum volume of a fitted parabola is not in the input volumes"):
+            EOS("birch_murnaghan").fit_many(bad_volumes, bad_energies)
@@ -8,6 +8,7 @@ from shutil import which
 
 import networkx as nx
 import networkx.algorithms.isomorphism as iso
+import numpy as np
 import pytest
 from monty.serialization import loadfn
 from pytest import approx
@@ -444,6 +445,49 @@ from    to  to_image
 
         assert struct_graph == self.square_sg
 
+    def test_add_edges(self):
+        edges = [
+            (0, 1, (0, 0, 0), 2.5),
+            (1, 0, (0, 0, 0), 2.5),  # duplicate in reverse
+            (1, 0, (1, 0, 0), None),
+            (0, 0, (-1, 0, 0), 1.0),  # normalized to (1, 0, 0)
+            (0, 0, (1, 0, 0), 1.0),  # duplicate
+            (1, 1, (0, 1, -1), 0),
+        ]
+        struct_graph = StructureGraph.from_empty_graph(self.bc_square_sg.structure)
+        for from_index, to_index, to_jimage, weight in edges:
+            struct_graph.add_edge(from_index, to_index, to_jimage=to_jimage, weight=weight, warn_duplicates=False)
+
+        bulk_graph = StructureGraph.from_empty_graph(self.bc_square_sg.structure)
+        bulk_graph.add_edges(*zip(*edges, strict=True))
+        assert list(bulk_graph.graph.edges(data=True)) == list(struct_graph.graph.edges(data=True))
+        assert bulk_graph.graph.number_of_edges() == 4
+
+        # edges already present are skipped, bonds of a site to itself are ignored
+        with pytest.warns(UserWarning, match="Tried to create a bond to itself"):
+            bulk_graph.add_edges([1, 0, 1], [0, 0, 1], [(0, 0, 0), (0, -1, 0), (0, 0, 0)])
+        assert bulk_graph.graph.number_of_edges() == 5
+
+    def test_get_edge_arrays(self):
+        from_indices, to_indices, to_jimages, weights = self.mos2_sg.get_edge_arrays()
+        assert len(from_indices) == len(to_indices) == len(to_jimages) == len(weights) == 6
+        for idx, (u, v, data) in enumerate(self.mos2_sg.graph.edges(data=True)):
+            assert (from_indices[idx], to_indices[idx], tuple(to_jimages[idx])) == (u, v, data["to_jimage"])
+            assert weights[idx] == approx(data["weight"])
+        _, _, _, weights = self.square_sg.get_edge_arrays()
+        assert np.isnan(weights).all()
+
+    def test_mul_get_connected_sites(self):
+        # neighbors of the sites in a supercell are the images of the neighbors in the cell
+        supercell_sg = self.mos2_sg * (3, 3, 1)
+        for idx in range(len(supercell_sg)):
+            connected = self.mos2_sg.get_connected_sites(idx % len(self.structure))
+            connected_supercell = supercell_sg.get_connected_sites(idx)
+            assert [site.dist for site in connected_supercell] == approx([site.dist for site in connected])
+            assert {site.index % len(self.structure) for site in connected_supercell} == {
+                site.index for site in connected
+            }
+
     def test_extract_molecules(self):
         structure_file = f"{TEST_FILES_DIR}/cif/H6PbCI3N_mp-977013_symmetrized.cif"
 
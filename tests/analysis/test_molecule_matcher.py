@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import platform
+import sys
 
 import numpy as np
 import pytest
 from pytest import approx
 
 from pymatgen.analysis.molecule_matcher import (
+    AbstractMolAtomMapper,
     BruteForceOrderMatcher,
     GeneticOrderMatcher,
     HungarianOrderMatcher,
@@ -25,6 +27,11 @@ try:
 except (ImportError, RuntimeError):
     openbabel = None
 
+try:  # the pickler used by joblib, vendored before joblib 1.6
+    from joblib.externals import cloudpickle
+except ImportError:
+    import cloudpickle
+
 TEST_DIR = f"{TEST_FILES_DIR}/analysis/molecule_matcher"
 
 
@@ -146,6 +153,76 @@ def generate_Si2O_cluster():
     XYZ(mol2).write_file(f"{TEST_DIR}/Si2O_cluster_2.xyz")
 
 
+class RadiiMapper(AbstractMolAtomMapper):
+    """Stub mapper hashing molecules by formula, with their sorted distances to the center of mass as label data."""
+
+    def __init__(self):
+        self.n_label_data = 0
+
+    def uniform_labels(self, mol1, mol2, label_data1=None, label_data2=None):
+        raise NotImplementedError
+
+    def get_molecule_hash(self, mol):
+        return mol.formula
+
+    def get_label_data(self, mol):
+        self.n_label_data += 1
+        return tuple(np.round(sorted(np.linalg.norm(mol.cart_coords - mol.center_of_mass, axis=1)), 3))
+
+
+class RadiiMatcher(MoleculeMatcher):
+    """Stub matcher that does not need OpenBabel, matching molecules with the same label data of RadiiMapper."""
+
+    def __init__(self):
+        self._tolerance = 0.01
+        self._mapper = RadiiMapper()
+
+    def fit(self, mol1, mol2, label_data1=None, label_data2=None):
+        assert label_data1 is not None, "label data should be computed once per molecule"
+        assert label_data2 is not None, "label data should be computed once per molecule"
+        return label_data1 == label_data2
+
+
+class OBMolAdaptor:
+    """Stand-in for BabelMolAdaptor as if openbabel were installed, giving OBMols the stub mapper cannot label."""
+
+    def __init__(self, mol):
+        self.openbabel_mol = object()
+
+
+@pytest.mark.parametrize("with_openbabel", [False, True])
+def test_group_molecules_label_data(monkeypatch, with_openbabel):
+    if with_openbabel:
+        # the mapper and fit must get the molecules as given, not converted to OBMols
+        monkeypatch.setattr("pymatgen.analysis.molecule_matcher.BabelMolAdaptor", OBMolAdaptor)
+    water = Molecule(["O", "H", "H"], [[0, 0, 0], [0.96, 0, 0], [-0.24, 0.93, 0]])
+    stretched_water = Molecule(["O", "H", "H"], [[0, 0, 0], [1.1, 0, 0], [-0.24, 0.93, 0]])
+    ammonia = Molecule(["N", "H", "H", "H"], [[0, 0, 0.38], [0.94, 0, 0], [-0.47, 0.81, 0], [-0.47, -0.81, 0]])
+    methane = Molecule(["C", "H", "H", "H", "H"], [[0, 0, 0], [1, 1, 1], [-1, -1, 1], [1, -1, -1], [-1, 1, -1]])
+    mol_list = [water, ammonia, stretched_water, methane, water.copy(), ammonia.copy(), water.copy()]
+    for seed, mol in enumerate(mol_list[4:]):
+        rotate(mol, seed=seed)
+
+    mol_matcher = RadiiMatcher()
+    mol_groups = mol_matcher.group_molecules(mol_list)
+    expected = [[0, 4, 6], [1, 5], [2], [3]]
+    assert [[next(idx for idx, m in enumerate(mol_list) if m is mol) for mol in group] for group in mol_groups] == (
+        expected
+    )
+    # one label computation per molecule in the hash groups with several molecules
+    assert mol_matcher._mapper.n_label_data == 6
+
+    # the stubs are pickled by value, as the worker processes cannot import this module
+    cloudpickle.register_pickle_by_value(sys.modules[__name__])
+    try:
+        assert mol_matcher.group_molecules(mol_list, n_jobs=2) == mol_groups
+    finally:
+        cloudpickle.unregister_pickle_by_value(sys.modules[__name__])
+
+    with pytest.raises(ValueError, match="OBMol objects cannot be grouped in parallel"):
+        mol_matcher.group_molecules([*mol_list, object()], n_jobs=2)
+
+
 @pytest.mark.skipif(ob_align_missing, reason="OBAlign is missing, Skipping")
 class TestMoleculeMatcher:
     @pytest.mark.skipif(platform.system() == "Windows", reason="Tests for openbabel failing on Win")
@@ -171,6 +248,7 @@ class TestMoleculeMatcher:
         with open(f"{TEST_DIR}/grouped_mol_list.txt", encoding="utf-8") as file:
             grouped_text = file.read().strip()
         assert str(filename_groups) == grouped_text
+        assert mol_matcher.group_molecules(mol_list, n_jobs=2) == mol_groups
 
     def test_to_and_from_dict(self):
         mol_matcher = MoleculeMatcher(tolerance=0.5, mapper=InchiMolAtomMapper(angle_tolerance=50.0))
@@ -11,6 +11,7 @@ from pymatgen.analysis.prototypes import (
     WYCKOFF_POSITION_RELAB_DICT,
     AflowPrototypeMatcher,
     _find_translations,
+    _load_prototype_data,
     count_crystal_dof,
     count_crystal_sites,
     count_distinct_wyckoff_letters,
@@ -22,6 +23,7 @@ from pymatgen.analysis.prototypes import (
     get_protostructure_label_from_moyopy,
     get_protostructure_label_from_spg_analyzer,
     get_protostructure_label_from_spglib,
+    get_protostructure_labels,
     get_protostructures_from_aflow_label_and_composition,
     get_prototype_formula_from_composition,
     get_prototype_from_protostructure,
@@ -73,6 +75,36 @@ class TestAflowPrototypeMatcher(MatSciTest):
             "strukturbericht": "C1",
         }
 
+    @pytest.mark.parametrize("n_jobs", [1, 2])
+    def test_get_prototypes_many(self, n_jobs):
+        af = AflowPrototypeMatcher()
+        structures = [self.get_structure(name) for name in ("Sn", "CsCl", "Li2O", "LiFePO4")]
+
+        expected = [af.get_prototypes(struct) for struct in structures]
+        assert [tags and [dct["tags"]["aflow"] for dct in tags] for tags in expected] == [
+            ["A_cF8_227_a"],
+            ["AB_cP2_221_b_a"],
+            ["AB2_cF12_225_a_c"],
+            None,
+        ]
+        assert af.get_prototypes_many(structures, n_jobs=n_jobs) == expected
+        assert af.get_prototypes_many(structures, prefilter_by_label=True, n_jobs=n_jobs) == expected
+
+    def test_load_prototype_data(self, tmp_path):
+        calls = []
+
+        def compute():
+            calls.append(None)
+            return [self.get_structure("Li2O")]
+
+        for _ in range(2):
+            assert _load_prototype_data("test", compute, tmp_path) == [self.get_structure("Li2O")]
+        assert len(calls) == 1
+        assert len(list(tmp_path.glob("aflow_prototypes_test_*.pkl"))) == 1
+
+        assert _load_prototype_data("test", compute, None) == [self.get_structure("Li2O")]
+        assert len(calls) == 2
+
 
 PROTOSTRUCTURE_SET = [
     ("A20BC14D8E5F2_oP800_61_40c_2c_28c_16c_10c_4c:C-Cd-H-N-O-S"),
@@ -150,6 +182,14 @@ def test_get_protostructure_label_from_spglib(structure, expected):
     assert get_protostructure_label_from_spglib(structure) == expected
 
 
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_get_protostructure_labels(n_jobs):
+    assert get_protostructure_labels(TEST_STRUCTS, method="spglib", n_jobs=n_jobs) == TEST_PROTOSTRUCTURES
+
+    with pytest.raises(ValueError, match="Invalid method: foo"):
+        get_protostructure_labels(TEST_STRUCTS, method="foo")
+
+
 def test_get_protostructure_label_from_spglib_edge_case():
     """Check edge case where the symmetry precision is too low."""
     struct = Structure.from_file(f"{TEST_DIR}/U2Pa4Tc6.json")
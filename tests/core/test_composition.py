@@ -6,13 +6,23 @@ Created on Nov 10, 2012.
 
 from __future__ import annotations
 
+import copy
+import pickle
+from itertools import product
+
 import numpy as np
 import pytest
 from numpy.testing import assert_allclose
 from pytest import approx
 
 from pymatgen.core import Composition, DummySpecies, Element, Species
-from pymatgen.core.composition import ChemicalPotential, CompositionError, reduce_formula
+from pymatgen.core.composition import (
+    ChemicalPotential,
+    CompositionArray,
+    CompositionError,
+    _charge_balanced_sums,
+    reduce_formula,
+)
 from pymatgen.util.testing import MatSciTest
 
 
@@ -701,6 +711,15 @@ class TestComposition(MatSciTest):
         with pytest.raises(ValueError, match="Composition V2 O3 cannot accommodate max_sites setting"):
             Composition("V2O3").oxi_state_guesses(max_sites=1)
 
+    def test_oxi_state_guesses_many(self):
+        formulas = ["LiFeO2", "Fe4O5", "VO2", "MnFeO3"]
+        expected = [Composition(formula).oxi_state_guesses(all_oxi_states=True) for formula in formulas]
+        assert Composition.oxi_state_guesses_many(formulas, all_oxi_states=True) == expected
+        assert Composition.oxi_state_guesses_many(map(Composition, formulas), n_jobs=2, all_oxi_states=True) == expected
+
+        # many elements without any charge balanced combination
+        assert Composition.oxi_state_guesses_many(["Ca6Mn7Cr5Ti3S20"]) == [()]
+
     def test_oxi_state_decoration(self):
         # Basic test: Get compositions where each element is in a single charge state
         decorated = Composition("H2O").add_charges_from_oxi_state_guesses()
@@ -885,6 +904,81 @@ def test_composition_error():
     assert str(error) == "Composition error"
 
 
+def test_parse_formula_cache_is_not_shared():
+    parsed = Composition._parse_formula("Fe2O3")
+    parsed["Fe"] += 1
+    assert Composition("Fe2O3")["Fe"] == 2
+
+
+def test_memoized_properties():
+    comp = Composition("Mn4O8")
+    assert comp.reduced_formula == "MnO2"
+    assert comp.anonymized_formula == comp.anonymized_formula == "AB2"
+    assert comp.get_reduced_composition_and_factor() is comp.get_reduced_composition_and_factor()
+    assert "_memo" not in comp.__getstate__()
+    assert pickle.loads(pickle.dumps(comp)) == comp  # noqa: S301
+    assert hash(copy.deepcopy(comp)) == hash(comp)
+
+
+def test_charge_balanced_sums():
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        el_sums = [tuple(rng.choice(range(-12, 13), size=rng.integers(1, 6), replace=False).tolist()) for _ in range(4)]
+        target = int(rng.integers(-2, 3))
+        expected = [x for x in product(*el_sums) if sum(x) == target]
+        assert list(_charge_balanced_sums(el_sums, target)) == expected
+
+    # non-integer sums are enumerated exhaustively
+    el_sums = [(2.5, 3, 4.5), (-2, -4)]
+    assert list(_charge_balanced_sums(el_sums, 0.5)) == [(2.5, -2), (4.5, -4)]
+
+
+class TestCompositionArray:
+    def setup_method(self):
+        self.formulas = ["Fe2O3", "LiFePO4", "Li4O4", "H4O2", "Fe0.5O0.5", "Li3Fe2(PO4)3", {}, "O2"]
+        self.comps = [Composition(formula) for formula in self.formulas]
+        self.arr = CompositionArray.from_compositions(self.formulas)
+
+    def test_from_compositions(self):
+        assert len(self.arr) == len(self.comps)
+        assert self.arr.species == tuple(map(Element, ["Fe", "O", "Li", "P", "H"]))
+        assert self.arr.to_compositions() == self.comps
+        assert self.arr[-1] == Composition("O2")
+        assert isinstance(self.arr[1:3], CompositionArray)
+        assert self.arr[[0, 2]].to_compositions() == [self.comps[0], self.comps[2]]
+        with pytest.raises(IndexError, match="out of range"):
+            self.arr[len(self.comps)]
+
+    def test_init(self):
+        arr = CompositionArray([[1, 2], [1e-9, 3]], ["Fe", Species("O", -2)])
+        assert arr[1] == Composition({Species("O", -2): 3})
+        with pytest.raises(ValueError, match="Got 2 columns of amounts for 3 species"):
+            CompositionArray([[1, 2]], ["Fe", "O", "Li"])
+
+    def test_num_atoms_and_weight(self):
+        assert_allclose(self.arr.num_atoms, [comp.num_atoms for comp in self.comps])
+        assert_allclose(self.arr.weight, [comp.weight for comp in self.comps])
+
+    def test_fractional_composition(self):
+        for comp, frac in zip(self.comps, self.arr.fractional_composition, strict=True):
+            assert frac.almost_equals(comp.fractional_composition)
+
+    def test_reduced_composition_and_factor(self):
+        reduced, factors = self.arr.get_reduced_composition_and_factor()
+        assert_allclose(factors, [1, 1, 2, 2, 1, 1, 0, 1])
+        for comp, red, factor in zip(self.comps, reduced, factors, strict=True):
+            if comp:
+                expected, expected_factor = comp.get_reduced_composition_and_factor()
+                assert red.almost_equals(expected)
+                assert factor == expected_factor
+        assert self.arr.reduced_composition[7] == Composition("O2")
+
+    def test_mixed_species(self):
+        arr = CompositionArray.from_compositions([{"Fe2+": 2, "Fe3+": 2, "O2-": 6}])
+        assert_allclose(arr.get_reduced_factors(), [2])
+        assert arr.reduced_composition[0] == Composition({"Fe2+": 1, "Fe3+": 1, "O2-": 3})
+
+
 class TestChemicalPotential:
     def test_init(self):
         dct = {"Fe": 1, Element("Fe"): 1}
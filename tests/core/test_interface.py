@@ -330,6 +330,11 @@ class TestGrainBoundaryGenerator(MatSciTest):
         angle = GrainBoundaryGenerator.get_rotation_angle_from_sigma(6, [1, 0, 0], lat_type="o", ratio=[270, 30, 29])
         assert_allclose(close_angle, angle)
 
+        # Sigma tables are cached, modifying the returned angles must not leak into later calls
+        angle.clear()
+        angle = GrainBoundaryGenerator.get_rotation_angle_from_sigma(6, [1, 0, 0], lat_type="o", ratio=[270, 30, 29])
+        assert_allclose(close_angle, angle)
+
 
 class TestInterface(MatSciTest):
     def setup_method(self):
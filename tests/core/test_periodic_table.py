@@ -8,10 +8,11 @@ from enum import Enum
 
 import numpy as np
 import pytest
+from numpy.testing import assert_array_equal
 from pytest import approx
 
 from pymatgen.core import DummySpecies, Element, Species, get_el_sp
-from pymatgen.core.periodic_table import ElementBase, ElementType
+from pymatgen.core.periodic_table import ElementBase, ElementType, get_element_property_table
 from pymatgen.core.units import Ha_to_eV
 from pymatgen.io.core import ParseError
 from pymatgen.util.testing import MatSciTest
@@ -741,3 +742,33 @@ def test_element_type():
     assert isinstance(ElementType.actinoid, Enum)
     assert isinstance(ElementType.metalloid, Enum)
     assert len(ElementType) == 18
+
+
+def test_element_property_table():
+    table = get_element_property_table()
+    assert table is get_element_property_table()
+    assert len(table) == 1 + len(list(Element)) + len(Element.named_isotopes)
+    assert table.symbols[26] == "Fe"
+    assert table.Z[26] == 26
+
+    for el in (*Element, *Element.named_isotopes):
+        (row,) = table.rows([el])
+        assert table.symbols[row] == el.name
+        assert table["atomic_mass"][row] == el.atomic_mass
+        assert table["max_oxidation_state"][row] == el.max_oxidation_state
+        assert table.oxidation_state_range[table["common_oxidation_states"][row]].tolist() == sorted(
+            el.common_oxidation_states
+        )
+        if not math.isnan(x_val := table["X"][row]):
+            assert x_val == el.X
+
+    assert_array_equal(table.get("X", ["Li", Species("Fe", 2), Element.O, 26]), [0.98, 1.83, 3.44, 1.83])
+    assert table.get("atomic_mass", ["D"])[0] == approx(2.0136, abs=1e-4)
+    assert math.isnan(table["X"][0])
+
+    with pytest.raises(ValueError, match="No element data for DummySpecies"):
+        table.rows([DummySpecies("X")])
+    with pytest.raises(KeyError, match="Unknown property 'foo'"):
+        table["foo"]
+    with pytest.raises(ValueError, match="read-only"):
+        table["atomic_mass"][1] = 0
@@ -838,6 +838,10 @@ class TestMillerIndexFinder(MatSciTest):
         slabs1 = generate_all_slabs(self.lifepo4, 1, 10, 10, tol=0.1, bonds={("P", "O"): 3})
         assert len(slabs1) == 4
 
+        slabs1_parallel = generate_all_slabs(self.lifepo4, 1, 10, 10, tol=0.1, bonds={("P", "O"): 3}, n_jobs=2)
+        assert slabs1_parallel == slabs1
+        assert [slab.miller_index for slab in slabs1_parallel] == [slab.miller_index for slab in slabs1]
+
         # Now we test this out for repair_broken_bonds()
         slabs1_repair = generate_all_slabs(self.lifepo4, 1, 10, 10, tol=0.1, bonds={("P", "O"): 3}, repair=True)
         assert len(slabs1_repair) > len(slabs1)
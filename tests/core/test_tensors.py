@@ -10,7 +10,15 @@ from numpy.testing import assert_allclose
 from pytest import approx
 
 from pymatgen.core.operations import SymmOp
-from pymatgen.core.tensors import SquareTensor, Tensor, TensorCollection, TensorMapping, itertools, symmetry_reduce
+from pymatgen.core.tensors import (
+    SquareTensor,
+    Tensor,
+    TensorCollection,
+    TensorMapping,
+    itertools,
+    symmetry_reduce,
+    transform_tensors,
+)
 from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
 from pymatgen.util.testing import TEST_FILES_DIR, MatSciTest
 
@@ -159,6 +167,15 @@ class TestTensor(MatSciTest):
             3,
         )
 
+    def test_transform_tensors(self):
+        symm_ops = SpacegroupAnalyzer(self.structure).get_symmetry_operations(cartesian=True)
+        tensors = [self.rand_rank4, 2 * self.rand_rank4]
+        transformed = transform_tensors(tensors, symm_ops)
+        assert transformed.shape == (len(symm_ops), 2, 3, 3, 3, 3)
+        for op_idx, symm_op in enumerate(symm_ops):
+            for tensor_idx, tensor in enumerate(tensors):
+                assert_allclose(transformed[op_idx, tensor_idx], tensor.transform(symm_op), atol=1e-12)
+
     def test_rotate(self):
         assert self.vec.rotate([[0, -1, 0], [1, 0, 0], [0, 0, 1]]).tolist() == [0, 1, 0]
         assert_allclose(
@@ -298,6 +315,30 @@ class TestTensor(MatSciTest):
         empty[tkey] = 1
         assert empty[tkey] == 1
 
+    def test_tensor_mapping_tolerance(self):
+        rng = np.random.default_rng(0)
+        keys = [Tensor(rng.random((3, 3))) for _ in range(200)]
+        mapping = TensorMapping(keys, list(range(200)), tol=1e-5)
+        # Keys are found anywhere within tol, including across bucket boundaries
+        for idx, key in enumerate(keys):
+            shift = 9e-6 * np.sign(rng.standard_normal((3, 3)))
+            assert mapping[key + shift] == idx
+            assert key + 2e-5 not in mapping
+        mapping[keys[0] + 1e-6] = "new"
+        assert len(mapping) == 200
+        assert mapping[keys[0]] == "new"
+
+        del mapping[keys[1]]
+        assert len(mapping) == 199
+        assert keys[1] not in mapping
+        assert mapping[keys[2]] == 2
+        with pytest.raises(KeyError, match="not found in mapping"):
+            del mapping[keys[1]]
+
+        close = TensorMapping([np.zeros((3, 3)), np.full((3, 3), 5e-6)], [0, 1], tol=1e-5)
+        with pytest.raises(ValueError, match="Tensor key collision"):
+            _ = close[np.full((3, 3), 2e-6)]
+
     def test_populate(self):
         test_data = loadfn(f"{TEST_FILES_DIR}/analysis/elasticity/test_toec_data.json")
 
@@ -50,6 +50,10 @@ class TestUnit(MatSciTest):
         newton = Unit("kg") * acc
         assert str(newton * Unit("m")) == "N m"
 
+        # parsed units are cached, but item access on one unit does not leak into others
+        assert Unit("m")["s"] == 0
+        assert dict(Unit("m")) == {"m": 1}
+
 
 class TestFloatWithUnit(MatSciTest):
     def test_energy(self):
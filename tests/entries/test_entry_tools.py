@@ -5,10 +5,11 @@ from itertools import starmap
 
 import pytest
 from monty.serialization import dumpfn, loadfn
+from pytest import approx
 
 from pymatgen.core import Element
 from pymatgen.entries.computed_entries import ComputedEntry
-from pymatgen.entries.entry_tools import EntrySet, group_entries_by_composition, group_entries_by_structure
+from pymatgen.entries.entry_tools import EntrySet, EntryTable, group_entries_by_composition, group_entries_by_structure
 from pymatgen.util.testing import TEST_FILES_DIR, MatSciTest
 
 TEST_DIR = f"{TEST_FILES_DIR}/entries"
@@ -87,3 +88,49 @@ class TestEntrySet(MatSciTest):
                 ent for ent in self.entry_set if ent.composition.reduced_formula == gs.composition.reduced_formula
             ]
             assert gs.energy_per_atom <= min(entry.energy_per_atom for entry in same_comp_entries)
+
+
+class TestEntryTable(MatSciTest):
+    def setup_method(self):
+        self.entries = loadfn(f"{TEST_DIR}/Li-Fe-P-O_entries.json")
+        self.table = EntryTable(self.entries)
+        self.entry_set = EntrySet(self.entries)
+
+    def test_columns(self):
+        assert len(self.table) == len(self.entries)
+        assert self.table.chemsys == {"Fe", "Li", "O", "P"}
+        assert self.table.elements == [Element.Li, Element.O, Element.P, Element.Fe]
+        entry = self.entries[0]
+        assert self.table.energies_per_atom[0] == approx(entry.energy_per_atom)
+        assert self.table.corrections[0] == approx(entry.correction)
+        assert dict(zip(self.table.elements, self.table.amounts[0], strict=True)) == {
+            el: entry.composition[el] for el in self.table.elements
+        }
+
+    def test_get_subset_in_chemsys(self):
+        subset = self.table.get_subset_in_chemsys(["Li", "O"])
+        assert {id(entry) for entry in subset} == {
+            id(entry) for entry in self.entry_set.get_subset_in_chemsys(["Li", "O"])
+        }
+        assert subset.chemsys == {"Li", "O"}
+        assert set(self.table.chemsys_index) >= {"Li", "O", "Li-O", "Fe-Li-O-P"}
+        with pytest.raises(ValueError, match="is not a subset of"):
+            self.table.get_subset_in_chemsys(["Fe", "F"])
+
+    def test_ground_states(self):
+        assert {id(entry) for entry in self.table.ground_states} == {
+            id(entry) for entry in self.entry_set.ground_states
+        }
+        for group in self.table.group_by_composition():
+            assert len({self.entries[idx].reduced_formula for idx in group}) == 1
+            assert list(self.table.energies_per_atom[group]) == sorted(self.table.energies_per_atom[group])
+
+        in_window = self.table.get_indices_in_energy_window(0)
+        assert len(in_window) == len(self.table.ground_states)
+        assert len(self.table.get_indices_in_energy_window(float("inf"))) == len(self.table)
+
+    def test_get_pd_entries(self):
+        pd_entries = self.table.get_pd_entries([0, 1])
+        assert [entry.attribute for entry in pd_entries] == self.entries[:2]
+        assert pd_entries[0].composition is self.entries[0].composition
+        assert pd_entries[0].energy == approx(self.entries[0].energy)
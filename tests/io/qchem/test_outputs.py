@@ -5,6 +5,7 @@ import shutil
 
 import numpy as np
 import pytest
+from monty.json import jsanitize
 from monty.serialization import dumpfn, loadfn
 from numpy.testing import assert_allclose
 from pytest import approx
@@ -326,6 +327,14 @@ class TestQCOutput(MatSciTest):
         for key in PROPERTIES:
             self._check_property(key, single_outs, multi_outs)
 
+    def test_parse_many(self):
+        filenames = [f"{NEW_QCHEM_TEST_DIR}/{name}" for name in ("nbo.qout", "ts.out", "almo.out")]
+        for n_jobs in (1, 2):
+            outputs = QCOutput.parse_many(filenames, n_jobs=n_jobs)
+            assert [out.filename for out in outputs] == filenames
+            for out, filename in zip(outputs, filenames, strict=True):
+                assert jsanitize(out.data) == jsanitize(QCOutput(filename).data)
+
     def test_multipole_parsing(self):
         sp = QCOutput(f"{NEW_QCHEM_TEST_DIR}/nbo.qout")
 
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
+import re
 import struct
 
 import pytest
 from monty.io import zopen
 from pytest import approx
 
-from pymatgen.io.qchem.utils import lower_and_check_unique, process_parsed_hess
+from pymatgen.io.qchem.utils import lower_and_check_unique, process_parsed_hess, read_pattern
 from pymatgen.util.testing import TEST_FILES_DIR, MatSciTest
 
 __author__ = "Ryan Kingsbury, Samuel Blau"
@@ -32,6 +33,21 @@ class TestUtil(MatSciTest):
         with pytest.raises(ValueError, match="Multiple instances of key"):
             lower_and_check_unique(d4)
 
+    def test_read_pattern_leading_whitespace(self):
+        text = "  jobtype = opt\n    JOB_TYPE opt\n\n   Total energy = -1.5\n  a b\n"
+        patterns = {
+            "job": r"(?i)\s*job(?:_)*type\s*(?:=)*\s*(opt)",
+            "energy": r"\s*Total\s+energy\s+=\s+([\d\-\.]+)",
+            "alternation": r"\s*a|\s",
+            "optional": r"\s*x*(\w)",
+        }
+        expected = {
+            key: [list(match.groups()) for match in re.finditer(pattern, text, re.MULTILINE | re.DOTALL)]
+            for key, pattern in patterns.items()
+        }
+        assert read_pattern(text, patterns) == expected
+        assert expected["job"] == [["opt"], ["opt"]]
+
     def test_process_parsed_hess(self):
         with zopen(f"{TEST_DIR}/parse_hess/132.0", mode="rb") as file:
             binary = file.read()
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import pytest
+
+from pymatgen.core import Composition, IStructure, Lattice, Molecule, Structure
+from pymatgen.entries.computed_entries import ComputedEntry, ComputedStructureEntry
+from pymatgen.entries.entry_tools import EntrySet
+from pymatgen.io.npz import NpzCollection, dump_npz, load_npz
+from pymatgen.util.testing import VASP_IN_DIR, MatSciTest
+
+
+class TestNpz(MatSciTest):
+    def setup_method(self):
+        self.struct = Structure.from_file(f"{VASP_IN_DIR}/POSCAR_LiFePO4")
+        self.struct.add_site_property("magmom", [float(idx) for idx in range(len(self.struct))])
+        self.struct.add_oxidation_state_by_guess()
+        self.disordered = Structure(
+            Lattice.cubic(3),
+            [{"Fe": 0.5, "Ni": 0.5}, "O"],
+            [[0, 0, 0], [0.5, 0.5, 0.5]],
+            labels=["A", "B"],
+            site_properties={"foo": [{"a": 1}, None]},
+            properties={"bar": 1, "parent": Composition("Fe2O3")},
+        )
+        self.mol = Molecule(["C", "O"], [[0, 0, 0], [0, 0, 1.2]], charge=1, spin_multiplicity=2)
+        self.entry = ComputedStructureEntry(
+            self.struct,
+            -10.0,
+            parameters={"run_type": "GGA"},
+            data={"y": [1, 2], "parent": Composition("Fe2O3")},
+            entry_id="mp-1",
+        )
+        self.comp_entry = ComputedEntry("Fe2O3", -3, entry_id="mp-2")
+
+    def test_round_trip(self):
+        objs = [self.struct, self.disordered, self.mol, self.entry, self.comp_entry]
+        coll = NpzCollection.from_bytes(dump_npz(objs))
+        assert len(coll) == len(objs)
+        for obj, loaded in zip(objs, coll, strict=True):
+            assert type(loaded) is type(obj)
+            assert loaded.as_dict() == obj.as_dict()
+
+        assert coll[1].labels == ["A", "B"]
+        assert coll[1].site_properties["foo"] == [{"a": 1}, None]
+        # MSONable properties and entry data are decoded
+        assert coll[1].properties["parent"] == Composition("Fe2O3")
+        assert coll[3].data["parent"] == Composition("Fe2O3")
+        assert coll[-1].entry_id == "mp-2"
+        assert [entry.entry_id for entry in coll[3:]] == ["mp-1", "mp-2"]
+        with pytest.raises(IndexError, match="out of range"):
+            coll[5]
+
+    def test_invalid_type(self):
+        with pytest.raises(TypeError, match="Cannot serialize"):
+            dump_npz(["Fe2O3"])
+
+    def test_structure_to_from_file(self):
+        filename = f"{self.tmp_path}/struct.npz"
+        self.struct.to(filename)
+        assert Structure.from_file(filename) == self.struct
+        assert isinstance(self.struct.to(fmt="npz"), bytes)
+
+        # a stored IStructure is converted to a Structure before its sites are sorted and merged
+        filename = f"{self.tmp_path}/istruct.npz"
+        species = ["O", {"Fe": 0.5}, {"Fe": 0.5}]
+        IStructure(Lattice.cubic(3), species, [[0.5, 0.5, 0.5], [0, 0, 0], [0.001, 0, 0]]).to(filename)
+        struct = Structure.from_file(filename, sort=True, merge_tol=0.01)
+        assert type(struct) is Structure
+        assert [site.species_string for site in struct] == ["Fe", "O"]
+        assert type(IStructure.from_file(filename, merge_tol=0.01)) is IStructure
+
+        filename = f"{self.tmp_path}/mol.npz"
+        self.mol.to(filename)
+        mol = Molecule.from_file(filename)
+        assert mol == self.mol
+        assert mol.spin_multiplicity == 2
+
+    def test_entry_set(self):
+        filename = f"{self.tmp_path}/entries.npz"
+        EntrySet([self.entry, self.comp_entry]).to_npz(filename)
+        entry_set = EntrySet.from_npz(filename)
+        assert {entry.entry_id for entry in entry_set} == {"mp-1", "mp-2"}
+        assert len(load_npz(filename)) == 2
@@ -35,6 +35,7 @@ from pymatgen.io.vasp.inputs import (
     UnknownPotcarWarning,
     VaspInput,
     _gen_potcar_summary_stats,
+    read_poscars,
 )
 from pymatgen.util.testing import FAKE_POTCAR_DIR, TEST_FILES_DIR, VASP_IN_DIR, VASP_OUT_DIR, MatSciTest
 
@@ -646,6 +647,65 @@ Cartesian
         poscar = Poscar.from_str(poscar_str)
         assert poscar.structure.formula == "Li4 Fe4 P4 O16"
 
+    def test_round_trip(self):
+        struct = Structure(
+            [[3.1, 0, 0], [0.5, 4.2, 0], [0, -1.25, 12.345678]],
+            ["Fe", "O", "O"],
+            [[0, 0, 0], [0.25, -0.5, 0.123456789], [0.999999999, 0.5, 0.75]],
+        )
+        poscar = Poscar(
+            struct, comment="test", selective_dynamics=[[True, True, False], [False, False, False], [True, True, True]]
+        )
+        # strings written by the site-by-site codec that get_str used to be
+        expected_direct = """test
+1.0
+   3.1000000000000001    0.0000000000000000    0.0000000000000000
+   0.5000000000000000    4.2000000000000002    0.0000000000000000
+   0.0000000000000000   -1.2500000000000000   12.3456779999999995
+Fe O
+1 2
+Selective dynamics
+direct
+   0.0000000000000000    0.0000000000000000    0.0000000000000000 T T F Fe
+   0.2500000000000000   -0.5000000000000000    0.1234567890000000 F F F O
+   0.9999999990000000    0.5000000000000000    0.7500000000000000 T T T O
+"""
+        expected_cart = """test
+1.0
+   3.100000    0.000000    0.000000
+   0.500000    4.200000    0.000000
+   0.000000   -1.250000   12.345678
+Fe O
+1 2
+Selective dynamics
+cartesian
+   0.000000    0.000000    0.000000 T T F Fe
+   0.525000   -2.254321    1.524158 F F F O
+   3.350000    1.162500    9.259258 T T T O
+"""
+        assert poscar.get_str() == expected_direct
+        assert poscar.get_str(direct=False, significant_figures=6) == expected_cart
+        assert Poscar.from_str(expected_direct).get_str() == expected_direct
+
+        for path in (f"{VASP_IN_DIR}/POSCAR", f"{VASP_IN_DIR}/POSCAR_LiFePO4", f"{VASP_OUT_DIR}/CONTCAR_Li2O"):
+            poscar = Poscar.from_file(path, check_for_potcar=False)
+            poscar_str = poscar.get_str()
+            # the coordinate lines, formatted site by site as by the former codec
+            n_sites = len(poscar.structure)
+            assert poscar_str.splitlines()[-n_sites:] == [
+                f"{' '.join(f'{coord:21.16f}' for coord in site.frac_coords)} {site.species_string}"
+                for site in poscar.structure
+            ]
+            assert Poscar.from_str(poscar_str).get_str() == poscar_str
+
+    def test_read_poscars(self):
+        filenames = [f"{VASP_IN_DIR}/POSCAR", f"{VASP_IN_DIR}/POSCAR_LiFePO4"]
+        poscars = read_poscars(filenames, check_for_potcar=False)
+        assert [poscar.structure.formula for poscar in poscars] == ["Fe4 P4 O16", "Li4 Fe4 P4 O16"]
+
+        parallel = read_poscars(filenames, n_jobs=2, check_for_potcar=False)
+        assert [poscar.get_str() for poscar in parallel] == [poscar.get_str() for poscar in poscars]
+
 
 class TestIncar(MatSciTest):
     def setup_method(self):
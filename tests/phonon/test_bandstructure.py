@@ -2,12 +2,13 @@ from __future__ import annotations
 
 import copy
 
+import numpy as np
 import orjson
 from numpy.testing import assert_allclose, assert_array_equal
 from pytest import approx
 
 from pymatgen.electronic_structure.bandstructure import Kpoint
-from pymatgen.phonon.bandstructure import PhononBandStructureSymmLine
+from pymatgen.phonon.bandstructure import PhononBandStructureSymmLine, estimate_band_connection, get_band_connections
 from pymatgen.util.testing import TEST_FILES_DIR, MatSciTest
 
 TEST_DIR = f"{TEST_FILES_DIR}/electronic_structure/bandstructure"
@@ -80,6 +81,35 @@ class TestPhononBandStructureSymmLine(MatSciTest):
         assert self.bs.get_nac_eigendisplacements_along_dir([0, 1, 1]) is None
         assert self.bs2.get_nac_eigendisplacements_along_dir([0, 0, 1]) is None
 
+    def test_band_connection(self):
+        rng = np.random.default_rng(0)
+        eigvecs = np.linalg.qr(rng.normal(size=(6, 6)))[0]
+        perm = rng.permutation(6)
+        # a small rotation does not change the connection to the permuted bands
+        rotated = (eigvecs + 1e-3 * rng.normal(size=(6, 6)))[:, perm]
+        assert estimate_band_connection(eigvecs, rotated, range(6)) == np.argsort(perm).tolist()
+        assert (
+            estimate_band_connection(eigvecs, rotated, [1, 0, 2, 3, 4, 5])
+            == np.argsort(perm)[[1, 0, 2, 3, 4, 5]].tolist()
+        )
+
+    def test_band_reorder(self):
+        masses = [site.specie.atomic_mass for site in self.bs2.structure]
+        order = get_band_connections(self.bs2.eigendisplacements, masses)
+        assert order.shape == (self.bs2.nb_qpoints, self.bs2.nb_bands)
+        assert_array_equal(order[0], range(6))
+        assert_array_equal(np.sort(order, axis=1), np.tile(range(6), (self.bs2.nb_qpoints, 1)))
+
+        bands, eigendisplacements = self.bs2.bands.copy(), self.bs2.eigendisplacements.copy()
+        self.bs2.band_reorder()
+        q_idx = range(self.bs2.nb_qpoints)
+        assert_allclose(self.bs2.bands, bands[order.T, q_idx])
+        assert_allclose(self.bs2.eigendisplacements, eigendisplacements[order.T, q_idx])
+        # reordering the eigendisplacements again gives the identity
+        assert_array_equal(
+            get_band_connections(self.bs2.eigendisplacements, masses), np.tile(range(6), (len(q_idx), 1))
+        )
+
     def test_branches(self):
         assert self.bs.branches[0]["end_index"] == 50
         assert self.bs.branches[1]["start_index"] == 51
@@ -8,7 +8,7 @@ import pytest
 from pytest import approx
 
 from pymatgen.core import Element
-from pymatgen.phonon.dos import CompletePhononDos, PhononDos
+from pymatgen.phonon.dos import CompletePhononDos, PhononDos, get_thermodynamic_properties
 from pymatgen.util.testing import TEST_FILES_DIR, MatSciTest
 
 TEST_DIR = f"{TEST_FILES_DIR}/phonon/dos"
@@ -58,6 +58,45 @@ class TestPhononDos(MatSciTest):
         assert self.dos.entropy(300, structure=self.structure) == approx(75.08543723748751, abs=1e-4)
         assert self.dos.zero_point_energy(structure=self.structure) == approx(4847.462485708741, abs=1e-4)
 
+    def test_thermodynamic_functions_temperature_grid(self):
+        temps = np.array([0, 10, 150.5, 300, 1000])
+        for prop in ("cv", "entropy", "internal_energy", "helmholtz_free_energy"):
+            values = getattr(self.dos, prop)(temps, structure=self.structure)
+            assert values.shape == temps.shape
+            assert list(values) == [getattr(self.dos, prop)(temp, structure=self.structure) for temp in temps]
+
+        # values of the former per-temperature integrals, per mol-c
+        expected = {
+            "cv": [0.19076720779056136, 43.152708516463264, 48.04936666598281, 49.71682028643413],
+            "entropy": [0.06218335941442148, 43.29561807468969, 75.08543724516092, 134.30068185864087],
+            "internal_energy": [4847.9285173016715, 8597.65882687807, 15527.59695889585, 50056.43207910637],
+            "helmholtz_free_energy": [4847.3066837075285, 2081.6683066372707, -6998.034214652427, -84244.2497795345],
+        }
+        for prop, values in self.dos.get_thermodynamic_properties(temps[1:]).items():
+            assert values == approx(expected[prop], rel=1e-10)
+            assert getattr(self.dos, prop)(300) == approx(expected[prop][2], rel=1e-10)
+
+        props = self.dos.get_thermodynamic_properties(temps.reshape(1, -1))
+        assert set(props) == {"cv", "entropy", "internal_energy", "helmholtz_free_energy"}
+        assert props["cv"].shape == (1, 5)
+        assert props["cv"][0, 0] == 0
+        assert props["internal_energy"][0, 0] == approx(self.dos.zero_point_energy())
+        with pytest.raises(ValueError, match="Unknown thermodynamic properties"):
+            self.dos.get_thermodynamic_properties(300, properties=("heat",))
+        with pytest.raises(ValueError, match="A temperature or an array of temperatures is required"):
+            self.dos.cv()
+
+    def test_get_thermodynamic_properties(self):
+        doses = [self.dos, self.dos * 2, PhononDos(self.dos.frequencies[::2], self.dos.densities[::2])]
+        temps = np.linspace(0, 1200, 7)
+        structures = [self.structure, None, self.structure]
+        results = get_thermodynamic_properties(doses, temps, structures=structures, chunk_size=1)
+        for idx, (dos, structure) in enumerate(zip(doses, structures, strict=True)):
+            for prop, values in dos.get_thermodynamic_properties(temps, structure).items():
+                assert list(results[prop][idx]) == list(values)
+        with pytest.raises(ValueError, match="1 structures for 3 DOSes"):
+            get_thermodynamic_properties(doses, temps, structures=[None])
+
     def test_add(self):
         dos_2x = self.dos + self.dos
         assert dos_2x.frequencies == approx(self.dos.frequencies)
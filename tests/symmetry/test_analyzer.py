@@ -11,8 +11,10 @@ from spglib import SpglibDataset
 from pymatgen.core import Lattice, Molecule, PeriodicSite, Site, Species, Structure
 from pymatgen.io.vasp.outputs import Vasprun
 from pymatgen.symmetry.analyzer import (
+    SYMMETRY_DATASET_CACHE,
     PointGroupAnalyzer,
     SpacegroupAnalyzer,
+    SymmetryDatasetCache,
     SymmetryUndeterminedError,
     cluster_sites,
     iterative_symmetrize,
@@ -469,6 +471,76 @@ class TestSpacegroupAnalyzer(MatSciTest):
         with pytest.raises(SymmetryUndeterminedError):
             SpacegroupAnalyzer(struct, 0.1)
 
+    @pytest.mark.parametrize("n_jobs", [1, 2])
+    def test_analyze_many(self, n_jobs):
+        structures = [self.structure, self.disordered_structure, self.structure4, self.structure.copy()]
+        SYMMETRY_DATASET_CACHE.clear()
+        analyzers = SpacegroupAnalyzer.analyze_many(structures, symprec=0.001, n_jobs=n_jobs)
+        # the two copies of FePO4 share a single dataset
+        assert len(SYMMETRY_DATASET_CACHE) == 3
+        assert analyzers[3].get_symmetry_dataset() is analyzers[0].get_symmetry_dataset()
+        for analyzer, ref in zip(analyzers, (self.sg, self.disordered_sg, self.sg4, self.sg), strict=True):
+            assert analyzer.get_space_group_symbol() == ref.get_space_group_symbol()
+            assert analyzer.get_symmetry_operations() == ref.get_symmetry_operations()
+        # later analyses are cache hits
+        assert SpacegroupAnalyzer(self.structure4, 0.001).get_symmetry_dataset() is analyzers[2].get_symmetry_dataset()
+
+        bad = Structure(Lattice.cubic(5), ["H", "H"], [[0.0, 0.0, 0.0], [0.001, 0.0, 0.0]])
+        with pytest.raises(SymmetryUndeterminedError):
+            SpacegroupAnalyzer.analyze_many([self.structure, bad], symprec=0.1, n_jobs=n_jobs)
+
+
+class TestSymmetryDatasetCache(MatSciTest):
+    def setup_method(self):
+        self.structure = self.get_structure("LiFePO4")
+        self.key = SpacegroupAnalyzer(self.structure)._cache_key
+
+    def test_digest(self):
+        assert SpacegroupAnalyzer(self.structure.copy())._cache_key == self.key
+        assert SpacegroupAnalyzer(self.structure, symprec=0.1)._cache_key != self.key
+        struct = self.structure.copy()
+        struct.add_site_property("magmom", [0] * len(struct))
+        assert SpacegroupAnalyzer(struct)._cache_key != self.key
+        struct.translate_sites([0], [1e-6, 0, 0])
+        assert SpacegroupAnalyzer(struct)._cache_key != SpacegroupAnalyzer(self.structure.copy())._cache_key
+
+    def test_lru(self):
+        cache = SymmetryDatasetCache(maxsize=2)
+        for key in "abc":
+            cache.put(key, key)
+        assert "a" not in cache
+        assert cache.get("b") == "b"
+        cache.put("d", "d")
+        assert "b" in cache
+        assert "c" not in cache
+        cache.maxsize = 1
+        assert len(cache) == 1
+        assert "b" not in cache
+
+        cache.maxsize = 0
+        cache.put("e", "e")
+        assert len(cache) == 0
+
+    def test_persistence(self):
+        dataset = SpacegroupAnalyzer(self.structure).get_symmetry_dataset()
+        cache = SymmetryDatasetCache(maxsize=2, cache_dir=self.tmp_path / "spglib")
+        cache.put(self.key, dataset)
+        assert len(list(cache.cache_dir.iterdir())) == 1
+
+        # a new cache, e.g. in another session, reads the dataset from disk
+        cache = SymmetryDatasetCache(maxsize=2, cache_dir=self.tmp_path / "spglib")
+        assert self.key not in cache
+        assert asdict(cache.get(self.key)).keys() == asdict(dataset).keys()
+        assert cache.get(self.key).international == dataset.international
+        assert self.key in cache
+
+        for key in "abc":
+            cache.put(key, dataset)
+        assert sorted(path.name.split(".")[0] for path in cache.cache_dir.iterdir()) == ["b", "c"]
+        cache.clear()
+        assert len(cache) == 0
+        assert list(cache.cache_dir.iterdir()) == []
+
 
 class TestSpacegroup:
     def setup_method(self):
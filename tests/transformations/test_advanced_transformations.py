@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+import sys
 from shutil import which
 
 import numpy as np
@@ -10,6 +12,8 @@ from numpy.testing import assert_allclose, assert_array_equal
 from pytest import approx
 
 from pymatgen.analysis.energy_models import IsingModel, SymmetryModel
+from pymatgen.analysis.ewald import EwaldSummation
+from pymatgen.command_line import enumlib_caller
 from pymatgen.core import Lattice, Molecule, Species, Structure
 from pymatgen.core.interface import GrainBoundaryGenerator
 from pymatgen.core.surface import SlabGenerator
@@ -253,6 +257,145 @@ class TestEnumerateStructureTransformation:
         assert trans.symm_prec == approx(0.1)
 
 
+# Stand-ins for enum.x and makestr.x: they enumerate the orderings of the disordered sites in the parent
+# cell only, and fail if the maximum cell size is smaller than FAKE_ENUM_MIN_SIZE. enum.x appends the
+# maximum cell size to FAKE_ENUM_LOG and sleeps for a minute if it is FAKE_ENUM_SLOW_SIZE, logging its process
+# ID before and "done" after the sleep to FAKE_ENUM_LOG with a .slow suffix.
+FAKE_ENUM_X = """
+import itertools, json, os, time
+
+with open("struct_enum.in") as file:
+    lines = file.read().splitlines()
+n_species, n_sites = int(lines[5]), int(lines[6])
+sites = [line.split() for line in lines[7 : 7 + n_sites]]
+max_size = int(lines[7 + n_sites].split()[1])
+concs = [[int(val) for val in line.split()] for line in lines[10 + n_sites : 10 + n_sites + n_species]]
+with open(os.environ["FAKE_ENUM_LOG"], mode="a") as file:
+    file.write(f"{max_size}\\n")
+if str(max_size) == os.environ.get("FAKE_ENUM_SLOW_SIZE"):
+    with open(f"{os.environ['FAKE_ENUM_LOG']}.slow", mode="a") as file:
+        file.write(f"{os.getpid()}\\n")
+    time.sleep(60)
+    with open(f"{os.environ['FAKE_ENUM_LOG']}.slow", mode="a") as file:
+        file.write("done\\n")
+
+orderings = []
+if max_size >= int(os.environ.get("FAKE_ENUM_MIN_SIZE", "1")):
+    for labels in itertools.product(*([int(label) for label in site[3].split("/")] for site in sites)):
+        if all(lo <= labels.count(idx) * base / n_sites <= hi for idx, (lo, hi, base) in enumerate(concs)):
+            orderings.append(labels)
+with open("struct_enum.out", mode="w") as file:
+    json.dump({"lattice": lines[2:5], "coords": [site[:3] for site in sites], "orderings": orderings}, file)
+print("  size  nconfigs  RunTot")
+if orderings:
+    print(f"     1  {len(orderings)}  {len(orderings)}")
+"""
+
+FAKE_MAKESTR_X = """
+import json, sys
+import numpy as np
+
+with open(sys.argv[1]) as file:
+    data = json.load(file)
+lattice = np.array([line.split() for line in data["lattice"]], dtype=float)
+frac_coords = np.array(data["coords"], dtype=float) @ np.linalg.inv(lattice)
+for idx, labels in enumerate(data["orderings"], start=1):
+    species = sorted(set(labels))
+    lines = ["fake", "scale factor", *data["lattice"], " ".join(str(labels.count(sp)) for sp in species), "D"]
+    lines += [" ".join(map(str, frac_coords[site])) for sp in species for site, lbl in enumerate(labels) if lbl == sp]
+    with open(f"vasp.{idx}", mode="w") as file:
+        file.write("\\n".join(lines) + "\\n")
+"""
+
+
+class TestEnumerateStructureTransformationFakeEnumlib:
+    @pytest.fixture(autouse=True)
+    def _setup(self, tmp_path, monkeypatch):
+        for name, script in {"enum.x": FAKE_ENUM_X, "makestr.x": FAKE_MAKESTR_X}.items():
+            path = tmp_path / name
+            path.write_text(f"#!{sys.executable}{script}")
+            path.chmod(0o755)
+            monkeypatch.setattr(enumlib_caller, f"{name.split('.')[0].upper()}_CMD", str(path))
+        self.log = tmp_path / "enum.log"
+        monkeypatch.setenv("FAKE_ENUM_LOG", str(self.log))
+
+        # rock salt conventional cell with a disordered cation sublattice
+        self.struct = Structure(
+            Lattice.cubic(4.2),
+            [{"Li+": 0.5, "Na+": 0.5}] * 4 + ["Cl-"] * 4,
+            [[0, 0, 0], [0.5, 0.5, 0], [0.5, 0, 0.5], [0, 0.5, 0.5], [0.5, 0, 0], [0, 0.5, 0], [0, 0, 0.5], [0.5] * 3],
+        )
+        EnumerateStructureTransformation.clear_enumeration_cache()
+        yield
+        EnumerateStructureTransformation.clear_enumeration_cache()
+
+    def get_enumerated_sizes(self) -> list[int]:
+        return [int(line) for line in self.log.read_text().split()] if self.log.exists() else []
+
+    def test_apply_transformation(self):
+        lst = EnumerateStructureTransformation(n_jobs=1).apply_transformation(self.struct, return_ranked_list=100)
+        assert len(lst) == 6
+        for dct in lst:
+            assert dct["structure"].is_ordered
+            assert dct["structure"].composition.reduced_formula == "NaLiCl2"
+            assert dct["energy"] == approx(EwaldSummation(dct["structure"]).total_energy, rel=1e-4)
+
+        # the Ewald energies do not depend on how the structures are split over the processes
+        EnumerateStructureTransformation.clear_enumeration_cache()
+        lst_parallel = EnumerateStructureTransformation(n_jobs=2).apply_transformation(self.struct, 100)
+        assert [dct["structure"] for dct in lst_parallel] == [dct["structure"] for dct in lst]
+        assert [dct["energy"] for dct in lst_parallel] == approx([dct["energy"] for dct in lst])
+
+    def test_enumeration_cache(self):
+        trafo = EnumerateStructureTransformation(n_jobs=1)
+        lst = trafo.apply_transformation(self.struct, return_ranked_list=100)
+        assert self.get_enumerated_sizes() == [1]
+
+        # returned structures are copies of the cached ones
+        lst[0]["structure"].replace_species({"Li+": "K+"})
+        lst_cached = EnumerateStructureTransformation(n_jobs=1).apply_transformation(self.struct, 100)
+        assert self.get_enumerated_sizes() == [1]
+        assert [dct["structure"] for dct in lst_cached[1:]] == [dct["structure"] for dct in lst[1:]]
+        assert lst_cached[0]["structure"].composition.reduced_formula == "NaLiCl2"
+
+        # a new sort criterion reuses the cached enumeration, new parameters do not
+        lst_nsites = EnumerateStructureTransformation(sort_criteria="nsites").apply_transformation(self.struct, 100)
+        assert "energy" not in lst_nsites[0]
+        EnumerateStructureTransformation(symm_prec=0.01).apply_transformation(self.struct, 100)
+        assert self.get_enumerated_sizes() == [1, 1]
+
+    def test_max_disordered_sites(self, monkeypatch):
+        monkeypatch.setenv("FAKE_ENUM_MIN_SIZE", "2")
+        serial = EnumerateStructureTransformation(max_cell_size=None, max_disordered_sites=12, n_jobs=1)
+        with pytest.warns(UserWarning, match="Unable to enumerate for max_cell_size = 1"):
+            lst = serial.apply_transformation(self.struct, return_ranked_list=100)
+        assert len(lst) == 6
+        assert self.get_enumerated_sizes() == [1, 2]
+
+        # cell sizes enumerated concurrently, the slow run with the largest size is killed
+        EnumerateStructureTransformation.clear_enumeration_cache()
+        self.log.unlink()
+        monkeypatch.setenv("FAKE_ENUM_SLOW_SIZE", "3")
+        concurrent = EnumerateStructureTransformation(max_cell_size=None, max_disordered_sites=12, n_jobs=3)
+        with pytest.warns(UserWarning, match="Unable to enumerate for max_cell_size = 1"):
+            lst_concurrent = concurrent.apply_transformation(self.struct, return_ranked_list=100)
+        assert sorted(self.get_enumerated_sizes()) == [1, 2, 3]
+        # the slow run never got past its sleep and its process is gone
+        pid, *lines = self.log.with_suffix(".log.slow").read_text().split()
+        assert lines == []
+        with pytest.raises(ProcessLookupError):
+            os.kill(int(pid), 0)
+        assert [dct["structure"] for dct in lst_concurrent] == [dct["structure"] for dct in lst]
+
+    def test_unable_to_enumerate(self, monkeypatch):
+        monkeypatch.setenv("FAKE_ENUM_MIN_SIZE", "2")
+        with pytest.warns(UserWarning, match="Unable to enumerate"), pytest.raises(ValueError, match="Unable"):
+            EnumerateStructureTransformation().apply_transformation(self.struct)
+        assert len(EnumerateStructureTransformation._enumeration_cache) == 0
+        # enumlib runs in its own temporary directory
+        assert "struct_enum.in" not in os.listdir()
+
+
 class TestSubstitutionPredictorTransformation:
     def test_apply_transformation(self):
         trafo = SubstitutionPredictorTransformation(threshold=1e-3, alpha=-5, lambda_table=get_table())
@@ -38,7 +38,12 @@ from __future__ import annotations
 
 import networkx as nx
 
-from pymatgen.util.graph_hashing import weisfeiler_lehman_graph_hash, weisfeiler_lehman_subgraph_hashes
+from pymatgen.util.graph_hashing import (
+    group_isomorphic_graphs,
+    weisfeiler_lehman_graph_hash,
+    weisfeiler_lehman_graph_hashes,
+    weisfeiler_lehman_subgraph_hashes,
+)
 
 
 def test_graph_hash():
@@ -75,3 +80,34 @@ def test_subgraph_hashes():
 
     assert g1_hashes[1] == ["a93b64973cfc8897", "db1b43ae35a1878f", "57872a7d2059c1c0"]
     assert g2_hashes[5] == ["a93b64973cfc8897", "db1b43ae35a1878f", "1716d2a4012fa4bc"]
+
+
+def test_graph_hashes():
+    graphs = [nx.cycle_graph(6), nx.path_graph(6), nx.relabel_nodes(nx.cycle_graph(6), {0: "a"}), nx.Graph()]
+    graphs.append(nx.DiGraph(nx.path_graph(4)))
+    for graph in graphs:
+        for node in graph:
+            graph.nodes[node]["specie"] = "C" if node in (0, 1) else "H"
+        for u, v in graph.edges:
+            graph.edges[u, v]["order"] = 2 if u == 1 else 1
+
+    for kwargs in ({}, {"node_attr": "specie"}, {"edge_attr": "order", "iterations": 5, "digest_size": 8}):
+        hashes = weisfeiler_lehman_graph_hashes(graphs, **kwargs)
+        assert hashes == [weisfeiler_lehman_graph_hash(graph, **kwargs) for graph in graphs]
+    assert hashes[0] != hashes[1]
+    assert weisfeiler_lehman_graph_hashes(graph for graph in graphs) == weisfeiler_lehman_graph_hashes(graphs)
+    assert weisfeiler_lehman_graph_hashes([]) == []
+
+
+def test_group_isomorphic_graphs():
+    graphs = [nx.cycle_graph(5), nx.path_graph(5), nx.cycle_graph(range(10, 15)), nx.star_graph(4), nx.path_graph(5)]
+    n_calls = 0
+
+    def is_isomorphic(graph1, graph2):
+        nonlocal n_calls
+        n_calls += 1
+        return nx.is_isomorphic(graph1, graph2)
+
+    assert group_isomorphic_graphs(graphs, is_isomorphic) == [[0, 2], [1, 4], [3]]
+    # only graphs with the same hash are compared
+    assert n_calls == 2